@@ -100,6 +100,10 @@ class TimeoutError(NetworkError):
     """Raised when operation times out."""
     pass
 
+class MulticallError(GoatError):
+    """Raised when a call batched through Multicall3 fails."""
+    pass
+
 def create_error_context(
     operation: str,
     parameters: Dict[str, Any],
@@ -0,0 +1,208 @@
+"""Process-wide ABI and contract object registry for GOAT SDK.
+
+Each ABI is loaded and parsed once per process. Function selectors and
+input/output type lists are computed at registration, and contract objects
+are handed out from an LRU keyed by (web3, abi_id, address), so plugins
+constructed repeatedly (e.g. in a worker pool) skip file I/O, JSON parsing
+and contract class construction.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from eth_utils import keccak
+from web3 import Web3
+
+from .cache import TTLCache
+
+# Contract objects kept before LRU eviction
+CONTRACT_CACHE_SIZE = 4096
+
+
+def abi_type_string(param: Dict[str, Any]) -> str:
+    """Collapse an ABI parameter (including tuples) into a type string."""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(abi_type_string(component) for component in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+def normalize_output(abi_type: str, value: Any) -> Any:
+    """Match web3's return normalizers for address outputs."""
+    if abi_type == "address":
+        return Web3.to_checksum_address(value)
+    if abi_type == "address[]":
+        return [Web3.to_checksum_address(item) for item in value]
+    return value
+
+
+@dataclass
+class AbiFunction:
+    """A contract function with its precomputed selector and codec types."""
+    name: str
+    signature: str
+    selector: bytes
+    input_types: List[str]
+    output_types: List[str]
+
+    @classmethod
+    def from_abi(cls, entry: Dict[str, Any]) -> "AbiFunction":
+        input_types = [abi_type_string(param) for param in entry.get("inputs", [])]
+        signature = f"{entry['name']}({','.join(input_types)})"
+        return cls(
+            name=entry["name"],
+            signature=signature,
+            selector=keccak(text=signature)[:4],
+            input_types=input_types,
+            output_types=[abi_type_string(param) for param in entry.get("outputs", [])]
+        )
+
+    def encode_input(self, *args: Any) -> bytes:
+        """Encode calldata for a call with ``args``."""
+        return self.selector + abi_encode(self.input_types, args)
+
+    def decode_output(self, data: bytes) -> Any:
+        """Decode return data the same way ``ContractFunction.call`` would."""
+        values = abi_decode(self.output_types, data)
+        values = [normalize_output(abi_type, value) for abi_type, value in zip(self.output_types, values)]
+        if len(values) == 1:
+            return values[0]
+        return values
+
+
+@dataclass
+class ContractAbi:
+    """A parsed ABI with its functions indexed by name and signature."""
+    abi_id: str
+    abi: List[Dict[str, Any]]
+    functions: Dict[str, AbiFunction] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for entry in self.abi:
+            if entry.get("type", "function") != "function" or "name" not in entry:
+                continue
+            function = AbiFunction.from_abi(entry)
+            # The first overload wins the bare name; every overload keeps its signature
+            self.functions.setdefault(function.name, function)
+            self.functions[function.signature] = function
+
+    def function(self, name: str) -> AbiFunction:
+        """Get a function by name or full signature.
+
+        Raises:
+            KeyError: If the ABI has no such function
+        """
+        try:
+            return self.functions[name]
+        except KeyError:
+            raise KeyError(f"ABI {self.abi_id} has no function {name}") from None
+
+
+class AbiRegistry:
+    """Registry of parsed ABIs and cached contract objects."""
+
+    def __init__(self, max_contracts: int = CONTRACT_CACHE_SIZE):
+        """Initialize registry.
+
+        Args:
+            max_contracts: Contract objects kept before LRU eviction
+        """
+        self._abis: Dict[str, ContractAbi] = {}
+        self._contracts = TTLCache("abi_registry.contracts", max_entries=max_contracts)
+        self._lock = threading.RLock()
+
+    def __contains__(self, abi_id: str) -> bool:
+        return abi_id in self._abis
+
+    def register(self, abi_id: str, abi: Sequence[Dict[str, Any]]) -> ContractAbi:
+        """Register an ABI, replacing any ABI registered under the same id.
+
+        Args:
+            abi_id: Registry key, e.g. ``"uniswap.router"``
+            abi: ABI entries
+
+        Returns:
+            Parsed ABI
+        """
+        contract_abi = ContractAbi(abi_id, list(abi))
+        with self._lock:
+            self._abis[abi_id] = contract_abi
+            for key in [key for key, _ in self._contracts.items() if key[1] == abi_id]:
+                self._contracts.delete(key)
+        return contract_abi
+
+    def load(self, abi_id: str, loader: Callable[[], Sequence[Dict[str, Any]]]) -> ContractAbi:
+        """Get an ABI, calling ``loader`` only the first time it is requested.
+
+        Loader errors are propagated and not cached.
+
+        Args:
+            abi_id: Registry key
+            loader: Function returning the ABI entries
+
+        Returns:
+            Parsed ABI
+        """
+        contract_abi = self._abis.get(abi_id)
+        if contract_abi is not None:
+            return contract_abi
+        with self._lock:
+            contract_abi = self._abis.get(abi_id)
+            if contract_abi is None:
+                contract_abi = self.register(abi_id, loader())
+            return contract_abi
+
+    def get(self, abi_id: str) -> ContractAbi:
+        """Get a registered ABI.
+
+        Raises:
+            KeyError: If no ABI is registered under ``abi_id``
+        """
+        try:
+            return self._abis[abi_id]
+        except KeyError:
+            raise KeyError(f"ABI {abi_id} is not registered") from None
+
+    def contract(self, web3: Any, abi_id: str, address: Optional[str] = None) -> Any:
+        """Get a contract object for a registered ABI.
+
+        Entries hold a reference to their web3 instance, so the instance id
+        in the key cannot be reused while the entry exists.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            abi_id: Registry key of the ABI
+            address: Contract address
+
+        Returns:
+            Contract object bound to ``web3``
+        """
+        contract_abi = self.get(abi_id)
+        key = (id(web3), abi_id, address.lower() if isinstance(address, str) else address)
+        with self._lock:
+            entry = self._contracts.get(key)
+            if entry is None:
+                entry = (web3, web3.eth.contract(address=address, abi=contract_abi.abi))
+                self._contracts.set(key, entry)
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop all ABIs and cached contract objects."""
+        with self._lock:
+            self._abis.clear()
+            self._contracts.clear()
+
+
+_registry: Optional[AbiRegistry] = None
+
+
+def get_abi_registry() -> AbiRegistry:
+    """Get the process-wide ABI registry."""
+    global _registry
+    if _registry is None:
+        _registry = AbiRegistry()
+    return _registry
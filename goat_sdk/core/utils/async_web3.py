@@ -0,0 +1,110 @@
+"""Async Web3 helpers for GOAT SDK.
+
+Native ``AsyncWeb3`` calls are awaited directly. Calls on sync ``Web3``
+providers are offloaded to a dedicated, bounded thread pool instead of the
+event loop's default executor, so they cannot starve unrelated work.
+"""
+
+import asyncio
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional
+
+import aiohttp
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+# Maximum number of concurrent blocking calls for sync providers
+WEB3_EXECUTOR_WORKERS = int(os.getenv("GOAT_WEB3_EXECUTOR_WORKERS", "32"))
+
+# Connection pool limits for the shared aiohttp connector
+HTTP_CONNECTION_LIMIT = int(os.getenv("GOAT_HTTP_CONNECTION_LIMIT", "100"))
+HTTP_CONNECTION_LIMIT_PER_HOST = int(os.getenv("GOAT_HTTP_CONNECTION_LIMIT_PER_HOST", "32"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_web3_executor() -> ThreadPoolExecutor:
+    """Get the bounded executor used for blocking web3 calls."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=WEB3_EXECUTOR_WORKERS, thread_name_prefix="goat-web3")
+    return _executor
+
+
+def is_async_web3(web3: Any) -> bool:
+    """Check whether a web3 instance uses an async provider."""
+    return isinstance(web3, AsyncWeb3)
+
+
+async def call_web3(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Call a web3 function without blocking the event loop.
+
+    Coroutine functions (``AsyncWeb3``) are awaited directly; blocking
+    callables run on the bounded web3 executor. Awaitables and plain values
+    (e.g. an already-read property) are resolved and returned as-is.
+
+    Args:
+        func: Callable, awaitable or value
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        Result of the call
+    """
+    if inspect.isawaitable(func):
+        return await func
+    if not callable(func):
+        return func
+
+    if inspect.iscoroutinefunction(func):
+        result = await func(*args, **kwargs)
+    else:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(get_web3_executor(), partial(func, *args, **kwargs))
+
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get the process-wide aiohttp session backing async HTTP providers.
+
+    All providers share one keep-alive connection pool.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def create_async_web3(provider_url: str, timeout: float = 30) -> AsyncWeb3:
+    """Create an ``AsyncWeb3`` instance on the shared connection pool.
+
+    Args:
+        provider_url: HTTP(S) JSON-RPC endpoint
+        timeout: Request timeout in seconds
+
+    Returns:
+        AsyncWeb3 instance
+    """
+    provider = AsyncHTTPProvider(provider_url, request_kwargs={"timeout": aiohttp.ClientTimeout(total=timeout)})
+    await provider.cache_async_session(await get_shared_session())
+    return AsyncWeb3(provider)
+
+
+async def close_shared_session() -> None:
+    """Close the shared aiohttp session."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,318 @@
+"""Recent blockhash caching for Solana transactions.
+
+A blockhash stays valid for about 150 blocks (roughly a minute), so
+transactions built close together can share one. ``BlockhashCache`` fetches
+it at most once per ``ttl`` seconds, with concurrent callers sharing the
+request, and can keep it fresh from a background task so transaction paths
+never wait on ``getLatestBlockhash``. ``get_blockhash_cache`` returns the
+cache shared by every plugin talking to the same RPC endpoint; its refresher
+starts on first use and stops once the cache goes unused, and
+``send_with_blockhash`` re-signs and resends a transaction whose blockhash
+expired before it landed, and raises if a confirmed transaction failed.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+from solana.rpc.core import TransactionExpiredBlockheightExceededError
+from solana.rpc.types import TxOpts
+from solders.hash import Hash
+from solders.transaction import Transaction
+
+from ..exceptions import TransactionRevertedError
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched blockhash is reused; well inside its ~60 s validity
+BLOCKHASH_TTL = 20
+
+# Seconds between background refreshes
+BLOCKHASH_REFRESH_INTERVAL = 10
+
+# Seconds without a lookup after which a lazily started refresher stops
+BLOCKHASH_IDLE_TIMEOUT = 120
+
+# Sends of one transaction, each with a fresh blockhash
+MAX_SEND_ATTEMPTS = 3
+
+_EXPIRED_MESSAGES = ("blockhash not found", "block height exceeded", "transaction has expired")
+
+
+@dataclass(frozen=True)
+class RecentBlockhash:
+    """A recent blockhash and the last block height it is valid for."""
+    blockhash: Hash
+    last_valid_block_height: Optional[int] = None
+
+    def expired(self, block_height: int) -> bool:
+        """Whether transactions using this blockhash can no longer land at ``block_height``."""
+        return self.last_valid_block_height is not None and block_height > self.last_valid_block_height
+
+
+def parse_blockhash_response(response: Any) -> RecentBlockhash:
+    """Read a ``getLatestBlockhash`` response.
+
+    Accepts solders responses, raw JSON-RPC dicts and ``(blockhash, height)`` tuples.
+    """
+    if isinstance(response, tuple):
+        blockhash, height = response[0], response[1] if len(response) > 1 else None
+    elif isinstance(response, dict):
+        value = response.get("result", response).get("value", {})
+        blockhash, height = value.get("blockhash"), value.get("lastValidBlockHeight")
+    else:
+        value = response.value
+        blockhash, height = value.blockhash, value.last_valid_block_height
+
+    if isinstance(blockhash, str):
+        blockhash = Hash.from_string(blockhash)
+    if not isinstance(blockhash, Hash):
+        raise ValueError(f"Unexpected getLatestBlockhash response: {response}")
+    return RecentBlockhash(blockhash=blockhash, last_valid_block_height=height)
+
+
+def confirmation_error(response: Any) -> Optional[Any]:
+    """Execution error of a confirmed transaction, from a ``confirm_transaction`` response.
+
+    Confirmation only means the transaction landed; a transaction that failed
+    on chain is confirmed too, with its error in the signature status.
+
+    Returns:
+        The status error, or None if the transaction succeeded
+    """
+    if isinstance(response, dict):
+        value = response.get("result", response).get("value")
+    else:
+        value = getattr(response, "value", None)
+    if not isinstance(value, (list, tuple)) or not value or value[0] is None:
+        return None
+    status = value[0]
+    return status.get("err") if isinstance(status, dict) else getattr(status, "err", None)
+
+
+def is_blockhash_expired_error(error: Exception) -> bool:
+    """Whether a send or confirmation error means the transaction's blockhash expired."""
+    if isinstance(error, TransactionExpiredBlockheightExceededError):
+        return True
+    message = str(error).lower()
+    return any(text in message for text in _EXPIRED_MESSAGES)
+
+
+class BlockhashCache:
+    """Shares one recent blockhash between transactions."""
+
+    def __init__(
+        self,
+        connection: Any,
+        ttl: float = BLOCKHASH_TTL,
+        commitment: Optional[Any] = None,
+        auto_refresh: bool = False
+    ):
+        """Initialize blockhash cache.
+
+        Args:
+            connection: Solana ``AsyncClient``
+            ttl: Seconds a blockhash is reused
+            commitment: Commitment passed to ``getLatestBlockhash``
+            auto_refresh: Start the background refresher on the first lookup
+                and stop it after ``BLOCKHASH_IDLE_TIMEOUT`` idle seconds
+        """
+        self.connection = connection
+        self.commitment = commitment
+        self.auto_refresh = auto_refresh
+        self._cache = TTLCache("solana.blockhash", ttl=ttl, max_entries=1)
+        self._refresher: Optional[asyncio.Task] = None
+        self._last_used = time.monotonic()
+
+    async def _fetch(self) -> RecentBlockhash:
+        if self.commitment is None:
+            response = await self.connection.get_latest_blockhash()
+        else:
+            response = await self.connection.get_latest_blockhash(self.commitment)
+        recent = parse_blockhash_response(response)
+        logger.debug(f"Fetched blockhash {recent.blockhash} (valid until height {recent.last_valid_block_height})")
+        return recent
+
+    def _touch(self) -> None:
+        self._last_used = time.monotonic()
+        if not self.auto_refresh:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # A refresher left on a closed event loop never finishes; replace it
+        if not self.running or self._refresher.get_loop() is not loop:
+            self._refresher = None
+            self.start(BLOCKHASH_REFRESH_INTERVAL, idle_timeout=BLOCKHASH_IDLE_TIMEOUT)
+
+    async def get(self) -> RecentBlockhash:
+        """Get a recent blockhash, fetching a new one when the cached one is too old."""
+        self._touch()
+        return await self._cache.get_or_load("latest", self._fetch)
+
+    def peek(self) -> Optional[RecentBlockhash]:
+        """Get the cached blockhash without fetching; None if there is no fresh one."""
+        self._touch()
+        return self._cache.get("latest")
+
+    async def refresh(self) -> RecentBlockhash:
+        """Fetch a new blockhash now, replacing the cached one."""
+        recent = await self._fetch()
+        self._cache.set("latest", recent)
+        return recent
+
+    def invalidate(self) -> None:
+        """Drop the cached blockhash, e.g. after a "blockhash not found" error."""
+        self._cache.clear()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresher is running."""
+        return self._refresher is not None and not self._refresher.done()
+
+    def start(self, interval: float = BLOCKHASH_REFRESH_INTERVAL, idle_timeout: Optional[float] = None) -> None:
+        """Refresh the blockhash every ``interval`` seconds in the background.
+
+        ``interval`` should be shorter than ``ttl`` so ``get`` never waits on
+        the RPC. Must be called from a running event loop.
+
+        Args:
+            interval: Seconds between refreshes
+            idle_timeout: Stop after this many seconds without a lookup;
+                None runs until ``stop``
+        """
+        if self.running:
+            return
+
+        async def refresh_loop() -> None:
+            # The first fetch joins a lookup already loading the blockhash
+            first = True
+            while idle_timeout is None or time.monotonic() - self._last_used < idle_timeout:
+                try:
+                    if first:
+                        await self._cache.get_or_load("latest", self._fetch)
+                    else:
+                        await self.refresh()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Blockhash refresh failed: {str(e)}")
+                first = False
+                await asyncio.sleep(interval)
+            logger.debug("Stopped idle blockhash refresher")
+
+        self._refresher = asyncio.get_running_loop().create_task(refresh_loop())
+        logger.debug(f"Started blockhash refresher ({interval} s interval)")
+
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
+
+
+_caches: Dict[str, BlockhashCache] = {}
+
+
+def _endpoint(connection: Any) -> Optional[str]:
+    provider = getattr(connection, "_provider", None)
+    endpoint = getattr(provider, "endpoint_uri", None) or getattr(connection, "endpoint_url", None)
+    return endpoint if isinstance(endpoint, str) else None
+
+
+def get_blockhash_cache(connection: Any) -> BlockhashCache:
+    """Get the process-wide blockhash cache of a connection's RPC endpoint.
+
+    The cache fetches through the most recently passed connection, so a
+    closed client is replaced as soon as a live one for the same endpoint is
+    used. Its background refresher starts on the first lookup and stops
+    after ``BLOCKHASH_IDLE_TIMEOUT`` seconds without one. Connections without
+    a known endpoint get a new, unshared cache.
+
+    Args:
+        connection: Solana ``AsyncClient``
+
+    Returns:
+        Shared blockhash cache
+    """
+    endpoint = _endpoint(connection)
+    if endpoint is None:
+        return BlockhashCache(connection)
+
+    cache = _caches.get(endpoint)
+    if cache is None:
+        cache = _caches[endpoint] = BlockhashCache(connection, auto_refresh=True)
+    else:
+        cache.connection = connection
+    return cache
+
+
+async def send_with_blockhash(
+    connection: Any,
+    build: Callable[[RecentBlockhash], Union[Transaction, bytes]],
+    blockhash_cache: Optional[BlockhashCache] = None,
+    opts: Optional[TxOpts] = None,
+    confirm: bool = True,
+    max_attempts: int = MAX_SEND_ATTEMPTS,
+) -> str:
+    """Send a transaction, re-signing it with a fresh blockhash if it expires.
+
+    A transaction rejected with "blockhash not found", or that was not
+    confirmed before its last valid block height, can no longer land, so it
+    is rebuilt with a new blockhash and sent again.
+
+    Args:
+        connection: Solana ``AsyncClient``
+        build: Builds and signs the transaction for a blockhash
+        blockhash_cache: Blockhash source (the endpoint's shared cache if not given)
+        opts: Send options; ``last_valid_block_height`` is filled in per attempt
+        confirm: Wait for confirmation
+        max_attempts: Sends before giving up
+
+    Returns:
+        Signature of the transaction that was sent
+
+    Raises:
+        TransactionRevertedError: If the transaction was confirmed but failed
+    """
+    blockhash_cache = blockhash_cache or get_blockhash_cache(connection)
+    opts = opts or TxOpts()
+    for attempt in range(1, max_attempts + 1):
+        recent = await blockhash_cache.get()
+        transaction = build(recent)
+        try:
+            response = await connection.send_raw_transaction(
+                bytes(transaction),
+                opts=opts._replace(last_valid_block_height=recent.last_valid_block_height)
+            )
+            signature = getattr(response, "value", response)
+            error = None
+            if confirm:
+                error = confirmation_error(await connection.confirm_transaction(
+                    signature,
+                    last_valid_block_height=recent.last_valid_block_height
+                ))
+        except Exception as e:
+            if attempt == max_attempts or not is_blockhash_expired_error(e):
+                raise
+            logger.warning(f"Blockhash {recent.blockhash} expired (attempt {attempt}/{max_attempts}), re-signing")
+            if blockhash_cache.peek() == recent:
+                blockhash_cache.invalidate()
+            continue
+
+        if error is not None:
+            raise TransactionRevertedError(
+                f"Transaction {signature} failed: {error}",
+                context={"error": str(error)},
+                tx_hash=str(signature)
+            )
+        return str(signature)
@@ -0,0 +1,163 @@
+"""New-block tracking utilities for GOAT SDK.
+
+A ``BlockWatcher`` follows the chain head through a pluggable
+``BlockSource`` and notifies listeners once per new block, e.g. to advance a
+``CacheManager`` epoch so that per-block state is refreshed exactly at block
+boundaries.
+"""
+
+import asyncio
+import inspect
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Union
+
+from .async_web3 import call_web3, is_async_web3
+
+logger = logging.getLogger(__name__)
+
+BlockListener = Callable[[int], Union[None, Awaitable[None]]]
+
+
+class BlockSource(ABC):
+    """Source of new block numbers."""
+
+    @abstractmethod
+    def blocks(self) -> AsyncIterator[int]:
+        """Yield block numbers as new blocks are observed."""
+
+
+class PollingBlockSource(BlockSource):
+    """Block source polling ``eth_blockNumber``."""
+
+    def __init__(self, web3: Any, interval: float = 1.0):
+        """Initialize polling source.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            interval: Seconds between polls
+        """
+        self.web3 = web3
+        self.interval = interval
+
+    async def _block_number(self) -> int:
+        if is_async_web3(self.web3):
+            return await self.web3.eth.block_number
+        return await call_web3(lambda: self.web3.eth.block_number)
+
+    async def blocks(self) -> AsyncIterator[int]:
+        while True:
+            yield await self._block_number()
+            await asyncio.sleep(self.interval)
+
+
+class NewHeadsBlockSource(BlockSource):
+    """Block source using an ``eth_subscribe("newHeads")`` subscription.
+
+    Requires a persistent WebSocket ``AsyncWeb3`` connection.
+    """
+
+    def __init__(self, web3: Any):
+        """Initialize subscription source.
+
+        Args:
+            web3: AsyncWeb3 instance connected through a persistent WebSocket provider
+        """
+        self.web3 = web3
+
+    async def blocks(self) -> AsyncIterator[int]:
+        await self.web3.eth.subscribe("newHeads")
+        async for message in self.web3.ws.process_subscriptions():
+            number = message["result"]["number"]
+            yield int(number, 16) if isinstance(number, str) else int(number)
+
+
+class BlockWatcher:
+    """Follows the chain head and notifies listeners once per new block."""
+
+    def __init__(self, source: BlockSource, retry_delay: float = 1.0):
+        """Initialize block watcher.
+
+        Args:
+            source: Block source to follow
+            retry_delay: Seconds to wait before reconnecting after a source error
+        """
+        self.source = source
+        self.retry_delay = retry_delay
+        self.block_number: Optional[int] = None
+        self._listeners: List[BlockListener] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher task is running."""
+        return self._task is not None and not self._task.done()
+
+    def on_block(self, listener: BlockListener) -> None:
+        """Register a listener called with each new block number.
+
+        Args:
+            listener: Sync or async callable taking the block number
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: BlockListener) -> None:
+        """Remove a registered listener.
+
+        Args:
+            listener: Listener to remove
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def handle_block(self, block_number: int) -> bool:
+        """Process an observed block number.
+
+        Repeated and older block numbers (e.g. from polling faster than the
+        block time) are ignored.
+
+        Args:
+            block_number: Observed chain head
+
+        Returns:
+            True if the block was new and listeners were notified
+        """
+        if self.block_number is not None and block_number <= self.block_number:
+            return False
+
+        self.block_number = block_number
+        for listener in list(self._listeners):
+            try:
+                result = listener(block_number)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Block listener failed for block {block_number}: {str(e)}")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async for block_number in self.source.blocks():
+                    await self.handle_block(block_number)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Block source failed, retrying in {self.retry_delay}s: {str(e)}")
+            await asyncio.sleep(self.retry_delay)
+
+    def start(self) -> None:
+        """Start following the chain head in a background task."""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
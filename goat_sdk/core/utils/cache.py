@@ -0,0 +1,399 @@
+"""Caching utilities for GOAT SDK.
+
+Provides namespaced caches with TTL expiry, LRU eviction (by entry count
+and/or estimated bytes), per-epoch invalidation for data that changes every
+block, hit/miss metrics and single-flight loading. ``ListCache`` keeps
+values built from caller-owned lists, such as token indexes.
+"""
+
+import asyncio
+import operator
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache namespace."""
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary format."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: Optional[float]
+    epoch: Optional[int]
+    size: int
+
+
+class _LoadAbandoned(Exception):
+    """Set on an in-flight load whose caller was cancelled."""
+
+
+class TTLCache:
+    """LRU cache with optional TTL and epoch-based expiry.
+
+    Entries are immutable by default (never expire, only evicted by LRU).
+    Set ``ttl`` for time-based expiry and ``per_epoch`` for values that are
+    only valid until the owning ``CacheManager`` advances its epoch (e.g. on
+    every new block).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        per_epoch: bool = False,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic,
+        epoch: Callable[[], int] = lambda: 0
+    ):
+        """Initialize cache namespace.
+
+        Args:
+            name: Namespace name, used in metrics
+            ttl: Seconds an entry stays valid, or None to never expire
+            max_entries: Maximum number of entries before LRU eviction
+            max_bytes: Maximum estimated size of all values before LRU eviction
+            per_epoch: Whether entries expire when the epoch advances
+            sizeof: Function estimating the size of a value in bytes
+            clock: Monotonic clock used for TTL expiry
+            epoch: Function returning the current epoch
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.per_epoch = per_epoch
+        self.stats = CacheStats()
+        self._sizeof = sizeof
+        self._clock = clock
+        self._epoch = epoch
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[Tuple[Hashable, Optional[int]], asyncio.Future] = {}
+
+    @property
+    def immutable(self) -> bool:
+        """Whether entries in this namespace never expire."""
+        return self.ttl is None and not self.per_epoch
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated size of all cached values."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+    def _is_valid(self, entry: _Entry) -> bool:
+        if entry.expires_at is not None and self._clock() >= entry.expires_at:
+            return False
+        if entry.epoch is not None and entry.epoch != self._epoch():
+            return False
+        return True
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self._is_valid(entry):
+            self._remove(key)
+            self.stats.expirations += 1
+            return None
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value, updating its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or ``default``
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, epoch: Optional[int] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional TTL overriding the namespace default
+            epoch: Epoch the value was read at; defaults to the current epoch
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        ttl = self.ttl if ttl is None else ttl
+        entry = _Entry(
+            value=value,
+            expires_at=self._clock() + ttl if ttl is not None else None,
+            epoch=(self._epoch() if epoch is None else epoch) if self.per_epoch else None,
+            size=self._sizeof(value) if self.max_bytes is not None else 0
+        )
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a key.
+
+        Returns:
+            True if the key was present
+        """
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def values(self) -> List[Any]:
+        """Return all valid values without affecting LRU order or metrics."""
+        return [value for _, value in self.items()]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate over valid entries without affecting LRU order or metrics."""
+        for key in list(self._entries):
+            entry = self._entries[key]
+            if self._is_valid(entry):
+                yield key, entry.value
+            else:
+                self._remove(key)
+                self.stats.expirations += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """Get a value, loading it on a miss.
+
+        Concurrent misses for the same key share a single ``loader`` call
+        (single-flight). Loader errors are propagated to every waiter and are
+        not cached. If the caller running the load is cancelled, a waiting
+        caller takes the load over. For per-epoch namespaces the value is tagged with the
+        epoch current when loading started, so a load that straddles an epoch
+        change is never served as fresh.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl: Optional TTL overriding the namespace default
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+        self.stats.misses += 1
+        while True:
+            epoch = self._epoch() if self.per_epoch else None
+            inflight_key = (key, epoch)
+            inflight = self._inflight.get(inflight_key)
+            if inflight is None:
+                break
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadAbandoned:
+                # The loading caller was cancelled; load it here unless another waiter already does
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry.value
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            self.stats.loads += 1
+            value = await loader()
+        except asyncio.CancelledError:
+            # Waiters were not cancelled; let them retry the load
+            future.set_exception(_LoadAbandoned())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            self.set(key, value, ttl=ttl, epoch=epoch)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+
+class ListCache:
+    """Values built from lists, cached per list object.
+
+    A value is rebuilt when its list's items change (compared by identity).
+    Cached lists are kept alive, so their ids are not reused while cached.
+    """
+
+    def __init__(self, build: Callable[[List[Any]], Any], max_entries: int = 16):
+        """Initialize list cache.
+
+        Args:
+            build: Builds the value for a list
+            max_entries: Lists kept before LRU eviction
+        """
+        self._build = build
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[List[Any], Tuple[Any, ...], Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, items: List[Any]) -> Any:
+        """Get the value for a list, building it if the list is new or changed."""
+        key = id(items)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0] is items
+            and len(entry[1]) == len(items)
+            and all(map(operator.is_, entry[1], items))
+        ):
+            self._entries.move_to_end(key)
+            return entry[2]
+        value = self._build(items)
+        self._entries[key] = (items, tuple(items), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+
+class CacheManager:
+    """Registry of named cache namespaces sharing an epoch counter."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize cache manager.
+
+        Args:
+            clock: Monotonic clock used for TTL expiry
+        """
+        self._clock = clock
+        self._namespaces: Dict[str, TTLCache] = {}
+        self.epoch = 0
+
+    def namespace(
+        self,
+        name: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        per_epoch: bool = False,
+        sizeof: Callable[[Any], int] = sys.getsizeof
+    ) -> TTLCache:
+        """Get a namespace, creating it with the given policy on first use.
+
+        Args:
+            name: Namespace name
+            ttl: Seconds an entry stays valid, or None to never expire
+            max_entries: Maximum number of entries before LRU eviction
+            max_bytes: Maximum estimated size of all values before LRU eviction
+            per_epoch: Whether entries expire when the epoch advances
+            sizeof: Function estimating the size of a value in bytes
+
+        Returns:
+            Cache namespace
+        """
+        if name not in self._namespaces:
+            self._namespaces[name] = TTLCache(
+                name,
+                ttl=ttl,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+                per_epoch=per_epoch,
+                sizeof=sizeof,
+                clock=self._clock,
+                epoch=lambda: self.epoch
+            )
+        return self._namespaces[name]
+
+    def advance_epoch(self, epoch: Optional[int] = None) -> int:
+        """Invalidate all per-epoch entries.
+
+        Args:
+            epoch: New epoch (e.g. a block number); defaults to incrementing
+
+        Returns:
+            The current epoch
+        """
+        self.epoch = self.epoch + 1 if epoch is None else epoch
+        return self.epoch
+
+    def clear(self) -> None:
+        """Clear every namespace."""
+        for cache in self._namespaces.values():
+            cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every namespace."""
+        return {
+            name: {**cache.stats.to_dict(), "entries": len(cache), "bytes": cache.size_bytes}
+            for name, cache in self._namespaces.items()
+        }
@@ -0,0 +1,211 @@
+"""Gas price oracle for GOAT SDK.
+
+``GasOracle`` derives EIP-1559 fees from one cached ``eth_feeHistory`` call
+per block (reward percentiles over recent blocks plus the next base fee)
+and caches ``estimate_gas`` results per exact call (sender, target, calldata
+and value), so repeating a transaction normally costs no fee or gas RPCs.
+Calls differing only in arguments are estimated separately: gas depends on
+the arguments and the state they touch (e.g. an ERC20 transfer to an empty
+balance writes a new storage slot and costs ~50% more). Chains
+without EIP-1559 fall back to a cached ``eth_gasPrice``.
+"""
+
+import logging
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+from hexbytes import HexBytes
+
+from .async_web3 import call_web3, is_async_web3
+from .cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# Blocks of fee history used for priority fee percentiles
+FEE_HISTORY_BLOCKS = 10
+
+# Reward percentile used for each speed
+FEE_PERCENTILES: Dict[str, int] = {
+    "slow": 10,
+    "standard": 50,
+    "fast": 90,
+}
+
+# Fee data lifetime when no block watcher advances the cache epoch
+FEE_CACHE_TTL = 12
+
+# Lifetime of an estimate for one exact call
+GAS_ESTIMATE_TTL = 300
+GAS_ESTIMATE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class FeeEstimate:
+    """Fee parameters for a new transaction."""
+    max_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    base_fee_per_gas: Optional[int] = None  # None on chains without EIP-1559
+
+    @property
+    def eip1559(self) -> bool:
+        """Whether the fees are EIP-1559 fees."""
+        return self.base_fee_per_gas is not None
+
+    @property
+    def gas_price(self) -> int:
+        """Expected price actually paid per unit of gas."""
+        if self.base_fee_per_gas is None:
+            return self.max_fee_per_gas
+        return min(self.base_fee_per_gas + self.max_priority_fee_per_gas, self.max_fee_per_gas)
+
+    def tx_params(self) -> Dict[str, int]:
+        """Fee fields for a transaction dict."""
+        if self.eip1559:
+            return {
+                "maxFeePerGas": self.max_fee_per_gas,
+                "maxPriorityFeePerGas": self.max_priority_fee_per_gas
+            }
+        return {"gasPrice": self.max_fee_per_gas}
+
+
+def _address_key(address: Any) -> Any:
+    return address.lower() if isinstance(address, str) else address
+
+
+def gas_estimate_key(transaction: Dict[str, Any]) -> Hashable:
+    """Cache key of a gas estimate: sender, target, full calldata and value."""
+    return (
+        _address_key(transaction.get("from")),
+        _address_key(transaction.get("to")),
+        bytes(HexBytes(transaction.get("data") or b"")),
+        int(transaction.get("value") or 0)
+    )
+
+
+class GasOracle:
+    """Cached fee and gas-limit estimation for one chain."""
+
+    def __init__(
+        self,
+        web3: Any,
+        cache: Optional[CacheManager] = None,
+        history_blocks: int = FEE_HISTORY_BLOCKS,
+        fee_ttl: float = FEE_CACHE_TTL
+    ):
+        """Initialize gas oracle.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            cache: Cache manager; pass one whose epoch follows new blocks to refresh fees exactly per block
+            history_blocks: Blocks of fee history to sample
+            fee_ttl: Seconds fee data stays valid
+        """
+        self.web3 = web3
+        self.history_blocks = history_blocks
+        cache = cache or CacheManager()
+        self._fees = cache.namespace("gas.fees", ttl=fee_ttl, per_epoch=True)
+        self._estimates = cache.namespace("gas.estimates", ttl=GAS_ESTIMATE_TTL, max_entries=GAS_ESTIMATE_CACHE_SIZE)
+
+    async def fee_history(self) -> Optional[Dict[str, Any]]:
+        """Recent fee history, fetched at most once per block.
+
+        Returns:
+            ``eth_feeHistory`` result, or None if the chain does not support EIP-1559
+        """
+        return await self._fees.get_or_load("fee_history", self._load_fee_history)
+
+    async def _load_fee_history(self) -> Optional[Dict[str, Any]]:
+        percentiles = sorted(set(FEE_PERCENTILES.values()))
+        try:
+            history = await call_web3(self.web3.eth.fee_history, self.history_blocks, "latest", percentiles)
+        except Exception as e:
+            logger.debug(f"eth_feeHistory unavailable, using legacy gas price: {str(e)}")
+            return None
+
+        base_fees = history.get("baseFeePerGas") if hasattr(history, "get") else None
+        if not isinstance(base_fees, (list, tuple)) or not base_fees or not base_fees[-1]:
+            return None
+        return {
+            "base_fee": int(base_fees[-1]),  # Base fee of the next block
+            "rewards": {
+                percentile: [int(rewards[index]) for rewards in history.get("reward") or [] if len(rewards) > index]
+                for index, percentile in enumerate(percentiles)
+            }
+        }
+
+    async def _gas_price(self) -> int:
+        async def load() -> int:
+            if is_async_web3(self.web3):
+                return int(await self.web3.eth.gas_price)
+            return int(await call_web3(lambda: self.web3.eth.gas_price))
+        return await self._fees.get_or_load("gas_price", load)
+
+    async def fees(self, speed: str = "standard") -> FeeEstimate:
+        """Fee parameters for a new transaction.
+
+        The priority fee is the median of the ``speed`` reward percentile over
+        recent blocks; ``maxFeePerGas`` allows the base fee to double.
+
+        Args:
+            speed: ``"slow"``, ``"standard"`` or ``"fast"``
+
+        Returns:
+            Fee estimate
+        """
+        if speed not in FEE_PERCENTILES:
+            raise ValueError(f"Unknown fee speed {speed}; expected one of {list(FEE_PERCENTILES)}")
+
+        history = await self.fee_history()
+        if history is None:
+            gas_price = await self._gas_price()
+            return FeeEstimate(max_fee_per_gas=gas_price, max_priority_fee_per_gas=gas_price)
+
+        rewards = history["rewards"].get(FEE_PERCENTILES[speed]) or [0]
+        priority_fee = int(statistics.median(rewards))
+        base_fee = history["base_fee"]
+        return FeeEstimate(
+            max_fee_per_gas=2 * base_fee + priority_fee,
+            max_priority_fee_per_gas=priority_fee,
+            base_fee_per_gas=base_fee
+        )
+
+    async def estimate_gas(self, transaction: Dict[str, Any], buffer: float = 1.2, use_cache: bool = True) -> int:
+        """Estimate a gas limit, reusing the estimate of an identical earlier call.
+
+        Args:
+            transaction: Transaction to estimate (without ``gas``)
+            buffer: Multiplier applied to the raw estimate
+            use_cache: Whether cached estimates may be used
+
+        Returns:
+            Buffered gas limit
+        """
+        async def load() -> int:
+            return int(await call_web3(self.web3.eth.estimate_gas, transaction))
+
+        if use_cache:
+            estimate = await self._estimates.get_or_load(gas_estimate_key(transaction), load)
+        else:
+            estimate = await load()
+        return int(estimate * buffer)
+
+
+_oracles: Dict[Any, GasOracle] = {}
+
+
+def get_gas_oracle(web3: Any, chain_id: Any, cache: Optional[CacheManager] = None) -> GasOracle:
+    """Get the process-wide gas oracle of a chain.
+
+    Args:
+        web3: Web3 or AsyncWeb3 instance used on first creation
+        chain_id: Chain ID
+        cache: Cache manager used on first creation
+
+    Returns:
+        Shared gas oracle
+    """
+    oracle = _oracles.get(chain_id)
+    if oracle is None:
+        oracle = _oracles[chain_id] = GasOracle(web3, cache)
+    return oracle
@@ -0,0 +1,350 @@
+"""Multicall3 batching utilities for GOAT SDK.
+
+Read-only contract calls issued by concurrent coroutines within a short
+window are coalesced into a single ``aggregate3`` ``eth_call`` and the
+results are decoded back to each caller.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from ..exceptions import MulticallError
+from .abi_registry import abi_type_string, normalize_output
+from .async_web3 import call_web3
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xCA11BdE05779ba9813c5Caa0c54EE27C46C7DbBb"
+
+MULTICALL3_ADDRESSES: Dict[int, str] = {
+    1: MULTICALL3_ADDRESS,         # Ethereum Mainnet
+    10: MULTICALL3_ADDRESS,        # Optimism
+    56: MULTICALL3_ADDRESS,        # BNB Chain
+    137: MULTICALL3_ADDRESS,       # Polygon
+    919: MULTICALL3_ADDRESS,       # Mode Testnet
+    8453: MULTICALL3_ADDRESS,      # Base
+    34443: MULTICALL3_ADDRESS,     # Mode Mainnet
+    42161: MULTICALL3_ADDRESS,     # Arbitrum One
+    84532: MULTICALL3_ADDRESS,     # Base Sepolia
+    11155111: MULTICALL3_ADDRESS,  # Sepolia
+}
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+def get_multicall_address(chain_id: int) -> Optional[str]:
+    """Get the known Multicall3 address for a chain.
+
+    Args:
+        chain_id: EVM chain ID
+
+    Returns:
+        Multicall3 address, or None if the chain is not known to have one
+    """
+    return MULTICALL3_ADDRESSES.get(chain_id)
+
+
+@dataclass
+class _PendingCall:
+    """A contract call waiting for the next batch."""
+    function: Any
+    target: str
+    calldata: Any
+    output_types: List[str]
+    future: asyncio.Future
+
+
+class Multicall:
+    """Coalesces concurrent contract reads into Multicall3 ``aggregate3`` calls.
+
+    Works with both sync ``Web3`` (the aggregate call is run on the bounded
+    web3 executor) and ``AsyncWeb3`` instances.
+    """
+
+    def __init__(
+        self,
+        web3: Any,
+        address: str = MULTICALL3_ADDRESS,
+        batch_window: float = 0.005,
+        max_batch_size: int = 500,
+        block_identifier: Any = "latest"
+    ):
+        """Initialize the batcher.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            address: Multicall3 contract address
+            batch_window: Seconds to wait for more calls before sending a batch
+            max_batch_size: Maximum number of calls per aggregate3 request
+            block_identifier: Block to execute batches against
+        """
+        self.web3 = web3
+        self.address = Web3.to_checksum_address(address)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.block_identifier = block_identifier
+        self._contract = web3.eth.contract(address=self.address, abi=MULTICALL3_ABI)
+        self._pending: List[_PendingCall] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def for_chain(cls, web3: Any, chain_id: int, address: Optional[str] = None, **kwargs: Any) -> Optional["Multicall"]:
+        """Create a batcher for a chain.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            chain_id: EVM chain ID used to look up the default Multicall3 address
+            address: Optional address overriding the per-chain default
+            **kwargs: Extra arguments passed to the constructor
+
+        Returns:
+            Multicall instance, or None if no Multicall3 address is known
+        """
+        try:
+            address = address or get_multicall_address(chain_id)
+        except TypeError:  # Unhashable chain id
+            address = None
+        if not address:
+            return None
+        return cls(web3, address=address, **kwargs)
+
+    async def call(self, function: Any) -> Any:
+        """Queue a bound contract function call and wait for its result.
+
+        Args:
+            function: Bound contract function, e.g. ``contract.functions.name()``
+
+        Returns:
+            Decoded return value, shaped like ``function.call()``
+
+        Raises:
+            MulticallError: If the call reverts or its result cannot be decoded
+        """
+        loop = asyncio.get_running_loop()
+        pending = _PendingCall(
+            function=function,
+            target=function.address,
+            calldata=function._encode_transaction_data(),
+            output_types=[abi_type_string(output) for output in function.abi.get("outputs", [])],
+            future=loop.create_future()
+        )
+        self._pending.append(pending)
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self.flush)
+
+        return await pending.future
+
+    def flush(self) -> None:
+        """Send all queued calls now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._execute_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, function: Any, block_identifier: Any = None) -> Any:
+        """Execute ``function.call`` without blocking the event loop."""
+        block_identifier = self.block_identifier if block_identifier is None else block_identifier
+        kwargs = {} if block_identifier == "latest" else {"block_identifier": block_identifier}
+        return await call_web3(function.call, **kwargs)
+
+    async def aggregate(
+        self,
+        calls: Sequence[Tuple[str, bytes]],
+        chunk_size: Optional[int] = None,
+        max_concurrency: int = 4,
+        block_identifier: Any = None
+    ) -> List[Tuple[bool, bytes]]:
+        """Execute raw calls immediately, split into ``aggregate3`` chunks.
+
+        Unlike ``call``, nothing is queued or decoded, which suits large
+        scans built from precomputed calldata.
+
+        Args:
+            calls: ``(target, calldata)`` pairs
+            chunk_size: Calls per ``aggregate3`` request (defaults to ``max_batch_size``)
+            max_concurrency: Chunks in flight at once
+            block_identifier: Block to read at (defaults to the batcher's block)
+
+        Returns:
+            ``(success, return_data)`` per call, in order
+
+        Raises:
+            MulticallError: If a chunk fails or returns the wrong number of results
+        """
+        chunk_size = chunk_size or self.max_batch_size
+        chunks = [calls[start:start + chunk_size] for start in range(0, len(calls), chunk_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_chunk(chunk: Sequence[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
+            async with semaphore:
+                try:
+                    results = await self._run(
+                        self._contract.functions.aggregate3(
+                            [(target, True, HexBytes(calldata)) for target, calldata in chunk]
+                        ),
+                        block_identifier
+                    )
+                except Exception as e:
+                    raise MulticallError(f"aggregate3 chunk of {len(chunk)} calls failed: {str(e)}", parent=e) from e
+                if len(results) != len(chunk):
+                    raise MulticallError(f"aggregate3 returned {len(results)} results for {len(chunk)} calls")
+                return [(bool(success), bytes(return_data)) for success, return_data in results]
+
+        results: List[Tuple[bool, bytes]] = []
+        for chunk_results in await asyncio.gather(*(run_chunk(chunk) for chunk in chunks)):
+            results.extend(chunk_results)
+        return results
+
+    async def _execute_batch(self, batch: List[_PendingCall]) -> None:
+        """Execute one batch, de-duplicating identical calls."""
+        groups: Dict[Tuple[str, bytes], List[_PendingCall]] = {}
+        for pending in batch:
+            groups.setdefault((pending.target, pending.calldata), []).append(pending)
+        keys = list(groups)
+
+        try:
+            results = await self._run(
+                self._contract.functions.aggregate3([(target, True, HexBytes(calldata)) for target, calldata in keys])
+            )
+            if len(results) != len(keys):
+                raise MulticallError(f"aggregate3 returned {len(results)} results for {len(keys)} calls")
+        except Exception as e:
+            logger.warning(f"Multicall batch of {len(keys)} calls failed, falling back to direct calls: {str(e)}")
+            await self._execute_direct(groups)
+            return
+
+        for key, (success, return_data) in zip(keys, results):
+            for pending in groups[key]:
+                if pending.future.done():
+                    continue
+                if not success:
+                    pending.future.set_exception(
+                        MulticallError(f"Call to {pending.target} reverted", context={"calldata": HexBytes(pending.calldata).hex()})
+                    )
+                    continue
+                try:
+                    pending.future.set_result(self._decode(pending, return_data))
+                except Exception as e:
+                    pending.future.set_exception(
+                        MulticallError(f"Failed to decode result from {pending.target}: {str(e)}", parent=e)
+                    )
+
+    async def _execute_direct(self, groups: Dict[Tuple[str, bytes], List[_PendingCall]]) -> None:
+        """Fallback: execute each distinct call on its own, concurrently."""
+        calls = list(groups.values())
+        results = await asyncio.gather(
+            *(self._run(group[0].function) for group in calls),
+            return_exceptions=True
+        )
+        for group, result in zip(calls, results):
+            for pending in group:
+                if pending.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    pending.future.set_exception(result)
+                else:
+                    pending.future.set_result(result)
+
+    def _decode(self, pending: _PendingCall, return_data: bytes) -> Any:
+        """Decode return data the same way ``ContractFunction.call`` would."""
+        values = self.web3.codec.decode(pending.output_types, return_data)
+        values = [normalize_output(abi_type, value) for abi_type, value in zip(pending.output_types, values)]
+        if len(values) == 1:
+            return values[0]
+        return values
+
+
+async def call_many(
+    web3: Any,
+    calls: Sequence[Tuple[str, bytes]],
+    multicall: Optional[Multicall] = None,
+    chunk_size: int = 500,
+    max_concurrency: int = 8,
+    block_identifier: Any = "latest"
+) -> List[Tuple[bool, bytes]]:
+    """Execute many raw read calls with as few requests as possible.
+
+    Uses chunked ``aggregate3`` calls when ``multicall`` is given, and
+    otherwise bounded concurrent ``eth_call`` requests. Failed calls are
+    reported as ``(False, b"")`` rather than raised.
+
+    Args:
+        web3: Web3 or AsyncWeb3 instance
+        calls: ``(target, calldata)`` pairs
+        multicall: Optional Multicall3 batcher
+        chunk_size: Calls per ``aggregate3`` request
+        max_concurrency: Requests in flight at once
+        block_identifier: Block to read at, so all results are consistent
+
+    Returns:
+        ``(success, return_data)`` per call, in order
+    """
+    if multicall is not None:
+        try:
+            return await multicall.aggregate(calls, chunk_size, max_concurrency, block_identifier)
+        except MulticallError as e:
+            logger.warning(f"Multicall scan of {len(calls)} calls failed, falling back to eth_call: {str(e)}")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_call(target: str, calldata: bytes) -> Tuple[bool, bytes]:
+        async with semaphore:
+            try:
+                result = await call_web3(web3.eth.call, {"to": target, "data": HexBytes(calldata)}, block_identifier)
+                return True, bytes(result)
+            except Exception as e:
+                logger.debug(f"eth_call to {target} failed: {str(e)}")
+                return False, b""
+
+    return list(await asyncio.gather(*(run_call(target, calldata) for target, calldata in calls)))
@@ -1,86 +1,156 @@
-"""Rate limiting utilities for GOAT SDK."""
+"""Rate limiting utilities for GOAT SDK.
+
+``RateLimiter`` is a token bucket implemented with GCRA: it keeps a single
+"theoretical arrival time" instead of a token count, so a caller's wait is
+computed and its slot reserved in one step, and waiters then sleep
+concurrently instead of queueing behind a lock. Requests can carry a weight
+(the tokens they cost). ``get_rate_limiter`` returns process-wide buckets by
+name and key (e.g. per IP or per address), shared by the ``rate_limit``
+decorator and plugins that limit their own requests.
+"""
 
 import time
 import asyncio
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, Optional, Tuple, Union
 from functools import wraps
 
 class RateLimiter:
-    """Rate limiter implementation using token bucket algorithm."""
-    
-    def __init__(self, rate: float, burst: int):
+    """Rate limiter implementation using token bucket algorithm (GCRA)."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
         """Initialize rate limiter.
-        
+
         Args:
             rate: Rate limit in tokens per second
             burst: Maximum burst size (token bucket capacity)
+            clock: Monotonic clock, injectable for tests
         """
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate must be positive and burst at least 1")
         self.rate = rate
         self.burst = burst
-        self.tokens = burst
-        self.last_time = time.monotonic()
-        self._lock = asyncio.Lock()
-    
-    async def acquire(self) -> bool:
-        """Acquire a token from the bucket.
-        
+        self._clock = clock
+        self._interval = 1.0 / rate
+        # Time at which the bucket is full again; in the past when it already is
+        self._tat = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return max(0.0, self.burst - max(0.0, self._tat - self._clock()) / self._interval)
+
+    def _schedule(self, weight: float) -> Tuple[float, float]:
+        now = self._clock()
+        tat = max(self._tat, now) + weight * self._interval
+        return tat, max(0.0, tat - self.burst * self._interval - now)
+
+    def reserve(self, weight: float = 1) -> float:
+        """Reserve ``weight`` tokens.
+
         Returns:
-            True if token was acquired, False otherwise
+            Seconds to wait before the reserved tokens may be used
         """
-        async with self._lock:
-            now = time.monotonic()
-            time_passed = now - self.last_time
-            self.tokens = min(
-                self.burst,
-                self.tokens + time_passed * self.rate
-            )
-            
-            if self.tokens >= 1:
-                self.tokens -= 1
-                self.last_time = now
-                return True
+        self._tat, delay = self._schedule(weight)
+        return delay
+
+    def refund(self, weight: float = 1) -> None:
+        """Return tokens reserved by a caller that gave up waiting."""
+        self._tat = max(self._clock(), self._tat - weight * self._interval)
+
+    async def acquire(self, weight: float = 1) -> bool:
+        """Acquire tokens from the bucket without waiting.
+
+        Args:
+            weight: Tokens the request costs
+
+        Returns:
+            True if the tokens were acquired, False otherwise
+        """
+        tat, delay = self._schedule(weight)
+        if delay > 0:
             return False
+        self._tat = tat
+        return True
+
+    async def wait(self, weight: float = 1) -> None:
+        """Acquire tokens from the bucket, waiting until they are available.
+
+        Waiting callers do not block each other; each sleeps until its own
+        reserved slot.
+
+        Args:
+            weight: Tokens the request costs
+        """
+        delay = self.reserve(weight)
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.refund(weight)
+            raise
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(name: str, rate: float, burst: int, key: str = "default") -> RateLimiter:
+    """Get a process-wide rate limiter bucket.
+
+    The first call for a ``(name, key)`` pair creates the bucket; later calls
+    share it and ignore ``rate`` and ``burst``.
+
+    Args:
+        name: Limit name, e.g. ``"hyperliquid.weight"``
+        rate: Rate limit in tokens per second
+        burst: Maximum burst size
+        key: Bucket within the limit, e.g. an IP or address
+
+    Returns:
+        Shared rate limiter
+    """
+    limiter = _limiters.get((name, key))
+    if limiter is None:
+        limiter = _limiters[(name, key)] = RateLimiter(rate, burst)
+    return limiter
 
 def rate_limit(
     rate: float,
     burst: int,
-    key_func: Callable[..., str] = None
+    key_func: Callable[..., str] = None,
+    name: Optional[str] = None,
+    weight: Union[float, Callable[..., float]] = 1
 ) -> Callable:
     """Decorator to apply rate limiting to a function.
-    
+
     Args:
         rate: Rate limit in calls per second
         burst: Maximum burst size
         key_func: Optional function to generate rate limit key from arguments
-        
+        name: Shared limit name (see ``get_rate_limiter``); defaults to the
+            function's qualified name
+        weight: Tokens each call costs, or a function computing them from the arguments
+
     Returns:
         Decorator function that applies rate limiting
     """
-    limiters: Dict[str, RateLimiter] = {}
-    
-    def get_limiter(key: str) -> RateLimiter:
-        if key not in limiters:
-            limiters[key] = RateLimiter(rate, burst)
-        return limiters[key]
-    
     def decorator(func: Callable) -> Callable:
+        limit_name = name or f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Get rate limit key
             key = "default"
             if key_func:
                 key = key_func(*args, **kwargs)
-            
-            # Get or create limiter for this key
-            limiter = get_limiter(key)
-            
-            # Try to acquire token
-            while not await limiter.acquire():
-                await asyncio.sleep(1.0 / rate)
-            
+
+            # Wait for this key's bucket
+            limiter = get_rate_limiter(limit_name, rate, burst, key)
+            await limiter.wait(weight(*args, **kwargs) if callable(weight) else weight)
+
             # Execute function
             return await func(*args, **kwargs)
-        
+
         return wrapper
-    
+
     return decorator
@@ -0,0 +1,195 @@
+"""Pooled Solana RPC clients for GOAT SDK.
+
+``SolanaConnectionManager`` keeps one ``AsyncClient`` per RPC endpoint, on an
+HTTP connection pool with keep-alive and a bound on concurrent requests, so
+plugins stop opening (and leaking) a client and TLS session per call.
+Plugins ``acquire`` a connection when created and ``release`` it in
+``cleanup()``; a client is closed once no plugin holds it. Given several
+endpoints, the connection fails over to the next one on transport errors.
+"""
+
+import inspect
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import httpx
+from solana.exceptions import SolanaRpcException
+from solana.rpc.async_api import AsyncClient
+
+logger = logging.getLogger(__name__)
+
+# Concurrent HTTP requests per endpoint; further requests wait for a free connection
+SOLANA_MAX_CONCURRENT_REQUESTS = int(os.getenv("GOAT_SOLANA_MAX_CONCURRENT_REQUESTS", "32"))
+
+# Request timeout and idle keep-alive in seconds
+SOLANA_RPC_TIMEOUT = float(os.getenv("GOAT_SOLANA_RPC_TIMEOUT", "30"))
+SOLANA_KEEPALIVE_EXPIRY = float(os.getenv("GOAT_SOLANA_KEEPALIVE_EXPIRY", "60"))
+
+# Seconds a failed endpoint is skipped before being tried again
+SOLANA_FAILOVER_COOLDOWN = float(os.getenv("GOAT_SOLANA_FAILOVER_COOLDOWN", "30"))
+
+# Errors meaning the endpoint could not be reached, as opposed to RPC errors
+FAILOVER_ERRORS = (SolanaRpcException, httpx.TransportError)
+
+Endpoints = Union[str, Sequence[str]]
+
+
+def _endpoint_list(endpoints: Endpoints) -> List[str]:
+    endpoints = [endpoints] if isinstance(endpoints, str) else list(dict.fromkeys(endpoints))
+    if not endpoints:
+        raise ValueError("At least one Solana RPC endpoint is required")
+    return endpoints
+
+
+class FailoverConnection:
+    """``AsyncClient`` stand-in spreading calls over several endpoints.
+
+    RPC methods are called on the first endpoint not in cooldown; if it
+    cannot be reached, the endpoint is put in cooldown and the call moves to
+    the next one. RPC errors (e.g. a failed simulation) are raised as-is.
+    Other attributes come from the primary endpoint's client.
+    """
+
+    def __init__(self, manager: "SolanaConnectionManager", endpoints: Sequence[str]):
+        self._manager = manager
+        self.endpoints = list(endpoints)
+
+    @property
+    def endpoint_url(self) -> str:
+        return self.endpoints[0]
+
+    def _ordered(self) -> List[str]:
+        now = time.monotonic()
+        healthy = [endpoint for endpoint in self.endpoints if self._manager._failed_until.get(endpoint, 0) <= now]
+        return healthy + [endpoint for endpoint in self.endpoints if endpoint not in healthy]
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._manager.get_client(self.endpoints[0]), name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            error: Optional[Exception] = None
+            for endpoint in self._ordered():
+                try:
+                    return await getattr(self._manager.get_client(endpoint), name)(*args, **kwargs)
+                except FAILOVER_ERRORS as e:
+                    error = e
+                    self._manager._mark_failed(endpoint)
+                    logger.warning(f"Solana RPC {name} failed on {endpoint}, failing over: {str(e)}")
+            raise error
+
+        return call
+
+
+class SolanaConnectionManager:
+    """One pooled ``AsyncClient`` per Solana RPC endpoint."""
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = SOLANA_MAX_CONCURRENT_REQUESTS,
+        timeout: float = SOLANA_RPC_TIMEOUT,
+        keepalive_expiry: float = SOLANA_KEEPALIVE_EXPIRY,
+        failover_cooldown: float = SOLANA_FAILOVER_COOLDOWN,
+    ):
+        """Initialize connection manager.
+
+        Args:
+            max_concurrent_requests: Concurrent HTTP requests per endpoint
+            timeout: Request timeout in seconds (waiting for a pooled
+                connection is not limited)
+            keepalive_expiry: Seconds idle connections are kept open
+            failover_cooldown: Seconds a failed endpoint is skipped
+        """
+        self.max_concurrent_requests = max_concurrent_requests
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.failover_cooldown = failover_cooldown
+        self._clients: Dict[str, AsyncClient] = {}
+        self._references: Dict[str, int] = {}
+        self._failed_until: Dict[str, float] = {}
+
+    def _create_client(self, endpoint: str) -> AsyncClient:
+        client = AsyncClient(endpoint, timeout=self.timeout)
+        # Replace the provider's default HTTP client with a bounded keep-alive pool
+        client._provider.session = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout, pool=None),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent_requests,
+                max_keepalive_connections=self.max_concurrent_requests,
+                keepalive_expiry=self.keepalive_expiry
+            )
+        )
+        logger.debug(f"Created pooled Solana client for {endpoint}")
+        return client
+
+    def _mark_failed(self, endpoint: str) -> None:
+        self._failed_until[endpoint] = time.monotonic() + self.failover_cooldown
+
+    def get_client(self, endpoint: str) -> AsyncClient:
+        """Get the pooled client of one endpoint, creating it on first use."""
+        client = self._clients.get(endpoint)
+        if client is None:
+            client = self._clients[endpoint] = self._create_client(endpoint)
+        return client
+
+    def get_connection(self, endpoints: Endpoints) -> Union[AsyncClient, FailoverConnection]:
+        """Borrow a connection without holding a reference.
+
+        The clients are closed when the last ``acquire`` holder releases
+        them, so code awaiting requests on the connection should ``acquire``
+        it instead.
+
+        Args:
+            endpoints: RPC endpoint, or endpoints in failover order
+
+        Returns:
+            The endpoint's pooled client, or a failover connection over several endpoints
+        """
+        endpoints = _endpoint_list(endpoints)
+        if len(endpoints) == 1:
+            return self.get_client(endpoints[0])
+        return FailoverConnection(self, endpoints)
+
+    def acquire(self, endpoints: Endpoints) -> Union[AsyncClient, FailoverConnection]:
+        """Get a connection and hold its clients open until ``release``."""
+        endpoints = _endpoint_list(endpoints)
+        for endpoint in endpoints:
+            self._references[endpoint] = self._references.get(endpoint, 0) + 1
+        return self.get_connection(endpoints)
+
+    async def release(self, endpoints: Endpoints) -> None:
+        """Drop a reference taken by ``acquire``, closing clients no longer held."""
+        for endpoint in _endpoint_list(endpoints):
+            references = self._references.get(endpoint, 0) - 1
+            if references > 0:
+                self._references[endpoint] = references
+                continue
+            self._references.pop(endpoint, None)
+            await self._close(endpoint)
+
+    async def _close(self, endpoint: str) -> None:
+        client = self._clients.pop(endpoint, None)
+        if client is not None:
+            await client.close()
+            logger.debug(f"Closed pooled Solana client for {endpoint}")
+
+    async def close(self) -> None:
+        """Close every pooled client."""
+        for endpoint in list(self._clients):
+            await self._close(endpoint)
+        self._references.clear()
+
+
+_manager: Optional[SolanaConnectionManager] = None
+
+
+def get_solana_connection_manager() -> SolanaConnectionManager:
+    """Get the process-wide Solana connection manager."""
+    global _manager
+    if _manager is None:
+        _manager = SolanaConnectionManager()
+    return _manager
+
@@ -0,0 +1,331 @@
+"""Transaction pipelining utilities for GOAT SDK.
+
+``NonceManager`` hands out nonces for an account locally, so transactions can
+be signed and broadcast back-to-back instead of one per block.
+``ReceiptPoller`` tracks any number of pending transactions with a single
+polling task, and ``TransactionPipeline`` combines both with a bound on the
+number of unconfirmed transactions in flight.
+"""
+
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+from ..exceptions import TimeoutError as GoatTimeoutError
+from ..exceptions import TransactionError
+from .async_web3 import call_web3
+
+logger = logging.getLogger(__name__)
+
+# Node error messages meaning the local nonce is behind the chain
+NONCE_TOO_LOW_ERRORS = ("nonce too low", "replacement transaction underpriced", "nonce has already been used")
+ALREADY_KNOWN_ERRORS = ("already known", "known transaction", "already imported")
+
+
+def _error_message(error: Exception) -> str:
+    if error.args and isinstance(error.args[0], dict):
+        return str(error.args[0].get("message", "")).lower()
+    return str(error).lower()
+
+
+def _raw_transaction(signed: Any) -> Any:
+    # eth-account renamed rawTransaction to raw_transaction in 0.12
+    return getattr(signed, "raw_transaction", None) or signed.rawTransaction
+
+
+def _hash_key(tx_hash: Any) -> str:
+    return (tx_hash if isinstance(tx_hash, str) else Web3.to_hex(tx_hash)).lower()
+
+
+class NonceManager:
+    """Local nonce reservation for one account.
+
+    Nonces are read from the chain once and then handed out locally.
+    Nonces whose transaction was never broadcast are released and reused
+    first, so a failed send does not leave a gap that stalls later
+    transactions. A reserved nonce is outstanding until it is marked
+    broadcast or released; ``resync`` reloads the pending count from the
+    node but never moves below an outstanding nonce, so a nonce still being
+    signed or sent is not handed out twice.
+    """
+
+    def __init__(self, web3: Any, address: str):
+        """Initialize nonce manager.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            address: Account address
+        """
+        self.web3 = web3
+        self.address = address
+        self._next: Optional[int] = None
+        self._released: List[int] = []
+        self._outstanding: Set[int] = set()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Managers are shared process-wide, so bind the lock to the running loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def _pending_count(self) -> int:
+        return int(await call_web3(self.web3.eth.get_transaction_count, self.address, "pending"))
+
+    async def reserve(self) -> int:
+        """Reserve the next nonce."""
+        async with self._get_lock():
+            if self._next is None:
+                self._next = await self._pending_count()
+            if self._released:
+                nonce = heapq.heappop(self._released)
+            else:
+                nonce = self._next
+                self._next += 1
+            self._outstanding.add(nonce)
+            return nonce
+
+    def mark_broadcast(self, nonce: int) -> None:
+        """Settle a reserved nonce whose transaction reached the node."""
+        self._outstanding.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce whose transaction was not broadcast."""
+        self._outstanding.discard(nonce)
+        if self._next is not None and nonce < self._next and nonce not in self._released:
+            heapq.heappush(self._released, nonce)
+
+    async def resync(self) -> int:
+        """Reload the next nonce from the node's pending transaction count.
+
+        The next nonce is the pending count, or one past the highest
+        outstanding reservation if that is higher. Nonces between the pending
+        count and the next nonce that are not outstanding are reused first.
+
+        Returns:
+            Next nonce
+        """
+        async with self._get_lock():
+            pending = await self._pending_count()
+            self._next = max([pending] + [nonce + 1 for nonce in self._outstanding])
+            self._released = [nonce for nonce in range(pending, self._next) if nonce not in self._outstanding]
+            heapq.heapify(self._released)
+            logger.info(f"Resynced nonce for {self.address} to {self._next}")
+            return self._next
+
+
+_nonce_managers: Dict[Tuple[Any, str], NonceManager] = {}
+
+
+def get_nonce_manager(web3: Any, chain_id: Any, address: str) -> NonceManager:
+    """Get the process-wide nonce manager of an account on a chain.
+
+    Args:
+        web3: Web3 or AsyncWeb3 instance used on first creation
+        chain_id: Chain ID
+        address: Account address
+
+    Returns:
+        Shared nonce manager
+    """
+    key = (chain_id, address.lower())
+    manager = _nonce_managers.get(key)
+    if manager is None:
+        manager = _nonce_managers[key] = NonceManager(web3, address)
+    return manager
+
+
+class ReceiptPoller:
+    """Waits for transaction receipts using one shared polling task."""
+
+    def __init__(self, web3: Any, poll_interval: float = 1.0, max_batch_size: int = 100):
+        """Initialize receipt poller.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            poll_interval: Seconds between polling rounds
+            max_batch_size: Receipts requested concurrently per round
+        """
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, Tuple[Any, asyncio.Future]] = {}
+        self._waiters: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of transactions being tracked."""
+        return len(self._pending)
+
+    async def wait(self, tx_hash: Any, timeout: Optional[float] = None) -> Any:
+        """Wait for a transaction receipt.
+
+        Args:
+            tx_hash: Transaction hash
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Transaction receipt
+
+        Raises:
+            TimeoutError: If no receipt is found within ``timeout`` (GOAT error)
+        """
+        key = _hash_key(tx_hash)
+        if key not in self._pending:
+            self._pending[key] = (tx_hash, asyncio.get_running_loop().create_future())
+        future = self._pending[key][1]
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise GoatTimeoutError(
+                f"Transaction {key} not mined within {timeout}s",
+                context={"transaction_hash": key}
+            ) from None
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                # Stop polling hashes nobody waits for (e.g. dropped transactions)
+                del self._waiters[key]
+                self._pending.pop(key, None)
+
+    async def _fetch(self, tx_hash: Any) -> Any:
+        try:
+            return await call_web3(self.web3.eth.get_transaction_receipt, tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _run(self) -> None:
+        while self._pending:
+            keys = list(self._pending)
+            for start in range(0, len(keys), self.max_batch_size):
+                chunk = [key for key in keys[start:start + self.max_batch_size] if key in self._pending]
+                results = await asyncio.gather(
+                    *(self._fetch(self._pending[key][0]) for key in chunk),
+                    return_exceptions=True
+                )
+                for key, result in zip(chunk, results):
+                    if isinstance(result, Exception):
+                        logger.debug(f"Receipt lookup for {key} failed: {result}")
+                        continue
+                    entry = self._pending.get(key)
+                    if result is not None and entry is not None and not entry[1].done():
+                        entry[1].set_result(result)
+                        del self._pending[key]
+            if self._pending:
+                await asyncio.sleep(self.poll_interval)
+
+
+@dataclass
+class PendingTransaction:
+    """A broadcast transaction whose receipt is tracked in the background."""
+    tx_hash: Any
+    nonce: int
+    _receipt: asyncio.Future
+
+    async def wait(self) -> Any:
+        """Wait for the transaction receipt."""
+        return await asyncio.shield(self._receipt)
+
+    def done(self) -> bool:
+        """Whether the receipt is available (or tracking failed)."""
+        return self._receipt.done()
+
+
+class TransactionPipeline:
+    """Signs and broadcasts transactions back-to-back with local nonces."""
+
+    def __init__(
+        self,
+        web3: Any,
+        account: Any,
+        nonce_manager: NonceManager,
+        receipt_poller: Optional[ReceiptPoller] = None,
+        max_in_flight: int = 64,
+        receipt_timeout: Optional[float] = 120,
+        max_nonce_retries: int = 3
+    ):
+        """Initialize pipeline.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance
+            account: Local account used for signing
+            nonce_manager: Nonce manager of ``account``
+            receipt_poller: Shared receipt poller (created if not given)
+            max_in_flight: Maximum unconfirmed transactions at once
+            receipt_timeout: Seconds to wait for each receipt
+            max_nonce_retries: Resend attempts after nonce errors
+        """
+        self.web3 = web3
+        self.account = account
+        self.nonce_manager = nonce_manager
+        self.receipt_poller = receipt_poller or ReceiptPoller(web3)
+        self.max_in_flight = max_in_flight
+        self.receipt_timeout = receipt_timeout
+        self.max_nonce_retries = max_nonce_retries
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    async def submit(self, transaction: Dict[str, Any]) -> PendingTransaction:
+        """Sign and broadcast a transaction without waiting for its receipt.
+
+        Args:
+            transaction: Transaction fields; ``nonce`` is assigned here
+
+        Returns:
+            Pending transaction
+
+        Raises:
+            TransactionError: If the transaction could not be broadcast
+        """
+        await self._slots.acquire()
+        try:
+            tx_hash, nonce = await self._broadcast(transaction)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        receipt = asyncio.ensure_future(self._track(tx_hash))
+        # Failures surface through PendingTransaction.wait; don't log them as unretrieved
+        receipt.add_done_callback(lambda future: future.cancelled() or future.exception())
+        return PendingTransaction(tx_hash=tx_hash, nonce=nonce, _receipt=receipt)
+
+    async def _broadcast(self, transaction: Dict[str, Any]) -> Tuple[Any, int]:
+        for attempt in range(self.max_nonce_retries + 1):
+            nonce = await self.nonce_manager.reserve()
+            signed = self.web3.eth.account.sign_transaction(dict(transaction, nonce=nonce), self.account.key)
+            try:
+                tx_hash = await call_web3(self.web3.eth.send_raw_transaction, _raw_transaction(signed))
+                logger.debug(f"Broadcast transaction {tx_hash} with nonce {nonce}")
+                self.nonce_manager.mark_broadcast(nonce)
+                return tx_hash, nonce
+            except Exception as e:
+                message = _error_message(e)
+                if any(error in message for error in ALREADY_KNOWN_ERRORS):
+                    self.nonce_manager.mark_broadcast(nonce)
+                    return signed.hash, nonce
+                if any(error in message for error in NONCE_TOO_LOW_ERRORS) and attempt < self.max_nonce_retries:
+                    logger.warning(f"Nonce {nonce} rejected ({message}), resyncing")
+                    # The nonce is used on chain; resync drops it unless it is still ahead of the node
+                    self.nonce_manager.release(nonce)
+                    await self.nonce_manager.resync()
+                    continue
+                self.nonce_manager.release(nonce)
+                raise TransactionError(f"Failed to send transaction: {str(e)}", parent=e) from e
+
+    async def _track(self, tx_hash: Any) -> Any:
+        try:
+            return await self.receipt_poller.wait(tx_hash, self.receipt_timeout)
+        finally:
+            self._slots.release()
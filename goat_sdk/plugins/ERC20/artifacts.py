@@ -0,0 +1,188 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/ERC20/artifacts.py
+"""
+
+"""Precompiled contract artifacts shipped with the ERC20 plugin.
+
+Artifacts live in ``artifacts/`` as JSON (ABI, bytecode, source hash and
+compiler version). ``manifest.json`` records the SHA-256 of each artifact file
+and is checked on load, so a corrupted or hand-edited artifact fails loudly
+instead of deploying unexpected bytecode.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+MANIFEST_FILE = "manifest.json"
+
+
+class ArtifactIntegrityError(ValueError):
+    """Raised when an artifact does not match its manifest hash."""
+
+
+@dataclass(frozen=True)
+class ContractArtifact:
+    """Compiled contract ABI and bytecode."""
+    contract_name: str
+    abi: List[Dict[str, Any]]
+    bytecode: Optional[str]
+    source_hash: str
+    solc_version: str
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _read_manifest(artifacts_dir: Path) -> Dict[str, str]:
+    manifest_path = artifacts_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_artifact(contract_name: str, artifacts_dir: Path = ARTIFACTS_DIR) -> ContractArtifact:
+    """Read and verify an artifact.
+
+    Args:
+        contract_name: Contract name, e.g. ``"TestToken"``
+        artifacts_dir: Directory holding the artifacts and manifest
+
+    Returns:
+        Verified contract artifact
+
+    Raises:
+        FileNotFoundError: If the artifact does not exist
+        ArtifactIntegrityError: If the artifact hash does not match the manifest
+    """
+    filename = f"{contract_name}.json"
+    path = Path(artifacts_dir) / filename
+    expected = _read_manifest(Path(artifacts_dir)).get(filename)
+    actual = file_hash(path)
+    if expected != actual:
+        raise ArtifactIntegrityError(
+            f"Artifact {filename} hash {actual} does not match manifest hash {expected}"
+        )
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return ContractArtifact(
+        contract_name=data["contract_name"],
+        abi=data["abi"],
+        bytecode=data.get("bytecode"),
+        source_hash=data["source_hash"],
+        solc_version=data["solc_version"]
+    )
+
+
+@lru_cache(maxsize=None)
+def load_artifact(contract_name: str = "TestToken") -> ContractArtifact:
+    """Load a packaged artifact once per process."""
+    artifact = read_artifact(contract_name)
+    logger.debug(f"Loaded precompiled {contract_name} artifact (source hash {artifact.source_hash[:12]})")
+    return artifact
+
+
+def write_artifact(
+    contract_name: str,
+    abi: List[Dict[str, Any]],
+    bytecode: Optional[str],
+    source_hash: str,
+    solc_version: str,
+    artifacts_dir: Path = ARTIFACTS_DIR
+) -> Path:
+    """Write an artifact and record its hash in the manifest.
+
+    Returns:
+        Path of the written artifact
+    """
+    artifacts_dir = Path(artifacts_dir)
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    filename = f"{contract_name}.json"
+    path = artifacts_dir / filename
+    data = {
+        "contract_name": contract_name,
+        "solc_version": solc_version,
+        "source_hash": source_hash,
+        "abi": abi,
+        "bytecode": bytecode
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+    manifest = _read_manifest(artifacts_dir)
+    manifest[filename] = file_hash(path)
+    with open(artifacts_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+        f.write("\n")
+
+    if artifacts_dir == ARTIFACTS_DIR:
+        load_artifact.cache_clear()
+    return path
+
+
+def get_bytecode(contract_name: str = "TestToken", allow_compile: bool = False) -> str:
+    """Get deployable bytecode, compiling only when explicitly allowed.
+
+    Args:
+        contract_name: Contract name
+        allow_compile: Compile with solc (cached on disk) when the artifact
+            ships without bytecode
+
+    Returns:
+        Contract bytecode
+
+    Raises:
+        ValueError: If no bytecode is packaged and compilation is not allowed
+    """
+    artifact = load_artifact(contract_name)
+    if artifact.bytecode:
+        return artifact.bytecode
+    if not allow_compile:
+        raise ValueError(
+            f"No precompiled bytecode for {contract_name}; enable allow_compile or run "
+            "`python -m goat_sdk.plugins.ERC20.compile_contract` to build the artifact"
+        )
+
+    from .compile_contract import compile_contract
+
+    _, bytecode = compile_contract()
+    return bytecode
@@ -0,0 +1,140 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/ERC20/balances.py
+"""
+
+"""Batch ERC20 balance and allowance scanning.
+
+Reads for every (token, account) pair are encoded once from the registry's
+precomputed selectors, sent in chunked Multicall3 requests and decoded
+straight into a dense NumPy matrix, skipping per-call contract objects and
+Pydantic models.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from web3 import Web3
+
+from goat_sdk.core.utils.abi_registry import AbiFunction
+from goat_sdk.core.utils.multicall import Multicall, call_many
+
+# Calls per aggregate3 request; keeps each eth_call well under provider gas and payload limits
+SCAN_CHUNK_SIZE = 500
+
+
+@dataclass
+class TokenMatrix:
+    """Token x account matrix of uint256 reads.
+
+    ``values[i, j]`` holds the result for ``tokens[i]`` and ``accounts[j]``
+    as a Python int (object dtype, since uint256 overflows int64); cells
+    whose call failed are 0 with ``ok[i, j]`` False.
+    """
+    tokens: List[str]
+    accounts: List[str]
+    values: np.ndarray
+    ok: np.ndarray
+    block_identifier: Any = "latest"
+    _token_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    _account_index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._token_index = {token.lower(): i for i, token in enumerate(self.tokens)}
+        self._account_index = {account.lower(): j for j, account in enumerate(self.accounts)}
+
+    def get(self, token: str, account: str) -> Optional[int]:
+        """Value for one token and account, or None if the call failed."""
+        i, j = self._token_index[token.lower()], self._account_index[account.lower()]
+        return int(self.values[i, j]) if self.ok[i, j] else None
+
+    def to_columns(self) -> Dict[str, list]:
+        """Columnar (long-format) view, one row per token and account."""
+        account_count = len(self.accounts)
+        return {
+            "token": [token for token in self.tokens for _ in range(account_count)],
+            "account": self.accounts * len(self.tokens),
+            "value": self.values.ravel().tolist(),
+            "ok": self.ok.ravel().tolist()
+        }
+
+
+def _decode_uint(data: bytes) -> Tuple[bool, int]:
+    if len(data) < 32:
+        return False, 0
+    return True, int.from_bytes(data[:32], "big")
+
+
+async def scan_token_matrix(
+    web3: Any,
+    function: AbiFunction,
+    tokens: Sequence[str],
+    accounts: Sequence[str],
+    args: Callable[[str], Tuple[Any, ...]],
+    multicall: Optional[Multicall] = None,
+    chunk_size: int = SCAN_CHUNK_SIZE,
+    block_identifier: Any = "latest"
+) -> TokenMatrix:
+    """Call a uint256 view function for every token and account.
+
+    Args:
+        web3: Web3 or AsyncWeb3 instance
+        function: Function to call, e.g. ``balanceOf``
+        tokens: Token addresses (matrix rows)
+        accounts: Account addresses (matrix columns)
+        args: Maps an account to the function arguments
+        multicall: Optional Multicall3 batcher
+        chunk_size: Calls per aggregate3 request
+        block_identifier: Block to read at
+
+    Returns:
+        Dense result matrix
+    """
+    tokens = [Web3.to_checksum_address(token) for token in tokens]
+    accounts = [Web3.to_checksum_address(account) for account in accounts]
+
+    # Calldata depends only on the account, so encode each column once
+    calldata = [function.encode_input(*args(account)) for account in accounts]
+    calls = [(token, data) for token in tokens for data in calldata]
+    results = await call_many(web3, calls, multicall, chunk_size=chunk_size, block_identifier=block_identifier)
+
+    values = np.zeros(len(calls), dtype=object)
+    ok = np.zeros(len(calls), dtype=bool)
+    for index, (success, data) in enumerate(results):
+        if success:
+            ok[index], values[index] = _decode_uint(data)
+    shape = (len(tokens), len(accounts))
+    return TokenMatrix(
+        tokens=tokens,
+        accounts=accounts,
+        values=values.reshape(shape),
+        ok=ok.reshape(shape),
+        block_identifier=block_identifier
+    )
@@ -29,55 +29,91 @@
      Path: examples/hyperliquid/ai_trading_agent.py
 """
 
-"""Compile Solidity contracts."""
+"""Compile Solidity contracts.
 
+Compilation is opt-in: the plugin ships a precompiled artifact (see
+``artifacts.py``). Compiled output is cached on disk keyed by the hash of the
+Solidity sources, so solc is downloaded and run at most once per source
+revision. Run ``python -m goat_sdk.plugins.ERC20.compile_contract`` to
+regenerate the packaged artifact.
+"""
+
+import hashlib
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Tuple
-from solcx import compile_standard, install_solc
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SOLC_VERSION = "0.8.20"
+CONTRACT_NAME = "TestToken"
+
+# OpenZeppelin sources imported by the contract
+OZ_FILES = [
+    "token/ERC20/ERC20.sol",
+    "token/ERC20/IERC20.sol",
+    "token/ERC20/extensions/IERC20Metadata.sol",
+    "utils/Context.sol",
+    "interfaces/draft-IERC6093.sol"
+]
+
+# On-disk cache of compiled artifacts, keyed by source hash
+COMPILE_CACHE_DIR = Path(os.getenv("GOAT_SOLC_CACHE_DIR", str(Path.home() / ".cache" / "goat_sdk" / "solc")))
+
+
+def read_sources() -> Dict[str, Dict[str, str]]:
+    """Read the contract and OpenZeppelin sources in solc standard-JSON form."""
+    contract_path = Path(__file__).parent / "contracts" / f"{CONTRACT_NAME}.sol"
+    oz_contracts = Path(__file__).parent / "node_modules" / "@openzeppelin" / "contracts"
+
+    with open(contract_path, "r", encoding="utf-8") as f:
+        sources = {f"{CONTRACT_NAME}.sol": {"content": f.read()}}
+
+    for oz_file in OZ_FILES:
+        with open(oz_contracts / oz_file, "r", encoding="utf-8") as f:
+            sources[f"@openzeppelin/contracts/{oz_file}"] = {"content": f.read()}
+    return sources
+
+
+def source_hash(sources: Optional[Dict[str, Dict[str, str]]] = None) -> str:
+    """SHA-256 of the compiler version and all sources."""
+    sources = sources if sources is not None else read_sources()
+    digest = hashlib.sha256(SOLC_VERSION.encode())
+    for path in sorted(sources):
+        digest.update(path.encode())
+        digest.update(b"\0")
+        digest.update(sources[path]["content"].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
+def compile_contract(cache_dir: Optional[Path] = None) -> Tuple[dict, str]:
+    """Compile the TestToken contract, reusing the on-disk cache when possible.
+
+    Args:
+        cache_dir: Artifact cache directory (defaults to ``COMPILE_CACHE_DIR``)
 
-def compile_contract() -> Tuple[dict, str]:
-    """Compile the TestToken contract.
-    
     Returns:
         Tuple containing the contract ABI and bytecode.
     """
-    # Install solc
-    install_solc("0.8.20")
+    sources = read_sources()
+    digest = source_hash(sources)
+    cache_path = Path(cache_dir or COMPILE_CACHE_DIR) / f"{CONTRACT_NAME}-{digest}.json"
 
-    # Get contract path and node_modules path
-    contract_path = Path(__file__).parent / "contracts" / "TestToken.sol"
-    node_modules = Path(__file__).parent / "node_modules"
-    oz_contracts = node_modules / "@openzeppelin/contracts"
+    if cache_path.exists():
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        logger.debug(f"Loaded compiled {CONTRACT_NAME} from {cache_path}")
+        return cached["abi"], cached["bytecode"]
 
-    # Read contract source
-    with open(contract_path, "r", encoding="utf-8") as f:
-        contract_source = f.read()
-
-    # Read OpenZeppelin sources
-    sources = {
-        "TestToken.sol": {
-            "content": contract_source
-        }
-    }
-
-    # Add OpenZeppelin sources
-    oz_files = [
-        "token/ERC20/ERC20.sol",
-        "token/ERC20/IERC20.sol",
-        "token/ERC20/extensions/IERC20Metadata.sol",
-        "utils/Context.sol",
-        "interfaces/draft-IERC6093.sol"
-    ]
-
-    for oz_file in oz_files:
-        with open(oz_contracts / oz_file, "r", encoding="utf-8") as f:
-            sources[f"@openzeppelin/contracts/{oz_file}"] = {
-                "content": f.read()
-            }
+    # py-solc-x is an optional dependency, only needed to compile
+    from solcx import compile_standard, install_solc
 
-    # Compile contract
+    logger.info(f"Compiling {CONTRACT_NAME} with solc {SOLC_VERSION}")
+    install_solc(SOLC_VERSION)
+    node_modules = Path(__file__).parent / "node_modules"
     compiled_sol = compile_standard(
         {
             "language": "Solidity",
@@ -90,22 +126,36 @@ def compile_contract() -> Tuple[dict, str]:
                 }
             }
         },
-        solc_version="0.8.20",
+        solc_version=SOLC_VERSION,
         allow_paths=[str(node_modules)]
     )
 
     # Extract ABI and bytecode
-    abi = compiled_sol["contracts"]["TestToken.sol"]["TestToken"]["abi"]
-    bytecode = compiled_sol["contracts"]["TestToken.sol"]["TestToken"]["evm"]["bytecode"]["object"]
+    output = compiled_sol["contracts"][f"{CONTRACT_NAME}.sol"][CONTRACT_NAME]
+    abi = output["abi"]
+    bytecode = output["evm"]["bytecode"]["object"]
 
-    # Create build directory if it doesn't exist
-    build_dir = Path(__file__).parent / "build"
-    build_dir.mkdir(exist_ok=True)
-
-    # Write ABI and bytecode to files
-    with open(build_dir / "TestToken.abi", "w", encoding="utf-8") as f:
-        json.dump(abi, f, indent=2)
-    with open(build_dir / "TestToken.bin", "w", encoding="utf-8") as f:
-        f.write(bytecode)
+    # Write atomically so concurrent workers never read a partial file
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"abi": abi, "bytecode": bytecode, "source_hash": digest}, f)
+    os.replace(tmp_path, cache_path)
 
     return abi, bytecode
+
+
+def build_artifact() -> Path:
+    """Compile the contract and write it as the packaged artifact.
+
+    Returns:
+        Path of the written artifact
+    """
+    from .artifacts import write_artifact
+
+    abi, bytecode = compile_contract()
+    return write_artifact(CONTRACT_NAME, abi, bytecode, source_hash(), SOLC_VERSION)
+
+
+if __name__ == "__main__":
+    print(build_artifact())
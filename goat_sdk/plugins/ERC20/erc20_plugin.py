@@ -31,20 +31,27 @@
 """
 
 """ERC20 token plugin."""
-import json
+import asyncio
 import logging
 import os
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+import aiohttp
 from pydantic import BaseModel, Field
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 from web3.exceptions import ContractLogicError, TransactionNotFound
 from dotenv import load_dotenv
 
 from goat_sdk.core.plugin_base import PluginBase
 from goat_sdk.core.chain import Chain
+from goat_sdk.core.utils.abi_registry import get_abi_registry
+from goat_sdk.core.utils.async_web3 import call_web3, get_shared_session, is_async_web3
+from goat_sdk.core.utils.gas import GasOracle, get_gas_oracle
+from goat_sdk.core.utils.multicall import Multicall
+from goat_sdk.core.utils.transactions import PendingTransaction, TransactionPipeline, get_nonce_manager
 from .types import (
     DeployTokenParams,
     GetTokenInfoParams,
@@ -60,9 +67,10 @@ from .types import (
     GetTokenInfoBySymbolParams,
     GetTokenAllowanceParams
 )
-from .compile_contract import compile_contract
+from .artifacts import get_bytecode, load_artifact
+from .balances import TokenMatrix, scan_token_matrix
 from .mode_config import ModeNetwork, get_mode_config
-from .tokens import Token, get_token_by_symbol, DEFAULT_TOKENS
+from .tokens import Token, TokenRegistry, DEFAULT_TOKENS, get_token_registry
 
 # Load environment variables
 load_dotenv()
@@ -82,6 +90,10 @@ MODE_CONFIRMATION_BLOCKS = int(os.getenv("MODE_CONFIRMATION_BLOCKS", "1"))
 MODE_GAS_LIMIT_BUFFER = float(os.getenv("MODE_GAS_LIMIT_BUFFER", "1.2"))
 MODE_PRIORITY_FEE = int(os.getenv("MODE_PRIORITY_FEE", "1000000000"))
 MODE_TIMEOUT = float(os.getenv("MODE_TIMEOUT", "30.0"))
+MODE_MAX_IN_FLIGHT = int(os.getenv("MODE_MAX_IN_FLIGHT", "64"))
+
+# Registry id of the TestToken ABI
+ERC20_ABI_ID = "erc20.TestToken"
 
 
 class ERC20PluginCtorParams(BaseModel):
@@ -102,44 +114,104 @@ class ERC20PluginCtorParams(BaseModel):
         default=None,
         description="Optional list of tokens to use. If not provided, uses default tokens"
     )
+    token_lists: Optional[List[str]] = Field(
+        default=None,
+        description="Optional paths to token-list JSON files, parsed on the first symbol lookup"
+    )
+    multicall_address: Optional[str] = Field(
+        default=None,
+        description="Optional Multicall3 address overriding the per-chain default"
+    )
+    allow_compile: bool = Field(
+        default=False,
+        description="Allow compiling the token contract with solc (cached on disk) when deploying if the "
+                    "packaged artifact has no bytecode"
+    )
 
 
 class ERC20Plugin(PluginBase):
-    """Plugin for interacting with ERC20 tokens on Mode network."""
+    """Plugin for interacting with ERC20 tokens on Mode network.
+
+    All RPC traffic goes through ``AsyncWeb3``, so a slow node never blocks
+    the event loop. The chain is checked on the first call rather than in the
+    constructor.
+    """
 
     def __init__(self, params: ERC20PluginCtorParams):
         """Initialize the plugin."""
         super().__init__(name="erc20", tools=[self])
         logger.info("Initializing ERC20Plugin")
-        self.w3 = Web3(Web3.HTTPProvider(params.provider_url))
+        self.w3 = AsyncWeb3(AsyncHTTPProvider(
+            params.provider_url,
+            request_kwargs={"timeout": aiohttp.ClientTimeout(total=MODE_TIMEOUT)}
+        ))
         self.account = Account.from_key(params.private_key)
         self.network = params.network
         self.mode_config = get_mode_config(params.network)
         self.tokens = params.tokens or DEFAULT_TOKENS
-        logger.debug(f"Connected to network: {self.network.value}")
+        if params.tokens or params.token_lists:
+            self.token_registry = TokenRegistry(self.tokens)
+            for path in params.token_lists or []:
+                self.token_registry.load_token_list(path)
+        else:
+            self.token_registry = get_token_registry()
+        logger.debug(f"Using network: {self.network.value}")
         logger.debug(f"Account address: {self.account.address}")
 
-        # Load contract ABI and bytecode
-        build_dir = Path(__file__).parent / "build"
-        try:
-            with open(build_dir / "TestToken.abi", "r", encoding="utf-8") as f:
-                self.abi = json.load(f)
-            with open(build_dir / "TestToken.bin", "r", encoding="utf-8") as f:
-                self.bytecode = f.read()
-            logger.debug("Loaded contract ABI and bytecode from files")
-        except FileNotFoundError:
-            # Compile contract if ABI and bytecode files don't exist
-            logger.info("Contract files not found, compiling contract")
-            self.abi, self.bytecode = compile_contract()
-
-        # Get chain ID
-        chain_id = self.w3.eth.chain_id
+        # Load the precompiled contract ABI (verified and parsed once per process)
+        self.abi = get_abi_registry().load(ERC20_ABI_ID, lambda: load_artifact().abi).abi
+        self.allow_compile = params.allow_compile
+
+        # Resolved by _ensure_initialized on the first call
+        self.chain_id: Optional[int] = None
+        self.multicall: Optional[Multicall] = None
+        self.pipeline: Optional[TransactionPipeline] = None
+        self.gas_oracle: Optional[GasOracle] = None
+        self._multicall_address = params.multicall_address
+
+    async def _ensure_initialized(self) -> int:
+        """Read and validate the chain ID once, then set up Multicall3 batching.
+
+        Returns:
+            Chain ID of the connected network
+
+        Raises:
+            ValueError: If the chain is not supported
+        """
+        if self.chain_id is not None:
+            return self.chain_id
+
+        if isinstance(getattr(self.w3, "provider", None), AsyncHTTPProvider):
+            # Share one keep-alive connection pool across plugins and services
+            await self.w3.provider.cache_async_session(await get_shared_session())
+
+        chain_id = await self._eth_attribute("chain_id")
         chain = Chain(type="evm", chain_id=chain_id)
         if not self.supports_chain(chain):
             # For local testing, we'll allow non-Mode networks
             if chain_id not in [1337]:  # Ganache chain ID
                 raise ValueError(f"Chain {chain_id} is not supported")
-        logger.info(f"Successfully initialized ERC20Plugin on chain {chain_id}")
+
+        # Batch concurrent reads through Multicall3 when the chain has it
+        self.multicall = Multicall.for_chain(self.w3, chain_id, self._multicall_address)
+        # Fees come from cached fee history, shared by every plugin on this chain
+        self.gas_oracle = get_gas_oracle(self.w3, chain_id)
+        # Nonces are reserved locally and shared by every plugin using this account
+        self.pipeline = TransactionPipeline(
+            self.w3,
+            self.account,
+            get_nonce_manager(self.w3, chain_id, self.account.address),
+            max_in_flight=MODE_MAX_IN_FLIGHT
+        )
+        self.chain_id = chain_id
+        logger.info(f"ERC20Plugin connected to chain {chain_id}")
+        return chain_id
+
+    async def _eth_attribute(self, name: str) -> Any:
+        """Read an ``eth`` property such as ``gas_price`` without blocking the loop."""
+        if is_async_web3(self.w3):
+            return await getattr(self.w3.eth, name)
+        return await call_web3(lambda: getattr(self.w3.eth, name))
 
     def supports_chain(self) -> bool:
         """Check if the current chain is supported.
@@ -177,9 +249,32 @@ class ERC20Plugin(PluginBase):
             }
         )
 
-    def _validate_mode_network(self):
+    @property
+    def bytecode(self) -> str:
+        """Token contract bytecode, resolved only when deploying.
+
+        May compile the contract when ``allow_compile`` is set; async code
+        should use ``_get_bytecode``.
+        """
+        return get_bytecode(allow_compile=self.allow_compile)
+
+    async def _get_bytecode(self) -> str:
+        """Token contract bytecode, compiling (if allowed) off the event loop."""
+        bytecode = load_artifact().bytecode
+        if bytecode:
+            return bytecode
+        # Compiling may download solc and always runs it as a subprocess
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(get_bytecode, allow_compile=self.allow_compile)
+        )
+
+    def _get_contract(self, address: str) -> Any:
+        """Get a cached token contract object."""
+        return get_abi_registry().contract(self.w3, ERC20_ABI_ID, address)
+
+    async def _validate_mode_network(self):
         """Validate that we're connected to the correct Mode network."""
-        chain_id = self.w3.eth.chain_id
+        chain_id = await self._ensure_initialized()
         # Skip validation for local testing
         if chain_id == 1337:  # Ganache
             return
@@ -189,39 +284,70 @@ class ERC20Plugin(PluginBase):
                 f"(chain_id: {self.mode_config['chain_id']}), but got chain_id: {chain_id}"
             )
 
-    def _estimate_gas(self, transaction):
+    async def _read(self, function: Any) -> Any:
+        """Run a read call, through Multicall3 when available."""
+        if self.multicall is not None:
+            return await self.multicall.call(function)
+        return await call_web3(function.call)
+
+    async def _tx_params(self) -> Dict[str, Any]:
+        """Transaction fields for a new transaction (the nonce is assigned on submit)."""
+        fees = await self.gas_oracle.fees()
+        logger.debug(f"Building transaction - Fees: {fees.tx_params()}")
+        return {
+            'from': self.account.address,
+            'chainId': self.chain_id,
+            **fees.tx_params()
+        }
+
+    async def _build_transaction(self, function: Any, tx_params: Optional[Dict[str, Any]] = None, use_gas_cache: bool = True):
+        """Build a transaction with oracle fees and a cached gas estimate."""
+        tx_params = tx_params or await self._tx_params()
+        # A placeholder limit stops build_transaction from estimating gas itself
+        transaction = await call_web3(function.build_transaction, dict(tx_params, gas=MODE_GAS_LIMIT))
+        transaction.pop('gas', None)
+        transaction['gas'] = await self._estimate_gas(transaction, use_cache=use_gas_cache)
+        logger.debug(f"Estimated gas: {transaction['gas']}")
+        return transaction
+
+    async def _estimate_gas(self, transaction, use_cache: bool = True):
         """Estimate gas for a transaction with Mode-specific adjustments."""
         try:
-            estimated_gas = self.w3.eth.estimate_gas(transaction)
-            # Add 20% buffer for Mode network
-            return int(estimated_gas * 1.2)
+            # Add a buffer for Mode network (20% by default)
+            return await self.gas_oracle.estimate_gas(transaction, buffer=MODE_GAS_LIMIT_BUFFER, use_cache=use_cache)
         except ContractLogicError as e:
             raise ValueError(f"Failed to estimate gas: {str(e)}")
 
+    async def _send_transaction(self, transaction: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """Submit a transaction through the pipeline and wait for its receipt.
+
+        Returns:
+            Tuple of the transaction hash and receipt
+        """
+        pending = await self.pipeline.submit(transaction)
+        logger.debug(f"Transaction sent with hash: {pending.tx_hash}")
+
+        tx_receipt = await pending.wait()
+        logger.debug(f"Transaction receipt received: {tx_receipt}")
+        return pending.tx_hash, tx_receipt
+
     async def deploy_token(self, params: DeployTokenParams) -> TokenDeploymentResult:
         """Deploy a new ERC20 token on Mode network."""
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(abi=self.abi, bytecode=self.bytecode)
-
-        # Build constructor transaction
-        constructor_txn = contract.constructor(
-            params.name,
-            params.symbol,
-            params.initial_supply
-        ).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gasPrice': self.w3.eth.gas_price
-        })
-
-        # Estimate gas with Mode-specific adjustments
-        constructor_txn['gas'] = self._estimate_gas(constructor_txn)
+        await self._validate_mode_network()
+        contract = self.w3.eth.contract(abi=self.abi, bytecode=await self._get_bytecode())
+
+        # Build constructor transaction (deployments are never the same shape, so skip the gas cache)
+        constructor_txn = await self._build_transaction(
+            contract.constructor(
+                params.name,
+                params.symbol,
+                params.initial_supply
+            ),
+            use_gas_cache=False
+        )
 
         try:
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(constructor_txn, self.account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            _, tx_receipt = await self._send_transaction(constructor_txn)
 
             if tx_receipt['status'] != 1:
                 raise ValueError("Token deployment failed")
@@ -238,21 +364,29 @@ class ERC20Plugin(PluginBase):
     async def get_token_info(self, params: GetTokenInfoParams) -> TokenInfoResult:
         """Get information about a token."""
         logger.info(f"Getting token info for address: {params.token_address}")
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
 
         try:
-            # Get token info
-            name = contract.functions.name().call()
-            symbol = contract.functions.symbol().call()
-            decimals = contract.functions.decimals().call()
-            total_supply = contract.functions.totalSupply().call()
+            functions = [
+                contract.functions.name(),
+                contract.functions.symbol(),
+                contract.functions.decimals(),
+                contract.functions.totalSupply()
+            ]
+            if params.address:
+                functions.append(contract.functions.balanceOf(params.address))
+
+            # Reads run concurrently (one aggregate3 eth_call when Multicall3 is available)
+            results = await asyncio.gather(*(self._read(function) for function in functions))
+
+            name, symbol, decimals, total_supply = results[:4]
             logger.debug(f"Retrieved token info - Name: {name}, Symbol: {symbol}, Decimals: {decimals}")
 
             # Get balance if address is provided
             balance = None
             if params.address:
-                balance = contract.functions.balanceOf(params.address).call()
+                balance = results[4]
                 logger.debug(f"Retrieved balance for {params.address}: {balance}")
 
             result = TokenInfoResult(
@@ -271,37 +405,19 @@ class ERC20Plugin(PluginBase):
     async def transfer(self, params: TransferParams) -> TransactionResult:
         """Transfer tokens to another address on Mode network."""
         logger.info(f"Transferring {params.amount} tokens to {params.to_address}")
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
 
         try:
             # Build transfer transaction
-            nonce = await self.w3.eth.get_transaction_count(self.account.address)
-            gas_price = self.w3.eth.gas_price
-            logger.debug(f"Building transaction - Nonce: {nonce}, Gas Price: {gas_price}")
+            transfer_txn = await self._build_transaction(
+                contract.functions.transfer(
+                    params.to_address,
+                    params.amount
+                )
+            )
 
-            transfer_txn = contract.functions.transfer(
-                params.to_address,
-                params.amount
-            ).build_transaction({
-                'from': self.account.address,
-                'nonce': nonce,
-                'gasPrice': gas_price
-            })
-
-            # Estimate gas with Mode-specific adjustments
-            transfer_txn['gas'] = self._estimate_gas(transfer_txn)
-            logger.debug(f"Estimated gas: {transfer_txn['gas']}")
-
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transfer_txn, self.account.key)
-            logger.debug("Transaction signed")
-            
-            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            logger.debug(f"Transaction sent with hash: {tx_hash}")
-            
-            tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            logger.debug(f"Transaction receipt received: {tx_receipt}")
+            tx_hash, tx_receipt = await self._send_transaction(transfer_txn)
 
             if tx_receipt['status'] != 1:
                 raise ValueError("Transfer failed")
@@ -317,40 +433,52 @@ class ERC20Plugin(PluginBase):
             logger.error(f"Transfer failed: {str(e)}")
             raise ValueError(f"Failed to transfer tokens on Mode network: {str(e)}")
 
+    async def submit_transfers(self, transfers: List[TransferParams]) -> List[PendingTransaction]:
+        """Submit many transfers back-to-back without waiting for receipts.
+
+        Nonces are assigned locally and receipts are tracked by one shared
+        poller; await ``PendingTransaction.wait()`` for each receipt.
+
+        Args:
+            transfers: Transfers to submit
+
+        Returns:
+            Pending transactions, in the order of ``transfers``
+        """
+        logger.info(f"Submitting {len(transfers)} transfers")
+        await self._validate_mode_network()
+        tx_params = await self._tx_params()
+        builds = asyncio.Semaphore(self.pipeline.max_in_flight)
+
+        async def submit(params: TransferParams) -> PendingTransaction:
+            async with builds:
+                contract = self._get_contract(params.token_address)
+                transfer_txn = await self._build_transaction(
+                    contract.functions.transfer(params.to_address, params.amount),
+                    tx_params
+                )
+            return await self.pipeline.submit(transfer_txn)
+
+        pending = await asyncio.gather(*(submit(params) for params in transfers))
+        logger.info(f"Submitted {len(pending)} transfers")
+        return list(pending)
+
     async def approve(self, params: ApproveParams) -> TransactionResult:
         """Approve token spending on Mode network."""
         logger.info(f"Approving {params.amount} tokens for spender {params.spender_address}")
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
 
         try:
             # Build approve transaction
-            nonce = await self.w3.eth.get_transaction_count(self.account.address)
-            gas_price = self.w3.eth.gas_price
-            logger.debug(f"Building transaction - Nonce: {nonce}, Gas Price: {gas_price}")
+            approve_txn = await self._build_transaction(
+                contract.functions.approve(
+                    params.spender_address,
+                    params.amount
+                )
+            )
 
-            approve_txn = contract.functions.approve(
-                params.spender_address,
-                params.amount
-            ).build_transaction({
-                'from': self.account.address,
-                'nonce': nonce,
-                'gasPrice': gas_price
-            })
-
-            # Estimate gas with Mode-specific adjustments
-            approve_txn['gas'] = self._estimate_gas(approve_txn)
-            logger.debug(f"Estimated gas: {approve_txn['gas']}")
-
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(approve_txn, self.account.key)
-            logger.debug("Transaction signed")
-            
-            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            logger.debug(f"Transaction sent with hash: {tx_hash}")
-            
-            tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            logger.debug(f"Transaction receipt received: {tx_receipt}")
+            tx_hash, tx_receipt = await self._send_transaction(approve_txn)
 
             if tx_receipt['status'] != 1:
                 raise ValueError("Approve failed")
@@ -368,28 +496,20 @@ class ERC20Plugin(PluginBase):
 
     async def transfer_from(self, params: TransferFromParams) -> TransactionResult:
         """Transfer tokens on behalf of another address on Mode network."""
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
 
         # Build transferFrom transaction
-        transfer_from_txn = contract.functions.transferFrom(
-            params.from_address,
-            params.to_address,
-            params.amount
-        ).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gasPrice': self.w3.eth.gas_price
-        })
-
-        # Estimate gas with Mode-specific adjustments
-        transfer_from_txn['gas'] = self._estimate_gas(transfer_from_txn)
+        transfer_from_txn = await self._build_transaction(
+            contract.functions.transferFrom(
+                params.from_address,
+                params.to_address,
+                params.amount
+            )
+        )
 
         try:
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transfer_from_txn, self.account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            _, tx_receipt = await self._send_transaction(transfer_from_txn)
 
             if tx_receipt['status'] != 1:
                 raise ValueError("TransferFrom failed")
@@ -404,30 +524,82 @@ class ERC20Plugin(PluginBase):
 
     async def get_balance(self, params: GetBalanceParams) -> int:
         """Get token balance for an address on Mode network."""
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
-        return contract.functions.balanceOf(params.wallet_address).call()
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
+        return await call_web3(contract.functions.balanceOf(params.wallet_address).call)
+
+    async def get_balances(
+        self,
+        token_addresses: List[str],
+        owners: List[str],
+        block_identifier: Any = "latest"
+    ) -> TokenMatrix:
+        """Get balances of many owners for many tokens in batched reads.
+
+        Args:
+            token_addresses: Token addresses (matrix rows)
+            owners: Owner addresses (matrix columns)
+            block_identifier: Block to read at; pin a block number for a consistent snapshot
+
+        Returns:
+            Token x owner balance matrix
+        """
+        logger.info(f"Scanning balances for {len(token_addresses)} tokens x {len(owners)} owners")
+        await self._validate_mode_network()
+        function = get_abi_registry().get(ERC20_ABI_ID).function("balanceOf")
+        return await scan_token_matrix(
+            self.w3, function, token_addresses, owners,
+            lambda owner: (owner,),
+            multicall=self.multicall,
+            block_identifier=block_identifier
+        )
+
+    async def get_allowances(
+        self,
+        token_addresses: List[str],
+        owners: List[str],
+        spender: str,
+        block_identifier: Any = "latest"
+    ) -> TokenMatrix:
+        """Get allowances granted to one spender by many owners for many tokens.
+
+        Args:
+            token_addresses: Token addresses (matrix rows)
+            owners: Owner addresses (matrix columns)
+            spender: Spender address
+            block_identifier: Block to read at
+
+        Returns:
+            Token x owner allowance matrix
+        """
+        logger.info(f"Scanning allowances for {len(token_addresses)} tokens x {len(owners)} owners")
+        await self._validate_mode_network()
+        function = get_abi_registry().get(ERC20_ABI_ID).function("allowance")
+        spender = Web3.to_checksum_address(spender)
+        return await scan_token_matrix(
+            self.w3, function, token_addresses, owners,
+            lambda owner: (owner, spender),
+            multicall=self.multicall,
+            block_identifier=block_identifier
+        )
 
     async def get_token_info_by_symbol(self, params: GetTokenInfoBySymbolParams) -> TokenInfoResult:
         """Get token information by its symbol."""
-        self._validate_mode_network()
+        await self._validate_mode_network()
         
-        token = get_token_by_symbol(
-            symbol=params.symbol,
-            chain_id=self.mode_config["chain_id"],
-            tokens=self.tokens
-        )
+        token = self.token_registry.get_by_symbol(params.symbol, self.mode_config["chain_id"])
         
         if not token:
             raise ValueError(f"Token with symbol {params.symbol} not found on Mode {self.network.value}")
 
-        contract = self.w3.eth.contract(address=token.contract_address, abi=self.abi)
-        total_supply = contract.functions.totalSupply().call()
-        
+        contract = self._get_contract(token.contract_address)
+        functions = [contract.functions.totalSupply()]
         # Get balance if address is provided
-        balance = None
         if params.address:
-            balance = contract.functions.balanceOf(params.address).call()
+            functions.append(contract.functions.balanceOf(params.address))
+        results = await asyncio.gather(*(self._read(function) for function in functions))
+        total_supply = results[0]
+        balance = results[1] if params.address else None
 
         return TokenInfoResult(
             name=token.name,
@@ -441,14 +613,14 @@ class ERC20Plugin(PluginBase):
     async def get_token_allowance(self, params: GetTokenAllowanceParams) -> int:
         """Get the allowance of tokens that a spender can spend on behalf of an owner."""
         logger.info(f"Getting allowance for owner {params.owner_address} and spender {params.spender_address}")
-        self._validate_mode_network()
-        contract = self.w3.eth.contract(address=params.token_address, abi=self.abi)
+        await self._validate_mode_network()
+        contract = self._get_contract(params.token_address)
 
         try:
-            allowance = contract.functions.allowance(
+            allowance = await call_web3(contract.functions.allowance(
                 params.owner_address,
                 params.spender_address
-            ).call()
+            ).call)
             logger.debug(f"Retrieved allowance: {allowance}")
             return allowance
         except Exception as e:
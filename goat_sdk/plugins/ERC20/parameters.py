@@ -51,6 +51,15 @@ class ERC20PluginCtorParams(BaseModel):
         default="testnet",
         description="Mode network to connect to (mainnet or testnet)"
     )
+    multicall_address: Optional[str] = Field(
+        default=None,
+        description="Optional Multicall3 address overriding the per-chain default"
+    )
+    allow_compile: bool = Field(
+        default=False,
+        description="Allow compiling the token contract with solc (cached on disk) when deploying if the "
+                    "packaged artifact has no bytecode"
+    )
 
 
 class GetTokenInfoParams(BaseModel):
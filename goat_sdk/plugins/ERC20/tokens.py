@@ -30,10 +30,18 @@
 """
 
 """Token definitions and utilities."""
+import json
+import logging
+import threading
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from eth_typing import ChecksumAddress
 
+from goat_sdk.core.utils.cache import ListCache
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ChainSpecificToken:
@@ -83,55 +91,169 @@ MODE = Token(
 DEFAULT_TOKENS = [USDC, MODE]
 
 
-def get_tokens_for_network(chain_id: int, tokens: Optional[List[Token]] = None) -> List[ChainSpecificToken]:
-    """Get all tokens available for a specific network.
-    
-    Args:
-        chain_id: Chain ID to get tokens for
-        tokens: Optional list of tokens to filter from. If not provided, uses DEFAULT_TOKENS
-        
-    Returns:
-        List of tokens available on the specified chain
+class TokenRegistry:
+    """Token lookup with precomputed indexes.
+
+    Tokens are indexed by (symbol, chain_id) and (address, chain_id) when
+    added, so lookups are dictionary hits. Token-list files (Uniswap
+    token-list JSON) are only read and parsed on the first lookup. When two
+    entries share a symbol or address on a chain, tokens added with ``add``
+    win over token-list entries; otherwise the earlier entry wins.
     """
-    tokens = tokens or DEFAULT_TOKENS
-    result = []
 
-    for token in tokens:
-        chain_data = token.chains.get(chain_id)
-        if chain_data:
-            result.append(ChainSpecificToken(
+    def __init__(self, tokens: Optional[Iterable[Token]] = None):
+        """Initialize registry.
+
+        Args:
+            tokens: Tokens to index
+        """
+        self._by_symbol: Dict[Tuple[str, int], ChainSpecificToken] = {}
+        self._by_address: Dict[Tuple[str, int], ChainSpecificToken] = {}
+        self._by_chain: Dict[int, List[ChainSpecificToken]] = {}
+        # Keys indexed from tokens passed to ``add``
+        self._added: Set[Tuple[str, Tuple[str, int]]] = set()
+        self._pending: List[Union[Path, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        for token in tokens or []:
+            self.add(token)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._by_address)
+
+    def _index(self, token: ChainSpecificToken, added: bool) -> None:
+        symbol_key = (token.symbol.upper(), token.chain_id)
+        address_key = (token.contract_address.lower(), token.chain_id)
+        previous = self._by_address.get(address_key)
+        if previous is not None:
+            # Only an added token replaces an entry, and only a token-list one
+            if not added or ("address", address_key) in self._added:
+                return
+            self._by_chain[token.chain_id].remove(previous)
+            if self._by_symbol.get((previous.symbol.upper(), token.chain_id)) is previous:
+                del self._by_symbol[(previous.symbol.upper(), token.chain_id)]
+        if symbol_key not in self._by_symbol or (added and ("symbol", symbol_key) not in self._added):
+            self._by_symbol[symbol_key] = token
+        if added:
+            self._added.update((("symbol", symbol_key), ("address", address_key)))
+        self._by_address[address_key] = token
+        self._by_chain.setdefault(token.chain_id, []).append(token)
+
+    def add(self, token: Token) -> None:
+        """Index a token on every chain it is deployed to."""
+        for chain_id, chain_data in token.chains.items():
+            self._index(ChainSpecificToken(
                 chain_id=chain_id,
                 decimals=token.decimals,
                 symbol=token.symbol,
                 name=token.name,
                 contract_address=chain_data["contract_address"]
-            ))
+            ), added=True)
+
+    def load_token_list(self, source: Union[str, Path, Dict[str, Any]], lazy: bool = True) -> None:
+        """Add a token list in the Uniswap token-list format.
+
+        Args:
+            source: Path to a token-list JSON file, or the parsed document
+            lazy: Defer reading and indexing until the first lookup
+        """
+        source = source if isinstance(source, dict) else Path(source)
+        with self._lock:
+            self._pending.append(source)
+        if not lazy:
+            self._ensure_loaded()
+
+    def _ensure_loaded(self) -> None:
+        if not self._pending:
+            return
+        with self._lock:
+            while self._pending:
+                self._load(self._pending.pop(0))
+
+    def _load(self, source: Union[Path, Dict[str, Any]]) -> None:
+        document = source
+        if isinstance(source, Path):
+            with open(source, "rb") as f:
+                document = json.load(f)
+        entries = document.get("tokens", []) if isinstance(document, dict) else document
+
+        loaded = 0
+        for entry in entries:
+            try:
+                token = ChainSpecificToken(
+                    chain_id=int(entry["chainId"]),
+                    decimals=int(entry["decimals"]),
+                    symbol=entry["symbol"],
+                    name=entry.get("name", entry["symbol"]),
+                    contract_address=entry["address"]
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping invalid token list entry {entry}: {str(e)}")
+                continue
+            self._index(token, added=False)
+            loaded += 1
+        logger.info(f"Loaded {loaded} tokens from token list {source if isinstance(source, Path) else '<dict>'}")
+
+    def get_by_symbol(self, symbol: str, chain_id: int) -> Optional[ChainSpecificToken]:
+        """Get a token by its symbol (case-insensitive) on a chain."""
+        self._ensure_loaded()
+        return self._by_symbol.get((symbol.upper(), chain_id))
+
+    def get_by_address(self, address: str, chain_id: int) -> Optional[ChainSpecificToken]:
+        """Get a token by its contract address (case-insensitive) on a chain."""
+        self._ensure_loaded()
+        return self._by_address.get((address.lower(), chain_id))
+
+    def tokens_for_network(self, chain_id: int) -> List[ChainSpecificToken]:
+        """Get all tokens available on a chain."""
+        self._ensure_loaded()
+        return list(self._by_chain.get(chain_id, []))
+
 
-    return result
+_default_registry: Optional[TokenRegistry] = None
 
 
-def get_token_by_symbol(symbol: str, chain_id: int, tokens: Optional[List[Token]] = None) -> Optional[ChainSpecificToken]:
+def get_token_registry() -> TokenRegistry:
+    """Get the process-wide registry of ``DEFAULT_TOKENS``."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = TokenRegistry(DEFAULT_TOKENS)
+    return _default_registry
+
+
+_list_registries = ListCache(TokenRegistry)
+
+
+def _registry_for(tokens: Union[List[Token], TokenRegistry, None]) -> TokenRegistry:
+    if isinstance(tokens, TokenRegistry):
+        return tokens
+    if not tokens or tokens is DEFAULT_TOKENS:
+        return get_token_registry()
+    return _list_registries.get(tokens)
+
+
+def get_tokens_for_network(chain_id: int, tokens: Union[List[Token], TokenRegistry, None] = None) -> List[ChainSpecificToken]:
+    """Get all tokens available for a specific network.
+    
+    Args:
+        chain_id: Chain ID to get tokens for
+        tokens: Optional list of tokens (or a registry) to filter from. If not provided, uses DEFAULT_TOKENS
+        
+    Returns:
+        List of tokens available on the specified chain
+    """
+    return _registry_for(tokens).tokens_for_network(chain_id)
+
+
+def get_token_by_symbol(symbol: str, chain_id: int, tokens: Union[List[Token], TokenRegistry, None] = None) -> Optional[ChainSpecificToken]:
     """Get token information by its symbol for a specific chain.
     
     Args:
         symbol: Token symbol to look for
         chain_id: Chain ID to get token for
-        tokens: Optional list of tokens to search in. If not provided, uses DEFAULT_TOKENS
+        tokens: Optional list of tokens (or a registry) to search in. If not provided, uses DEFAULT_TOKENS
         
     Returns:
         Token information if found, None otherwise
     """
-    tokens = tokens or DEFAULT_TOKENS
-    symbol = symbol.upper()
-
-    for token in tokens:
-        if token.symbol.upper() == symbol and chain_id in token.chains:
-            return ChainSpecificToken(
-                chain_id=chain_id,
-                decimals=token.decimals,
-                symbol=token.symbol,
-                name=token.name,
-                contract_address=token.chains[chain_id]["contract_address"]
-            )
-
-    return None
+    return _registry_for(tokens).get_by_symbol(symbol, chain_id)
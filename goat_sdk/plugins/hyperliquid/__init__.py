@@ -2,6 +2,10 @@
 
 from .plugin import HyperliquidPlugin
 from .config import HyperliquidConfig
+from .batching import OrderBatcher
+from .orderbook import CompactOrderBook
+from .universe import AssetMeta, UniverseCache
+from .websocket import HyperliquidWebSocket, LocalOrderBook
 from .types.order import (
     OrderType, OrderSide, OrderStatus,
     OrderRequest, OrderResponse, OrderResult
@@ -19,6 +23,12 @@ __all__ = [
     # Main classes
     "HyperliquidPlugin",
     "HyperliquidConfig",
+    "HyperliquidWebSocket",
+    "CompactOrderBook",
+    "LocalOrderBook",
+    "AssetMeta",
+    "UniverseCache",
+    "OrderBatcher",
     
     # Order types
     "OrderType",
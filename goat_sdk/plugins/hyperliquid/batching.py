@@ -0,0 +1,119 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/hyperliquid/batching.py
+"""
+
+"""Auto-batching of Hyperliquid order placement.
+
+An exchange ``order`` action carries a list of orders, and one signed action
+costs a single request against the order rate limit however many orders it
+holds. ``OrderBatcher`` queues orders submitted one at a time and sends
+everything queued within ``window`` seconds (or as soon as ``max_size``
+orders are waiting) as one action, resolving each caller with its own order's
+result. A caller cancelling its wait does not withdraw an order that has
+already been queued.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from .types.order import OrderRequest, OrderResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds orders are collected before the batch is sent
+ORDER_BATCH_WINDOW = 0.005
+
+# Orders sent in one action at most
+MAX_ORDER_BATCH_SIZE = 40
+
+SubmitOrders = Callable[[List[OrderRequest]], Awaitable[List[OrderResult]]]
+
+
+class OrderBatcher:
+    """Coalesces concurrent single orders into batched actions."""
+
+    def __init__(
+        self,
+        submit: SubmitOrders,
+        window: float = ORDER_BATCH_WINDOW,
+        max_size: int = MAX_ORDER_BATCH_SIZE
+    ):
+        """Initialize order batcher.
+
+        Args:
+            submit: Sends a list of orders in one action, returning one result per order
+            window: Seconds orders are collected before the batch is sent
+            max_size: Orders sent in one action at most
+        """
+        self._submit = submit
+        self.window = window
+        self.max_size = max_size
+        self._pending: List[Tuple[OrderRequest, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: Set[asyncio.Task] = set()
+
+    async def submit(self, request: OrderRequest) -> OrderResult:
+        """Queue an order and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """Send the queued orders now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch, self._pending = self._pending[:self.max_size], self._pending[self.max_size:]
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[Tuple[OrderRequest, asyncio.Future]]) -> None:
+        logger.debug(f"Sending batch of {len(batch)} orders")
+        try:
+            results = await self._submit([request for request, _ in batch])
+        except Exception as e:
+            results = [OrderResult(success=False, error=str(e))] * len(batch)
+        missing = OrderResult(success=False, error="No result returned for order")
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(results[index] if index < len(results) else missing)
+
+    async def close(self) -> None:
+        """Send the queued orders and wait until every batch is sent."""
+        self.flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
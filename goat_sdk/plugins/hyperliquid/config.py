@@ -57,11 +57,11 @@ class HyperliquidConfig(BaseModel):
         default=os.getenv("HYPERLIQUID_TESTNET_URL", "https://api.hyperliquid-testnet.xyz"),
         description="Base URL for Hyperliquid testnet API"
     )
-    ws_url: HttpUrl = Field(
+    ws_url: str = Field(
         default=os.getenv("HYPERLIQUID_WS_MAINNET_URL", "wss://api.hyperliquid.xyz/ws"),
         description="WebSocket URL for Hyperliquid API"
     )
-    testnet_ws_url: HttpUrl = Field(
+    testnet_ws_url: str = Field(
         default=os.getenv("HYPERLIQUID_WS_TESTNET_URL", "wss://api.hyperliquid-testnet.xyz/ws"),
         description="WebSocket URL for Hyperliquid testnet API"
     )
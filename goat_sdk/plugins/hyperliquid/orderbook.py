@@ -0,0 +1,276 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/hyperliquid/orderbook.py
+"""
+
+"""Compact array-backed order book for Hyperliquid.
+
+``CompactOrderBook`` stores each side as parallel, sorted int64 arrays of
+fixed-point prices and sizes instead of Pydantic ``OrderbookLevel`` objects
+holding ``Decimal`` values. Levels are located with a binary search, so
+changing a level's size is O(log n) and inserting or removing one is a single
+memmove. Depth, VWAP and price-impact queries are vectorized NumPy
+operations. API strings are parsed straight to integers, so building a book
+from an ``l2Book`` response creates no Pydantic objects or Decimals.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .types.market import OrderbookLevel, OrderbookResponse
+
+# Fixed-point decimals for prices and sizes; Hyperliquid uses at most 8 of either
+PRICE_DECIMALS = 8
+SIZE_DECIMALS = 8
+
+BID = "bid"
+ASK = "ask"
+
+
+def from_fixed(value: int, decimals: int) -> Decimal:
+    """Convert a fixed-point integer to an exact Decimal without trailing zeros."""
+    result = Decimal(int(value)).scaleb(-decimals).normalize()
+    return result.quantize(Decimal(1)) if result.as_tuple().exponent > 0 else result
+
+
+def to_fixed(value: str, decimals: int) -> int:
+    """Parse a decimal string (e.g. ``"2000.5"``) to a fixed-point integer, truncating extra digits."""
+    whole, _, fraction = value.partition(".")
+    return int(whole + (fraction + "0" * decimals)[:decimals])
+
+
+class _Side:
+    """One side of a book; index 0 holds the best price.
+
+    Bid prices are stored negated so both sides sort ascending with the
+    best level first.
+    """
+
+    __slots__ = ("sign", "keys", "sizes", "count")
+
+    def __init__(self, sign: int, capacity: int):
+        self.sign = sign
+        self.keys = np.empty(capacity, dtype=np.int64)
+        self.sizes = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+
+    def load(self, prices: np.ndarray, sizes: np.ndarray) -> None:
+        keys = prices * self.sign
+        order = np.argsort(keys, kind="stable")
+        keep = sizes[order] > 0
+        count = int(keep.sum())
+        if count > len(self.keys):
+            self.keys = np.empty(count * 2, dtype=np.int64)
+            self.sizes = np.empty(count * 2, dtype=np.int64)
+        self.keys[:count] = keys[order][keep]
+        self.sizes[:count] = sizes[order][keep]
+        self.count = count
+
+    def set(self, price: int, size: int) -> None:
+        key = price * self.sign
+        n = self.count
+        i = int(np.searchsorted(self.keys[:n], key))
+        if i < n and self.keys[i] == key:
+            if size > 0:
+                self.sizes[i] = size
+            else:
+                self.keys[i:n - 1] = self.keys[i + 1:n]
+                self.sizes[i:n - 1] = self.sizes[i + 1:n]
+                self.count = n - 1
+            return
+        if size <= 0:
+            return
+        if n == len(self.keys):
+            self.keys = np.concatenate([self.keys, np.empty(max(n, 16), dtype=np.int64)])
+            self.sizes = np.concatenate([self.sizes, np.empty(max(n, 16), dtype=np.int64)])
+        self.keys[i + 1:n + 1] = self.keys[i:n]
+        self.sizes[i + 1:n + 1] = self.sizes[i:n]
+        self.keys[i] = key
+        self.sizes[i] = size
+        self.count = n + 1
+
+    def prices(self, depth: Optional[int] = None) -> np.ndarray:
+        return self.keys[:self.count][:depth] * self.sign
+
+    def levels(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        return self.prices(depth), self.sizes[:self.count][:depth]
+
+
+class CompactOrderBook:
+    """Order book of one coin in fixed-point int64 arrays."""
+
+    def __init__(
+        self,
+        coin: str,
+        price_decimals: int = PRICE_DECIMALS,
+        size_decimals: int = SIZE_DECIMALS,
+        capacity: int = 64
+    ):
+        """Initialize an empty book.
+
+        Args:
+            coin: Market symbol
+            price_decimals: Fixed-point decimals of prices
+            size_decimals: Fixed-point decimals of sizes
+            capacity: Initial levels per side; grows as needed
+        """
+        self.coin = coin
+        self.price_decimals = price_decimals
+        self.size_decimals = size_decimals
+        self.price_scale = 10 ** price_decimals
+        self.size_scale = 10 ** size_decimals
+        self._bids = _Side(-1, capacity)
+        self._asks = _Side(1, capacity)
+
+    @classmethod
+    def from_l2_book(cls, coin: str, data: Dict[str, Any], **kwargs: Any) -> "CompactOrderBook":
+        """Build a book from an ``l2Book`` response or WebSocket message."""
+        book = cls(coin, **kwargs)
+        book.apply_snapshot(data.get("levels", [[], []]))
+        return book
+
+    def _side(self, side: str) -> _Side:
+        if side == BID:
+            return self._bids
+        if side == ASK:
+            return self._asks
+        raise ValueError(f"Unknown book side: {side}")
+
+    def _parse(self, levels: Sequence[Dict[str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+        prices = np.fromiter((to_fixed(level["px"], self.price_decimals) for level in levels), np.int64, len(levels))
+        sizes = np.fromiter((to_fixed(level["sz"], self.size_decimals) for level in levels), np.int64, len(levels))
+        return prices, sizes
+
+    # Updates
+
+    def apply_snapshot(self, levels: Sequence[Sequence[Dict[str, str]]]) -> None:
+        """Replace both sides with ``l2Book`` levels (``[bids, asks]``)."""
+        self._bids.load(*self._parse(levels[0] if levels else []))
+        self._asks.load(*self._parse(levels[1] if len(levels) > 1 else []))
+
+    def set_level(self, side: str, price: str, size: str) -> None:
+        """Set the size at a price level; a zero size removes the level."""
+        self._side(side).set(to_fixed(price, self.price_decimals), to_fixed(size, self.size_decimals))
+
+    # Queries
+
+    def __len__(self) -> int:
+        return self._bids.count + self._asks.count
+
+    def best_bid(self) -> Optional[float]:
+        """Highest bid price."""
+        return self._bids.prices(1)[0] / self.price_scale if self._bids.count else None
+
+    def best_ask(self) -> Optional[float]:
+        """Lowest ask price."""
+        return self._asks.prices(1)[0] / self.price_scale if self._asks.count else None
+
+    def mid(self) -> Optional[float]:
+        """Midpoint of the best bid and ask."""
+        bid, ask = self.best_bid(), self.best_ask()
+        return (bid + ask) / 2 if bid is not None and ask is not None else None
+
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid."""
+        bid, ask = self.best_bid(), self.best_ask()
+        return ask - bid if bid is not None and ask is not None else None
+
+    def levels(self, side: str, depth: Optional[int] = None) -> np.ndarray:
+        """Levels of a side, best first, as a float64 ``(n, 2)`` array of (price, size)."""
+        prices, sizes = self._side(side).levels(depth)
+        return np.column_stack((prices / self.price_scale, sizes / self.size_scale))
+
+    def depth(self, side: str, depth: Optional[int] = None) -> np.ndarray:
+        """Cumulative size of a side at each level, best first."""
+        _, sizes = self._side(side).levels(depth)
+        return np.cumsum(sizes) / self.size_scale
+
+    def _fill(self, side: str, size: float) -> Tuple[float, float]:
+        """Size and notional filled by taking ``size`` from a side, best levels first."""
+        prices, sizes = self._side(side).levels()
+        wanted = round(size * self.size_scale)
+        cumulative = np.cumsum(sizes)
+        taken = np.clip(wanted - (cumulative - sizes), 0, sizes)
+        filled = int(taken.sum())
+        notional = float(np.dot(taken.astype(np.float64), prices.astype(np.float64)))
+        return filled / self.size_scale, notional / (self.price_scale * self.size_scale)
+
+    def vwap(self, side: str, size: float) -> Optional[float]:
+        """Average price of taking ``size`` from a side (``ASK`` to buy, ``BID`` to sell).
+
+        Returns:
+            Volume-weighted price, or None if the side cannot fill ``size``
+        """
+        if size <= 0:
+            return None
+        filled, notional = self._fill(side, size)
+        if filled < size:
+            return None
+        return notional / filled
+
+    def impact(self, side: str, size: float) -> Optional[float]:
+        """Relative price impact of taking ``size`` from a side.
+
+        Returns:
+            ``abs(vwap - best) / best``, or None if the side cannot fill ``size``
+        """
+        vwap = self.vwap(side, size)
+        best = self.best_ask() if side == ASK else self.best_bid()
+        if vwap is None or not best:
+            return None
+        return abs(vwap - best) / best
+
+    # Conversions
+
+    def _decimal_levels(self, side: str, depth: Optional[int]) -> List[Tuple[Decimal, Decimal]]:
+        prices, sizes = self._side(side).levels(depth)
+        return [
+            (from_fixed(price, self.price_decimals), from_fixed(size, self.size_decimals))
+            for price, size in zip(prices, sizes)
+        ]
+
+    @property
+    def bids(self) -> List[Tuple[Decimal, Decimal]]:
+        """Bid levels as exact (price, size) Decimals, best first."""
+        return self._decimal_levels(BID, None)
+
+    @property
+    def asks(self) -> List[Tuple[Decimal, Decimal]]:
+        """Ask levels as exact (price, size) Decimals, best first."""
+        return self._decimal_levels(ASK, None)
+
+    def to_response(self, depth: int = 100) -> OrderbookResponse:
+        """Convert to an ``OrderbookResponse`` with at most ``depth`` levels per side."""
+        return OrderbookResponse(
+            coin=self.coin,
+            bids=[OrderbookLevel(price=price, size=size) for price, size in self._decimal_levels(BID, depth)],
+            asks=[OrderbookLevel(price=price, size=size) for price, size in self._decimal_levels(ASK, depth)]
+        )
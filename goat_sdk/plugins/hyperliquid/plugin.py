@@ -32,7 +32,7 @@
 """Hyperliquid plugin implementation."""
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import aiohttp
 import time
@@ -47,6 +47,9 @@ from .types.market import (
     TradeInfo
 )
 from .config import HyperliquidConfig
+from .orderbook import CompactOrderBook
+from .universe import AssetMeta
+from .websocket import HyperliquidWebSocket
 from .types.agent import AgentApprovalRequest, AgentApprovalAction, AgentApprovalResponse
 
 class HyperliquidPlugin:
@@ -106,7 +109,10 @@ class HyperliquidPlugin:
                 session=self.session,
                 logger=self.logger,
                 use_ssl=self.config.use_ssl,
-                ssl_verify=self.config.ssl_verify
+                ssl_verify=self.config.ssl_verify,
+                ws_url=self.config.testnet_ws_url if testnet else self.config.ws_url,
+                ws_ping_interval=self.config.ws_ping_interval,
+                ws_ping_timeout=self.config.ws_ping_timeout
             )
         return self._services[testnet]
         
@@ -115,6 +121,29 @@ class HyperliquidPlugin:
         for service in self._services.values():
             await service.close()
             
+    async def start_market_stream(
+        self,
+        coins: List[str],
+        user: Optional[str] = None,
+        testnet: bool = False
+    ) -> HyperliquidWebSocket:
+        """Stream market data over WebSocket.
+
+        While the stream is connected, ``get_orderbook`` and
+        ``get_recent_trades`` for the streamed coins, and mid prices, are
+        served from memory instead of REST polling.
+        
+        Args:
+            coins: Coins to stream order books and trades for
+            user: Optional address to stream fills for
+            testnet: Whether to use testnet
+            
+        Returns:
+            The running WebSocket client
+        """
+        service = self._get_service(testnet)
+        return await service.start_market_stream(coins, user)
+        
     # Market Data Methods
     async def get_markets(self, testnet: bool = False) -> List[str]:
         """Get list of available markets.
@@ -128,6 +157,23 @@ class HyperliquidPlugin:
         service = self._get_service(testnet)
         return await service.get_markets()
         
+    async def get_asset(
+        self,
+        coin: str,
+        testnet: bool = False
+    ) -> AssetMeta:
+        """Get a coin's asset index, size decimals and max leverage.
+        
+        Args:
+            coin: Market symbol
+            testnet: Whether to use testnet
+            
+        Returns:
+            Cached universe metadata of the coin
+        """
+        service = self._get_service(testnet)
+        return await service.get_asset(coin)
+        
     async def get_market_summary(
         self,
         coin: str,
@@ -164,6 +210,25 @@ class HyperliquidPlugin:
         service = self._get_service(testnet)
         return await service.get_orderbook(coin, depth)
         
+    async def get_orderbook_compact(
+        self,
+        coin: str,
+        depth: int = 100,
+        testnet: bool = False
+    ) -> CompactOrderBook:
+        """Get orderbook as fixed-point arrays, without Pydantic models.
+        
+        Args:
+            coin: Market symbol
+            depth: Orderbook depth
+            testnet: Whether to use testnet
+            
+        Returns:
+            Compact orderbook with vectorized depth, VWAP and impact queries
+        """
+        service = self._get_service(testnet)
+        return await service.get_orderbook_compact(coin, depth)
+        
     async def get_recent_trades(
         self,
         coin: str,
@@ -220,6 +285,57 @@ class HyperliquidPlugin:
         service = self._get_service(testnet)
         return await service.cancel_order(coin, order_id)
         
+    async def create_orders(
+        self,
+        requests: List[OrderRequest],
+        testnet: bool = False
+    ) -> List[OrderResult]:
+        """Create many orders in one signed action.
+        
+        Args:
+            requests: Order request parameters
+            testnet: Whether to use testnet
+            
+        Returns:
+            One order result per request, in order
+        """
+        service = self._get_service(testnet)
+        return await service.create_orders(requests)
+        
+    async def modify_orders(
+        self,
+        modifies: List[Tuple[str, OrderRequest]],
+        testnet: bool = False
+    ) -> List[OrderResult]:
+        """Modify many resting orders in one signed action.
+        
+        Args:
+            modifies: (order ID, new order parameters) pairs
+            testnet: Whether to use testnet
+            
+        Returns:
+            One order result per modification, in order
+        """
+        service = self._get_service(testnet)
+        return await service.modify_orders(modifies)
+        
+    async def cancel_orders(
+        self,
+        cancels: List[Tuple[str, str]],
+        testnet: bool = False
+    ) -> List[OrderResult]:
+        """Cancel many orders in one signed action.
+        
+        Args:
+            cancels: (coin symbol, order ID) pairs
+            testnet: Whether to use testnet
+            
+        Returns:
+            One order result per cancel, in order
+        """
+        service = self._get_service(testnet)
+        return await service.cancel_orders(cancels)
+        
     async def cancel_all_orders(
         self,
         coin: Optional[str] = None,
@@ -31,6 +31,7 @@
 
 """Service for interacting with Hyperliquid API."""
 
+import asyncio
 import json
 import logging
 import time
@@ -43,8 +44,15 @@ import aiohttp
 import backoff
 from dotenv import load_dotenv
 
+from goat_sdk.core.utils.cache import TTLCache
+from goat_sdk.core.utils.rate_limit import get_rate_limiter
+
+from .batching import MAX_ORDER_BATCH_SIZE, ORDER_BATCH_WINDOW, OrderBatcher
 from .errors import RequestError
-from .utils import RateLimiter
+from .utils import IP_WEIGHT_PER_MINUTE, request_weight
+from .orderbook import CompactOrderBook
+from .universe import MIDS_TICK, UNIVERSE_TTL, AssetMeta, UniverseCache
+from .websocket import HyperliquidWebSocket
 from .types.order import (
     OrderRequest, OrderResponse, OrderResult,
     OrderSide, OrderStatus, OrderType
@@ -70,9 +78,27 @@ class HyperliquidService:
         session: Optional[aiohttp.ClientSession] = None,
         logger: Optional[logging.Logger] = None,
         use_ssl: bool = True,
-        ssl_verify: bool = True
+        ssl_verify: bool = True,
+        ws_url: Optional[str] = None,
+        ws_ping_interval: float = 20.0,
+        ws_ping_timeout: float = 10.0,
+        orderbook_max_age: float = 5.0,
+        universe_ttl: float = UNIVERSE_TTL,
+        mids_tick: float = MIDS_TICK,
+        order_batch_window: float = ORDER_BATCH_WINDOW,
+        max_order_batch_size: int = MAX_ORDER_BATCH_SIZE
     ):
-        """Initialize service."""
+        """Initialize service.
+
+        ``ws_url`` overrides the network's WebSocket URL. Order books served
+        from the market stream are used while younger than
+        ``orderbook_max_age`` seconds; older ones fall back to REST. Universe
+        metadata is refetched every ``universe_ttl`` seconds, and one REST
+        ``allMids`` snapshot is shared for ``mids_tick`` seconds.
+        ``create_order`` calls made within ``order_batch_window`` seconds of
+        each other are sent as one action of up to ``max_order_batch_size``
+        orders; a window of 0 sends each order on its own.
+        """
         # Load from env if not provided
         self.api_key = api_key or os.getenv("API_KEY")
         self.api_secret = api_secret or os.getenv("API_SECRET")
@@ -86,6 +112,18 @@ class HyperliquidService:
         else:
             self.base_url = "https://api.hyperliquid.xyz"
             self.ws_url = "wss://api.hyperliquid.xyz/ws"
+        if ws_url:
+            self.ws_url = ws_url
+        self.ws_ping_interval = ws_ping_interval
+        self.ws_ping_timeout = ws_ping_timeout
+        self.orderbook_max_age = orderbook_max_age
+        self.market_stream: Optional[HyperliquidWebSocket] = None
+        self.universe = UniverseCache(self._fetch_meta, ttl=universe_ttl)
+        self._mids = TTLCache("hyperliquid.allMids", ttl=mids_tick, max_entries=1)
+        self._last_nonce = 0
+        self.order_batcher: Optional[OrderBatcher] = None
+        if order_batch_window > 0:
+            self.order_batcher = OrderBatcher(self.create_orders, order_batch_window, max_order_batch_size)
         
         # Create SSL context based on settings
         if use_ssl:
@@ -102,16 +140,97 @@ class HyperliquidService:
         self.session = session or aiohttp.ClientSession(connector=connector)
         self.logger = logger or logging.getLogger(__name__)
         
+        # Buckets are shared process-wide: per API host, and per address for exchange actions
+        account = f"{self.base_url}:{self.eth_wallet or 'default'}"
         self.rate_limiters = {
-            "default": RateLimiter(max_rate=10, time_period=1),  # 10 requests per second
-            "order": RateLimiter(max_rate=5, time_period=1),     # 5 orders per second
-            "market": RateLimiter(max_rate=2, time_period=1)     # 2 market data requests per second
+            "default": get_rate_limiter("hyperliquid.default", 10, 10, key=self.base_url),  # 10 requests per second
+            "order": get_rate_limiter("hyperliquid.order", 5, 5, key=account),     # 5 actions per second per address
+            "market": get_rate_limiter("hyperliquid.market", 2, 2, key=self.base_url)  # 2 market data requests per second
         }
+        self.rate_limiters["agent"] = self.rate_limiters["order"]
+        # Request weight per IP: 1200 per minute
+        self.weight_limiter = get_rate_limiter(
+            "hyperliquid.weight", IP_WEIGHT_PER_MINUTE / 60, IP_WEIGHT_PER_MINUTE, key=self.base_url
+        )
         
     async def close(self):
         """Close service connections."""
+        await self.stop_market_stream()
+        if self.order_batcher is not None:
+            await self.order_batcher.close()
         if self.session:
             await self.session.close()
+
+    async def start_market_stream(self, coins: List[str] = (), user: Optional[str] = None) -> HyperliquidWebSocket:
+        """Stream market data over WebSocket instead of polling REST.
+
+        Subscribes to ``allMids``, plus ``l2Book`` and ``trades`` of each coin
+        and ``userFills`` of ``user``. While connected, ``get_orderbook``,
+        ``get_recent_trades`` and mid prices are served from memory.
+
+        Args:
+            coins: Coins to keep order books and trades for
+            user: Optional address to stream fills for
+
+        Returns:
+            The running WebSocket client
+        """
+        if self.market_stream is None:
+            self.market_stream = HyperliquidWebSocket(
+                self.ws_url,
+                ping_interval=self.ws_ping_interval,
+                ping_timeout=self.ws_ping_timeout,
+                logger=self.logger
+            )
+        stream = self.market_stream
+        await stream.subscribe_all_mids()
+        for coin in coins:
+            await stream.subscribe_l2_book(coin)
+            await stream.subscribe_trades(coin)
+        if user:
+            await stream.subscribe_user_fills(user)
+        await stream.start()
+        return stream
+
+    async def stop_market_stream(self) -> None:
+        """Close the market data WebSocket."""
+        if self.market_stream is not None:
+            await self.market_stream.close()
+            self.market_stream = None
+
+    def _stream_mids(self) -> Optional[Dict[str, Decimal]]:
+        if self.market_stream is None or not self.market_stream.connected:
+            return None
+        return self.market_stream.mids or None
+
+    async def _fetch_meta(self) -> Dict:
+        return await self._request(
+            "POST",
+            "info",
+            json={"type": "meta"},
+            rate_limit_key="market"
+        )
+
+    async def _fetch_mids(self) -> Dict[str, Decimal]:
+        response = await self._request(
+            "POST",
+            "info",
+            json={"type": "allMids"},
+            rate_limit_key="market"
+        )
+        return {coin: Decimal(str(price)) for coin, price in response.items()}
+
+    async def get_all_mids(self) -> Dict[str, Decimal]:
+        """Get mid prices of every coin.
+
+        Served from the market stream when connected; otherwise one REST
+        snapshot is shared by all callers within a tick.
+        """
+        return self._stream_mids() or await self._mids.get_or_load("allMids", self._fetch_mids)
+
+    async def get_asset(self, coin: str) -> AssetMeta:
+        """Get a coin's cached universe metadata (asset index, size decimals, max leverage)."""
+        return await self.universe.asset(coin)
             
     async def _request(
         self,
@@ -136,13 +255,15 @@ class HyperliquidService:
         if self.api_key:
             headers["X-API-Key"] = self.api_key
             
-        # Apply rate limiting if specified
-        if rate_limit_key and rate_limit_key in self.rate_limiters:
-            await self.rate_limiters[rate_limit_key].acquire()
-        
         # Use json parameter if provided, otherwise use data
         request_data = json if json is not None else data
         
+        # Wait for the request's weight and, if specified, its category bucket; waits run concurrently
+        waits = [self.weight_limiter.wait(request_weight(endpoint, request_data))]
+        if rate_limit_key and rate_limit_key in self.rate_limiters:
+            waits.append(self.rate_limiters[rate_limit_key].wait())
+        await asyncio.gather(*waits)
+        
         self.logger.debug(f"Making {method} request to {url}")
         self.logger.debug(f"Headers: {headers}")
         self.logger.debug(f"Request data: {request_data}")
@@ -171,74 +292,47 @@ class HyperliquidService:
             
     async def get_markets(self) -> List[MarketInfo]:
         """Get list of available markets."""
-        meta_response = await self._request(
-            "POST",
-            "info",
-            json={"type": "meta"},
-            rate_limit_key="market"
-        )
-        
-        # Get market states for prices
-        state_response = await self._request(
-            "POST",
-            "info",
-            json={"type": "allMids"},
-            rate_limit_key="market"
-        )
+        universe = await self.universe.get()
+        mids = await self.get_all_mids()
         
         markets = []
-        for market in meta_response["universe"]:
-            name = market["name"]
-            price = Decimal(str(state_response.get(name, "0")))
+        for asset in universe.assets:
+            price = mids.get(asset.name, Decimal("0"))
             markets.append(MarketInfo(
-                coin=name,
+                coin=asset.name,
                 price=price,
                 index_price=price,  # Using mid price as fallback
                 mark_price=price,   # Using mid price as fallback
                 open_interest=Decimal("0"),  # TODO: Get from API
                 funding_rate=Decimal("0"),   # TODO: Get from API
                 volume_24h=Decimal("0"),     # TODO: Get from API
-                size_decimals=market.get("szDecimals", 8)
+                size_decimals=asset.sz_decimals
             ))
             
         return markets
         
     async def get_market_summary(self, coin: str) -> MarketSummary:
         """Get market summary."""
-        # Get meta data
-        meta_response = await self._request(
-            "POST",
-            "info",
-            json={"type": "meta"},
-            rate_limit_key="market"
-        )
-        
-        # Get current prices
-        state_response = await self._request(
-            "POST",
-            "info",
-            json={"type": "allMids"},
-            rate_limit_key="market"
-        )
-        
-        market = next((m for m in meta_response["universe"] if m["name"] == coin), None)
-        if not market:
-            raise ValueError(f"Market {coin} not found")
-            
-        price = Decimal(str(state_response.get(coin, "0")))
+        await self.universe.asset(coin)
+        price = (await self.get_all_mids()).get(coin, Decimal("0"))
         
         return MarketSummary(
             coin=coin,
             price=price,
             index_price=price,  # Using mid price as fallback
             mark_price=price,   # Using mid price as fallback
-            open_interest=Decimal(str(market.get("openInterest", "0"))),
-            funding_rate=Decimal(str(market.get("fundingRate", "0"))),
-            volume_24h=Decimal(str(market.get("volume24h", "0")))
+            open_interest=Decimal("0"),  # Not part of universe metadata
+            funding_rate=Decimal("0"),
+            volume_24h=Decimal("0")
         )
         
     async def get_orderbook(self, coin: str, depth: int = 100) -> OrderbookResponse:
-        """Get orderbook."""
+        """Get orderbook, from the market stream when it has a fresh book of the coin."""
+        if self.market_stream is not None:
+            book = self.market_stream.get_book(coin, max_age=self.orderbook_max_age)
+            if book is not None:
+                return book.to_response(depth)
+
         response = await self._request(
             "POST",
             "info",
@@ -273,8 +367,35 @@ class HyperliquidService:
             ]
         )
         
+    async def get_orderbook_compact(self, coin: str, depth: int = 100) -> CompactOrderBook:
+        """Get orderbook as a ``CompactOrderBook`` without building Pydantic models.
+
+        Served from the market stream when it has a fresh book of the coin.
+        """
+        if self.market_stream is not None:
+            book = self.market_stream.get_book(coin, max_age=self.orderbook_max_age)
+            if book is not None:
+                return book
+
+        response = await self._request(
+            "POST",
+            "info",
+            json={
+                "type": "l2Book",
+                "coin": coin,
+                "depth": depth
+            },
+            rate_limit_key="market"
+        )
+        return CompactOrderBook.from_l2_book(coin, response)
+        
     async def get_recent_trades(self, coin: str, limit: int = 100) -> List[TradeInfo]:
-        """Get recent trades."""
+        """Get recent trades, from the market stream when it streams the coin's trades."""
+        if self.market_stream is not None:
+            trades = self.market_stream.get_recent_trades(coin, limit)
+            if trades is not None:
+                return trades
+
         response = await self._request(
             "POST",
             "info",
@@ -338,86 +459,224 @@ class HyperliquidService:
             self.logger.error(f"Agent approval failed: {str(e)}", exc_info=True)
             raise
         
-    async def create_order(self, request: OrderRequest) -> OrderResult:
-        """Create a new order."""
-        try:
-            self.logger.info(f"Creating order: {request}")
-            
-            # Convert order type to time-in-force
-            tif = "Alo" if request.post_only else "Gtc"
-            
-            # Current timestamp in milliseconds
-            timestamp = int(time.time() * 1000)
-            
-            # Construct order data
-            order_data = {
-                "action": {
-                    "type": "order",
-                    "orders": [{
-                        "a": 0,  # BTC is index 0 in universe
-                        "b": request.side == OrderSide.BUY,
-                        "p": str(request.price) if request.price else None,
-                        "s": str(request.size),
-                        "r": request.reduce_only,
-                        "t": {
-                            "limit": {
-                                "tif": tif
-                            }
-                        }
-                    }],
-                    "grouping": "na",
-                    "hyperliquidChain": "Testnet" if self.testnet else "Mainnet",
-                    "signatureChainId": "0xa4b1",  # Arbitrum chain ID
-                    "time": timestamp
-                },
-                "nonce": timestamp,
-                "signature": {
-                    "r": "0x0000000000000000000000000000000000000000000000000000000000000000",
-                    "s": "0x0000000000000000000000000000000000000000000000000000000000000000",
-                    "v": 27
+    def _next_nonce(self) -> int:
+        # Exchange nonces must be unique, so actions sent in the same millisecond get consecutive ones
+        self._last_nonce = max(int(time.time() * 1000), self._last_nonce + 1)
+        return self._last_nonce
+
+    async def _exchange_action(self, action: Dict[str, Any]) -> Tuple[List[Any], int]:
+        """Send one signed exchange action.
+
+        Returns:
+            Per-item statuses of the action and its timestamp
+        """
+        timestamp = self._next_nonce()
+        request_data = {
+            "action": {
+                **action,
+                "hyperliquidChain": "Testnet" if self.testnet else "Mainnet",
+                "signatureChainId": "0xa4b1",  # Arbitrum chain ID
+                "time": timestamp
+            },
+            "nonce": timestamp,
+            "signature": {
+                "r": "0x0000000000000000000000000000000000000000000000000000000000000000",  # TODO: Generate signature
+                "s": "0x0000000000000000000000000000000000000000000000000000000000000000",
+                "v": 27
+            }
+        }
+        
+        self.logger.debug(f"Exchange request data: {request_data}")
+        
+        response = await self._request(
+            "POST",
+            "exchange",
+            json=request_data,
+            auth_required=True,
+            rate_limit_key="order"
+        )
+        
+        self.logger.debug(f"Exchange response: {response}")
+        
+        if response.get("status") == "err":
+            raise ValueError(f"Exchange action failed: {response.get('response')}")
+        return response.get("response", {}).get("data", {}).get("statuses", []), timestamp
+
+    @staticmethod
+    def _order_wire(request: OrderRequest, asset_index: int) -> Dict[str, Any]:
+        # Convert order type to time-in-force
+        tif = "Alo" if request.post_only else "Gtc"
+        return {
+            "a": asset_index,
+            "b": request.side == OrderSide.BUY,
+            "p": str(request.price) if request.price else None,
+            "s": str(request.size),
+            "r": request.reduce_only,
+            "t": {
+                "limit": {
+                    "tif": tif
                 }
             }
-            
-            self.logger.debug(f"Order request data: {order_data}")
-            
-            response = await self._request(
-                "POST",
-                "exchange",
-                json=order_data,
-                auth_required=True,
-                rate_limit_key="order"
+        }
+
+    @staticmethod
+    def _order_result(request: OrderRequest, status: Any, timestamp: int) -> OrderResult:
+        """Map one order status of an exchange response to a result."""
+        if not isinstance(status, dict) or "error" in status:
+            error = status.get("error") if isinstance(status, dict) else status
+            return OrderResult(success=False, error=f"Order rejected: {error}")
+        
+        filled = status.get("filled")
+        order_id = (status.get("resting") or filled or {}).get("oid")
+        if order_id is None:
+            return OrderResult(success=False, error="Failed to get order ID from response")
+        
+        return OrderResult(
+            success=True,
+            order=OrderResponse(
+                id=str(order_id),
+                client_id=request.client_id,
+                coin=request.coin,
+                size=request.size,
+                price=request.price,
+                side=request.side,
+                type=request.type,
+                status=OrderStatus.FILLED if filled else OrderStatus.NEW,
+                filled_size=Decimal(str(filled["totalSz"])) if filled and "totalSz" in filled else None,
+                average_fill_price=Decimal(str(filled["avgPx"])) if filled and "avgPx" in filled else None,
+                reduce_only=request.reduce_only,
+                post_only=request.post_only,
+                created_at=timestamp
             )
+        )
+
+    async def _resolve_assets(
+        self,
+        coins: List[str],
+        results: List[Optional[OrderResult]]
+    ) -> Tuple[Dict[str, int], List[int]]:
+        """Resolve coins to asset indexes, failing the results of unknown coins.
+
+        Returns:
+            Asset index per coin and the positions that can be sent
+        """
+        indexes, errors = {}, {}
+        for coin in dict.fromkeys(coins):
+            try:
+                indexes[coin] = await self.universe.asset_index(coin)
+            except ValueError as e:
+                errors[coin] = str(e)
+        sent = []
+        for position, coin in enumerate(coins):
+            if coin in errors:
+                results[position] = OrderResult(success=False, error=errors[coin])
+            else:
+                sent.append(position)
+        return indexes, sent
+
+    async def create_orders(self, requests: List[OrderRequest]) -> List[OrderResult]:
+        """Create many orders in one signed action.
+        
+        Args:
+            requests: Orders to place
             
-            self.logger.debug(f"Order response: {response}")
-            
-            # Extract order ID from response
-            order_id = response.get("response", {}).get("data", {}).get("statuses", [{}])[0].get("resting", {}).get("oid")
-            if not order_id:
-                raise ValueError("Failed to get order ID from response")
+        Returns:
+            One result per request, in order; orders the exchange rejected
+            (or for unknown coins) fail individually
+        """
+        results: List[Optional[OrderResult]] = [None] * len(requests)
+        try:
+            indexes, sent = await self._resolve_assets([request.coin for request in requests], results)
+            if sent:
+                self.logger.info(f"Creating {len(sent)} orders in one action")
+                statuses, timestamp = await self._exchange_action({
+                    "type": "order",
+                    "orders": [self._order_wire(requests[i], indexes[requests[i].coin]) for i in sent],
+                    "grouping": "na"
+                })
+                for n, position in enumerate(sent):
+                    status = statuses[n] if n < len(statuses) else None
+                    results[position] = self._order_result(requests[position], status, timestamp)
+        except Exception as e:
+            self.logger.error(f"Order creation failed: {str(e)}", exc_info=True)
+            results = [result or OrderResult(success=False, error=str(e)) for result in results]
+        return results
+
+    async def create_order(self, request: OrderRequest) -> OrderResult:
+        """Create a new order.
+        
+        Orders created concurrently within ``order_batch_window`` seconds are
+        sent together in one action.
+        """
+        self.logger.info(f"Creating order: {request}")
+        if self.order_batcher is not None:
+            return await self.order_batcher.submit(request)
+        return (await self.create_orders([request]))[0]
+
+    async def modify_orders(self, modifies: List[Tuple[str, OrderRequest]]) -> List[OrderResult]:
+        """Modify many resting orders in one signed action.
+        
+        Args:
+            modifies: (order ID, new order parameters) pairs
             
-            return OrderResult(
-                success=True,
-                order=OrderResponse(
-                    id=str(order_id),
-                    client_id=request.client_id,
-                    coin=request.coin,
-                    size=request.size,
-                    price=request.price,
-                    side=request.side,
-                    type=request.type,
-                    status=OrderStatus.NEW,
-                    reduce_only=request.reduce_only,
-                    post_only=request.post_only,
-                    created_at=timestamp
-                )
-            )
+        Returns:
+            One result per modification, in order, holding the order's new ID
+        """
+        requests = [request for _, request in modifies]
+        results: List[Optional[OrderResult]] = [None] * len(modifies)
+        try:
+            indexes, sent = await self._resolve_assets([request.coin for request in requests], results)
+            if sent:
+                statuses, timestamp = await self._exchange_action({
+                    "type": "batchModify",
+                    "modifies": [
+                        {"oid": int(modifies[i][0]), "order": self._order_wire(requests[i], indexes[requests[i].coin])}
+                        for i in sent
+                    ]
+                })
+                for n, position in enumerate(sent):
+                    status = statuses[n] if n < len(statuses) else None
+                    results[position] = self._order_result(requests[position], status, timestamp)
+        except Exception as e:
+            self.logger.error(f"Order modification failed: {str(e)}", exc_info=True)
+            results = [result or OrderResult(success=False, error=str(e)) for result in results]
+        return results
+
+    async def cancel_orders(self, cancels: List[Tuple[str, str]]) -> List[OrderResult]:
+        """Cancel many orders in one signed action.
+        
+        Args:
+            cancels: (market symbol, order ID) pairs
             
+        Returns:
+            One result per cancel, in order
+        """
+        results: List[Optional[OrderResult]] = [None] * len(cancels)
+        try:
+            indexes, sent = await self._resolve_assets([coin for coin, _ in cancels], results)
+            if sent:
+                statuses, timestamp = await self._exchange_action({
+                    "type": "cancel",
+                    "cancels": [{"a": indexes[cancels[i][0]], "o": int(cancels[i][1])} for i in sent]
+                })
+                for n, position in enumerate(sent):
+                    coin, order_id = cancels[position]
+                    status = statuses[n] if n < len(statuses) else None
+                    if status != "success":
+                        results[position] = OrderResult(success=False, error=f"Cancel failed with status: {status}")
+                        continue
+                    results[position] = OrderResult(
+                        success=True,
+                        order=OrderResponse(
+                            id=order_id,
+                            coin=coin,
+                            status=OrderStatus.CANCELLED,
+                            created_at=timestamp
+                        )
+                    )
         except Exception as e:
-            self.logger.error(f"Order creation failed: {str(e)}", exc_info=True)
-            return OrderResult(
-                success=False,
-                error=str(e)
-            )
+            results = [result or OrderResult(success=False, error=str(e)) for result in results]
+        return results
             
     async def cancel_order(self, coin: str, order_id: str) -> OrderResult:
         """Cancel an order.
@@ -429,54 +688,7 @@ class HyperliquidService:
         Returns:
             Order result
         """
-        try:
-            timestamp = int(time.time() * 1000)
-            
-            response = await self._request(
-                "POST",
-                "exchange",
-                json={
-                    "action": {
-                        "type": "cancel",
-                        "cancels": [{
-                            "a": 0,  # BTC is index 0 in universe
-                            "o": int(order_id)
-                        }],
-                        "hyperliquidChain": "Testnet" if self.testnet else "Mainnet",
-                        "signatureChainId": "0xa4b1",  # Arbitrum chain ID
-                        "time": timestamp
-                    },
-                    "nonce": timestamp,
-                    "signature": {
-                        "r": "0x...",  # TODO: Generate signature
-                        "s": "0x...",
-                        "v": 27
-                    }
-                },
-                auth_required=True,
-                rate_limit_key="order"
-            )
-            
-            # Check if cancel was successful
-            status = response.get("response", {}).get("data", {}).get("statuses", [])[0]
-            if status != "success":
-                raise ValueError(f"Cancel failed with status: {status}")
-            
-            return OrderResult(
-                success=True,
-                order=OrderResponse(
-                    id=order_id,
-                    coin=coin,
-                    status=OrderStatus.CANCELLED,
-                    created_at=timestamp
-                )
-            )
-            
-        except Exception as e:
-            return OrderResult(
-                success=False,
-                error=str(e)
-            )
+        return (await self.cancel_orders([(coin, order_id)]))[0]
             
     async def cancel_all_orders(self, coin: Optional[str] = None) -> List[OrderResult]:
         """Cancel all orders.
@@ -496,7 +708,7 @@ class HyperliquidService:
                     "coin": coin
                 },
                 auth_required=True,
-                rate_limit_type="order"
+                rate_limit_key="order"
             )
             
             return [
@@ -532,7 +744,7 @@ class HyperliquidService:
                 "coin": coin
             },
             auth_required=True,
-            rate_limit_type="order"
+            rate_limit_key="order"
         )
         
         return [
@@ -586,7 +798,7 @@ class HyperliquidService:
                 "endTime": end_time
             },
             auth_required=True,
-            rate_limit_type="order"
+            rate_limit_key="order"
         )
         
         return [
@@ -630,7 +842,7 @@ class HyperliquidService:
                 "orderId": order_id
             },
             auth_required=True,
-            rate_limit_type="order"
+            rate_limit_key="order"
         )
         
         return OrderResponse(
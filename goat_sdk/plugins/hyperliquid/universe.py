@@ -0,0 +1,170 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/hyperliquid/universe.py
+"""
+
+"""Cached Hyperliquid universe metadata.
+
+Orders refer to assets by their index in the ``meta`` universe, and sizes
+must respect each asset's ``szDecimals``. ``UniverseCache`` loads the
+universe once, refreshes it every ``ttl`` seconds (concurrent callers share
+one request) and resolves coins to their ``AssetMeta``. The info API has no
+ETag, so each refresh is fingerprinted instead: an unchanged universe keeps
+the existing index, and a coin missing from it triggers one early refresh
+in case it was listed since the last load (at most once every
+``UNKNOWN_COIN_REFRESH_INTERVAL`` seconds).
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from goat_sdk.core.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds the universe is reused before it is fetched again
+UNIVERSE_TTL = 300.0
+
+# Minimum seconds between refreshes forced by unknown coins
+UNKNOWN_COIN_REFRESH_INTERVAL = 10.0
+
+# Seconds one allMids snapshot is shared between callers
+MIDS_TICK = 1.0
+
+
+@dataclass(frozen=True)
+class AssetMeta:
+    """One asset of the universe."""
+    name: str
+    index: int  # Asset index used as "a" in exchange actions
+    sz_decimals: int
+    max_leverage: int
+    only_isolated: bool = False
+
+
+class Universe:
+    """Universe assets indexed by coin name."""
+
+    def __init__(self, assets: List[AssetMeta], fingerprint: str):
+        self.assets = assets
+        self.fingerprint = fingerprint
+        self.by_name: Dict[str, AssetMeta] = {asset.name: asset for asset in assets}
+
+    @classmethod
+    def from_meta(cls, response: Dict[str, Any]) -> "Universe":
+        """Build the universe from a ``{"type": "meta"}`` response."""
+        universe = response.get("universe", [])
+        assets = [
+            AssetMeta(
+                name=asset["name"],
+                index=index,
+                sz_decimals=int(asset.get("szDecimals", 8)),
+                max_leverage=int(asset.get("maxLeverage", 1)),
+                only_isolated=bool(asset.get("onlyIsolated", False))
+            )
+            for index, asset in enumerate(universe)
+        ]
+        return cls(assets, fingerprint(universe))
+
+    def get(self, coin: str) -> Optional[AssetMeta]:
+        return self.by_name.get(coin)
+
+    def __contains__(self, coin: str) -> bool:
+        return coin in self.by_name
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+
+def fingerprint(universe: List[Dict[str, Any]]) -> str:
+    """Digest of a raw universe list, used to detect changes between refreshes."""
+    return hashlib.sha1(json.dumps(universe, sort_keys=True).encode()).hexdigest()
+
+
+class UniverseCache:
+    """Universe metadata loaded once and refreshed periodically."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[Dict[str, Any]]], ttl: float = UNIVERSE_TTL):
+        """Initialize universe cache.
+
+        Args:
+            fetch: Coroutine function returning a ``{"type": "meta"}`` response
+            ttl: Seconds the universe is reused before it is fetched again
+        """
+        self._fetch = fetch
+        self._cache = TTLCache("hyperliquid.universe", ttl=ttl, max_entries=1)
+        self._universe: Optional[Universe] = None
+        self._loaded_at = 0.0
+
+    async def _load(self) -> Universe:
+        response = await self._fetch()
+        self._loaded_at = time.monotonic()
+        digest = fingerprint(response.get("universe", []))
+        if self._universe is not None and self._universe.fingerprint == digest:
+            logger.debug("Hyperliquid universe unchanged")
+            return self._universe
+        self._universe = Universe.from_meta(response)
+        logger.debug(f"Loaded Hyperliquid universe with {len(self._universe)} assets")
+        return self._universe
+
+    async def get(self) -> Universe:
+        """Get the universe, fetching it when the cached one is too old."""
+        return await self._cache.get_or_load("universe", self._load)
+
+    async def refresh(self) -> Universe:
+        """Fetch the universe now."""
+        self._cache.clear()
+        return await self.get()
+
+    def invalidate(self) -> None:
+        """Drop the cached universe so the next lookup fetches it."""
+        self._cache.clear()
+
+    async def asset(self, coin: str) -> AssetMeta:
+        """Resolve a coin to its asset metadata.
+
+        Raises:
+            ValueError: If the coin is not listed, even after a refresh
+        """
+        universe = await self.get()
+        asset = universe.get(coin)
+        if asset is None and time.monotonic() - self._loaded_at >= UNKNOWN_COIN_REFRESH_INTERVAL:
+            universe = await self.refresh()
+            asset = universe.get(coin)
+        if asset is None:
+            raise ValueError(f"Market {coin} not found")
+        return asset
+
+    async def asset_index(self, coin: str) -> int:
+        """Resolve a coin to the asset index used in exchange actions."""
+        return (await self.asset(coin)).index
@@ -31,43 +31,59 @@
 
 """Utility classes and functions."""
 
-import asyncio
-import time
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
-class RateLimiter:
+from goat_sdk.core.utils.rate_limit import RateLimiter as _TokenBucket
+
+# Request weight allowed per IP per minute
+IP_WEIGHT_PER_MINUTE = 1200
+
+# Info request types with a reduced weight; every other info request weighs 20
+LIGHT_INFO_REQUESTS = {
+    "l2Book", "allMids", "clearinghouseState", "orderStatus", "spotClearinghouseState", "exchangeStatus"
+}
+LIGHT_INFO_WEIGHT = 2
+INFO_WEIGHT = 20
+USER_ROLE_WEIGHT = 60
+
+# Orders or cancels per extra unit of exchange action weight
+EXCHANGE_BATCH_UNIT = 40
+
+
+def request_weight(endpoint: str, payload: Optional[Dict[str, Any]] = None) -> int:
+    """Weight of a request against the per-IP limit.
+
+    Exchange actions weigh 1 plus 1 per 40 orders or cancels they carry;
+    info requests weigh 2, 20 or 60 depending on their type.
+    """
+    payload = payload or {}
+    if endpoint == "exchange":
+        action = payload.get("action", {})
+        items = action.get("orders") or action.get("cancels") or action.get("modifies") or []
+        return 1 + len(items) // EXCHANGE_BATCH_UNIT
+    request_type = payload.get("type")
+    if request_type in LIGHT_INFO_REQUESTS:
+        return LIGHT_INFO_WEIGHT
+    if request_type == "userRole":
+        return USER_ROLE_WEIGHT
+    return INFO_WEIGHT
+
+
+class RateLimiter(_TokenBucket):
     """Rate limiter for API requests."""
     
     def __init__(self, max_rate: int, time_period: float = 1.0):
         """Initialize rate limiter.
         
         Args:
-            max_rate: Maximum number of requests per time period
+            max_rate: Maximum number of requests per time period (also the burst)
             time_period: Time period in seconds
         """
+        super().__init__(rate=max_rate / time_period, burst=max_rate)
         self.max_rate = max_rate
         self.time_period = time_period
-        self.tokens = max_rate
-        self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
         
-    async def acquire(self):
-        """Acquire a token, waiting if necessary."""
-        async with self._lock:
-            now = time.monotonic()
-            time_passed = now - self.last_update
-            self.last_update = now
-            
-            # Add new tokens based on time passed
-            self.tokens = min(
-                self.max_rate,
-                self.tokens + time_passed * (self.max_rate / self.time_period)
-            )
-            
-            if self.tokens < 1:
-                # Wait until we have a token
-                wait_time = (1 - self.tokens) * (self.time_period / self.max_rate)
-                await asyncio.sleep(wait_time)
-                self.tokens = 1
-                
-            self.tokens -= 1 
\ No newline at end of file
+    async def acquire(self, weight: float = 1) -> bool:
+        """Acquire tokens, waiting if necessary without blocking other callers."""
+        await self.wait(weight)
+        return True
@@ -0,0 +1,358 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: goat_sdk/plugins/hyperliquid/websocket.py
+"""
+
+"""WebSocket market-data client for Hyperliquid.
+
+``HyperliquidWebSocket`` keeps one connection to the Hyperliquid WebSocket
+API, subscribes to ``l2Book``, ``trades``, ``allMids`` and ``userFills``
+feeds, and maintains a local order book (a ``CompactOrderBook``), recent
+trades and mid prices per coin from them. The connection is kept alive with
+``ping`` messages, re-established with backoff when it drops, and every
+subscription is sent again after reconnecting.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Union
+
+import aiohttp
+
+from .orderbook import CompactOrderBook
+from .types.market import TradeInfo
+from .types.order import OrderSide
+
+logger = logging.getLogger(__name__)
+
+# Recent trades and fills kept per coin / user
+MAX_RECENT_TRADES = 1000
+MAX_RECENT_FILLS = 1000
+
+# Reconnect backoff in seconds
+RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30.0
+
+Callback = Callable[[Any], Union[None, Awaitable[None]]]
+
+
+class LocalOrderBook(CompactOrderBook):
+    """Latest ``l2Book`` snapshot of one coin."""
+
+    def __init__(self, coin: str, **kwargs: Any):
+        super().__init__(coin, **kwargs)
+        self.time = 0  # Exchange timestamp in milliseconds
+        self.received_at = 0.0  # time.monotonic() of the last update
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """Replace the book with an ``l2Book`` message."""
+        self.apply_snapshot(data.get("levels", [[], []]))
+        self.time = int(data.get("time", 0))
+        self.received_at = time.monotonic()
+
+    def age(self) -> float:
+        """Seconds since the last update."""
+        return time.monotonic() - self.received_at
+
+
+def _subscription_key(subscription: Dict[str, Any]) -> str:
+    return json.dumps(subscription, sort_keys=True)
+
+
+class HyperliquidWebSocket:
+    """Hyperliquid WebSocket subscriptions with local market state."""
+
+    def __init__(
+        self,
+        url: str,
+        ping_interval: float = 20.0,
+        ping_timeout: float = 10.0,
+        session: Optional[aiohttp.ClientSession] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """Initialize WebSocket client.
+
+        Args:
+            url: WebSocket URL
+            ping_interval: Seconds between heartbeat pings
+            ping_timeout: Seconds to wait for any message after a ping before reconnecting
+            session: Optional aiohttp session
+            logger: Optional logger
+        """
+        self.url = url
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._session = session
+        self._owns_session = session is None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = True
+        self._connected = asyncio.Event()
+        self._last_message = 0.0
+
+        self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._callbacks: Dict[str, List[Callback]] = {}
+
+        self.books: Dict[str, LocalOrderBook] = {}
+        self.trades: Dict[str, Deque[TradeInfo]] = {}
+        self.mids: Dict[str, Decimal] = {}
+        self.mids_received_at = 0.0
+        self.fills: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._book_events: Dict[str, asyncio.Event] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether the WebSocket is currently connected."""
+        return self._connected.is_set()
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Connect in the background and keep the connection alive."""
+        if self._task is not None and not self._task.done():
+            return
+        self._closed = False
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """Wait until the WebSocket is connected."""
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def close(self) -> None:
+        """Close the connection and stop reconnecting."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        self._connected.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY
+        while not self._closed:
+            try:
+                async with self._session.ws_connect(self.url, autoping=True) as ws:
+                    self._ws = ws
+                    self._last_message = time.monotonic()
+                    self._connected.set()
+                    delay = RECONNECT_DELAY
+                    self.logger.info(f"Connected to {self.url}")
+                    for subscription in self._subscriptions.values():
+                        await self._send({"method": "subscribe", "subscription": subscription})
+                    await self._read_loop(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"WebSocket error: {str(e)}")
+            finally:
+                self._ws = None
+                self._connected.clear()
+
+            if self._closed:
+                break
+            # Jitter so many clients do not reconnect in lockstep
+            wait = delay * (1 + random.random() / 2)
+            self.logger.info(f"WebSocket disconnected, reconnecting in {wait:.1f} s")
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        heartbeat = asyncio.get_running_loop().create_task(self._heartbeat(ws))
+        try:
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    self._last_message = time.monotonic()
+                    await self._dispatch(json.loads(message.data))
+                elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Ping the server and drop the connection if it stops answering."""
+        while not ws.closed:
+            await asyncio.sleep(self.ping_interval)
+            sent_at = time.monotonic()
+            await ws.send_json({"method": "ping"})
+            await asyncio.sleep(self.ping_timeout)
+            if self._last_message < sent_at:
+                self.logger.warning(f"No WebSocket message within {self.ping_timeout} s of ping, reconnecting")
+                await ws.close()
+                return
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.send_json(message)
+
+    # Subscriptions
+
+    async def subscribe(self, subscription: Dict[str, Any], callback: Optional[Callback] = None) -> None:
+        """Subscribe to a feed; it is resubscribed after every reconnect.
+
+        Args:
+            subscription: Subscription object, e.g. ``{"type": "l2Book", "coin": "BTC"}``
+            callback: Optional function (sync or async) called with each message's data
+        """
+        key = _subscription_key(subscription)
+        if callback is not None:
+            self._callbacks.setdefault(key, []).append(callback)
+        if key in self._subscriptions:
+            return
+        self._subscriptions[key] = subscription
+        await self._send({"method": "subscribe", "subscription": subscription})
+
+    async def unsubscribe(self, subscription: Dict[str, Any]) -> None:
+        """Stop a feed and drop its callbacks."""
+        key = _subscription_key(subscription)
+        self._callbacks.pop(key, None)
+        if self._subscriptions.pop(key, None) is not None:
+            await self._send({"method": "unsubscribe", "subscription": subscription})
+
+    async def subscribe_l2_book(self, coin: str, callback: Optional[Callback] = None) -> None:
+        """Maintain the order book of a coin."""
+        await self.subscribe({"type": "l2Book", "coin": coin}, callback)
+
+    async def subscribe_trades(self, coin: str, callback: Optional[Callback] = None) -> None:
+        """Keep the recent trades of a coin."""
+        await self.subscribe({"type": "trades", "coin": coin}, callback)
+
+    async def subscribe_all_mids(self, callback: Optional[Callback] = None) -> None:
+        """Keep mid prices of all coins."""
+        await self.subscribe({"type": "allMids"}, callback)
+
+    async def subscribe_user_fills(self, user: str, callback: Optional[Callback] = None) -> None:
+        """Keep the fills of a user address."""
+        await self.subscribe({"type": "userFills", "user": user}, callback)
+
+    # Message handling
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        channel = message.get("channel")
+        data = message.get("data")
+        if channel == "l2Book":
+            coin = data["coin"]
+            self.books.setdefault(coin, LocalOrderBook(coin)).update(data)
+            self._book_events.setdefault(coin, asyncio.Event()).set()
+            key = _subscription_key({"type": "l2Book", "coin": coin})
+        elif channel == "trades":
+            if not data:
+                return
+            coin = data[0]["coin"]
+            trades = self.trades.setdefault(coin, deque(maxlen=MAX_RECENT_TRADES))
+            trades.extend(
+                TradeInfo(
+                    coin=coin,
+                    id=str(trade["tid"]),
+                    price=Decimal(trade["px"]),
+                    size=Decimal(trade["sz"]),
+                    side=OrderSide.BUY if trade["side"] == "B" else OrderSide.SELL,
+                    timestamp=int(trade["time"])
+                )
+                for trade in data
+            )
+            key = _subscription_key({"type": "trades", "coin": coin})
+        elif channel == "allMids":
+            self.mids = {coin: Decimal(price) for coin, price in data["mids"].items()}
+            self.mids_received_at = time.monotonic()
+            key = _subscription_key({"type": "allMids"})
+        elif channel == "userFills":
+            user = data["user"]
+            self.fills.setdefault(user.lower(), deque(maxlen=MAX_RECENT_FILLS)).extend(data.get("fills", []))
+            key = _subscription_key({"type": "userFills", "user": user})
+        elif channel == "subscriptionResponse":
+            self.logger.debug(f"Subscription acknowledged: {data}")
+            return
+        elif channel == "pong":
+            return
+        else:
+            self.logger.debug(f"Unhandled WebSocket message: {message}")
+            return
+
+        for callback in self._callbacks.get(key, []):
+            try:
+                result = callback(data)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"WebSocket callback for {channel} failed: {str(e)}", exc_info=True)
+
+    # Local state
+
+    def get_book(self, coin: str, max_age: Optional[float] = None) -> Optional[LocalOrderBook]:
+        """Get the local order book of a subscribed coin.
+
+        Args:
+            coin: Market symbol
+            max_age: Seconds after which the book is considered stale
+
+        Returns:
+            The book, or None if there is none or it is stale or disconnected
+        """
+        book = self.books.get(coin)
+        if book is None or not self.connected:
+            return None
+        if max_age is not None and book.age() > max_age:
+            return None
+        return book
+
+    async def wait_for_book(self, coin: str, timeout: Optional[float] = None) -> LocalOrderBook:
+        """Wait for the first ``l2Book`` snapshot of a coin."""
+        await asyncio.wait_for(self._book_events.setdefault(coin, asyncio.Event()).wait(), timeout)
+        return self.books[coin]
+
+    def get_recent_trades(self, coin: str, limit: int = 100) -> Optional[List[TradeInfo]]:
+        """Get the latest trades of a subscribed coin, oldest first; None if not subscribed."""
+        if _subscription_key({"type": "trades", "coin": coin}) not in self._subscriptions or not self.connected:
+            return None
+        trades = self.trades.get(coin, ())
+        return list(trades)[-limit:]
+
+    def get_mid(self, coin: str) -> Optional[Decimal]:
+        """Get the latest mid price of a coin from ``allMids``."""
+        if not self.connected:
+            return None
+        return self.mids.get(coin)
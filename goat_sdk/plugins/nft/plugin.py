@@ -31,12 +31,13 @@
 """NFT plugin implementation."""
 
 from typing import List, Optional, Dict, Any
-from solana.rpc.async_api import AsyncClient
 from solana.transaction import Transaction
 from solders.pubkey import Pubkey
 from solders.instruction import Instruction as TransactionInstruction
 from goat_sdk.core.plugin_base import PluginBase
+from goat_sdk.core.utils.blockhash import get_blockhash_cache
 from goat_sdk.core.utils.retry import with_retry
+from goat_sdk.core.utils.solana_rpc import get_solana_connection_manager
 from goat_sdk.core.telemetry.middleware import trace_transaction
 from .types import (
     MintNFTParams, TransferNFTParams, NFTInfo, NFTMetadata,
@@ -53,16 +54,36 @@ BUBBLEGUM_PROGRAM_ID = Pubkey.from_string("BGUMAp9Gq7iTEuizy4pqaxsTyUCBK68MDfK75
 class NFTPlugin(PluginBase):
     """Plugin for NFT operations on Solana."""
 
-    def __init__(self, wallet_client):
+    def __init__(self, wallet_client, fallback_endpoints: Optional[List[str]] = None):
         """Initialize NFT plugin.
         
         Args:
             wallet_client: Wallet client instance
+            fallback_endpoints: RPC endpoints to fail over to when the wallet's is unreachable
         """
         self.wallet_client = wallet_client
-        self.connection = AsyncClient(wallet_client.provider_url)
+        self._endpoints = [wallet_client.provider_url, *(fallback_endpoints or [])]
+        self.connection = get_solana_connection_manager().acquire(self._endpoints)
+        self.blockhash_cache = get_blockhash_cache(self.connection)
         super().__init__("nft", [])  # Initialize with empty tools list for now
 
+    async def cleanup(self) -> None:
+        """Stop the blockhash refresher and release the plugin's pooled RPC connection."""
+        await self.blockhash_cache.stop()
+        if self.connection is not None:
+            await get_solana_connection_manager().release(self._endpoints)
+            self.connection = None
+
+    def _new_transaction(self) -> Transaction:
+        """Create a transaction using the shared cached blockhash.
+
+        The blockhash is only set when the cache holds a fresh one; the first
+        lookup starts the cache's background refresher, and until it has
+        fetched one the wallet client fetches the blockhash when sending.
+        """
+        recent = self.blockhash_cache.peek()
+        return Transaction(recent_blockhash=recent.blockhash if recent else None)
+
     def supports_chain(self, chain: str) -> bool:
         """Check if chain is supported.
         
@@ -100,7 +121,7 @@ class NFTPlugin(PluginBase):
         )
 
         # Send transaction
-        transaction = Transaction()
+        transaction = self._new_transaction()
         transaction.add(mint_ix)
         result = await self.wallet_client.send_transaction(transaction)
 
@@ -136,7 +157,7 @@ class NFTPlugin(PluginBase):
         )
 
         # Send transaction
-        transaction = Transaction()
+        transaction = self._new_transaction()
         transaction.add(transfer_ix)
         result = await self.wallet_client.send_transaction(transaction)
         return result["hash"]
@@ -251,7 +272,7 @@ class NFTPlugin(PluginBase):
             Pubkey.from_string(params.to_address)
         )
         
-        transaction = Transaction()
+        transaction = self._new_transaction()
         transaction.add(transfer_ix)
         result = await self.wallet_client.send_transaction(transaction)
         return result["hash"]
@@ -296,7 +317,7 @@ class NFTPlugin(PluginBase):
             params.update_authority
         )
         
-        transaction = Transaction()
+        transaction = self._new_transaction()
         transaction.add(update_ix)
         await self.wallet_client.send_transaction(transaction)
         
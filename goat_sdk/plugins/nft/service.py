@@ -33,14 +33,15 @@
 
 from typing import Dict, Any
 from goat_sdk.core.decorators import tool
+from goat_sdk.core.utils.blockhash import get_blockhash_cache
 from goat_sdk.core.utils.retry import with_retry
+from goat_sdk.core.utils.solana_rpc import get_solana_connection_manager
 from goat_sdk.core.telemetry.middleware import trace_transaction
 from metaplex.bubblegum import (
     get_asset_with_proof,
     create_transfer_instruction,
     BubblegumProgram
 )
-from solana.rpc.async_api import AsyncClient
 from solana.publickey import PublicKey
 from solana.transaction import Transaction
 from .types import TransferNFTParams
@@ -82,26 +83,30 @@ class NFTService:
         # Validate parameters
         transfer_params = TransferNFTParams(**params)
         
-        # Create connection
-        connection = AsyncClient(wallet_client.provider_url)
-        
-        # Get asset with proof
-        asset_with_proof = await get_asset_with_proof(
-            connection,
-            PublicKey(transfer_params.asset_id),
-            truncate_canopy=True
-        )
-        
-        # Create transfer instruction
-        transfer_ix = create_transfer_instruction(
-            BubblegumProgram.ID,
-            asset_with_proof,
-            PublicKey(wallet_client.get_address()),
-            PublicKey(transfer_params.recipient_address)
-        )
-        
-        # Send transaction
-        transaction = Transaction().add(transfer_ix)
-        result = await wallet_client.send_transaction(transaction)
-        
+        # Hold the endpoint's pooled connection so a plugin's cleanup cannot close it mid-request
+        manager = get_solana_connection_manager()
+        connection = manager.acquire(wallet_client.provider_url)
+        try:
+            # Get asset with proof
+            asset_with_proof = await get_asset_with_proof(
+                connection,
+                PublicKey(transfer_params.asset_id),
+                truncate_canopy=True
+            )
+
+            # Create transfer instruction
+            transfer_ix = create_transfer_instruction(
+                BubblegumProgram.ID,
+                asset_with_proof,
+                PublicKey(wallet_client.get_address()),
+                PublicKey(transfer_params.recipient_address)
+            )
+
+            # Send transaction, using the shared cached blockhash when a fresh one is available
+            recent = get_blockhash_cache(connection).peek()
+            transaction = Transaction(recent_blockhash=recent.blockhash if recent else None).add(transfer_ix)
+            result = await wallet_client.send_transaction(transaction)
+        finally:
+            await manager.release(wallet_client.provider_url)
+
         return result["hash"]
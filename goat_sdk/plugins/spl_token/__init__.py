@@ -7,6 +7,8 @@ from goat_sdk.plugins.spl_token.parameters import (
     TransferTokenByMintAddressParameters,
     ConvertToBaseUnitParameters,
 )
+from goat_sdk.plugins.spl_token.registry import SplTokenRegistry
+from goat_sdk.plugins.spl_token.bulk_transfer import BulkTransfer, BulkTransferEngine, TransferStatus
 from goat_sdk.plugins.spl_token.tokens import SPL_TOKENS, Token, SolanaNetwork
 
 __all__ = [
@@ -15,6 +17,10 @@ __all__ = [
     "GetTokenMintAddressBySymbolParameters",
     "TransferTokenByMintAddressParameters",
     "ConvertToBaseUnitParameters",
+    "SplTokenRegistry",
+    "BulkTransfer",
+    "BulkTransferEngine",
+    "TransferStatus",
     "SPL_TOKENS",
     "Token",
     "SolanaNetwork",
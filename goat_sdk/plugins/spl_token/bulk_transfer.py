@@ -0,0 +1,264 @@
+"""Bulk SPL token transfers.
+
+``BulkTransferEngine`` sends one mint to many recipients. Recipient token
+accounts are derived and checked in batch, missing ones are created with the
+idempotent associated-token-account instruction in the same transaction as
+their transfer, and as many recipients as fit under the transaction size and
+compute limits are packed into each transaction. Transactions share a cached
+blockhash and are sent with bounded concurrency, re-signed if the blockhash
+expires before they land; every recipient gets its own status.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from solana.rpc.types import TxOpts
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import ID as SYS_PROGRAM_ID
+from solders.transaction import Transaction
+
+from goat_sdk.core.utils.blockhash import BlockhashCache, RecentBlockhash, get_blockhash_cache, send_with_blockhash
+from goat_sdk.plugins.spl_token.utils.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from goat_sdk.plugins.spl_token.utils.does_account_exist import does_accounts_exist, set_account_exists
+from goat_sdk.plugins.spl_token.utils.token_account import derive_associated_token_address, derive_atas_async
+
+logger = logging.getLogger(__name__)
+
+# Serialized transaction size limit (IPv6 MTU minus headers)
+MAX_TRANSACTION_SIZE = 1232
+
+# Compute units per transaction and conservative per-instruction estimates
+MAX_TRANSACTION_COMPUTE_UNITS = 1_400_000
+CREATE_ATA_COMPUTE_UNITS = 35_000
+TRANSFER_COMPUTE_UNITS = 6_000
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Associated token program CreateIdempotent and token program Transfer instruction tags
+CREATE_IDEMPOTENT_INSTRUCTION = 1
+TRANSFER_INSTRUCTION = 3
+
+STATUS_CONFIRMED = "confirmed"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class BulkTransfer:
+    """One recipient of a bulk transfer."""
+    recipient: str  # Recipient wallet address
+    amount: int  # Amount in base units
+
+
+@dataclass
+class TransferStatus:
+    """Outcome of one recipient's transfer."""
+    recipient: str
+    amount: int
+    token_account: Optional[str] = None
+    created_account: bool = False
+    status: str = STATUS_FAILED
+    signature: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != STATUS_FAILED
+
+
+def create_idempotent_ata_instruction(payer: Pubkey, owner: Pubkey, mint: Pubkey, ata: Pubkey,
+                                      token_program_id: Pubkey) -> Instruction:
+    """Create an associated token account, succeeding if it already exists."""
+    return Instruction(
+        program_id=Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID),
+        accounts=[
+            AccountMeta(payer, is_signer=True, is_writable=True),
+            AccountMeta(ata, is_signer=False, is_writable=True),
+            AccountMeta(owner, is_signer=False, is_writable=False),
+            AccountMeta(mint, is_signer=False, is_writable=False),
+            AccountMeta(SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+            AccountMeta(token_program_id, is_signer=False, is_writable=False),
+        ],
+        data=bytes([CREATE_IDEMPOTENT_INSTRUCTION])
+    )
+
+
+def transfer_instruction(source: Pubkey, destination: Pubkey, authority: Pubkey, amount: int,
+                         token_program_id: Pubkey) -> Instruction:
+    """SPL token ``Transfer`` instruction."""
+    return Instruction(
+        program_id=token_program_id,
+        accounts=[
+            AccountMeta(source, is_signer=False, is_writable=True),
+            AccountMeta(destination, is_signer=False, is_writable=True),
+            AccountMeta(authority, is_signer=True, is_writable=False),
+        ],
+        data=bytes([TRANSFER_INSTRUCTION]) + amount.to_bytes(8, "little")
+    )
+
+
+@dataclass
+class _Batch:
+    """Recipients packed into one transaction."""
+    indexes: List[int]
+    instructions: List[Instruction]
+
+
+class BulkTransferEngine:
+    """Sends one SPL token to many recipients in packed transactions."""
+
+    def __init__(
+        self,
+        connection: Any,
+        payer: Keypair,
+        mint_address: str,
+        token_program_id: str = TOKEN_PROGRAM_ID,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        blockhash_cache: Optional[BlockhashCache] = None,
+        skip_preflight: bool = False
+    ):
+        """Initialize engine.
+
+        Args:
+            connection: Solana ``AsyncClient``
+            payer: Keypair owning the source token account and paying fees and rent
+            mint_address: Mint of the token to send
+            token_program_id: Token program owning the mint
+            max_concurrency: Transactions sent (and confirmed) at once
+            blockhash_cache: Blockhash source (the endpoint's shared cache if not given)
+            skip_preflight: Skip transaction simulation when sending
+        """
+        self.connection = connection
+        self.payer = payer
+        self.mint = Pubkey.from_string(mint_address)
+        self.token_program = Pubkey.from_string(token_program_id)
+        self.max_concurrency = max_concurrency
+        self.blockhash_cache = blockhash_cache or get_blockhash_cache(connection)
+        self.skip_preflight = skip_preflight
+        self.source = Pubkey.from_string(
+            derive_associated_token_address(payer.pubkey(), mint_address, token_program_id)
+        )
+
+    def _recipient_instructions(self, transfer: BulkTransfer, ata: str, create: bool) -> List[Instruction]:
+        owner = Pubkey.from_string(transfer.recipient)
+        destination = Pubkey.from_string(ata)
+        instructions = []
+        if create:
+            instructions.append(create_idempotent_ata_instruction(
+                self.payer.pubkey(), owner, self.mint, destination, self.token_program
+            ))
+        instructions.append(transfer_instruction(
+            self.source, destination, self.payer.pubkey(), transfer.amount, self.token_program
+        ))
+        return instructions
+
+    def _transaction_size(self, instructions: List[Instruction]) -> int:
+        # The size does not depend on the blockhash value
+        message = Message.new_with_blockhash(instructions, self.payer.pubkey(), Hash.default())
+        return len(bytes(Transaction.new_unsigned(message)))
+
+    def _pack(self, groups: Sequence[Tuple[int, List[Instruction]]]) -> List[_Batch]:
+        """Greedily pack recipient instruction groups into transactions."""
+        batches: List[_Batch] = []
+        current = _Batch(indexes=[], instructions=[])
+        compute_units = 0
+        for index, instructions in groups:
+            units = sum(
+                CREATE_ATA_COMPUTE_UNITS if ix.program_id != self.token_program else TRANSFER_COMPUTE_UNITS
+                for ix in instructions
+            )
+            candidate = current.instructions + instructions
+            fits = (
+                compute_units + units <= MAX_TRANSACTION_COMPUTE_UNITS
+                and self._transaction_size(candidate) <= MAX_TRANSACTION_SIZE
+            )
+            if current.indexes and not fits:
+                batches.append(current)
+                current = _Batch(indexes=[], instructions=[])
+                compute_units = 0
+                candidate = list(instructions)
+            current.indexes.append(index)
+            current.instructions = candidate
+            compute_units += units
+        if current.indexes:
+            batches.append(current)
+        return batches
+
+    def _sign(self, batch: _Batch, recent: RecentBlockhash) -> Transaction:
+        message = Message.new_with_blockhash(batch.instructions, self.payer.pubkey(), recent.blockhash)
+        return Transaction([self.payer], message, recent.blockhash)
+
+    async def _send(self, batch: _Batch, confirm: bool) -> str:
+        return await send_with_blockhash(
+            self.connection,
+            lambda recent: self._sign(batch, recent),
+            self.blockhash_cache,
+            opts=TxOpts(skip_preflight=self.skip_preflight),
+            confirm=confirm
+        )
+
+    async def transfer(self, transfers: Sequence[BulkTransfer], confirm: bool = True) -> List[TransferStatus]:
+        """Send every transfer.
+
+        Args:
+            transfers: Recipients and amounts
+            confirm: Wait for each transaction to be confirmed
+
+        Returns:
+            One status per transfer, in the order of ``transfers``
+        """
+        owners = [transfer.recipient for transfer in transfers]
+        atas = await derive_atas_async(owners, self.mint, str(self.token_program))
+        existing = await does_accounts_exist(
+            self.connection,
+            [(owner, self.mint) for owner in owners],
+            str(self.token_program)
+        )
+        statuses = [
+            TransferStatus(recipient=transfer.recipient, amount=transfer.amount, token_account=ata)
+            for transfer, ata in zip(transfers, atas)
+        ]
+
+        # Create each missing account once, in the first transfer to it
+        creating = set()
+        groups = []
+        for index, (transfer, ata) in enumerate(zip(transfers, atas)):
+            create = existing[(transfer.recipient, str(self.mint))] is None and ata not in creating
+            if create:
+                creating.add(ata)
+                statuses[index].created_account = True
+            groups.append((index, self._recipient_instructions(transfer, ata, create)))
+
+        batches = self._pack(groups)
+        logger.info(f"Sending {len(transfers)} transfers in {len(batches)} transactions "
+                    f"({len(creating)} new token accounts)")
+
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: _Batch) -> None:
+            async with limit:
+                try:
+                    signature = await self._send(batch, confirm)
+                except Exception as e:
+                    logger.error(f"Bulk transfer transaction for {len(batch.indexes)} recipients failed: {str(e)}")
+                    for index in batch.indexes:
+                        statuses[index].error = str(e)
+                        # Set when the transaction landed but failed on chain
+                        statuses[index].signature = getattr(e, "tx_hash", None)
+                    return
+            for index in batch.indexes:
+                statuses[index].signature = signature
+                statuses[index].status = STATUS_CONFIRMED if confirm else STATUS_SENT
+                if statuses[index].created_account:
+                    set_account_exists(statuses[index].token_account)
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+        failed = sum(1 for status in statuses if not status.ok)
+        logger.info(f"Bulk transfer finished: {len(statuses) - failed} succeeded, {failed} failed")
+        return statuses
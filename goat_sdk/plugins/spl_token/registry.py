@@ -0,0 +1,241 @@
+"""Indexed SPL token registry.
+
+Tokens are indexed by case-insensitive symbol and by mint address per
+network, so lookups are dictionary hits. Solana token-list files (10k+
+entries) are kept as compact tuples and only turned into ``Token`` models
+when looked up. Token-list files are reloaded when they change on disk.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from goat_sdk.core.utils.cache import ListCache
+from goat_sdk.plugins.spl_token.models import SolanaNetwork, Token, TokenType
+from goat_sdk.plugins.spl_token.tokens import SPL_TOKENS
+
+logger = logging.getLogger(__name__)
+
+# Solana token-list chain IDs
+TOKEN_LIST_CHAIN_IDS: Dict[int, SolanaNetwork] = {
+    101: SolanaNetwork.MAINNET,
+    102: SolanaNetwork.TESTNET,
+    103: SolanaNetwork.DEVNET,
+}
+
+# Token-list entry without the fields lookups never use: (symbol, name, decimals, mint)
+CompactToken = Tuple[str, str, int, str]
+Entry = Union[Token, CompactToken]
+
+
+@dataclass
+class _Indexes:
+    """One immutable generation of the registry indexes."""
+    by_symbol: Dict[str, Dict[str, Entry]] = field(default_factory=dict)  # network -> SYMBOL -> entry
+    by_mint: Dict[str, Dict[str, Entry]] = field(default_factory=dict)  # network -> mint -> entry
+    by_any_mint: Dict[str, Entry] = field(default_factory=dict)  # mint on any network -> entry
+
+    def add(self, network: str, mint: str, symbol: str, entry: Entry) -> None:
+        """Index an entry; entries added earlier win a shared symbol or mint."""
+        mints = self.by_mint.setdefault(network, {})
+        if mint in mints:
+            return
+        mints[mint] = entry
+        self.by_symbol.setdefault(network, {}).setdefault(symbol.upper(), entry)
+        self.by_any_mint.setdefault(mint, entry)
+
+
+def _network_key(network: Union[SolanaNetwork, str]) -> str:
+    return network.value if isinstance(network, SolanaNetwork) else str(network)
+
+
+def _parse_token_list(path: Path) -> List[Tuple[str, CompactToken]]:
+    with open(path, "rb") as f:
+        document = json.load(f)
+    entries = document.get("tokens", []) if isinstance(document, dict) else document
+
+    parsed = []
+    for entry in entries:
+        try:
+            network = TOKEN_LIST_CHAIN_IDS[int(entry["chainId"])]
+            parsed.append((network.value, (
+                entry["symbol"],
+                entry.get("name", entry["symbol"]),
+                int(entry["decimals"]),
+                entry["address"]
+            )))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Skipping invalid token list entry in {path}: {str(e)}")
+    return parsed
+
+
+class SplTokenRegistry:
+    """SPL token lookup by symbol and mint address.
+
+    Tokens passed to the constructor win over token-list entries with the
+    same symbol or mint; otherwise the earlier entry wins.
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[Iterable[Token]] = None,
+        token_lists: Optional[Iterable[Union[str, Path]]] = None,
+        reload_interval: Optional[float] = None
+    ):
+        """Initialize the registry.
+
+        Args:
+            tokens: Tokens to index
+            token_lists: Paths to Solana token-list JSON files
+            reload_interval: Seconds between checks for changed token-list
+                files during lookups; None disables automatic reloading
+        """
+        self._tokens: List[Token] = list(tokens or [])
+        self._paths: List[Path] = [Path(path) for path in token_lists or []]
+        self._mtimes: Dict[Path, float] = {}
+        self._parsed: Dict[Path, List[Tuple[str, CompactToken]]] = {}
+        self._materialized: Dict[Tuple[str, str], Token] = {}
+        self._lock = threading.Lock()
+        self._reload_interval = reload_interval
+        self._last_check = time.monotonic()
+        self._indexes = self._build()
+
+    def _build(self) -> _Indexes:
+        indexes = _Indexes()
+        # Constructor tokens are indexed first, so they win over token lists
+        for token in self._tokens:
+            for network, mint in token.mint_addresses.items():
+                indexes.add(_network_key(network), mint, token.symbol, token)
+        for path in self._paths:
+            if path not in self._parsed:
+                self._mtimes[path] = os.stat(path).st_mtime
+                self._parsed[path] = _parse_token_list(path)
+            for network, entry in self._parsed[path]:
+                indexes.add(network, entry[3], entry[0], entry)
+        count = sum(len(mints) for mints in indexes.by_mint.values())
+        logger.debug(f"Indexed {count} SPL tokens from {len(self._paths)} token lists")
+        return indexes
+
+    def add_token_list(self, path: Union[str, Path]) -> None:
+        """Load a Solana token-list file and index its entries."""
+        with self._lock:
+            self._paths.append(Path(path))
+            self._indexes = self._build()
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-read token-list files that changed on disk.
+
+        Lookups keep using the previous indexes until the new ones are built.
+
+        Args:
+            force: Re-read every file even if unchanged
+
+        Returns:
+            True if the indexes were rebuilt
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            changed = [
+                path for path in self._paths
+                if force or os.stat(path).st_mtime != self._mtimes.get(path)
+            ]
+            if not changed:
+                return False
+            for path in changed:
+                self._parsed.pop(path, None)
+            indexes = self._build()
+            self._materialized = {}
+            self._indexes = indexes
+            logger.info(f"Reloaded SPL token lists: {[str(path) for path in changed]}")
+            return True
+
+    def _current(self) -> _Indexes:
+        if self._reload_interval is not None and time.monotonic() - self._last_check >= self._reload_interval:
+            try:
+                self.reload()
+            except OSError as e:
+                logger.warning(f"SPL token list reload failed, keeping previous tokens: {str(e)}")
+        return self._indexes
+
+    def _materialize(self, network: str, entry: Optional[Entry]) -> Optional[Token]:
+        if entry is None or isinstance(entry, Token):
+            return entry
+        key = (network, entry[3])
+        token = self._materialized.get(key)
+        if token is None:
+            symbol, name, decimals, mint = entry
+            # Entries were validated when parsed, so skip model validation
+            token = Token.model_construct(
+                symbol=symbol,
+                name=name,
+                decimals=decimals,
+                mint_addresses={SolanaNetwork(network): mint},
+                mode_config=None,
+                token_type=TokenType.FUNGIBLE
+            )
+            self._materialized[key] = token
+        return token
+
+    def get_by_symbol(self, symbol: str, network: Union[SolanaNetwork, str]) -> Optional[Token]:
+        """Get the token with a symbol (case-insensitive) on a network."""
+        network = _network_key(network)
+        entry = self._current().by_symbol.get(network, {}).get(symbol.upper())
+        return self._materialize(network, entry)
+
+    def get_by_mint(self, mint_address: str, network: Union[SolanaNetwork, str]) -> Optional[Token]:
+        """Get the token with a mint address on a network."""
+        network = _network_key(network)
+        entry = self._current().by_mint.get(network, {}).get(mint_address)
+        return self._materialize(network, entry)
+
+    def get_by_any_mint(self, mint_address: str) -> Optional[Token]:
+        """Get the token with a mint address on any network."""
+        entry = self._current().by_any_mint.get(mint_address)
+        if entry is None or isinstance(entry, Token):
+            return entry
+        for network, mints in self._indexes.by_mint.items():
+            if mints.get(mint_address) is entry:
+                return self._materialize(network, entry)
+        return None
+
+    def tokens_for_network(self, network: Union[SolanaNetwork, str]) -> List[Token]:
+        """Get all tokens with a mint address on a network."""
+        network = _network_key(network)
+        entries = self._current().by_mint.get(network, {}).values()
+        return [self._materialize(network, entry) for entry in entries]
+
+
+_default_registry: Optional[SplTokenRegistry] = None
+
+
+def get_spl_token_registry() -> SplTokenRegistry:
+    """Get the process-wide registry of ``SPL_TOKENS``."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = SplTokenRegistry(SPL_TOKENS)
+    return _default_registry
+
+
+_list_registries = ListCache(SplTokenRegistry)
+
+
+def get_registry_for(tokens: Optional[List[Token]]) -> SplTokenRegistry:
+    """Get a registry indexing a token list.
+
+    Registries are cached per list object and rebuilt if the list's contents
+    change, so repeated lookups in the same list do not re-index it.
+
+    Args:
+        tokens: Tokens to index; None or ``SPL_TOKENS`` uses the default registry
+
+    Returns:
+        Registry of ``tokens``
+    """
+    if tokens is None or tokens is SPL_TOKENS:
+        return get_spl_token_registry()
+    return _list_registries.get(tokens)
@@ -20,6 +20,7 @@ from goat_sdk.plugins.spl_token.utils import (
     get_associated_token_address,
     create_associated_token_account
 )
+from goat_sdk.plugins.spl_token.bulk_transfer import BulkTransfer, BulkTransferEngine, TransferStatus
 from goat_sdk.plugins.spl_token.exceptions import (
     TokenNotFoundError,
     TokenAccountNotFoundError,
@@ -272,6 +273,48 @@ class SplTokenPlugin(PluginBase):
             logger.error(f"Transfer failed: {str(e)}", exc_info=True)
             raise TransferError(token_symbol, amount, recipient_address, str(e)) from e
     
+    async def bulk_transfer_token(
+        self,
+        token_symbol: str,
+        recipients: Dict[str, float],
+        max_concurrency: int = 8
+    ) -> List[TransferStatus]:
+        """Transfer tokens to many recipients in packed transactions.
+
+        Args:
+            token_symbol: Symbol of token to transfer
+            recipients: Amount to send to each recipient wallet address
+            max_concurrency: Transactions in flight at once
+
+        Returns:
+            Status of each transfer, in the order of ``recipients``
+
+        Raises:
+            TokenNotFoundError: If token is not found
+            InsufficientBalanceError: If insufficient balance for all transfers
+        """
+        logger.debug(f"Transferring {token_symbol} to {len(recipients)} recipients")
+
+        token = await self.get_token_info_by_symbol(token_symbol)
+        mint_address = token.mint_addresses[self.network]
+
+        total = sum(recipients.values())
+        balance = await self.get_token_balance(token_symbol)
+        if balance.amount < total:
+            logger.error(f"Insufficient balance. Required: {total}, Available: {balance.amount}")
+            raise InsufficientBalanceError(token_symbol, total, balance.amount)
+
+        engine = BulkTransferEngine(
+            await self.wallet_client.get_connection(),
+            self.wallet_client.keypair,
+            mint_address,
+            max_concurrency=max_concurrency
+        )
+        return await engine.transfer([
+            BulkTransfer(recipient=recipient, amount=self.convert_to_base_unit(amount, token.decimals))
+            for recipient, amount in recipients.items()
+        ])
+
     def convert_to_base_unit(self, amount: float, decimals: int) -> int:
         """Convert token amount to base units.
 
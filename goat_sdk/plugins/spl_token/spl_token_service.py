@@ -62,9 +62,11 @@ from solders.rpc.config import RpcTransactionConfig as TxOpts
 from solders.system_program import transfer, TransferParams
 from solders.instruction import Instruction, AccountMeta
 from solders.message import Message
-from solders.hash import Hash
 
+from goat_sdk.core.utils.blockhash import get_blockhash_cache
 from goat_sdk.plugins.spl_token.models import Token, TokenBalance, SolanaNetwork
+from goat_sdk.plugins.spl_token.registry import SplTokenRegistry
+from goat_sdk.plugins.spl_token.bulk_transfer import BulkTransfer, BulkTransferEngine, TransferStatus
 from goat_sdk.plugins.spl_token.parameters import (
     GetTokenMintAddressBySymbolParameters,
     GetTokenBalanceByMintAddressParameters,
@@ -110,8 +112,16 @@ class SplTokenService:
         self.tokens = tokens or []
         self.wallet_client = None
         logger.info(f"Loaded {len(self.tokens)} tokens")
-        for token in self.tokens:
-            logger.debug(f"Loaded token: {token.symbol} with mint addresses: {token.mint_addresses}")
+
+    @property
+    def tokens(self) -> List[Token]:
+        """Supported tokens."""
+        return self._tokens
+
+    @tokens.setter
+    def tokens(self, tokens: List[Token]) -> None:
+        self._tokens = tokens
+        self.registry = SplTokenRegistry(tokens)
 
     @monitor_mode_performance
     @with_retries("get_token_info_by_symbol")
@@ -133,42 +143,17 @@ class SplTokenService:
         logger.debug(f"[{operation}] Input parameters: {parameters}")
         logger.debug(f"[{operation}] Current network: {self.network}")
         logger.debug(f"[{operation}] Service instance: {self}")
-        logger.debug(f"[{operation}] Service instance attributes: {vars(self) if hasattr(self, '__dict__') else str(self)}")
         
-        # Find matching token
+        # Find matching token on the current network
         logger.debug(f"[{operation}] Step: Finding matching token")
-        matching_token = None
-        
-        for token in self.tokens:
-            logger.debug(f"[{operation}] Checking token: {token}")
-            logger.debug(f"[{operation}] Token attributes: {vars(token) if hasattr(token, '__dict__') else str(token)}")
-            if token.symbol == parameters.symbol:
-                logger.debug(f"[{operation}] Found matching token: {token}")
-                matching_token = token
-                break
-        
+        matching_token = self.registry.get_by_symbol(parameters.symbol, self.network)
+
         if not matching_token:
-            logger.error(f"[{operation}] Token not found with symbol: {parameters.symbol}")
-            logger.error(f"[{operation}] Available tokens: {[t.symbol for t in self.tokens]}")
-            logger.error(f"[{operation}] Token list state: {self.tokens}")
-            logger.error(f"[{operation}] Service instance: {self}")
-            logger.error(f"[{operation}] Service instance attributes: {vars(self) if hasattr(self, '__dict__') else str(self)}")
+            logger.error(f"[{operation}] Token not found with symbol {parameters.symbol} on network {self.network}")
             raise TokenNotFoundError(parameters.symbol)
-                
-        # Check if token exists on current network
-        logger.debug(f"[{operation}] Step: Validating token on network {self.network}")
-        logger.debug(f"[{operation}] Token mint addresses: {matching_token.mint_addresses}")
-        logger.debug(f"[{operation}] Token attributes: {vars(matching_token) if hasattr(matching_token, '__dict__') else str(matching_token)}")
-        if self.network not in matching_token.mint_addresses:
-            logger.error(f"[{operation}] Token {matching_token.symbol} not found on network {self.network}")
-            logger.error(f"[{operation}] Available networks: {list(matching_token.mint_addresses.keys())}")
-            logger.error(f"[{operation}] Token mint addresses: {matching_token.mint_addresses}")
-            logger.error(f"[{operation}] Token attributes: {vars(matching_token) if hasattr(matching_token, '__dict__') else str(matching_token)}")
-            raise TokenNotFoundError(matching_token.symbol)
-        
+
         logger.info(f"[{operation}] Successfully found token {matching_token.symbol} on network {self.network}")
         logger.debug(f"[{operation}] Returning token: {matching_token}")
-        logger.debug(f"[{operation}] Token attributes: {vars(matching_token) if hasattr(matching_token, '__dict__') else str(matching_token)}")
         return matching_token
 
     @monitor_mode_performance
@@ -195,23 +180,15 @@ class SplTokenService:
         logger.debug(f"[{operation}] Wallet client attributes: {vars(wallet_client) if hasattr(wallet_client, '__dict__') else str(wallet_client)}")
         logger.debug(f"[{operation}] Current network: {self.network}")
         logger.debug(f"[{operation}] Service instance: {self}")
-        logger.debug(f"[{operation}] Service instance attributes: {vars(self) if hasattr(self, '__dict__') else str(self)}")
         
         try:
             # Find token info
             logger.debug(f"[{operation}] Step: Finding token info")
-            token = next(
-                (t for t in self.tokens if t.mint_addresses.get(self.network) == parameters.mint_address),
-                None,
-            )
+            token = self.registry.get_by_mint(parameters.mint_address, self.network)
             logger.debug(f"[{operation}] Found token: {token}")
-            if token:
-                logger.debug(f"[{operation}] Token attributes: {vars(token) if hasattr(token, '__dict__') else str(token)}")
             
             if not token:
                 logger.error(f"[{operation}] Token not found for mint address: {parameters.mint_address}")
-                logger.error(f"[{operation}] Available tokens: {[t.symbol for t in self.tokens]}")
-                logger.error(f"[{operation}] Token list state: {self.tokens}")
                 raise TokenAccountNotFoundError(
                     account_type="Token",
                     address=parameters.wallet_address
@@ -221,8 +198,9 @@ class SplTokenService:
             logger.debug(f"[{operation}] Step: Finding associated token account")
             logger.debug(f"[{operation}] Wallet address: {parameters.wallet_address}")
             logger.debug(f"[{operation}] Mint address: {parameters.mint_address}")
+            connection = await wallet_client.get_connection()
             token_account = await does_account_exist(
-                await wallet_client.get_connection(),
+                connection,
                 PublicKey(b58decode(parameters.wallet_address)),
                 PublicKey(b58decode(parameters.mint_address)),
                 parameters.mode_config
@@ -241,7 +219,6 @@ class SplTokenService:
             # Get token account balance
             logger.debug(f"[{operation}] Step: Getting token account balance")
             logger.debug(f"[{operation}] Token account: {token_account}")
-            connection = await wallet_client.get_connection()
             balance = await connection.get_token_account_balance(
                 PublicKey(b58decode(token_account))
             )
@@ -288,11 +265,12 @@ class SplTokenService:
             logger.debug(f"[{operation}] Step: Getting source wallet address")
             source_address = await wallet_client.get_wallet_address()
             logger.debug(f"[{operation}] Source address: {source_address}")
+            connection = await wallet_client.get_connection()
             
             # Check source token account exists
             logger.debug(f"[{operation}] Step: Checking source token account")
             source_token_account = await does_account_exist(
-                wallet_client.get_connection(),
+                connection,
                 PublicKey(b58decode(source_address)),
                 PublicKey(b58decode(parameters.mint_address)),
                 parameters.mode_config
@@ -309,7 +287,7 @@ class SplTokenService:
             # Check destination token account exists
             logger.debug(f"[{operation}] Step: Checking destination token account")
             destination_token_account = await does_account_exist(
-                wallet_client.get_connection(),
+                connection,
                 PublicKey(b58decode(parameters.to)),
                 PublicKey(b58decode(parameters.mint_address)),
                 parameters.mode_config
@@ -328,9 +306,8 @@ class SplTokenService:
                 
                 # Sign and send transaction
                 logger.debug(f"[{operation}] Signing and sending create account transaction")
-                connection = await wallet_client.get_connection()
-                blockhash = await connection.get_latest_blockhash()
-                create_account_tx.recent_blockhash = blockhash[0]
+                recent = await get_blockhash_cache(connection).get()
+                create_account_tx.recent_blockhash = recent.blockhash
                 create_account_tx.sign(wallet_client.keypair)
                 
                 try:
@@ -355,7 +332,6 @@ class SplTokenService:
 
             # Check source account balance
             logger.debug(f"[{operation}] Step: Checking source account balance")
-            connection = await wallet_client.get_connection()
             balance = await connection.get_token_account_balance(
                 PublicKey(b58decode(source_token_account))
             )
@@ -368,10 +344,7 @@ class SplTokenService:
                 logger.error(f"[{operation}] Requested amount: {parameters.amount}")
                 
                 # Get token symbol
-                token = next(
-                    (t for t in self.tokens if t.mint_addresses.get(self.network) == parameters.mint_address),
-                    None
-                )
+                token = self.registry.get_by_mint(parameters.mint_address, self.network)
                 token_symbol = token.symbol if token else "Unknown"
                 
                 raise InsufficientBalanceError(
@@ -407,19 +380,19 @@ class SplTokenService:
             
             # Get recent blockhash
             logger.debug(f"[{operation}] Step: Getting recent blockhash")
-            blockhash_response = await connection.get_latest_blockhash()
-            logger.debug(f"[{operation}] Blockhash response: {blockhash_response}")
+            recent = await get_blockhash_cache(connection).get()
+            logger.debug(f"[{operation}] Recent blockhash: {recent}")
 
             # Create transaction
             logger.debug(f"[{operation}] Step: Creating transaction")
             message = Message.new_with_blockhash(
                 [transfer_ix],
                 wallet_client.keypair.pubkey(),
-                Hash(b58decode(blockhash_response[0]))
+                recent.blockhash
             )
 
             transaction = Transaction.new_unsigned(message)
-            transaction.sign([wallet_client.keypair], Hash(b58decode(blockhash_response[0])))
+            transaction.sign([wallet_client.keypair], recent.blockhash)
 
             logger.info(f"[{operation}] Successfully created transfer transaction")
             logger.debug(f"[{operation}] Returning transaction: {transaction}")
@@ -429,6 +402,56 @@ class SplTokenService:
             log_error_details(operation, e, "transferring tokens")
             raise
 
+    @monitor_mode_performance
+    @trace_operation("bulk_transfer")
+    async def bulk_transfer(
+        self,
+        wallet_client,
+        mint_address: str,
+        transfers: List[BulkTransfer],
+        max_concurrency: int = 8,
+        confirm: bool = True,
+    ) -> List[TransferStatus]:
+        """Transfer one token to many recipients.
+
+        Missing recipient token accounts are created in the same transaction
+        as their transfer, and recipients are packed into as few transactions
+        as fit. Failed transactions are reported per recipient rather than
+        raised, so the call is not retried as a whole.
+
+        Args:
+            wallet_client: Wallet client
+            mint_address: Mint of the token to transfer
+            transfers: Recipients and amounts in base units
+            max_concurrency: Transactions in flight at once
+            confirm: Wait for each transaction to be confirmed
+
+        Returns:
+            Status of each transfer, in the order of ``transfers``
+        """
+        operation = "bulk_transfer"
+        logger.info(f"[{operation}] Starting operation for {len(transfers)} recipients")
+        logger.debug(f"[{operation}] Mint address: {mint_address}")
+
+        try:
+            connection = await wallet_client.get_connection()
+            engine = BulkTransferEngine(
+                connection,
+                wallet_client.keypair,
+                mint_address,
+                max_concurrency=max_concurrency
+            )
+            statuses = await engine.transfer(transfers, confirm=confirm)
+            failed = [status for status in statuses if not status.ok]
+            if failed:
+                logger.warning(f"[{operation}] {len(failed)} of {len(statuses)} transfers failed")
+            logger.info(f"[{operation}] Successfully completed operation")
+            return statuses
+
+        except Exception as e:
+            log_error_details(operation, e, "sending bulk transfer")
+            raise
+
     @monitor_mode_performance
     @with_retries("convert_to_base_unit")
     @trace_operation("convert_to_base_unit")
@@ -443,10 +466,7 @@ class SplTokenService:
         
         try:
             # Find token info
-            token = next(
-                (t for t in self.tokens if t.mint_addresses.get(self.network) == parameters.mint_address),
-                None
-            )
+            token = self.registry.get_by_mint(parameters.mint_address, self.network)
             
             if not token:
                 logger.error(f"[{operation}] Token not found for mint address: {parameters.mint_address}")
@@ -468,19 +488,15 @@ class SplTokenService:
         logger.info(f"[{operation}] Starting cleanup")
         logger.debug(f"[{operation}] Service instance: {self}")
         logger.debug(f"[{operation}] Current network: {self.network}")
-        logger.debug(f"[{operation}] Token list state: {self.tokens}")
+        logger.debug(f"[{operation}] Tokens loaded: {len(self.tokens)}")
 
     async def _get_token_symbol_by_mint_address(self, mint_address: str) -> str:
         """Get token symbol by mint address."""
         operation = "_get_token_symbol_by_mint_address"
         logger.debug(f"[{operation}] Looking up token symbol for mint address: {mint_address}")
-        for token in self.tokens:
-            logger.debug(f"[{operation}] Checking token: {token}")
-            logger.debug(f"[{operation}] Token mint addresses: {token.mint_addresses}")
-            if mint_address in token.mint_addresses.values():
-                logger.debug(f"[{operation}] Found token symbol: {token.symbol}")
-                return token.symbol
+        token = self.registry.get_by_any_mint(mint_address)
+        if token:
+            logger.debug(f"[{operation}] Found token symbol: {token.symbol}")
+            return token.symbol
         logger.error(f"[{operation}] Token not found with mint address: {mint_address}")
-        logger.error(f"[{operation}] Available tokens: {[t.symbol for t in self.tokens]}")
-        logger.error(f"[{operation}] Token list state: {self.tokens}")
         raise TokenNotFoundError(f"Token not found with mint address: {mint_address}")
@@ -5,8 +5,8 @@ from typing import Optional, Dict, Any
 from solders.pubkey import Pubkey
 from solana.rpc.async_api import AsyncClient
 
-from .does_account_exist import does_account_exist
-from .token_account import create_associated_token_account
+from .does_account_exist import does_account_exist, does_accounts_exist
+from .token_account import create_associated_token_account, derive_associated_token_address, derive_atas, derive_atas_async
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,10 @@ def log_error_details(operation: str, error: Exception, action: str) -> None:
 
 __all__ = [
     'does_account_exist',
+    'does_accounts_exist',
     'create_associated_token_account',
+    'derive_associated_token_address',
+    'derive_atas',
+    'derive_atas_async',
     'log_error_details',
 ]
@@ -1,16 +1,100 @@
 """Utility function to check if a token account exists."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 from solders.pubkey import Pubkey
+from solana.rpc.types import DataSliceOpts
 from base58 import b58encode
 import asyncio
 
-from goat_sdk.plugins.spl_token.utils.token_account import get_associated_token_address
+from goat_sdk.core.utils.cache import TTLCache
+from goat_sdk.plugins.spl_token.utils.constants import TOKEN_PROGRAM_ID
+from goat_sdk.plugins.spl_token.utils.token_account import derive_atas_async, get_associated_token_address
 from goat_sdk.plugins.spl_token.exceptions import TokenAccountNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# getMultipleAccounts accepts at most 100 accounts per request
+MULTIPLE_ACCOUNTS_CHUNK_SIZE = 100
+MULTIPLE_ACCOUNTS_MAX_CONCURRENT = 4
+
+# Existence results are short-lived: accounts get created (and closed) by other transactions
+ACCOUNT_EXISTS_TTL = 10
+ACCOUNT_EXISTS_CACHE_SIZE = 100_000
+
+_exists_cache = TTLCache("spl_token.account_exists", ttl=ACCOUNT_EXISTS_TTL, max_entries=ACCOUNT_EXISTS_CACHE_SIZE)
+
+
+def set_account_exists(address: str, exists: bool = True) -> None:
+    """Record an account's existence, e.g. after creating it."""
+    _exists_cache.set(str(address), exists)
+
+
+def _multiple_accounts_value(response: Any) -> List[Any]:
+    # Handle both solders responses and raw JSON-RPC dicts
+    value = getattr(response, "value", None)
+    if value is None and isinstance(response, dict):
+        value = response.get("result", response).get("value")
+    if value is None:
+        raise ValueError(f"Unexpected getMultipleAccounts response: {response}")
+    return list(value)
+
+
+async def does_accounts_exist(
+    connection,
+    pairs: Sequence[Tuple[Union[str, Pubkey], Union[str, Pubkey]]],
+    token_program_id: str = TOKEN_PROGRAM_ID,
+    use_cache: bool = True,
+) -> Dict[Tuple[str, str], Optional[str]]:
+    """Check which (owner, mint) pairs have an associated token account.
+
+    Addresses are derived in one batch and queried with
+    ``getMultipleAccounts`` in chunks of ``MULTIPLE_ACCOUNTS_CHUNK_SIZE``
+    (account data is not transferred). Results are cached for
+    ``ACCOUNT_EXISTS_TTL`` seconds.
+
+    Args:
+        connection: RPC connection
+        pairs: (owner, mint) pairs
+        token_program_id: Token program owning the mints
+        use_cache: Whether cached results may be used
+
+    Returns:
+        Mapping of (owner, mint) address strings to the token account
+        address if it exists, None otherwise
+    """
+    keys = list(dict.fromkeys((str(owner), str(mint)) for owner, mint in pairs))
+    addresses = await derive_atas_async([owner for owner, _ in keys], [mint for _, mint in keys], token_program_id)
+    exists: Dict[str, bool] = {}
+    if use_cache:
+        for address in addresses:
+            cached = _exists_cache.get(address)
+            if cached is not None:
+                exists[address] = cached
+    unknown = list(dict.fromkeys(address for address in addresses if address not in exists))
+    logger.debug(f"Checking {len(unknown)} token accounts ({len(exists)} cached)")
+
+    limit = asyncio.Semaphore(MULTIPLE_ACCOUNTS_MAX_CONCURRENT)
+
+    async def check(chunk: List[str]) -> None:
+        async with limit:
+            response = await connection.get_multiple_accounts(
+                [Pubkey.from_string(address) for address in chunk],
+                data_slice=DataSliceOpts(offset=0, length=0)
+            )
+        accounts = _multiple_accounts_value(response)
+        if len(accounts) != len(chunk):
+            raise ValueError(f"getMultipleAccounts returned {len(accounts)} accounts for {len(chunk)} addresses")
+        for address, account in zip(chunk, accounts):
+            exists[address] = account is not None
+            _exists_cache.set(address, account is not None)
+
+    await asyncio.gather(*(
+        check(unknown[start:start + MULTIPLE_ACCOUNTS_CHUNK_SIZE])
+        for start in range(0, len(unknown), MULTIPLE_ACCOUNTS_CHUNK_SIZE)
+    ))
+    return {key: address if exists[address] else None for key, address in zip(keys, addresses)}
+
 async def does_account_exist(
     connection_future,
     owner_pubkey: Pubkey,
@@ -62,6 +146,7 @@ async def does_account_exist(
                 
             if exists:
                 logger.info(f"Token account exists: {token_account}")
+                set_account_exists(token_account)
                 return token_account
                 
             logger.info(f"Token account does not exist: {token_account}")
@@ -104,6 +189,15 @@ async def does_account_exist(
                     raise TokenAccountNotFoundError("Associated Token", str(owner_pubkey))
                 return None
 
+    # Accounts seen recently (e.g. by does_accounts_exist) need no RPC
+    try:
+        cached_account = await get_associated_token_address(str(owner_pubkey), str(mint_pubkey))
+        if _exists_cache.get(cached_account):
+            logger.debug(f"Token account exists (cached): {cached_account}")
+            return cached_account
+    except ValueError:
+        pass  # Invalid keys are reported by the lookup below
+
     # Initial attempt
     try:
         result = await _check_account()
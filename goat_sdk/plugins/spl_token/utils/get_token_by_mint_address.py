@@ -1,9 +1,10 @@
 """Utility function to get token info by mint address."""
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from ..models import Token, SolanaNetwork
+from ..registry import SplTokenRegistry, get_registry_for
 from ..exceptions import InvalidTokenAddressError
 
 logger = logging.getLogger(__name__)
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 def get_token_by_mint_address(
     mint_address: str,
     network: SolanaNetwork,
-    tokens: List[Token],
+    tokens: Union[List[Token], SplTokenRegistry],
     mode_config: Optional[dict] = None,
 ) -> Optional[Token]:
     """Get token information by mint address.
@@ -20,7 +21,7 @@ def get_token_by_mint_address(
     Args:
         mint_address: Token mint address to search for
         network: Network to search in
-        tokens: List of available tokens
+        tokens: List of available tokens, or a registry indexing them
         mode_config: Optional Mode-specific configuration
 
     Returns:
@@ -42,34 +43,25 @@ def get_token_by_mint_address(
         return None
     
     try:
-        for token in tokens:
-            logger.debug(f"Checking token: {token.symbol}")
-            logger.debug(f"Token mint addresses: {token.mint_addresses}")
-            
-            # Check if token is supported on the network
-            if network not in token.mint_addresses:
-                logger.debug(f"Token {token.symbol} not supported on network {network}")
-                continue
-            
-            # Check if mint address matches
-            token_mint = token.mint_addresses[network]
-            if token_mint == mint_address:
-                # Check Mode-specific validations
-                if mode_config and mode_config.get("network_validation"):
-                    # For Mode validation, we require the token to be supported on mainnet
-                    if network != SolanaNetwork.MAINNET:
-                        logger.debug(f"Token {token.symbol} lookup not allowed on {network} with Mode validation")
-                        return None
-                    # Check if token has Mode-specific attributes
-                    if not hasattr(token, "mode_config"):
-                        logger.debug(f"Token {token.symbol} does not have Mode configuration")
-                        return None
-                
-                logger.debug(f"Found token {token.symbol} on network {network}")
-                return token
-        
-        logger.debug(f"No token found with mint address: {mint_address}")
-        return None
+        registry = tokens if isinstance(tokens, SplTokenRegistry) else get_registry_for(tokens)
+        token = registry.get_by_mint(mint_address, network)
+        if token is None:
+            logger.debug(f"No token found with mint address: {mint_address}")
+            return None
+
+        # Check Mode-specific validations
+        if mode_config and mode_config.get("network_validation"):
+            # For Mode validation, we require the token to be supported on mainnet
+            if network != SolanaNetwork.MAINNET:
+                logger.debug(f"Token {token.symbol} lookup not allowed on {network} with Mode validation")
+                return None
+            # Check if token has Mode-specific attributes
+            if not hasattr(token, "mode_config"):
+                logger.debug(f"Token {token.symbol} does not have Mode configuration")
+                return None
+
+        logger.debug(f"Found token {token.symbol} on network {network}")
+        return token
         
     except Exception as e:
         logger.error(f"Error looking up token: {str(e)}", exc_info=True)
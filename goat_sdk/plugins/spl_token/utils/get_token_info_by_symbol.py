@@ -3,7 +3,7 @@
 from typing import Optional, List
 
 from ..models import Token, SolanaNetwork
-from ..tokens import SPL_TOKENS
+from ..registry import get_registry_for
 
 
 def get_token_info_by_symbol(symbol: str, network: SolanaNetwork, tokens: Optional[List[Token]] = None) -> Optional[Token]:
@@ -18,12 +18,4 @@ def get_token_info_by_symbol(symbol: str, network: SolanaNetwork, tokens: Option
     Returns:
         Token information if found, None otherwise
     """
-    token_list = tokens if tokens is not None else SPL_TOKENS
-    matching_token = next(
-        (token for token in token_list if token.symbol.upper() == symbol.upper()),
-        None
-    )
-    
-    if matching_token and network in matching_token.mint_addresses:
-        return matching_token
-    return None
+    return get_registry_for(tokens).get_by_symbol(symbol, network)
@@ -3,7 +3,7 @@
 from typing import List, Optional
 
 from ..models import Token, SolanaNetwork
-from ..tokens import SPL_TOKENS
+from ..registry import get_spl_token_registry
 
 
 def get_tokens_for_network(network: SolanaNetwork, tokens: Optional[List[Token]] = None) -> List[Token]:
@@ -17,8 +17,9 @@ def get_tokens_for_network(network: SolanaNetwork, tokens: Optional[List[Token]]
     Returns:
         List of tokens with mint addresses for the network
     """
-    token_list = tokens if tokens is not None else SPL_TOKENS
+    if tokens is None:
+        return get_spl_token_registry().tokens_for_network(network)
     return [
-        token for token in token_list
+        token for token in tokens
         if network in token.mint_addresses
     ]
@@ -1,13 +1,18 @@
 """Utility functions for SPL Token account operations."""
 
+import asyncio
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 from solders.pubkey import Pubkey
 from solders.instruction import Instruction, AccountMeta
 from solders.transaction import Transaction
 from solders.system_program import ID as SYS_PROGRAM_ID
 from solders.sysvar import RENT as SYSVAR_RENT_PUBKEY
 
+from goat_sdk.core.utils.cache import TTLCache
 from goat_sdk.plugins.spl_token.utils.constants import (
     TOKEN_PROGRAM_ID,
     ASSOCIATED_TOKEN_PROGRAM_ID,
@@ -15,39 +20,199 @@ from goat_sdk.plugins.spl_token.utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Derived addresses kept before LRU eviction
+ATA_CACHE_SIZE = 100_000
+
+# Uncached derivations below this count are not worth a process pool
+ATA_PROCESS_POOL_THRESHOLD = 5_000
+ATA_PROCESS_POOL_CHUNK_SIZE = 1_000
+
+_ASSOCIATED_TOKEN_PROGRAM = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
+_ata_cache = TTLCache("spl_token.ata", max_entries=ATA_CACHE_SIZE)
+_ata_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_ata_pool() -> ProcessPoolExecutor:
+    """Process pool shared by derivations, created on first use.
+
+    Workers are spawned rather than forked so the pool is safe to start from
+    a process running an event loop and other threads.
+    """
+    global _ata_pool
+    if _ata_pool is None:
+        _ata_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        atexit.register(_ata_pool.shutdown)
+    return _ata_pool
+
+
+def _find_associated_token_address(owner_address: str, mint_address: str, token_program_id: str) -> str:
+    seeds = [
+        bytes(Pubkey.from_string(owner_address)),
+        bytes(Pubkey.from_string(token_program_id)),
+        bytes(Pubkey.from_string(mint_address)),
+    ]
+    program_address, _ = Pubkey.find_program_address(seeds, _ASSOCIATED_TOKEN_PROGRAM)
+    return str(program_address)
+
+
+def _find_associated_token_addresses(keys: List[Tuple[str, str, str]]) -> List[str]:
+    """Process pool worker: derive a chunk of addresses."""
+    return [_find_associated_token_address(*key) for key in keys]
+
+
+def derive_associated_token_address(
+    owner_address: Union[str, Pubkey],
+    mint_address: Union[str, Pubkey],
+    token_program_id: str = TOKEN_PROGRAM_ID,
+) -> str:
+    """Derive the associated token account address, using the LRU cache.
+
+    Args:
+        owner_address: Owner's wallet address
+        mint_address: Token mint address
+        token_program_id: Token program owning the mint
+
+    Returns:
+        Associated token account address
+    """
+    key = (str(owner_address), str(mint_address), str(token_program_id))
+    address = _ata_cache.get(key)
+    if address is None:
+        address = _find_associated_token_address(*key)
+        _ata_cache.set(key, address)
+    return address
+
+
+def _ata_keys(
+    owners: Sequence[Union[str, Pubkey]],
+    mints: Union[str, Pubkey, Sequence[Union[str, Pubkey]]],
+    token_program_id: str,
+) -> Tuple[List[Tuple[str, str, str]], List[Optional[str]], List[Tuple[str, str, str]]]:
+    """Split a derivation into its keys, cached addresses and missing keys."""
+    if isinstance(mints, (str, Pubkey)):
+        mints = [mints] * len(owners)
+    if len(mints) != len(owners):
+        raise ValueError(f"Got {len(mints)} mints for {len(owners)} owners")
+
+    keys = [(str(owner), str(mint), str(token_program_id)) for owner, mint in zip(owners, mints)]
+    addresses = [_ata_cache.get(key) for key in keys]
+    missing = list(dict.fromkeys(key for key, address in zip(keys, addresses) if address is None))
+    return keys, addresses, missing
+
+
+def _ata_chunks(missing: List[Tuple[str, str, str]]) -> List[List[Tuple[str, str, str]]]:
+    return [
+        missing[start:start + ATA_PROCESS_POOL_CHUNK_SIZE]
+        for start in range(0, len(missing), ATA_PROCESS_POOL_CHUNK_SIZE)
+    ]
+
+
+def _merge_atas(
+    keys: List[Tuple[str, str, str]],
+    addresses: List[Optional[str]],
+    missing: List[Tuple[str, str, str]],
+    derived: List[str],
+) -> List[str]:
+    """Cache newly derived addresses and fill them in, in key order."""
+    resolved = dict(zip(missing, derived))
+    for key, address in resolved.items():
+        _ata_cache.set(key, address)
+    return [address if address is not None else resolved[key] for key, address in zip(keys, addresses)]
+
+
+def derive_atas(
+    owners: Sequence[Union[str, Pubkey]],
+    mints: Union[str, Pubkey, Sequence[Union[str, Pubkey]]],
+    token_program_id: str = TOKEN_PROGRAM_ID,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """Derive associated token account addresses for many owners.
+
+    Cached addresses are reused. When at least ``ATA_PROCESS_POOL_THRESHOLD``
+    addresses are missing, they are derived in a process pool. This blocks
+    until they are derived; async callers should use ``derive_atas_async``.
+
+    Args:
+        owners: Owner wallet addresses
+        mints: One mint for every owner, or a mint per owner
+        token_program_id: Token program owning the mints
+        max_workers: Size of a dedicated process pool; None uses the shared
+            pool and 0 derives in this process
+
+    Returns:
+        Associated token account addresses, in the order of ``owners``
+    """
+    keys, addresses, missing = _ata_keys(owners, mints, token_program_id)
+    if not missing:
+        return addresses
+
+    if max_workers != 0 and len(missing) >= ATA_PROCESS_POOL_THRESHOLD:
+        logger.debug(f"Deriving {len(missing)} associated token addresses in a process pool")
+        chunks = _ata_chunks(missing)
+        if max_workers is None:
+            results = _get_ata_pool().map(_find_associated_token_addresses, chunks)
+            derived = [address for chunk in results for address in chunk]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                derived = [address for chunk in pool.map(_find_associated_token_addresses, chunks) for address in chunk]
+    else:
+        derived = _find_associated_token_addresses(missing)
+    return _merge_atas(keys, addresses, missing, derived)
+
+
+async def derive_atas_async(
+    owners: Sequence[Union[str, Pubkey]],
+    mints: Union[str, Pubkey, Sequence[Union[str, Pubkey]]],
+    token_program_id: str = TOKEN_PROGRAM_ID,
+) -> List[str]:
+    """Derive associated token account addresses without blocking the event loop.
+
+    Like ``derive_atas``, but large derivations run in the shared process
+    pool while the event loop keeps serving other tasks.
+
+    Args:
+        owners: Owner wallet addresses
+        mints: One mint for every owner, or a mint per owner
+        token_program_id: Token program owning the mints
+
+    Returns:
+        Associated token account addresses, in the order of ``owners``
+    """
+    keys, addresses, missing = _ata_keys(owners, mints, token_program_id)
+    if not missing:
+        return addresses
+
+    if len(missing) >= ATA_PROCESS_POOL_THRESHOLD:
+        logger.debug(f"Deriving {len(missing)} associated token addresses in a process pool")
+        loop = asyncio.get_running_loop()
+        pool = _get_ata_pool()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(pool, _find_associated_token_addresses, chunk)
+            for chunk in _ata_chunks(missing)
+        ))
+        derived = [address for chunk in results for address in chunk]
+    else:
+        derived = _find_associated_token_addresses(missing)
+    return _merge_atas(keys, addresses, missing, derived)
+
+
 async def get_associated_token_address(
     owner_address: str,
     mint_address: str,
+    token_program_id: str = TOKEN_PROGRAM_ID,
 ) -> str:
     """Get the associated token account address for a wallet and mint.
 
     Args:
         owner_address: Owner's wallet address
         mint_address: Token mint address
+        token_program_id: Token program owning the mint
 
     Returns:
         Associated token account address
     """
     try:
-        logger.debug(f"Getting associated token address for owner: {owner_address}, mint: {mint_address}")
-        owner = Pubkey.from_string(owner_address)
-        mint = Pubkey.from_string(mint_address)
-        token_program_id = Pubkey.from_string(TOKEN_PROGRAM_ID)
-        associated_token_program_id = Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID)
-
-        seeds = [
-            bytes(owner),
-            bytes(token_program_id),
-            bytes(mint),
-        ]
-        
-        program_address, _ = Pubkey.find_program_address(
-            seeds,
-            associated_token_program_id,
-        )
-        
-        logger.debug(f"Found associated token address: {program_address}")
-        return str(program_address)
+        return derive_associated_token_address(owner_address, mint_address, token_program_id)
     except Exception as e:
         logger.error(f"Error getting associated token address: {str(e)}")
         raise
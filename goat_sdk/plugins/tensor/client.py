@@ -1,12 +1,14 @@
 """Client for interacting with Tensor API."""
 
 from typing import Any, Dict, List, Optional
+import inspect
 import os
 import aiohttp
 from dotenv import load_dotenv
 
 from goat_sdk.core import ModeClientBase
 from goat_sdk.core.decorators.tool import tool
+from goat_sdk.core.utils.blockhash import BlockhashCache, get_blockhash_cache
 from goat_sdk.plugins.tensor.config import TensorConfig
 from goat_sdk.plugins.tensor.types import (
     NFTInfo,
@@ -38,15 +40,19 @@ class TensorClient(ModeClientBase):
         self,
         config: Optional[TensorConfig] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        blockhash_cache: Optional[BlockhashCache] = None,
     ) -> None:
         """Initialize Tensor client.
 
         Args:
             config: Tensor configuration
             session: Optional aiohttp session
+            blockhash_cache: Optional blockhash source; defaults to the shared
+                cache of the wallet client's connection
         """
         self.config = config or TensorConfig(api_key=TENSOR_API_KEY or "")
         self._session = session
+        self._blockhash_cache = blockhash_cache
         self._headers = {
             "Content-Type": "application/json",
             "x-tensor-api-key": self.config.api_key,
@@ -67,6 +73,17 @@ class TensorClient(ModeClientBase):
                 pass
         self._session = None
 
+    async def _recent_blockhash(self, wallet_client: Any) -> str:
+        """Get a recent blockhash for transactions built by the Tensor API."""
+        blockhash_cache = self._blockhash_cache
+        if blockhash_cache is None:
+            connection = wallet_client.get_connection()
+            if inspect.isawaitable(connection):
+                connection = await connection
+            blockhash_cache = get_blockhash_cache(connection)
+        recent = await blockhash_cache.get()
+        return str(recent.blockhash)
+
     @tool(description="Get information about an NFT from the Tensor API")
     async def get_nft_info(self, request: GetNFTInfoRequest) -> NFTInfo:
         """Get information about an NFT.
@@ -134,7 +151,7 @@ class TensorClient(ModeClientBase):
             "mint": request.mint_hash,
             "owner": owner,
             "maxPrice": price,
-            "blockhash": "11111111111111111111111111111111",
+            "blockhash": await self._recent_blockhash(wallet_client),
         }
 
         try:
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from solders.hash import Hash
 
 from goat_sdk.plugins.tensor.config import TensorConfig
 from goat_sdk.plugins.tensor.types import (
@@ -20,7 +21,9 @@ def mock_wallet_client():
     client = AsyncMock()
     client.public_key = "0x" + "11" * 32  # Valid hex string
     client.get_address = MagicMock(return_value=client.public_key)
-    client.get_connection = MagicMock(return_value=MagicMock(endpoint_url="https://api.mainnet-beta.solana.com"))
+    connection = MagicMock(endpoint_url="https://api.mainnet-beta.solana.com")
+    connection.get_latest_blockhash = AsyncMock(return_value=(str(Hash.new_unique()), 1000))
+    client.get_connection = MagicMock(return_value=connection)
     return client
 
 
@@ -2,7 +2,6 @@
 Advanced security features for Uniswap operations.
 """
 
-import asyncio
 import logging
 from typing import Dict, List, Optional, Set, Tuple
 from decimal import Decimal
@@ -13,6 +12,8 @@ from eth_abi.codec import ABICodec
 from eth_utils import to_checksum_address
 from datetime import datetime, timedelta
 
+from goat_sdk.core.utils.async_web3 import call_web3
+
 # Set up logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -178,11 +179,7 @@ class TokenSecurityChecker:
     async def _call_async(self, func, *args, **kwargs):
         logger.debug("Calling async function")
         try:
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, func, *args, **kwargs
-            )
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await call_web3(func, *args, **kwargs)
             logger.debug("Async function result: %s", result)
             return result
         except Exception as e:
@@ -0,0 +1,306 @@
+"""
+Route search over an in-memory Uniswap pool graph.
+
+Pools are indexed by token so that multi-hop paths can be enumerated and
+scored locally (V2 constant product, V3 single-tick) before any candidate is
+sent to the on-chain quoter.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .types import PoolFee, PoolInfo, TokenInfo, UniswapVersion
+from .v3_math import quote_in_range
+
+Q96 = 2 ** 96
+FEE_DENOMINATOR = 1_000_000
+
+# Gas model used for route scoring (matches the historical per-hop estimates)
+BASE_SWAP_GAS = 100000
+ADDITIONAL_HOP_GAS = 80000
+
+
+def _to_int(value) -> int:
+    """Convert a liquidity/reserve value (int, Decimal or str) to int."""
+    if value is None:
+        return 0
+    return int(Decimal(str(value)))
+
+
+@dataclass
+class PoolEdge:
+    """Directed view of a pool (token_in -> token_out) used for routing."""
+    pool: PoolInfo
+    token_in: str
+    token_out: str
+    zero_for_one: bool
+    version: UniswapVersion
+
+    @property
+    def fee(self) -> PoolFee:
+        return self.pool.fee
+
+    @property
+    def liquidity(self) -> int:
+        return _to_int(self.pool.liquidity)
+
+    def _reserves(self) -> Tuple[int, int]:
+        """Return (reserve_in, reserve_out) for a V2 pair.
+
+        V2 ``PoolInfo`` stores reserve0 as ``liquidity`` and reserve1/reserve0
+        as ``token0_price``.
+        """
+        reserve0 = _to_int(self.pool.liquidity)
+        reserve1 = int(Decimal(str(self.pool.liquidity)) * Decimal(str(self.pool.token0_price)))
+        if self.zero_for_one:
+            return reserve0, reserve1
+        return reserve1, reserve0
+
+    def estimate_output(self, amount_in: int) -> int:
+        """Estimate the raw output amount for ``amount_in`` raw input units.
+
+        V2 uses the exact constant-product formula. V3 assumes the swap stays
+        within the current tick range (single-tick approximation), which is
+        accurate for sizes that are small relative to in-range liquidity.
+        """
+        if amount_in <= 0:
+            return 0
+
+        if self.version == UniswapVersion.V2:
+            reserve_in, reserve_out = self._reserves()
+            if reserve_in <= 0 or reserve_out <= 0:
+                return 0
+            amount_in_with_fee = amount_in * 997
+            return (amount_in_with_fee * reserve_out) // (reserve_in * 1000 + amount_in_with_fee)
+
+        liquidity = self.liquidity
+        sqrt_price = self.pool.sqrt_price_x96 or 0
+        if liquidity <= 0 or sqrt_price <= 0:
+            return 0
+
+        amount_less_fee = amount_in * (FEE_DENOMINATOR - self.fee.value) // FEE_DENOMINATOR
+        if self.zero_for_one:
+            # Price moves down: sqrtQ = L * sqrtP / (L + amount * sqrtP / Q96), rounded up
+            numerator = liquidity << 96
+            denominator = numerator + amount_less_fee * sqrt_price
+            sqrt_next = -(-(numerator * sqrt_price) // denominator)
+            return liquidity * (sqrt_price - sqrt_next) // Q96
+
+        # Price moves up: sqrtQ = sqrtP + amount * Q96 / L, rounded down
+        sqrt_next = sqrt_price + (amount_less_fee << 96) // liquidity
+        return ((liquidity << 96) * (sqrt_next - sqrt_price) // sqrt_next) // sqrt_price
+
+    def exact_outputs(self, amounts_in: List[int]) -> List[Optional[int]]:
+        """Exact raw outputs for many input sizes from the loaded pool state.
+
+        V2 outputs are always exact. V3 outputs are exact while the swap stays
+        inside the current tick-spacing range; sizes that reach its boundary
+        (and may cross an initialized tick) are returned as None.
+        """
+        if self.version == UniswapVersion.V2:
+            return [self.estimate_output(amount_in) for amount_in in amounts_in]
+        return quote_in_range(
+            self.pool.sqrt_price_x96 or 0,
+            self.pool.tick,
+            self.liquidity,
+            self.fee.value,
+            self.zero_for_one,
+            amounts_in
+        )
+
+    def spot_price(self) -> Decimal:
+        """Mid price as raw token_out units per raw token_in unit (fee excluded)."""
+        if self.version == UniswapVersion.V2:
+            reserve_in, reserve_out = self._reserves()
+            if reserve_in <= 0:
+                return Decimal(0)
+            return Decimal(reserve_out) / Decimal(reserve_in)
+
+        sqrt_price = self.pool.sqrt_price_x96 or 0
+        if sqrt_price <= 0:
+            return Decimal(0)
+        price = (Decimal(sqrt_price) / Decimal(Q96)) ** 2
+        return price if self.zero_for_one else Decimal(1) / price
+
+    def fee_fraction(self) -> Decimal:
+        if self.version == UniswapVersion.V2:
+            return Decimal("0.003")
+        return Decimal(self.fee.value) / Decimal(FEE_DENOMINATOR)
+
+
+@dataclass
+class RouteCandidate:
+    """A path through the pool graph with its locally estimated output."""
+    edges: List[PoolEdge]
+    amount_in: int
+    amount_out: int
+
+    @property
+    def path(self) -> List[str]:
+        return [self.edges[0].token_in] + [edge.token_out for edge in self.edges]
+
+    @property
+    def pools(self) -> List[str]:
+        return [edge.pool.address for edge in self.edges]
+
+    @property
+    def fees(self) -> List[PoolFee]:
+        return [edge.fee for edge in self.edges]
+
+    @property
+    def gas_estimate(self) -> int:
+        return BASE_SWAP_GAS + ADDITIONAL_HOP_GAS * (len(self.edges) - 1)
+
+    def price_impact(self, amount_out: Optional[int] = None) -> Decimal:
+        """Price impact of the route relative to the fee-adjusted mid price."""
+        amount_out = self.amount_out if amount_out is None else amount_out
+        if self.amount_in <= 0:
+            return Decimal(0)
+
+        expected = Decimal(self.amount_in)
+        for edge in self.edges:
+            expected *= edge.spot_price() * (Decimal(1) - edge.fee_fraction())
+        if expected <= 0:
+            return Decimal(1)
+
+        impact = Decimal(1) - Decimal(amount_out) / expected
+        return min(max(impact, Decimal(0)), Decimal(1))
+
+
+@dataclass
+class RouteGraph:
+    """Token/pool adjacency graph built from cached ``PoolInfo`` entries."""
+    version: UniswapVersion
+    min_liquidity: Decimal = Decimal(0)
+    _edges: Dict[str, List[PoolEdge]] = field(default_factory=dict, repr=False)
+    _addresses: Dict[str, str] = field(default_factory=dict, repr=False)
+    _decimals: Dict[str, int] = field(default_factory=dict, repr=False)
+    _tokens: Dict[str, TokenInfo] = field(default_factory=dict, repr=False)
+    _pools: Dict[str, PoolInfo] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_pools(
+        cls,
+        pools: Iterable[PoolInfo],
+        version: UniswapVersion,
+        min_liquidity: Decimal = Decimal(0)
+    ) -> "RouteGraph":
+        graph = cls(version=version, min_liquidity=min_liquidity)
+        for pool in pools:
+            graph.add_pool(pool)
+        return graph
+
+    def add_pool(self, pool: PoolInfo) -> bool:
+        """Add both swap directions of a pool.
+
+        Returns:
+            False if the pool was pruned (duplicate or below ``min_liquidity``)
+        """
+        key = pool.address.lower()
+        if key in self._pools:
+            return False
+        if Decimal(str(pool.liquidity or 0)) <= self.min_liquidity:
+            return False
+
+        token0 = pool.token0.address.lower()
+        token1 = pool.token1.address.lower()
+        self._pools[key] = pool
+        for info in (pool.token0, pool.token1):
+            self._addresses[info.address.lower()] = info.address
+            self._decimals[info.address.lower()] = info.decimals
+            self._tokens[info.address.lower()] = info
+
+        self._edges.setdefault(token0, []).append(
+            PoolEdge(pool=pool, token_in=token0, token_out=token1, zero_for_one=True, version=self.version)
+        )
+        self._edges.setdefault(token1, []).append(
+            PoolEdge(pool=pool, token_in=token1, token_out=token0, zero_for_one=False, version=self.version)
+        )
+        return True
+
+    @property
+    def pool_count(self) -> int:
+        return len(self._pools)
+
+    def edges_from(self, token: str) -> List[PoolEdge]:
+        return self._edges.get(token.lower(), [])
+
+    def decimals(self, token: str) -> Optional[int]:
+        return self._decimals.get(token.lower())
+
+    def token_info(self, token: str) -> Optional[TokenInfo]:
+        return self._tokens.get(token.lower())
+
+    def address(self, token: str) -> str:
+        """Return the address of ``token`` as it was reported by the pool."""
+        return self._addresses.get(token.lower(), token)
+
+    def find_routes(
+        self,
+        token_in: str,
+        token_out: str,
+        amount_in: int,
+        max_hops: int = 3,
+        k: int = 5,
+        beam_width: int = 8
+    ) -> List[RouteCandidate]:
+        """Return up to ``k`` best simple paths by locally estimated output.
+
+        The search expands one hop at a time. After each hop only the
+        ``beam_width`` best partial paths ending at each intermediate token
+        are kept; amounts are only ever compared for the same token, so the
+        pruning is unit-consistent.
+        """
+        source = token_in.lower()
+        target = token_out.lower()
+        if source == target or amount_in <= 0 or max_hops < 1:
+            return []
+
+        best: List[Tuple[int, int, RouteCandidate]] = []  # min-heap of (amount_out, seq, candidate)
+        seq = 0
+        frontier = [(amount_in, [], frozenset([source]))]
+
+        for hop in range(max_hops):
+            expanded: Dict[str, List[tuple]] = {}
+            for amount, edges, visited in frontier:
+                current = edges[-1].token_out if edges else source
+                for edge in self._edges.get(current, []):
+                    if edge.token_out in visited:
+                        continue
+                    out = edge.estimate_output(amount)
+                    if out <= 0:
+                        continue
+
+                    path_edges = edges + [edge]
+                    if edge.token_out == target:
+                        seq += 1
+                        entry = (out, seq, RouteCandidate(path_edges, amount_in, out))
+                        if len(best) < k:
+                            heapq.heappush(best, entry)
+                        elif out > best[0][0]:
+                            heapq.heapreplace(best, entry)
+                    elif hop + 1 < max_hops:
+                        expanded.setdefault(edge.token_out, []).append(
+                            (out, path_edges, visited | {edge.token_out})
+                        )
+
+            frontier = []
+            for states in expanded.values():
+                frontier.extend(heapq.nlargest(beam_width, states, key=lambda state: state[0]))
+            if not frontier:
+                break
+
+        return [entry[2] for entry in sorted(best, key=lambda entry: (-entry[0], entry[1]))]
+
+
+def encode_v3_path(tokens: List[str], fees: List[PoolFee]) -> bytes:
+    """Encode a V3 multi-hop path (token, fee, token, ...) for ``quoteExactInput``."""
+    if len(tokens) != len(fees) + 1:
+        raise ValueError("Path must contain exactly one more token than fees")
+
+    encoded = bytes.fromhex(tokens[0][2:])
+    for fee, token in zip(fees, tokens[1:]):
+        encoded += fee.value.to_bytes(3, "big") + bytes.fromhex(token[2:])
+    return encoded
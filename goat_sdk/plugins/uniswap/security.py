@@ -2,13 +2,14 @@
 Security enhancements for Uniswap plugin.
 """
 
-import asyncio
 from typing import List, Optional, Tuple, Dict
 from decimal import Decimal
 from eth_typing import Address
 from web3 import Web3
 from web3.types import TxParams, TxReceipt
 
+from goat_sdk.core.utils.async_web3 import call_web3
+
 from .validation import SecuritySettings, SwapParameters, Quote
 from .types import SwapRoute, PoolInfo
 
@@ -165,7 +166,7 @@ class SecurityManager:
         Detect potential sandwich attack patterns.
         """
         # Get recent blocks
-        latest_block = await self._call_async(self.web3.eth.block_number)
+        latest_block = await self._call_async(lambda: self.web3.eth.block_number)
         blocks_to_check = 5
 
         for block_number in range(latest_block - blocks_to_check, latest_block):
@@ -235,6 +236,4 @@ class SecurityManager:
 
     async def _call_async(self, func, *args, **kwargs):
         """Helper to call web3 functions asynchronously."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, func, *args, **kwargs
-        )
+        return await call_web3(func, *args, **kwargs)
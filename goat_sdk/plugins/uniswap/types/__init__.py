@@ -29,6 +29,9 @@ class UniswapPluginConfig:
     default_deadline_minutes: int = 20
     max_hops: int = 3
     supported_fee_tiers: List[PoolFee] = None
+    multicall_address: Optional[str] = None  # Overrides the per-chain Multicall3 address
+    block_poll_interval: float = 1.0  # Seconds between eth_blockNumber polls for cache invalidation
+    wrapped_native_address: str = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"  # Prices gas costs (WETH)
 
 @dataclass
 class TokenInfo:
@@ -67,6 +70,7 @@ class SwapRoute:
     price_impact: Decimal
     minimum_output: Decimal
     gas_estimate: int
+    gas_cost: Decimal = Decimal(0)  # Expected gas cost in output token units
 
 @dataclass
 class Position:
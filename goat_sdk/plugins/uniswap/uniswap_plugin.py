@@ -319,6 +319,11 @@ class UniswapPlugin(PluginBase):
             log_error(operation, e)
             raise
 
+    async def cleanup(self) -> None:
+        """Stop background tasks and clean up plugin resources."""
+        await self.service.stop_block_watcher()
+        await super().cleanup()
+
     @tool
     async def quote_swap(self, params: QuoteParameters) -> List[SwapRoute]:
         """Get detailed swap quotes with multiple route options."""
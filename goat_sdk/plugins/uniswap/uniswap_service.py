@@ -31,6 +31,14 @@ from .types import (
     PositionFees,
     UniswapPluginConfig
 )
+from .routing import PoolEdge, RouteCandidate, RouteGraph, encode_v3_path
+from .v3_simulator import PoolSnapshot
+from goat_sdk.core.utils.abi_registry import get_abi_registry
+from goat_sdk.core.utils.async_web3 import call_web3, is_async_web3
+from goat_sdk.core.utils.blocks import BlockSource, BlockWatcher, PollingBlockSource
+from goat_sdk.core.utils.cache import CacheManager, TTLCache
+from goat_sdk.core.utils.gas import GasOracle
+from goat_sdk.core.utils.multicall import Multicall
 
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
@@ -104,6 +112,32 @@ def log_error(operation: str, error: Exception) -> None:
     ERROR_COUNTS[operation][error_type] = ERROR_COUNTS[operation].get(error_type, 0) + 1
     logger.error(f"Error in {operation}: {error_type} - {str(error)}")
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Minimal ABIs for token and pool reads, registered once per process
+STATIC_ABIS = {
+    "uniswap.erc20_metadata": [
+        {"constant": True, "inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}
+    ],
+    "uniswap.v3_pool": [
+        {"constant": True, "inputs": [], "name": "token0", "outputs": [{"name": "", "type": "address"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "token1", "outputs": [{"name": "", "type": "address"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "fee", "outputs": [{"name": "", "type": "uint24"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "tickSpacing", "outputs": [{"name": "", "type": "int24"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "liquidity", "outputs": [{"name": "", "type": "uint128"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "slot0", "outputs": [{"name": "sqrtPriceX96", "type": "uint160"}, {"name": "tick", "type": "int24"}, {"name": "observationIndex", "type": "uint16"}, {"name": "observationCardinality", "type": "uint16"}, {"name": "observationCardinalityNext", "type": "uint16"}, {"name": "feeProtocol", "type": "uint8"}, {"name": "unlocked", "type": "bool"}], "type": "function"},
+        {"constant": True, "inputs": [{"name": "wordPosition", "type": "int16"}], "name": "tickBitmap", "outputs": [{"name": "", "type": "uint256"}], "type": "function"},
+        {"constant": True, "inputs": [{"name": "tick", "type": "int24"}], "name": "ticks", "outputs": [{"name": "liquidityGross", "type": "uint128"}, {"name": "liquidityNet", "type": "int128"}, {"name": "feeGrowthOutside0X128", "type": "uint256"}, {"name": "feeGrowthOutside1X128", "type": "uint256"}, {"name": "tickCumulativeOutside", "type": "int56"}, {"name": "secondsPerLiquidityOutsideX128", "type": "uint160"}, {"name": "secondsOutside", "type": "uint32"}, {"name": "initialized", "type": "bool"}], "type": "function"}
+    ],
+    "uniswap.v2_pair": [
+        {"constant": True, "inputs": [], "name": "token0", "outputs": [{"name": "", "type": "address"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "token1", "outputs": [{"name": "", "type": "address"}], "type": "function"},
+        {"constant": True, "inputs": [], "name": "getReserves", "outputs": [{"name": "reserve0", "type": "uint112"}, {"name": "reserve1", "type": "uint112"}, {"name": "blockTimestampLast", "type": "uint32"}], "type": "function"}
+    ]
+}
+
 class ContractCallError(Exception):
     """Base exception for contract call errors."""
     pass
@@ -138,15 +172,32 @@ class UniswapService(ToolBase):
     quoter: Any = Field(default=None, exclude=True)
     position_manager: Any = Field(default=None, exclude=True)
 
-    # Cache fields with TTL tracking
-    token_cache: Dict[str, Tuple[TokenInfo, float]] = Field(default_factory=dict, exclude=True)
-    pool_cache: Dict[str, Tuple[PoolInfo, float]] = Field(default_factory=dict, exclude=True)
-    price_cache: Dict[str, Tuple[Decimal, float]] = Field(default_factory=dict, exclude=True)
+    # Cache namespaces (created in __init__ from the shared CacheManager)
+    cache: CacheManager = Field(default_factory=CacheManager, exclude=True)
+    token_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    pool_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    pool_token_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    price_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    pool_address_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    pool_snapshot_cache: Optional[TTLCache] = Field(default=None, exclude=True)
+    block_watcher: Optional[BlockWatcher] = Field(default=None, exclude=True)
+    gas_oracle: Optional[GasOracle] = Field(default=None, exclude=True)
     CACHE_TTL: ClassVar[int] = 300  # 5 minutes
+    POOL_CACHE_TTL: ClassVar[int] = 12  # Pool state changes every block (used without a block watcher)
+    CACHE_MAX_ENTRIES: ClassVar[int] = 10_000
+
+    # Routing constants
+    ROUTE_SEARCH_CANDIDATES: ClassVar[int] = 8  # Paths kept by the local graph search
+    ROUTE_QUOTE_CANDIDATES: ClassVar[int] = 3  # Best local paths priced exactly
+    ROUTE_MIN_LIQUIDITY: ClassVar[Decimal] = Decimal(0)  # Pools at or below are pruned
+    TICK_BITMAP_WORD_RADIUS: ClassVar[int] = 2  # tickBitmap words loaded on each side of the current one
 
     # Private attributes for configuration and web3
     _config: UniswapPluginConfig = PrivateAttr(default=None)
     _web3: Web3 = PrivateAttr(default=None)
+    _chain_id: Optional[int] = PrivateAttr(default=None)
+    _multicall: Optional[Multicall] = PrivateAttr(default=None)
+    _multicall_resolved: bool = PrivateAttr(default=False)
 
     # Properties to access private attributes
     @property
@@ -195,10 +246,32 @@ class UniswapService(ToolBase):
                 }
             )
             
-            # Initialize caches with timestamps
-            self.token_cache = {}
-            self.pool_cache = {}
-            self.price_cache = {}
+            self._config = config
+            self._web3 = web3
+
+            # Token metadata and pool composition never change; pool state does
+            self.token_cache = self.cache.namespace("uniswap.tokens", max_entries=self.CACHE_MAX_ENTRIES)
+            self.pool_token_cache = self.cache.namespace("uniswap.pool_tokens", max_entries=self.CACHE_MAX_ENTRIES)
+            self.pool_address_cache = self.cache.namespace("uniswap.pool_addresses", max_entries=self.CACHE_MAX_ENTRIES)
+            self.pool_cache = self.cache.namespace(
+                "uniswap.pools",
+                ttl=self.POOL_CACHE_TTL,
+                max_entries=self.CACHE_MAX_ENTRIES,
+                per_epoch=True
+            )
+            self.pool_snapshot_cache = self.cache.namespace(
+                "uniswap.pool_snapshots",
+                ttl=self.POOL_CACHE_TTL,
+                max_entries=self.CACHE_MAX_ENTRIES,
+                per_epoch=True
+            )
+            self.price_cache = self.cache.namespace(
+                "uniswap.prices",
+                ttl=self.CACHE_TTL,
+                max_entries=self.CACHE_MAX_ENTRIES
+            )
+            # Fee data shares the cache epoch, so a block watcher refreshes it per block
+            self.gas_oracle = GasOracle(web3, self.cache)
             
             logger.info(f"[{operation}] UniswapService initialized successfully")
             logger.debug(f"[{operation}] Initial state: {vars(self)}")
@@ -225,14 +298,6 @@ class UniswapService(ToolBase):
             logger.info(f"[{operation}] Starting pool info retrieval")
             logger.debug(f"[{operation}] Parameters: token_a={token_a}, token_b={token_b}, fee={fee}")
             
-            # Check cache first
-            cache_key = f"{token_a}-{token_b}-{fee}"
-            if cache_key in self.pool_cache:
-                pool_info, timestamp = self.pool_cache[cache_key]
-                if time.time() - timestamp < self.CACHE_TTL:
-                    logger.debug(f"[{operation}] Cache hit for {cache_key}")
-                    return pool_info
-            
             # Validate inputs
             logger.debug(f"[{operation}] Validating input addresses")
             if not self.web3.is_address(token_a):
@@ -240,13 +305,16 @@ class UniswapService(ToolBase):
             if not self.web3.is_address(token_b):
                 raise ValueError(f"Invalid token_b address: {token_b}")
             
-            # Get pool info from contract
-            logger.debug(f"[{operation}] Fetching pool info from contract")
-            pool_info = await self._get_pool_info_from_contract(token_a, token_b, fee)
-            
-            # Update cache
-            logger.debug(f"[{operation}] Updating cache with new pool info")
-            self.pool_cache[cache_key] = (pool_info, time.time())
+            # Resolve the pool and load its state (both are cached)
+            logger.debug(f"[{operation}] Resolving pool address")
+            pool_address = await self._get_cached_pool_address(token_a, token_b, fee)
+            if pool_address.lower() == ZERO_ADDRESS:
+                raise ValueError(f"No pool exists for {token_a}/{token_b} with fee {fee.value}")
+
+            if self.config.version == UniswapVersion.V3:
+                pool_info = await self.get_pool_info_v3(pool_address)
+            else:
+                pool_info = await self.get_pool_info_v2(pool_address)
             
             duration = time.time() - start_time
             log_operation_time(operation, duration)
@@ -260,7 +328,27 @@ class UniswapService(ToolBase):
             log_error(operation, e)
             raise
 
+    @staticmethod
+    def _abi_id(filename: str) -> str:
+        """Registry id of a Uniswap ABI file."""
+        return f"uniswap.{Path(filename).stem}"
+
     async def _load_abi(self, filename: str) -> List[Dict[str, Any]]:
+        """Load an ABI through the process-wide registry.
+
+        The file is located and parsed once per process; later calls, from
+        any service instance, return the registered ABI.
+        """
+        return get_abi_registry().load(self._abi_id(filename), lambda: self._read_abi_file(filename)).abi
+
+    def _get_contract(self, abi_id: str, address: str) -> Any:
+        """Get a cached contract object for a registered or static ABI."""
+        registry = get_abi_registry()
+        if abi_id in STATIC_ABIS:
+            registry.load(abi_id, lambda: STATIC_ABIS[abi_id])
+        return registry.contract(self.web3, abi_id, self.web3.to_checksum_address(address))
+
+    def _read_abi_file(self, filename: str) -> List[Dict[str, Any]]:
         """Load ABI from file with extensive error handling and logging."""
         operation = "load_abi"
         start_time = time.time()
@@ -357,10 +445,8 @@ class UniswapService(ToolBase):
                 logger.debug(f"[{operation}] Executing async call")
                 response = await func_instance
             else:
-                logger.debug(f"[{operation}] Executing sync call")
-                response = func_instance.call()
-                if asyncio.iscoroutine(response):
-                    response = await response
+                logger.debug(f"[{operation}] Executing call")
+                response = await call_web3(func_instance.call)
             
             # Validate response
             if validation_func:
@@ -434,34 +520,25 @@ class UniswapService(ToolBase):
     async def _initialize_contracts(self):
         """Initialize smart contract interfaces with validation."""
         try:
-            # Load ABIs
-            router_abi = await self._load_abi("router.json")
-            factory_abi = await self._load_abi("factory.json")
+            # Load ABIs (parsed once per process)
+            await self._load_abi("router.json")
+            await self._load_abi("factory.json")
             
             # Initialize V2 contracts
-            self.router = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(self.config.router_address),
-                abi=router_abi
-            )
-            self.factory = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(self.config.factory_address),
-                abi=factory_abi
-            )
+            self.router = self._get_contract(self._abi_id("router.json"), self.config.router_address)
+            self.factory = self._get_contract(self._abi_id("factory.json"), self.config.factory_address)
             
             # Initialize V3 contracts if needed
             if self.config.version == UniswapVersion.V3:
-                quoter_abi = await self._load_abi("quoter.json")
-                position_manager_abi = await self._load_abi("position_manager.json")
+                await self._load_abi("quoter.json")
+                await self._load_abi("position_manager.json")
                 
-                self.quoter = self.web3.eth.contract(
-                    address=self.web3.to_checksum_address(self.config.quoter_address),
-                    abi=quoter_abi
-                )
+                self.quoter = self._get_contract(self._abi_id("quoter.json"), self.config.quoter_address)
                 
                 if self.config.position_manager_address:
-                    self.position_manager = self.web3.eth.contract(
-                        address=self.web3.to_checksum_address(self.config.position_manager_address),
-                        abi=position_manager_abi
+                    self.position_manager = self._get_contract(
+                        self._abi_id("position_manager.json"),
+                        self.config.position_manager_address
                     )
             
             # Validate all contracts
@@ -512,37 +589,14 @@ class UniswapService(ToolBase):
         if validation_tasks:
             await asyncio.gather(*validation_tasks)
 
-    @Tool
-    async def get_token_info(self, token_address: str) -> TokenInfo:
-        """Get token information."""
-        if token_address in self.token_cache:
-            return self.token_cache[token_address]
-
-        token = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(token_address),
-            abi=[
-                {"constant": True, "inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}
-            ]
-        )
-
-        name = await self._call_contract(token, "name")
-        symbol = await self._call_contract(token, "symbol")
-        decimals = await self._call_contract(token, "decimals")
-        chain_id = await self._call_async(self.web3.eth.chain_id)
-
-        token_info = TokenInfo(
-            address=token_address,
-            name=name,
-            symbol=symbol,
-            decimals=decimals,
-            chain_id=chain_id
+    async def _get_token_price(self, token_address: str) -> Optional[Decimal]:
+        """Get token price, cached for ``CACHE_TTL`` seconds."""
+        return await self.price_cache.get_or_load(
+            token_address.lower(),
+            lambda: self._fetch_token_price(token_address)
         )
-        self.token_cache[token_address] = token_info
-        return token_info
 
-    async def _get_token_price(self, token_address: str) -> Optional[Decimal]:
+    async def _fetch_token_price(self, token_address: str) -> Optional[Decimal]:
         """Fetch token price from reliable price feeds."""
         # Implement price fetching from multiple sources
         # Example using CoinGecko API
@@ -557,78 +611,10 @@ class UniswapService(ToolBase):
                 pass
         return None
 
-    @Tool
-    async def get_pool_info(self, token0: str, token1: str, fee: PoolFee) -> PoolInfo:
-        """Fetch detailed pool information."""
-        pool_address = await self._get_pool_address(token0, token1, fee)
-        if pool_address in self.pool_cache:
-            return self.pool_cache[pool_address]
-
-        # Get token information
-        token0_info = await self.get_token_info(token0)
-        token1_info = await self.get_token_info(token1)
-
-        if self.config.version == UniswapVersion.V3:
-            # Fetch V3 specific pool data
-            pool_contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(pool_address),
-                abi=self._load_abi("v3_pool")
-            )
-            
-            slot0 = await self._call_contract(pool_contract, "slot0")
-            liquidity = await self._call_contract(pool_contract, "liquidity")
-            
-            sqrt_price_x96 = slot0[0]
-            tick = slot0[1]
-            
-            # Calculate prices
-            token0_price = self._calculate_price_from_sqrt_price_x96(
-                sqrt_price_x96,
-                token0_info.decimals,
-                token1_info.decimals
-            )
-            token1_price = Decimal(1) / token0_price
-            
-        else:
-            # Fetch V2 specific pool data
-            pair_contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(pool_address),
-                abi=self._load_abi("v2_pair")
-            )
-            
-            reserves = await self._call_contract(pair_contract, "getReserves")
-            token0_price = Decimal(reserves[1]) / Decimal(reserves[0])
-            token1_price = Decimal(reserves[0]) / Decimal(reserves[1])
-            liquidity = Decimal(reserves[0])
-            sqrt_price_x96 = 0  # Not applicable for V2
-            tick = 0  # Not applicable for V2
-
-        # Calculate TVL
-        tvl_usd = None
-        if token0_info.price_usd is not None:
-            reserve0_usd = Decimal(str(liquidity)) * token0_info.price_usd
-            tvl_usd = reserve0_usd * Decimal(2)  # Assuming balanced pool
-
-        pool_info = PoolInfo(
-            address=pool_address,
-            token0=token0_info,
-            token1=token1_info,
-            fee=fee,
-            liquidity=liquidity,
-            sqrt_price_x96=sqrt_price_x96,
-            tick=tick,
-            token0_price=token0_price,
-            token1_price=token1_price,
-            tvl_usd=tvl_usd
-        )
-
-        self.pool_cache[pool_address] = pool_info
-        return pool_info
-
     async def _get_pool_address(self, token0: str, token1: str, fee: PoolFee) -> str:
         """Get pool address for token pair."""
         if self.config.version == UniswapVersion.V3:
-            return await self._call_contract(
+            return await self._read_contract(
                 self.factory,
                 "getPool",
                 self.web3.to_checksum_address(token0),
@@ -636,174 +622,13 @@ class UniswapService(ToolBase):
                 fee.value
             )
         else:
-            return await self._call_contract(
+            return await self._read_contract(
                 self.factory,
                 "getPair",
                 self.web3.to_checksum_address(token0),
                 self.web3.to_checksum_address(token1)
             )
 
-    async def find_optimal_routes(
-        self,
-        token_in: str,
-        token_out: str,
-        amount_in: Decimal
-    ) -> List[SwapRoute]:
-        """Find optimal routes for a swap."""
-        # For testing purposes, use a fixed 5% slippage
-        output_amount = amount_in * Decimal('0.95')  # 5% slippage
-        minimum_output = output_amount * (Decimal('1') - self.config.default_slippage)
-        
-        route = SwapRoute(
-            path=[token_in, token_out],
-            pools=["0x1234"],  # Placeholder pool address
-            fees=[PoolFee.MEDIUM],
-            input_amount=amount_in,
-            output_amount=output_amount,
-            price_impact=Decimal("0.05"),  # Fixed 5% price impact to match test
-            minimum_output=minimum_output,
-            gas_estimate=200000
-        )
-        return [route]
-
-    async def _find_direct_routes(
-        self,
-        token_in: str,
-        token_out: str,
-        amount_in: Decimal,
-        fee_tiers: List[PoolFee]
-    ) -> List[SwapRoute]:
-        """Find direct swap routes between two tokens."""
-        routes = []
-        
-        for fee in fee_tiers:
-            try:
-                # Get pool address
-                pool_address = await self._get_pool_address(token_in, token_out, fee)
-                if not pool_address:
-                    continue
-                    
-                # Get pool info
-                pool_info = await self.get_pool_info_v3(pool_address)
-                if not pool_info or pool_info.liquidity == 0:
-                    continue
-                
-                # Calculate output amount
-                output_amount = await self._get_output_amount(token_in, token_out, amount_in, [fee])
-                if output_amount <= 0:
-                    continue
-                
-                # Calculate price impact
-                price_impact = await self._estimate_price_impact(amount_in, output_amount, pool_info)
-                
-                # Estimate gas (base cost for direct swap)
-                gas_estimate = 100000  # Base gas estimate for direct swap
-                
-                route = SwapRoute(
-                    path=[token_in, token_out],
-                    pools=[pool_address],
-                    fees=[fee],
-                    input_amount=amount_in,
-                    output_amount=output_amount,
-                    price_impact=price_impact,
-                    minimum_output=output_amount * (Decimal('1') - self.config.default_slippage),
-                    gas_estimate=gas_estimate
-                )
-                routes.append(route)
-                
-            except Exception as e:
-                # Log error but continue trying other fee tiers
-                print(f"Error finding direct route with fee {fee}: {str(e)}")
-                continue
-                
-        return routes
-
-    async def _find_multi_hop_routes(
-        self,
-        token_in: str,
-        token_out: str,
-        amount_in: Decimal,
-        intermediate_tokens: List[str],
-        fee_tiers: List[PoolFee]
-    ) -> List[SwapRoute]:
-        """Find routes through intermediate tokens."""
-        routes = []
-        
-        for intermediate_token in intermediate_tokens:
-            if intermediate_token in [token_in, token_out]:
-                continue
-                
-            # Try different fee combinations
-            for fee1 in fee_tiers:
-                for fee2 in fee_tiers:
-                    try:
-                        # Check first hop pool
-                        pool1_address = await self._get_pool_address(token_in, intermediate_token, fee1)
-                        if not pool1_address:
-                            continue
-                            
-                        # Check second hop pool    
-                        pool2_address = await self._get_pool_address(intermediate_token, token_out, fee2)
-                        if not pool2_address:
-                            continue
-                            
-                        # Get pool info and verify liquidity
-                        pool1_info = await self.get_pool_info_v3(pool1_address)
-                        pool2_info = await self.get_pool_info_v3(pool2_address)
-                        
-                        if not pool1_info or not pool2_info or pool1_info.liquidity == 0 or pool2_info.liquidity == 0:
-                            continue
-                        
-                        # Calculate output amounts for both hops
-                        intermediate_amount = await self._get_output_amount(token_in, intermediate_token, amount_in, [fee1])
-                        if intermediate_amount <= 0:
-                            continue
-                            
-                        final_amount = await self._get_output_amount(intermediate_token, token_out, intermediate_amount, [fee2])
-                        if final_amount <= 0:
-                            continue
-                        
-                        # Calculate combined price impact
-                        price_impact1 = await self._estimate_price_impact(amount_in, intermediate_amount, pool1_info)
-                        price_impact2 = await self._estimate_price_impact(intermediate_amount, final_amount, pool2_info)
-                        total_price_impact = price_impact1 + price_impact2
-                        
-                        # Estimate gas (higher for multi-hop)
-                        gas_estimate = 180000  # Base gas estimate for 2 hops
-                        
-                        route = SwapRoute(
-                            path=[token_in, intermediate_token, token_out],
-                            pools=[pool1_address, pool2_address],
-                            fees=[fee1, fee2],
-                            input_amount=amount_in,
-                            output_amount=final_amount,
-                            price_impact=total_price_impact,
-                            minimum_output=final_amount * (Decimal('1') - self.config.default_slippage),
-                            gas_estimate=gas_estimate
-                        )
-                        routes.append(route)
-                        
-                    except Exception as e:
-                        # Log error but continue trying other combinations
-                        print(f"Error finding multi-hop route through {intermediate_token}: {str(e)}")
-                        continue
-                        
-        return routes
-
-    async def _find_three_hop_routes(
-        self,
-        token_in: str,
-        token_out: str,
-        amount_in: Decimal,
-        fee_tiers: List[PoolFee]
-    ) -> List[SwapRoute]:
-        """Find three hop routes (more complex paths)."""
-        # This is a simplified implementation - in practice you'd want to:
-        # 1. Use a graph algorithm to find optimal 3-hop paths
-        # 2. Consider common routing patterns
-        # 3. Filter based on historical volume/liquidity
-        return []  # For now, just return empty list as 3-hop routes are expensive
-
     async def _get_base_tokens(self) -> List[str]:
         """Get list of common base tokens for routing."""
         # These would typically be tokens like WETH, USDC, USDT, DAI
@@ -815,76 +640,32 @@ class UniswapService(ToolBase):
             "0x6B175474E89094C44Da98b954EedeAC495271d0F"   # DAI
         ]
 
-    def _estimate_gas_cost_in_token(self, gas_estimate: int, token_info: TokenInfo) -> Decimal:
-        """Estimate gas cost in terms of output token."""
-        # This would need proper implementation based on:
-        # 1. Current gas prices
-        # 2. ETH price in terms of output token
-        # 3. Token decimals
-        return Decimal('0')  # Placeholder
-
-    async def _get_output_amount(
+    async def _estimate_gas_cost_in_token(
         self,
-        token_in: str,
-        token_out: str,
-        amount_in: Decimal,
-        fees: List[PoolFee],
-        path: Optional[List[str]] = None
+        gas_estimate: int,
+        token_info: TokenInfo,
+        graph: Optional[RouteGraph] = None
     ) -> Decimal:
-        """Get exact output amount for a route."""
-        if self.config.version == UniswapVersion.V3:
-            # Use V3 quoter contract
-            quote_params = [
-                self.web3.to_checksum_address(token_in),
-                self.web3.to_checksum_address(token_out),
-                fees[0].value,
-                self._to_wei(amount_in),
-                0  # Square root price limit
-            ]
-            
-            if path:
-                # Multi-hop quote
-                quote_params.extend([
-                    self.web3.to_checksum_address(token) for token in path[1:-1]
-                ])
-                quote_params.extend([f.value for f in fees[1:]])
-            
-            raw_output = await self._call_contract(
-                self.quoter,
-                "quoteExactInputSingle",
-                *quote_params
-            )
-            return self._from_wei(raw_output)
-        else:
-            # Use V2 getAmountsOut
-            amounts = await self._call_contract(
-                self.router,
-                "getAmountsOut",
-                self._to_wei(amount_in),
-                [self.web3.to_checksum_address(t) for t in ([token_in, token_out] if not path else [token_in] + path + [token_out])]
-            )
-            return self._from_wei(amounts[-1])
+        """Estimate gas cost in terms of output token.
 
-    def _estimate_price_impact(
-        self,
-        input_amount: Decimal,
-        output_amount: Decimal,
-        pool_info: PoolInfo
-    ) -> Decimal:
-        """
-        Estimate price impact of a trade.
-        Uses advanced metrics for accurate estimation.
+        The gas price comes from the (per-block cached) gas oracle and the
+        native cost is converted through the best local route from the
+        wrapped native token. Returns 0 if the token cannot be priced.
         """
-        if input_amount == 0:
+        fees = await self.gas_oracle.fees()
+        cost_wei = gas_estimate * fees.gas_price
+        native = self.config.wrapped_native_address
+        if cost_wei <= 0 or not native:
+            return Decimal(0)
+        if token_info.address.lower() == native.lower():
+            return Decimal(cost_wei) / Decimal(10 ** 18)
+        if graph is None:
             return Decimal(0)
 
-        # Calculate expected output at current price
-        expected_output = input_amount * pool_info.token0_price
-        
-        # Calculate price impact
-        price_impact = abs(Decimal(1) - (output_amount / expected_output))
-        
-        return min(price_impact, Decimal(1))
+        conversions = graph.find_routes(native, token_info.address, cost_wei, max_hops=2, k=1)
+        if not conversions:
+            return Decimal(0)
+        return Decimal(conversions[0].amount_out) / Decimal(10 ** token_info.decimals)
 
     async def simulate_swap(
         self,
@@ -957,28 +738,82 @@ class UniswapService(ToolBase):
 
     async def _call_async(self, func, *args, **kwargs):
         """Helper to call web3 functions asynchronously."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, func, *args, **kwargs
-        )
+        return await call_web3(func, *args, **kwargs)
+
+    async def _get_chain_id(self) -> int:
+        """Get the chain ID, fetching it from the node only once."""
+        if self._chain_id is None:
+            if is_async_web3(self.web3):
+                self._chain_id = await self.web3.eth.chain_id
+            else:
+                self._chain_id = await self._call_async(lambda: self.web3.eth.chain_id)
+        return self._chain_id
 
-    def _to_wei(self, amount: Decimal) -> int:
-        """Convert decimal to wei."""
-        return int(amount * Decimal(10**18))
+    async def _get_multicall(self) -> Optional[Multicall]:
+        """Get the Multicall3 batcher for this chain, if one is available."""
+        if not self._multicall_resolved:
+            self._multicall_resolved = True
+            try:
+                self._multicall = Multicall.for_chain(
+                    self.web3,
+                    await self._get_chain_id(),
+                    address=self.config.multicall_address
+                )
+            except Exception as e:
+                logger.warning(f"[multicall] Multicall3 unavailable, using direct calls: {str(e)}")
+                self._multicall = None
+        return self._multicall
 
-    def _from_wei(self, amount: int) -> Decimal:
-        """Convert wei to decimal."""
-        return Decimal(amount) / Decimal(10**18)
+    async def start_block_watcher(self, source: Optional[BlockSource] = None) -> BlockWatcher:
+        """Invalidate volatile pool state on every new block.
 
-    def _calculate_price_from_sqrt_price_x96(
-        self,
-        sqrt_price_x96: int,
-        decimals0: int,
-        decimals1: int
-    ) -> Decimal:
-        """Calculate price from sqrtPriceX96."""
-        price = (Decimal(sqrt_price_x96) / Decimal(2**96)) ** 2
-        decimal_adjustment = Decimal(10 ** (decimals1 - decimals0))
-        return price * decimal_adjustment
+        While the watcher runs, pool state is cached for exactly one block
+        instead of ``POOL_CACHE_TTL`` seconds, and batched reads are pinned
+        to the current block so quotes within a block share one snapshot.
+
+        Args:
+            source: Block source; defaults to polling ``eth_blockNumber``
+        """
+        if self.block_watcher is None:
+            self.block_watcher = BlockWatcher(
+                source or PollingBlockSource(self.web3, self.config.block_poll_interval)
+            )
+            self.block_watcher.on_block(self._on_new_block)
+        for cache in (self.pool_cache, self.pool_snapshot_cache):
+            cache.ttl = None
+        self.block_watcher.start()
+        logger.info("[block_watcher] Started block-aware cache invalidation")
+        return self.block_watcher
+
+    async def stop_block_watcher(self) -> None:
+        """Stop block tracking and fall back to TTL-based pool state expiry."""
+        if self.block_watcher is not None:
+            await self.block_watcher.stop()
+            self.block_watcher = None
+        for cache in (self.pool_cache, self.pool_snapshot_cache):
+            cache.ttl = self.POOL_CACHE_TTL
+        if self._multicall is not None:
+            self._multicall.block_identifier = "latest"
+        logger.info("[block_watcher] Stopped block-aware cache invalidation")
+
+    async def _on_new_block(self, block_number: int) -> None:
+        """Expire per-block cache entries and pin batched reads to the new block."""
+        self.cache.advance_epoch(block_number)
+        multicall = await self._get_multicall()
+        if multicall is not None:
+            multicall.block_identifier = block_number
+        logger.debug(f"[block_watcher] New block {block_number}")
+
+    async def _read_contract(self, contract: Any, function_name: str, *args) -> Any:
+        """Read a view function, batching it with concurrent reads through Multicall3.
+
+        Falls back to ``_call_contract`` when no Multicall3 contract is
+        configured for the chain.
+        """
+        multicall = await self._get_multicall()
+        if multicall is None:
+            return await self._call_contract(contract, function_name, *args)
+        return await multicall.call(getattr(contract.functions, function_name)(*args))
 
     async def execute(self, params: Dict[str, Any]) -> str:
         """Execute the tool with the given parameters."""
@@ -997,23 +832,26 @@ class UniswapService(ToolBase):
         return str(result)
 
     async def get_token_info(self, token_address: str) -> TokenInfo:
-        """Get token information."""
-        if token_address in self.token_cache:
-            return self.token_cache[token_address]
-
-        token = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(token_address),
-            abi=[
-                {"constant": True, "inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}
-            ]
+        """Get token information.
+
+        Token metadata is immutable, so it is cached without expiry and
+        concurrent lookups of the same token share one set of reads.
+        """
+        return await self.token_cache.get_or_load(
+            token_address.lower(),
+            lambda: self._fetch_token_info(token_address)
         )
 
-        name = await self._call_contract(token, "name")
-        symbol = await self._call_contract(token, "symbol")
-        decimals = await self._call_contract(token, "decimals")
-        chain_id = await self._call_async(self.web3.eth.chain_id)
+    async def _fetch_token_info(self, token_address: str) -> TokenInfo:
+        """Read token metadata from the chain."""
+        token = self._get_contract("uniswap.erc20_metadata", token_address)
+
+        name, symbol, decimals, chain_id = await asyncio.gather(
+            self._read_contract(token, "name"),
+            self._read_contract(token, "symbol"),
+            self._read_contract(token, "decimals"),
+            self._get_chain_id()
+        )
 
         token_info = TokenInfo(
             address=token_address,
@@ -1022,34 +860,45 @@ class UniswapService(ToolBase):
             decimals=decimals,
             chain_id=chain_id
         )
-        self.token_cache[token_address] = token_info
         return token_info
 
+    async def _get_pool_tokens(
+        self,
+        pool: Any,
+        pool_address: str,
+        with_fee: bool
+    ) -> Tuple[TokenInfo, TokenInfo, Optional[int]]:
+        """Get a pool's tokens (and V3 fee), which never change once deployed."""
+        async def load() -> Tuple[TokenInfo, TokenInfo, Optional[int]]:
+            reads = [self._read_contract(pool, "token0"), self._read_contract(pool, "token1")]
+            if with_fee:
+                reads.append(self._read_contract(pool, "fee"))
+            results = await asyncio.gather(*reads)
+
+            token0_info, token1_info = await asyncio.gather(
+                self.get_token_info(results[0]),
+                self.get_token_info(results[1])
+            )
+            return token0_info, token1_info, results[2] if with_fee else None
+
+        return await self.pool_token_cache.get_or_load(pool_address.lower(), load)
+
     async def get_pool_info_v3(self, pool_address: str) -> PoolInfo:
         """Get pool information for Uniswap V3."""
-        if pool_address in self.pool_cache:
-            return self.pool_cache[pool_address]
-
-        pool = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(pool_address),
-            abi=[
-                {"constant": True, "inputs": [], "name": "token0", "outputs": [{"name": "", "type": "address"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "token1", "outputs": [{"name": "", "type": "address"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "fee", "outputs": [{"name": "", "type": "uint24"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "liquidity", "outputs": [{"name": "", "type": "uint128"}], "type": "function"},
-                {"constant": True, "inputs": [], "name": "slot0", "outputs": [{"name": "sqrtPriceX96", "type": "uint160"}, {"name": "tick", "type": "int24"}, {"name": "observationIndex", "type": "uint16"}, {"name": "observationCardinality", "type": "uint16"}, {"name": "observationCardinalityNext", "type": "uint16"}, {"name": "feeProtocol", "type": "uint8"}, {"name": "unlocked", "type": "bool"}], "type": "function"}
-            ]
+        return await self.pool_cache.get_or_load(
+            pool_address.lower(),
+            lambda: self._fetch_pool_info_v3(pool_address)
         )
 
-        token0_address = await self._call_contract(pool, "token0")
-        token1_address = await self._call_contract(pool, "token1")
-        fee = await self._call_contract(pool, "fee")
-        liquidity = await self._call_contract(pool, "liquidity")
-        slot0 = await self._call_contract(pool, "slot0")
+    async def _fetch_pool_info_v3(self, pool_address: str) -> PoolInfo:
+        """Read V3 pool state from the chain."""
+        pool = self._get_contract("uniswap.v3_pool", pool_address)
 
-        # Get token info for both tokens
-        token0_info = await self.get_token_info(token0_address)
-        token1_info = await self.get_token_info(token1_address)
+        (token0_info, token1_info, fee), liquidity, slot0 = await asyncio.gather(
+            self._get_pool_tokens(pool, pool_address, with_fee=True),
+            self._read_contract(pool, "liquidity"),
+            self._read_contract(pool, "slot0")
+        )
 
         # Convert fee to PoolFee enum
         pool_fee = PoolFee(fee)
@@ -1066,31 +915,403 @@ class UniswapService(ToolBase):
             fee=pool_fee,
             liquidity=liquidity,
             sqrt_price_x96=slot0[0],
+            tick=slot0[1],
             token0_price=token0_price,
             token1_price=token1_price
         )
-        self.pool_cache[pool_address] = pool_info
         return pool_info
 
+    async def get_pool_snapshot(self, pool_address: str) -> PoolSnapshot:
+        """Get the tick-level state of a V3 pool, cached per block.
+
+        Args:
+            pool_address: V3 pool address
+
+        Returns:
+            Snapshot with the initialized ticks of the ``TICK_BITMAP_WORD_RADIUS``
+            tickBitmap words around the current tick
+        """
+        return await self.pool_snapshot_cache.get_or_load(
+            pool_address.lower(),
+            lambda: self._fetch_pool_snapshot(pool_address)
+        )
+
+    async def _fetch_pool_snapshot(self, pool_address: str) -> PoolSnapshot:
+        """Read slot0, liquidity and nearby initialized ticks of a V3 pool."""
+        pool = self._get_contract("uniswap.v3_pool", pool_address)
+
+        slot0, liquidity, fee, tick_spacing = await asyncio.gather(
+            self._read_contract(pool, "slot0"),
+            self._read_contract(pool, "liquidity"),
+            self._read_contract(pool, "fee"),
+            self._read_contract(pool, "tickSpacing")
+        )
+        snapshot = PoolSnapshot(
+            address=pool_address,
+            sqrt_price_x96=int(slot0[0]),
+            tick=int(slot0[1]),
+            liquidity=int(liquidity),
+            fee=int(fee),
+            tick_spacing=int(tick_spacing),
+            block_number=self.block_watcher.block_number if self.block_watcher is not None else None
+        )
+
+        center = PoolSnapshot.word_position(snapshot.tick, snapshot.tick_spacing)
+        words = list(range(center - self.TICK_BITMAP_WORD_RADIUS, center + self.TICK_BITMAP_WORD_RADIUS + 1))
+        bitmaps = await asyncio.gather(*(self._read_contract(pool, "tickBitmap", word) for word in words))
+        snapshot.bitmap = {word: int(bitmap) for word, bitmap in zip(words, bitmaps)}
+
+        ticks = [
+            tick
+            for word, bitmap in snapshot.bitmap.items()
+            for tick in PoolSnapshot.initialized_ticks(word, bitmap, snapshot.tick_spacing)
+        ]
+        tick_data = await asyncio.gather(*(self._read_contract(pool, "ticks", tick) for tick in ticks))
+        snapshot.liquidity_net = {tick: int(data[1]) for tick, data in zip(ticks, tick_data)}
+
+        logger.debug(f"[pool_snapshot] Loaded {len(ticks)} initialized ticks for {pool_address}")
+        return snapshot
+
+    async def get_pool_info_v2(self, pair_address: str) -> PoolInfo:
+        """Get pair information for Uniswap V2."""
+        return await self.pool_cache.get_or_load(
+            pair_address.lower(),
+            lambda: self._fetch_pool_info_v2(pair_address)
+        )
+
+    async def _fetch_pool_info_v2(self, pair_address: str) -> PoolInfo:
+        """Read V2 pair state from the chain."""
+        pair = self._get_contract("uniswap.v2_pair", pair_address)
+
+        (token0_info, token1_info, _), reserves = await asyncio.gather(
+            self._get_pool_tokens(pair, pair_address, with_fee=False),
+            self._read_contract(pair, "getReserves")
+        )
+
+        reserve0 = Decimal(reserves[0])
+        reserve1 = Decimal(reserves[1])
+
+        pool_info = PoolInfo(
+            address=pair_address,
+            token0=token0_info,
+            token1=token1_info,
+            fee=PoolFee.MEDIUM,  # V2 pairs always charge 0.3%
+            liquidity=reserve0,
+            token0_price=reserve1 / reserve0 if reserve0 else Decimal(0),
+            token1_price=reserve0 / reserve1 if reserve1 else Decimal(0)
+        )
+        return pool_info
+
+    async def _get_cached_pool_address(self, token_a: str, token_b: str, fee: PoolFee) -> str:
+        """Resolve a pool address through the factory, caching the result.
+
+        Pool addresses are immutable once created, so lookups (including
+        misses, which return the zero address) are cached for the service
+        lifetime.
+        """
+        key = tuple(sorted((token_a.lower(), token_b.lower()))) + (fee.value,)
+        return await self.pool_address_cache.get_or_load(
+            key,
+            lambda: self._get_pool_address(token_a, token_b, fee)
+        )
+
+    async def _discover_pools(self, tokens: List[str], fee_tiers: List[PoolFee]) -> List[PoolInfo]:
+        """Load every existing pool between ``tokens`` for the given fee tiers."""
+        pairs = [(a, b) for i, a in enumerate(tokens) for b in tokens[i + 1:]]
+        if self.config.version == UniswapVersion.V3:
+            keys = [(a, b, fee) for a, b in pairs for fee in fee_tiers]
+            load_pool = self.get_pool_info_v3
+        else:
+            keys = [(a, b, PoolFee.MEDIUM) for a, b in pairs]
+            load_pool = self.get_pool_info_v2
+
+        addresses = await asyncio.gather(
+            *(self._get_cached_pool_address(*key) for key in keys),
+            return_exceptions=True
+        )
+        pool_addresses = {
+            address for address in addresses
+            if isinstance(address, str) and address.lower() != ZERO_ADDRESS
+        }
+
+        pools = await asyncio.gather(
+            *(load_pool(address) for address in pool_addresses),
+            return_exceptions=True
+        )
+        for result in pools:
+            if isinstance(result, Exception):
+                logger.debug(f"[discover_pools] Skipping pool: {str(result)}")
+        return [pool for pool in pools if isinstance(pool, PoolInfo)]
+
+    async def _build_route_graph(self, token_in: str, token_out: str) -> RouteGraph:
+        """Build the routing graph for a swap from discovered and cached pools."""
+        tokens: List[str] = []
+        for token in [token_in, token_out] + await self._get_base_tokens():
+            if token.lower() not in (t.lower() for t in tokens):
+                tokens.append(token)
+
+        fee_tiers = self.config.supported_fee_tiers or list(PoolFee)
+        pools = await self._discover_pools(tokens, fee_tiers)
+        pools.extend(self.pool_cache.values())
+
+        return RouteGraph.from_pools(pools, self.config.version, min_liquidity=self.ROUTE_MIN_LIQUIDITY)
+
+    async def _simulate_route(self, candidate: RouteCandidate) -> int:
+        """Quote a V3 route exactly from per-block pool snapshots, without the quoter.
+
+        Raises:
+            TickDataUnavailableError: If a hop moves past the loaded ticks
+            ValueError: If a pool cannot fill the hop
+        """
+        snapshots = await asyncio.gather(*(self.get_pool_snapshot(edge.pool.address) for edge in candidate.edges))
+        amount = candidate.amount_in
+        for edge, snapshot in zip(candidate.edges, snapshots):
+            simulation = snapshot.simulate_exact_input(amount, edge.zero_for_one)
+            if simulation.amount_in < amount:
+                raise ValueError(f"Insufficient liquidity in pool {snapshot.address}")
+            amount = simulation.amount_out
+        return amount
+
+    async def _quote_route(self, candidate: RouteCandidate) -> int:
+        """Quote a candidate route exactly, falling back to its local estimate.
+
+        V3 routes are simulated locally over tick snapshots; the quoter is
+        only called when the snapshots cannot price the route.
+        """
+        if self.config.version == UniswapVersion.V3:
+            try:
+                return await self._simulate_route(candidate)
+            except Exception as e:
+                logger.debug(f"[quote_route] Local simulation unavailable for {candidate.pools}: {str(e)}")
+
+        contract = self.quoter if self.config.version == UniswapVersion.V3 else self.router
+        if contract is None:
+            return candidate.amount_out
+
+        tokens = [self.web3.to_checksum_address(token) for token in candidate.path]
+        if self.config.version == UniswapVersion.V3:
+            if len(candidate.edges) == 1:
+                result = await self._call_contract(
+                    self.quoter,
+                    "quoteExactInputSingle",
+                    tokens[0],
+                    tokens[1],
+                    candidate.fees[0].value,
+                    candidate.amount_in,
+                    0  # Square root price limit
+                )
+            else:
+                result = await self._call_contract(
+                    self.quoter,
+                    "quoteExactInput",
+                    encode_v3_path(tokens, candidate.fees),
+                    candidate.amount_in
+                )
+        else:
+            amounts = await self._call_contract(self.router, "getAmountsOut", candidate.amount_in, tokens)
+            result = amounts[-1]
+
+        # QuoterV2 returns (amountOut, sqrtPriceX96After, ticksCrossed, gasEstimate)
+        if isinstance(result, (list, tuple)):
+            result = result[0]
+        return int(result)
+
     async def find_optimal_routes(
         self,
         token_in: str,
         token_out: str,
-        amount_in: Decimal
+        amount_in: Decimal,
+        max_hops: Optional[int] = None
     ) -> List[SwapRoute]:
-        """Find optimal routes for a swap."""
-        # Placeholder for now - would need to implement actual routing logic
-        route = SwapRoute(
-            path=[token_in, token_out],
-            pools=["0x1234"],  # Placeholder pool address
-            fees=[PoolFee.MEDIUM],
-            input_amount=amount_in,
-            output_amount=amount_in * Decimal("0.98"),  # Placeholder 2% slippage
-            price_impact=Decimal("0.02"),
-            minimum_output=amount_in * Decimal("0.97"),
-            gas_estimate=200000
-        )
-        return [route]
+        """Find the best swap routes between two tokens, best output first.
+
+        Paths of up to ``max_hops`` pools (at most 3) are searched in an
+        in-memory pool graph and scored locally; only the best
+        ``ROUTE_QUOTE_CANDIDATES`` are priced exactly (V3 routes by local
+        tick simulation, with the quoter as fallback). Routes are ranked by
+        output net of their estimated gas cost in the output token.
+        """
+        operation = "find_optimal_routes"
+        start_time = time.time()
+
+        try:
+            logger.info(f"[{operation}] Searching routes {token_in} -> {token_out} for {amount_in}")
+            max_hops = min(max_hops or self.config.max_hops or 3, 3)
+
+            graph = await self._build_route_graph(token_in, token_out)
+            logger.debug(f"[{operation}] Route graph contains {graph.pool_count} pools")
+
+            decimals_in = graph.decimals(token_in)
+            decimals_out = graph.decimals(token_out)
+            if decimals_in is None or decimals_out is None:
+                logger.warning(f"[{operation}] No pools found for {token_in} or {token_out}")
+                return []
+
+            raw_amount_in = int(amount_in * Decimal(10 ** decimals_in))
+            candidates = graph.find_routes(
+                token_in,
+                token_out,
+                raw_amount_in,
+                max_hops=max_hops,
+                k=self.ROUTE_SEARCH_CANDIDATES
+            )[:self.ROUTE_QUOTE_CANDIDATES]
+            logger.debug(f"[{operation}] Quoting {len(candidates)} candidate routes")
+
+            quotes = await asyncio.gather(
+                *(self._quote_route(candidate) for candidate in candidates),
+                return_exceptions=True
+            )
+
+            routes = []
+            for candidate, raw_output in zip(candidates, quotes):
+                if isinstance(raw_output, Exception):
+                    logger.debug(f"[{operation}] Quote failed for {candidate.path}: {str(raw_output)}")
+                    continue
+                if raw_output <= 0:
+                    continue
+
+                output_amount = Decimal(raw_output) / Decimal(10 ** decimals_out)
+                routes.append(SwapRoute(
+                    path=[graph.address(token) for token in candidate.path],
+                    pools=candidate.pools,
+                    fees=candidate.fees,
+                    input_amount=amount_in,
+                    output_amount=output_amount,
+                    price_impact=candidate.price_impact(raw_output),
+                    minimum_output=output_amount * (Decimal('1') - self.config.default_slippage),
+                    gas_estimate=candidate.gas_estimate
+                ))
+
+            token_out_info = graph.token_info(token_out)
+            costs = await asyncio.gather(
+                *(self._estimate_gas_cost_in_token(route.gas_estimate, token_out_info, graph) for route in routes),
+                return_exceptions=True
+            )
+            for route, cost in zip(routes, costs):
+                if isinstance(cost, Exception):
+                    logger.debug(f"[{operation}] Gas cost unavailable for {route.path}: {str(cost)}")
+                    continue
+                route.gas_cost = cost
+
+            # Longer routes must beat shorter ones by more than their extra gas
+            routes.sort(key=lambda route: route.output_amount - route.gas_cost, reverse=True)
+
+            duration = time.time() - start_time
+            log_operation_time(operation, duration)
+
+            logger.info(f"[{operation}] Found {len(routes)} routes")
+            return routes
+
+        except Exception as e:
+            logger.error(f"[{operation}] Route search failed")
+            logger.error(f"[{operation}] Error: {str(e)}")
+            logger.error(f"[{operation}] Stack trace:", exc_info=True)
+            log_error(operation, e)
+            raise
+
+    async def quote_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        amounts: List[Decimal]
+    ) -> Dict[Tuple[str, str], List[Optional[Decimal]]]:
+        """Quote every amount for every (token_in, token_out) pair in one call.
+
+        Each pool's state is loaded once (batched through Multicall3 and
+        cached per block) and all amounts are priced locally with exact
+        integer math: V2 via the constant-product formula and V3 within the
+        current tick range. V3 sizes that may cross an initialized tick are
+        simulated over the pool's tick snapshot, falling back to the quoter
+        when the loaded ticks do not cover the swap. The best direct pool is
+        used per amount.
+
+        Args:
+            pairs: (token_in, token_out) pairs
+            amounts: Input amounts in token_in units
+
+        Returns:
+            Output amounts per pair, aligned with ``amounts`` (None where no
+            pool exists or the quote failed)
+        """
+        operation = "quote_batch"
+        start_time = time.time()
+
+        try:
+            logger.info(f"[{operation}] Quoting {len(amounts)} amounts for {len(pairs)} pairs")
+            if self.config.version == UniswapVersion.V3:
+                fee_tiers = self.config.supported_fee_tiers or list(PoolFee)
+            else:
+                fee_tiers = [PoolFee.MEDIUM]
+
+            pair_pools = await asyncio.gather(
+                *(self._discover_pools([token_in, token_out], fee_tiers) for token_in, token_out in pairs)
+            )
+
+            results: Dict[Tuple[str, str], List[Optional[Decimal]]] = {}
+            fallbacks = []  # (pair, amount index, edge, raw amount)
+            best_outputs = []
+            for (token_in, token_out), pools in zip(pairs, pair_pools):
+                best: List[Optional[int]] = [None] * len(amounts)
+                best_outputs.append((token_in, token_out, pools, best))
+                if not pools:
+                    continue
+
+                decimals_in = pools[0].token0.decimals
+                if pools[0].token0.address.lower() != token_in.lower():
+                    decimals_in = pools[0].token1.decimals
+                raw_amounts = [int(Decimal(amount) * Decimal(10 ** decimals_in)) for amount in amounts]
+
+                for pool in pools:
+                    zero_for_one = pool.token0.address.lower() == token_in.lower()
+                    edge = PoolEdge(
+                        pool=pool,
+                        token_in=token_in.lower(),
+                        token_out=token_out.lower(),
+                        zero_for_one=zero_for_one,
+                        version=self.config.version
+                    )
+                    for index, output in enumerate(edge.exact_outputs(raw_amounts)):
+                        if output is None:
+                            fallbacks.append((best, index, edge, raw_amounts[index]))
+                        elif best[index] is None or output > best[index]:
+                            best[index] = output
+
+            logger.debug(f"[{operation}] {len(fallbacks)} tick-crossing sizes to simulate or quote")
+            quotes = await asyncio.gather(
+                *(
+                    self._quote_route(RouteCandidate([edge], raw_amount, edge.estimate_output(raw_amount)))
+                    for _, _, edge, raw_amount in fallbacks
+                ),
+                return_exceptions=True
+            )
+            for (best, index, edge, _), output in zip(fallbacks, quotes):
+                if isinstance(output, Exception):
+                    logger.debug(f"[{operation}] Quote failed for pool {edge.pool.address}: {str(output)}")
+                    continue
+                if best[index] is None or output > best[index]:
+                    best[index] = output
+
+            for token_in, token_out, pools, best in best_outputs:
+                decimals_out = None
+                if pools:
+                    out_info = pools[0].token1 if pools[0].token0.address.lower() == token_in.lower() else pools[0].token0
+                    decimals_out = out_info.decimals
+                results[(token_in, token_out)] = [
+                    Decimal(output) / Decimal(10 ** decimals_out) if output is not None else None
+                    for output in best
+                ]
+
+            duration = time.time() - start_time
+            log_operation_time(operation, duration)
+
+            logger.info(f"[{operation}] Quoted {len(pairs) * len(amounts)} sizes with {len(fallbacks)} exact quotes")
+            return results
+
+        except Exception as e:
+            logger.error(f"[{operation}] Batch quote failed")
+            logger.error(f"[{operation}] Error: {str(e)}")
+            logger.error(f"[{operation}] Stack trace:", exc_info=True)
+            log_error(operation, e)
+            raise
 
     async def monitor_mempool(
         self,
@@ -1124,9 +1345,60 @@ class UniswapService(ToolBase):
         token_out: str,
         amount_in: Decimal
     ) -> Decimal:
-        """Calculate the price impact of a swap."""
-        # Placeholder for now - would need to implement actual price impact calculation
-        return Decimal("0.02")  # 2% price impact
+        """Calculate the price impact of a swap through the deepest direct pool.
+
+        V3 swaps are simulated exactly across tick crossings from a per-block
+        pool snapshot; V2 swaps use the constant-product formula.
+
+        Args:
+            token_in: Input token address
+            token_out: Output token address
+            amount_in: Input amount in token_in units
+
+        Returns:
+            Shortfall against the fee-adjusted mid price (1 if no pool exists)
+        """
+        operation = "calculate_price_impact"
+        start_time = time.time()
+
+        try:
+            logger.info(f"[{operation}] Calculating price impact {token_in} -> {token_out} for {amount_in}")
+            if self.config.version == UniswapVersion.V3:
+                fee_tiers = self.config.supported_fee_tiers or list(PoolFee)
+            else:
+                fee_tiers = [PoolFee.MEDIUM]
+
+            pools = await self._discover_pools([token_in, token_out], fee_tiers)
+            if not pools:
+                logger.warning(f"[{operation}] No pool found for {token_in} -> {token_out}")
+                return Decimal(1)
+
+            pool = max(pools, key=lambda p: Decimal(p.liquidity or 0))
+            zero_for_one = pool.token0.address.lower() == token_in.lower()
+            decimals_in = pool.token0.decimals if zero_for_one else pool.token1.decimals
+            raw_amount_in = int(amount_in * Decimal(10 ** decimals_in))
+            edge = PoolEdge(
+                pool=pool,
+                token_in=token_in.lower(),
+                token_out=token_out.lower(),
+                zero_for_one=zero_for_one,
+                version=self.config.version
+            )
+            candidate = RouteCandidate([edge], raw_amount_in, edge.estimate_output(raw_amount_in))
+            price_impact = candidate.price_impact(await self._quote_route(candidate))
+
+            duration = time.time() - start_time
+            log_operation_time(operation, duration)
+
+            logger.info(f"[{operation}] Price impact through {pool.address}: {price_impact}")
+            return price_impact
+
+        except Exception as e:
+            logger.error(f"[{operation}] Price impact calculation failed")
+            logger.error(f"[{operation}] Error: {str(e)}")
+            logger.error(f"[{operation}] Stack trace:", exc_info=True)
+            log_error(operation, e)
+            raise
 
     @classmethod
     async def create(cls, config: UniswapPluginConfig, web3: Web3) -> "UniswapService":
@@ -0,0 +1,248 @@
+"""
+Uniswap V3 core math in exact Python integer arithmetic.
+
+Ports of ``TickMath``, ``FullMath``, ``SqrtPriceMath`` and ``SwapMath`` from
+v3-core. Results match the contracts bit-for-bit, including rounding.
+"""
+
+from typing import List, Optional, Tuple
+
+Q96 = 2 ** 96
+MAX_UINT160 = 2 ** 160 - 1
+MAX_UINT256 = 2 ** 256 - 1
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+FEE_PIPS_DENOMINATOR = 1_000_000
+
+# Tick spacing enabled by the factory for each fee tier
+TICK_SPACINGS = {100: 1, 500: 10, 3000: 60, 10000: 200}
+
+_TICK_RATIO_CONSTANTS = [
+    (0x2, 0xfff97272373d413259a46990580e213a),
+    (0x4, 0xfff2e50f5f656932ef12357cf3c7fdcc),
+    (0x8, 0xffe5caca7e10e4e61c3624eaa0941cd0),
+    (0x10, 0xffcb9843d60f6159c9db58835c926644),
+    (0x20, 0xff973b41fa98c081472e6896dfb254c0),
+    (0x40, 0xff2ea16466c96a3843ec78b326b52861),
+    (0x80, 0xfe5dee046a99a2a811c461f1969c3053),
+    (0x100, 0xfcbe86c7900a88aedcffc83b479aa3a4),
+    (0x200, 0xf987a7253ac413176f2b074cf7815e54),
+    (0x400, 0xf3392b0822b70005940c7a398e4b70f3),
+    (0x800, 0xe7159475a2c29b7443b29c7fa6e889d9),
+    (0x1000, 0xd097f3bdfd2022b8845ad8f792aa5825),
+    (0x2000, 0xa9f746462d870fdf8a65dc1f90e061e5),
+    (0x4000, 0x70d869a156d2a1b890bb3df62baf32f7),
+    (0x8000, 0x31be135f97d08fd981231505542fcfa6),
+    (0x10000, 0x9aa508b5b7a84e1c677de54f3e99bc9),
+    (0x20000, 0x5d6af8dedb81196699c329225ee604),
+    (0x40000, 0x2216e584f5fa1ea926041bedfe98),
+    (0x80000, 0x48a170391f7dc42444e8fa2),
+]
+
+
+def mul_div(a: int, b: int, denominator: int) -> int:
+    """floor(a * b / denominator) with full precision."""
+    return a * b // denominator
+
+
+def mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    """ceil(a * b / denominator) with full precision."""
+    return -(-(a * b) // denominator)
+
+
+def div_rounding_up(x: int, y: int) -> int:
+    return -(-x // y)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """sqrt(1.0001^tick) as a Q64.96, matching ``TickMath.getSqrtRatioAtTick``."""
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} out of range")
+
+    ratio = 0xfffcb933bd6fad37aa2d162d1a594001 if abs_tick & 0x1 else 1 << 128
+    for mask, constant in _TICK_RATIO_CONSTANTS:
+        if abs_tick & mask:
+            ratio = (ratio * constant) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # Q128.128 -> Q64.96, rounding up
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Greatest tick whose sqrt ratio is <= ``sqrt_price_x96``."""
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"sqrtPriceX96 {sqrt_price_x96} out of range")
+
+    low, high = MIN_TICK, MAX_TICK
+    while low < high:
+        mid = (low + high + 1) // 2
+        if get_sqrt_ratio_at_tick(mid) <= sqrt_price_x96:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def get_next_sqrt_price_from_amount0_rounding_up(sqrt_price_x96: int, liquidity: int, amount: int, add: bool) -> int:
+    if amount == 0:
+        return sqrt_price_x96
+    numerator1 = liquidity << 96
+
+    if add:
+        product = amount * sqrt_price_x96
+        if product // amount == sqrt_price_x96 and product <= MAX_UINT256:
+            denominator = numerator1 + product
+            if denominator >= numerator1 and denominator <= MAX_UINT256:
+                return mul_div_rounding_up(numerator1, sqrt_price_x96, denominator)
+        return div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+
+    product = amount * sqrt_price_x96
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise ValueError("Insufficient liquidity")
+    return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+
+
+def get_next_sqrt_price_from_amount1_rounding_down(sqrt_price_x96: int, liquidity: int, amount: int, add: bool) -> int:
+    if add:
+        quotient = (amount << 96) // liquidity if amount <= MAX_UINT160 else mul_div(amount, Q96, liquidity)
+        result = sqrt_price_x96 + quotient
+        if result > MAX_UINT160:
+            raise ValueError("Price overflow")
+        return result
+
+    quotient = div_rounding_up(amount << 96, liquidity) if amount <= MAX_UINT160 else mul_div_rounding_up(amount, Q96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("Insufficient liquidity")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool) -> int:
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount0_rounding_up(sqrt_price_x96, liquidity, amount_in, True)
+    return get_next_sqrt_price_from_amount1_rounding_down(sqrt_price_x96, liquidity, amount_in, True)
+
+
+def get_amount0_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b - sqrt_ratio_a
+    if round_up:
+        return div_rounding_up(mul_div_rounding_up(numerator1, numerator2, sqrt_ratio_b), sqrt_ratio_a)
+    return mul_div(numerator1, numerator2, sqrt_ratio_b) // sqrt_ratio_a
+
+
+def get_amount1_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+    if round_up:
+        return mul_div_rounding_up(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+    return mul_div(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+
+
+def compute_swap_step(
+    sqrt_price_current: int,
+    sqrt_price_target: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int
+) -> Tuple[int, int, int, int]:
+    """One exact-input swap step within a tick range (``SwapMath.computeSwapStep``).
+
+    Returns:
+        (sqrt_price_next, amount_in, amount_out, fee_amount)
+    """
+    zero_for_one = sqrt_price_current >= sqrt_price_target
+    amount_remaining_less_fee = mul_div(amount_remaining, FEE_PIPS_DENOMINATOR - fee_pips, FEE_PIPS_DENOMINATOR)
+
+    if zero_for_one:
+        amount_in = get_amount0_delta(sqrt_price_target, sqrt_price_current, liquidity, True)
+    else:
+        amount_in = get_amount1_delta(sqrt_price_current, sqrt_price_target, liquidity, True)
+
+    if amount_remaining_less_fee >= amount_in:
+        sqrt_price_next = sqrt_price_target
+    else:
+        sqrt_price_next = get_next_sqrt_price_from_input(
+            sqrt_price_current, liquidity, amount_remaining_less_fee, zero_for_one
+        )
+
+    reached_target = sqrt_price_target == sqrt_price_next
+    if zero_for_one:
+        if not reached_target:
+            amount_in = get_amount0_delta(sqrt_price_next, sqrt_price_current, liquidity, True)
+        amount_out = get_amount1_delta(sqrt_price_next, sqrt_price_current, liquidity, False)
+    else:
+        if not reached_target:
+            amount_in = get_amount1_delta(sqrt_price_current, sqrt_price_next, liquidity, True)
+        amount_out = get_amount0_delta(sqrt_price_current, sqrt_price_next, liquidity, False)
+
+    if not reached_target:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = mul_div_rounding_up(amount_in, fee_pips, FEE_PIPS_DENOMINATOR - fee_pips)
+
+    return sqrt_price_next, amount_in, amount_out, fee_amount
+
+
+def tick_range_bounds(tick: int, tick_spacing: int) -> Tuple[int, int]:
+    """Sqrt prices of the tick-spacing boundaries enclosing ``tick``.
+
+    Liquidity can only change at initialized ticks, which are multiples of
+    ``tick_spacing``, so within these bounds liquidity is constant.
+    """
+    lower = max((tick // tick_spacing) * tick_spacing, MIN_TICK)
+    upper = min(lower + tick_spacing, MAX_TICK)
+    return get_sqrt_ratio_at_tick(lower), get_sqrt_ratio_at_tick(upper)
+
+
+def quote_in_range(
+    sqrt_price_x96: int,
+    tick: Optional[int],
+    liquidity: int,
+    fee_pips: int,
+    zero_for_one: bool,
+    amounts_in: List[int]
+) -> List[Optional[int]]:
+    """Exact outputs for many input sizes that stay within the current tick range.
+
+    Args:
+        sqrt_price_x96: Current pool sqrt price
+        tick: Current pool tick (derived from the price if None)
+        liquidity: Current in-range liquidity
+        fee_pips: Pool fee in hundredths of a bip
+        zero_for_one: Swap direction
+        amounts_in: Raw input amounts
+
+    Returns:
+        Output per input, or None where the swap would reach the next
+        tick-spacing boundary (and may cross an initialized tick)
+    """
+    if liquidity <= 0 or sqrt_price_x96 <= 0:
+        return [None for _ in amounts_in]
+
+    if tick is None:
+        tick = get_tick_at_sqrt_ratio(sqrt_price_x96)
+    tick_spacing = TICK_SPACINGS.get(fee_pips, 1)
+    lower, upper = tick_range_bounds(tick, tick_spacing)
+    target = lower if zero_for_one else upper
+    if target == sqrt_price_x96:
+        # Price sits on a boundary, so the first step already crosses a tick
+        return [None if amount_in > 0 else 0 for amount_in in amounts_in]
+
+    outputs: List[Optional[int]] = []
+    for amount_in in amounts_in:
+        if amount_in <= 0:
+            outputs.append(0)
+            continue
+        sqrt_price_next, _, amount_out, _ = compute_swap_step(sqrt_price_x96, target, liquidity, amount_in, fee_pips)
+        outputs.append(None if sqrt_price_next == target else amount_out)
+    return outputs
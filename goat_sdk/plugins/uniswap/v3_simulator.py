@@ -0,0 +1,216 @@
+"""
+Offline Uniswap V3 swap simulation.
+
+A ``PoolSnapshot`` holds a pool's slot0, liquidity and the initialized ticks
+of the loaded ``tickBitmap`` words. ``simulate_exact_input`` replays
+``UniswapV3Pool.swap`` over it with the exact contract math, crossing
+initialized ticks, so quotes and price impact need no RPC per candidate.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from .v3_math import (
+    FEE_PIPS_DENOMINATOR,
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+
+class TickDataUnavailableError(ValueError):
+    """Raised when a swap reaches a tickBitmap word that was not loaded."""
+
+
+@dataclass
+class SwapSimulation:
+    """Result of an exact-input swap simulation."""
+    amount_in: int
+    amount_out: int
+    fee_amount: int
+    sqrt_price_x96_after: int
+    tick_after: int
+    ticks_crossed: int
+    price_impact: Decimal
+
+
+def _most_significant_bit(x: int) -> int:
+    return x.bit_length() - 1
+
+
+def _least_significant_bit(x: int) -> int:
+    return (x & -x).bit_length() - 1
+
+
+@dataclass
+class PoolSnapshot:
+    """State of a V3 pool at one block, sufficient for local swap simulation."""
+    address: str
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    fee: int
+    tick_spacing: int
+    bitmap: Dict[int, int] = field(default_factory=dict)  # Loaded word position -> bitmap
+    liquidity_net: Dict[int, int] = field(default_factory=dict)  # Initialized tick -> liquidityNet
+    block_number: Optional[int] = None
+
+    def __post_init__(self):
+        if not MIN_SQRT_RATIO <= self.sqrt_price_x96 < MAX_SQRT_RATIO:
+            raise ValueError(f"sqrtPriceX96 {self.sqrt_price_x96} of pool {self.address} out of range")
+        if self.tick_spacing <= 0 or self.liquidity < 0 or not 0 <= self.fee < FEE_PIPS_DENOMINATOR:
+            raise ValueError(f"Invalid state for pool {self.address}")
+
+    @staticmethod
+    def word_position(tick: int, tick_spacing: int) -> int:
+        """Bitmap word holding ``tick``."""
+        return (tick // tick_spacing) >> 8
+
+    @staticmethod
+    def initialized_ticks(word: int, bitmap: int, tick_spacing: int):
+        """Ticks flagged as initialized in a bitmap word."""
+        while bitmap:
+            bit = _least_significant_bit(bitmap)
+            yield ((word << 8) + bit) * tick_spacing
+            bitmap &= bitmap - 1
+
+    def next_initialized_tick_within_one_word(self, tick: int, lte: bool):
+        """Port of ``TickBitmap.nextInitializedTickWithinOneWord``.
+
+        Raises:
+            TickDataUnavailableError: If the word was not loaded
+        """
+        compressed = tick // self.tick_spacing
+
+        if lte:
+            word_pos, bit_pos = compressed >> 8, compressed % 256
+            bitmap = self._word(word_pos)
+            masked = bitmap & ((1 << bit_pos) - 1 + (1 << bit_pos))
+            if masked:
+                return (compressed - (bit_pos - _most_significant_bit(masked))) * self.tick_spacing, True
+            return (compressed - bit_pos) * self.tick_spacing, False
+
+        compressed += 1
+        word_pos, bit_pos = compressed >> 8, compressed % 256
+        bitmap = self._word(word_pos)
+        masked = bitmap & ~((1 << bit_pos) - 1)
+        if masked:
+            return (compressed + (_least_significant_bit(masked) - bit_pos)) * self.tick_spacing, True
+        return (compressed + (255 - bit_pos)) * self.tick_spacing, False
+
+    def _word(self, word_pos: int) -> int:
+        if word_pos not in self.bitmap:
+            raise TickDataUnavailableError(f"tickBitmap word {word_pos} of pool {self.address} is not loaded")
+        return self.bitmap[word_pos]
+
+    def simulate_exact_input(
+        self,
+        amount_in: int,
+        zero_for_one: bool,
+        sqrt_price_limit_x96: Optional[int] = None
+    ) -> SwapSimulation:
+        """Simulate an exact-input swap as ``UniswapV3Pool.swap`` would execute it.
+
+        Args:
+            amount_in: Raw input amount
+            zero_for_one: True to swap token0 for token1
+            sqrt_price_limit_x96: Optional price limit (defaults to the full range)
+
+        Raises:
+            TickDataUnavailableError: If the swap moves past the loaded ticks
+        """
+        if sqrt_price_limit_x96 is None:
+            sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+        amount_remaining = amount_in
+        amount_out = 0
+        fee_total = 0
+        sqrt_price = self.sqrt_price_x96
+        tick = self.tick
+        liquidity = self.liquidity
+        ticks_crossed = 0
+
+        while amount_remaining > 0 and sqrt_price != sqrt_price_limit_x96:
+            sqrt_price_start = sqrt_price
+            tick_next, initialized = self.next_initialized_tick_within_one_word(tick, zero_for_one)
+            tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+            sqrt_price_next = get_sqrt_ratio_at_tick(tick_next)
+
+            if (sqrt_price_next < sqrt_price_limit_x96) if zero_for_one else (sqrt_price_next > sqrt_price_limit_x96):
+                target = sqrt_price_limit_x96
+            else:
+                target = sqrt_price_next
+
+            sqrt_price, step_in, step_out, step_fee = compute_swap_step(
+                sqrt_price, target, liquidity, amount_remaining, self.fee
+            )
+            amount_remaining -= step_in + step_fee
+            amount_out += step_out
+            fee_total += step_fee
+
+            if sqrt_price == sqrt_price_next:
+                if initialized:
+                    liquidity_net = self.liquidity_net.get(tick_next, 0)
+                    liquidity += -liquidity_net if zero_for_one else liquidity_net
+                    ticks_crossed += 1
+                tick = tick_next - 1 if zero_for_one else tick_next
+            elif sqrt_price != sqrt_price_start:
+                tick = get_tick_at_sqrt_ratio(sqrt_price)
+
+        amount_used = amount_in - amount_remaining
+        return SwapSimulation(
+            amount_in=amount_used,
+            amount_out=amount_out,
+            fee_amount=fee_total,
+            sqrt_price_x96_after=sqrt_price,
+            tick_after=tick,
+            ticks_crossed=ticks_crossed,
+            price_impact=self.price_impact(amount_used, amount_out, zero_for_one)
+        )
+
+    def price_impact(self, amount_in: int, amount_out: int, zero_for_one: bool) -> Decimal:
+        """Shortfall of ``amount_out`` against the fee-adjusted mid price."""
+        if amount_in <= 0:
+            return Decimal(0)
+        price = (Decimal(self.sqrt_price_x96) / Decimal(Q96)) ** 2
+        if not zero_for_one:
+            price = Decimal(1) / price
+        expected = Decimal(amount_in) * price * Decimal(FEE_PIPS_DENOMINATOR - self.fee) / Decimal(FEE_PIPS_DENOMINATOR)
+        if expected <= 0:
+            return Decimal(1)
+        return min(max(Decimal(1) - Decimal(amount_out) / expected, Decimal(0)), Decimal(1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for recorded fixtures (large ints are stored as strings)."""
+        return {
+            "address": self.address,
+            "sqrt_price_x96": str(self.sqrt_price_x96),
+            "tick": self.tick,
+            "liquidity": str(self.liquidity),
+            "fee": self.fee,
+            "tick_spacing": self.tick_spacing,
+            "bitmap": {str(word): str(bitmap) for word, bitmap in self.bitmap.items()},
+            "liquidity_net": {str(tick): str(net) for tick, net in self.liquidity_net.items()},
+            "block_number": self.block_number
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PoolSnapshot":
+        """Load a snapshot serialized with ``to_dict``."""
+        return cls(
+            address=data["address"],
+            sqrt_price_x96=int(data["sqrt_price_x96"]),
+            tick=int(data["tick"]),
+            liquidity=int(data["liquidity"]),
+            fee=int(data["fee"]),
+            tick_spacing=int(data["tick_spacing"]),
+            bitmap={int(word): int(bitmap) for word, bitmap in data.get("bitmap", {}).items()},
+            liquidity_net={int(tick): int(net) for tick, net in data.get("liquidity_net", {}).items()},
+            block_number=data.get("block_number")
+        )
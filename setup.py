@@ -38,6 +38,7 @@ setup(
     name="goat_sdk",
     version="0.1.0",
     packages=find_packages(),
+    include_package_data=True,
     install_requires=[
         "aiohttp>=3.8.0",
         "pydantic>=2.0.0",
@@ -0,0 +1,137 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_abi_registry.py
+"""
+
+"""Tests for the ABI and contract registry."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from goat_sdk.core.utils.abi_registry import AbiRegistry, get_abi_registry
+
+TOKEN_ABI = [
+    {"inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"name": "account", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "token0", "outputs": [{"name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "getReserves", "outputs": [{"name": "reserve0", "type": "uint112"}, {"name": "reserve1", "type": "uint112"}], "stateMutability": "view", "type": "function"},
+    {"anonymous": False, "inputs": [], "name": "Sync", "type": "event"},
+]
+
+TOKEN_ADDRESS = "0x" + "1" * 40
+HOLDER_ADDRESS = "0x" + "2" * 40
+
+
+@pytest.fixture
+def registry():
+    return AbiRegistry(max_contracts=2)
+
+
+def test_load_calls_loader_once(registry):
+    loader = MagicMock(return_value=TOKEN_ABI)
+    first = registry.load("token", loader)
+    second = registry.load("token", loader)
+    assert first is second
+    assert loader.call_count == 1
+    assert "token" in registry
+
+
+def test_loader_errors_are_not_cached(registry):
+    with pytest.raises(FileNotFoundError):
+        registry.load("token", MagicMock(side_effect=FileNotFoundError))
+    assert "token" not in registry
+    assert registry.load("token", lambda: TOKEN_ABI).abi == TOKEN_ABI
+
+
+def test_selectors_and_codecs(registry):
+    contract_abi = registry.register("token", TOKEN_ABI)
+    assert set(contract_abi.functions) == {
+        "decimals", "decimals()",
+        "balanceOf", "balanceOf(address)",
+        "token0", "token0()",
+        "getReserves", "getReserves()",
+    }
+
+    balance_of = contract_abi.function("balanceOf")
+    assert balance_of.selector == bytes.fromhex("70a08231")
+    assert balance_of.encode_input(HOLDER_ADDRESS) == bytes.fromhex("70a08231") + encode(["address"], [HOLDER_ADDRESS])
+    assert balance_of.decode_output(encode(["uint256"], [42])) == 42
+
+    token0 = contract_abi.function("token0()")
+    assert token0.decode_output(encode(["address"], [TOKEN_ADDRESS])) == Web3.to_checksum_address(TOKEN_ADDRESS)
+    assert contract_abi.function("getReserves").decode_output(encode(["uint112", "uint112"], [1, 2])) == [1, 2]
+
+    with pytest.raises(KeyError):
+        contract_abi.function("transfer")
+
+
+def test_contract_objects_are_cached_per_web3(registry):
+    registry.register("token", TOKEN_ABI)
+    web3 = MagicMock()
+    web3.eth.contract.side_effect = lambda address, abi: MagicMock(address=address)
+
+    first = registry.contract(web3, "token", TOKEN_ADDRESS)
+    assert registry.contract(web3, "token", TOKEN_ADDRESS.upper().replace("0X", "0x")) is first
+    assert web3.eth.contract.call_count == 1
+
+    other_web3 = MagicMock()
+    assert registry.contract(other_web3, "token", TOKEN_ADDRESS) is not first
+
+    with pytest.raises(KeyError):
+        registry.contract(web3, "unknown", TOKEN_ADDRESS)
+
+
+def test_contract_cache_is_lru_bounded(registry):
+    registry.register("token", TOKEN_ABI)
+    web3 = MagicMock()
+    web3.eth.contract.side_effect = lambda address, abi: MagicMock(address=address)
+
+    first = registry.contract(web3, "token", "0x" + "1" * 40)
+    registry.contract(web3, "token", "0x" + "2" * 40)
+    registry.contract(web3, "token", "0x" + "3" * 40)
+    assert registry.contract(web3, "token", "0x" + "1" * 40) is not first
+
+
+def test_register_replaces_cached_contracts(registry):
+    registry.register("token", TOKEN_ABI)
+    web3 = MagicMock()
+    web3.eth.contract.side_effect = lambda address, abi: MagicMock(address=address, abi=abi)
+
+    old = registry.contract(web3, "token", TOKEN_ADDRESS)
+    registry.register("token", TOKEN_ABI[:1])
+    new = registry.contract(web3, "token", TOKEN_ADDRESS)
+    assert new is not old
+    assert new.abi == TOKEN_ABI[:1]
+
+
+def test_process_wide_registry():
+    assert get_abi_registry() is get_abi_registry()
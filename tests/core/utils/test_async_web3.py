@@ -0,0 +1,85 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_async_web3.py
+"""
+
+"""Tests for the async Web3 helpers."""
+
+import threading
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+
+from goat_sdk.core.utils.async_web3 import call_web3, close_shared_session, create_async_web3, is_async_web3
+
+
+@pytest.mark.asyncio
+async def test_coroutine_functions_are_awaited_on_the_loop():
+    async def fetch(value, scale=1):
+        return threading.current_thread().name, value * scale
+
+    thread_name, value = await call_web3(fetch, 2, scale=3)
+
+    assert thread_name == threading.current_thread().name
+    assert value == 6
+
+
+@pytest.mark.asyncio
+async def test_blocking_functions_run_on_bounded_executor():
+    def fetch(value, scale=1):
+        return threading.current_thread().name, value * scale
+
+    thread_name, value = await call_web3(fetch, 2, scale=3)
+
+    assert thread_name.startswith("goat-web3")
+    assert value == 6
+
+
+@pytest.mark.asyncio
+async def test_values_and_awaitables_pass_through():
+    async def fetch():
+        return 42
+
+    assert await call_web3(7) == 7
+    assert await call_web3(fetch()) == 42
+    assert await call_web3(lambda: fetch()) == 42
+
+
+@pytest.mark.asyncio
+async def test_create_async_web3_shares_session():
+    first = await create_async_web3("http://localhost:8545")
+    second = await create_async_web3("http://localhost:8546")
+    try:
+        assert is_async_web3(first)
+        assert not is_async_web3(Web3())
+        assert isinstance(first.provider, AsyncHTTPProvider)
+        assert isinstance(first, AsyncWeb3)
+    finally:
+        await close_shared_session()
+    assert second is not first
@@ -0,0 +1,194 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_blockhash.py
+"""
+
+"""Tests for recent blockhash caching."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from solders.hash import Hash
+
+from solana.rpc.core import TransactionExpiredBlockheightExceededError
+
+from goat_sdk.core.exceptions import TransactionRevertedError
+
+from goat_sdk.core.utils import blockhash
+from goat_sdk.core.utils.blockhash import (
+    confirmation_error,
+    BlockhashCache,
+    get_blockhash_cache,
+    parse_blockhash_response,
+    send_with_blockhash,
+)
+
+BLOCKHASH = Hash.new_unique()
+
+
+@pytest.mark.parametrize("response", [
+    SimpleNamespace(value=SimpleNamespace(blockhash=BLOCKHASH, last_valid_block_height=42)),
+    {"result": {"value": {"blockhash": str(BLOCKHASH), "lastValidBlockHeight": 42}}},
+    (str(BLOCKHASH), 42),
+])
+def test_parse_blockhash_response(response):
+    recent = parse_blockhash_response(response)
+    assert recent.blockhash == BLOCKHASH
+    assert recent.last_valid_block_height == 42
+
+
+def test_parse_blockhash_response_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_blockhash_response({"result": {"value": {}}})
+
+
+@pytest.mark.asyncio
+async def test_blockhash_shared_until_invalidated():
+    connection = MagicMock()
+    connection.get_latest_blockhash = AsyncMock(return_value=(str(BLOCKHASH), 42))
+    cache = BlockhashCache(connection)
+
+    results = await asyncio.gather(*(cache.get() for _ in range(5)))
+    assert {recent.blockhash for recent in results} == {BLOCKHASH}
+    connection.get_latest_blockhash.assert_awaited_once()
+
+    cache.invalidate()
+    await cache.get()
+    assert connection.get_latest_blockhash.await_count == 2
+
+
+def make_connection():
+    """Connection returning a new blockhash, valid until height 100 more than the last, per call."""
+    connection = MagicMock()
+    heights = iter(range(100, 10_000, 100))
+    connection.get_latest_blockhash = AsyncMock(side_effect=lambda: (str(Hash.new_unique()), next(heights)))
+    connection.send_raw_transaction = AsyncMock(return_value=SimpleNamespace(value="signature"))
+    connection.confirm_transaction = AsyncMock()
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_background_refresher_keeps_blockhash_fresh():
+    connection = make_connection()
+    cache = BlockhashCache(connection)
+    cache.start(interval=0.01)
+    try:
+        await asyncio.sleep(0.05)
+        assert cache.running
+        assert connection.get_latest_blockhash.await_count >= 2
+        fetched = connection.get_latest_blockhash.await_count
+        assert cache.peek() is not None
+        await cache.get()
+        assert connection.get_latest_blockhash.await_count in (fetched, fetched + 1)
+    finally:
+        await cache.stop()
+    assert not cache.running
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_refresher_starts_on_first_use_and_stops_when_idle(monkeypatch):
+    monkeypatch.setattr(blockhash, "BLOCKHASH_REFRESH_INTERVAL", 0.01)
+    monkeypatch.setattr(blockhash, "BLOCKHASH_IDLE_TIMEOUT", 0.05)
+    connection = make_connection()
+    cache = BlockhashCache(connection, auto_refresh=True)
+    assert not cache.running
+
+    await cache.get()
+    assert cache.running
+    # The refresher's first fetch joins the lookup's
+    assert connection.get_latest_blockhash.await_count == 1
+
+    await asyncio.sleep(0.03)
+    assert connection.get_latest_blockhash.await_count >= 2
+    await asyncio.sleep(0.1)
+    assert not cache.running
+
+    # A later lookup starts it again
+    assert cache.peek() is not None
+    assert cache.running
+    await cache.stop()
+
+
+def test_cache_shared_per_endpoint():
+    first = MagicMock(_provider=SimpleNamespace(endpoint_uri="https://rpc.example"))
+    second = MagicMock(_provider=SimpleNamespace(endpoint_uri="https://rpc.example"))
+    cache = get_blockhash_cache(first)
+    assert get_blockhash_cache(second) is cache
+    assert cache.connection is second
+    assert get_blockhash_cache(MagicMock(_provider=SimpleNamespace(endpoint_uri="https://other.example"))) is not cache
+
+
+@pytest.mark.asyncio
+async def test_send_raises_when_confirmed_transaction_failed():
+    connection = make_connection()
+    connection.confirm_transaction.return_value = SimpleNamespace(
+        value=[SimpleNamespace(err="InstructionError(1, Custom(1))")]
+    )
+    with pytest.raises(TransactionRevertedError, match="Custom") as raised:
+        await send_with_blockhash(connection, lambda recent: b"transaction", BlockhashCache(connection))
+    assert raised.value.tx_hash == "signature"
+    # A failed transaction is not re-signed
+    connection.send_raw_transaction.assert_awaited_once()
+
+    assert confirmation_error({"result": {"value": [{"err": None}]}}) is None
+    assert confirmation_error({"result": {"value": [{"err": {"InstructionError": [0, "Custom"]}}]}})
+
+
+@pytest.mark.asyncio
+async def test_send_resigns_on_expired_blockhash():
+    connection = make_connection()
+    connection.confirm_transaction.side_effect = [
+        TransactionExpiredBlockheightExceededError("signature has expired: block height exceeded"),
+        None,
+    ]
+    built = []
+
+    def build(recent):
+        built.append(recent)
+        return b"transaction"
+
+    assert await send_with_blockhash(connection, build, BlockhashCache(connection)) == "signature"
+
+    assert len(built) == 2
+    assert built[0].blockhash != built[1].blockhash
+    assert [call.kwargs["opts"].last_valid_block_height for call in connection.send_raw_transaction.await_args_list] == [
+        built[0].last_valid_block_height,
+        built[1].last_valid_block_height,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_does_not_retry_other_errors():
+    connection = make_connection()
+    connection.send_raw_transaction.side_effect = RuntimeError("insufficient funds")
+    with pytest.raises(RuntimeError):
+        await send_with_blockhash(connection, lambda recent: b"transaction", BlockhashCache(connection))
+    connection.send_raw_transaction.assert_awaited_once()
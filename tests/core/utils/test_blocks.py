@@ -0,0 +1,148 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_blocks.py
+"""
+
+"""Tests for new-block tracking and block-driven cache invalidation."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from goat_sdk.core.utils.blocks import BlockSource, BlockWatcher, PollingBlockSource
+from goat_sdk.core.utils.cache import CacheManager
+
+
+class ListBlockSource(BlockSource):
+    """Yields a fixed sequence of block numbers, then idles."""
+
+    def __init__(self, numbers):
+        self.numbers = numbers
+
+    async def blocks(self):
+        for number in self.numbers:
+            yield number
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_listeners_called_once_per_new_block():
+    watcher = BlockWatcher(ListBlockSource([]))
+    seen = []
+    watcher.on_block(seen.append)
+
+    assert await watcher.handle_block(10)
+    assert not await watcher.handle_block(10)
+    assert not await watcher.handle_block(9)
+    assert await watcher.handle_block(11)
+
+    assert seen == [10, 11]
+    assert watcher.block_number == 11
+
+
+@pytest.mark.asyncio
+async def test_async_listener_and_failing_listener():
+    watcher = BlockWatcher(ListBlockSource([]))
+    seen = []
+
+    async def record(block_number):
+        seen.append(block_number)
+
+    def fail(block_number):
+        raise RuntimeError("listener error")
+
+    watcher.on_block(fail)
+    watcher.on_block(record)
+    await watcher.handle_block(1)
+
+    assert seen == [1]
+
+
+@pytest.mark.asyncio
+async def test_watcher_advances_cache_epoch():
+    manager = CacheManager()
+    pools = manager.namespace("pools", per_epoch=True)
+    pools.set("pool", "state@0")
+
+    watcher = BlockWatcher(ListBlockSource([100, 100, 101]))
+    watcher.on_block(manager.advance_epoch)
+    watcher.start()
+    await asyncio.sleep(0.01)
+    await watcher.stop()
+
+    assert not watcher.running
+    assert manager.epoch == 101
+    assert "pool" not in pools
+
+
+@pytest.mark.asyncio
+async def test_load_straddling_block_is_not_served_as_fresh():
+    manager = CacheManager()
+    pools = manager.namespace("pools", per_epoch=True)
+    manager.advance_epoch(100)
+
+    async def slow_load():
+        manager.advance_epoch(101)  # New block arrives mid-load
+        return "state@100"
+
+    assert await pools.get_or_load("pool", slow_load) == "state@100"
+    assert "pool" not in pools
+
+
+@pytest.mark.asyncio
+async def test_watcher_recovers_from_source_errors():
+    class FlakySource(BlockSource):
+        def __init__(self):
+            self.attempts = 0
+
+        async def blocks(self):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise ConnectionError("dropped")
+            yield 5
+            await asyncio.Event().wait()
+
+    watcher = BlockWatcher(FlakySource(), retry_delay=0)
+    watcher.start()
+    await asyncio.sleep(0.01)
+    await watcher.stop()
+
+    assert watcher.block_number == 5
+
+
+@pytest.mark.asyncio
+async def test_polling_source_reads_block_number():
+    web3 = MagicMock()
+    web3.eth.block_number = 42
+    source = PollingBlockSource(web3, interval=0)
+
+    blocks = source.blocks()
+    assert await blocks.__anext__() == 42
+    await blocks.aclose()
@@ -0,0 +1,192 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_cache.py
+"""
+
+"""Tests for the TTL/LRU cache subsystem."""
+
+import asyncio
+
+import pytest
+
+from goat_sdk.core.utils.cache import CacheManager, ListCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def manager(clock):
+    return CacheManager(clock=clock)
+
+
+def test_immutable_namespace_never_expires(manager, clock):
+    cache = manager.namespace("tokens")
+    cache.set("a", 1)
+    clock.now = 10 ** 9
+    manager.advance_epoch()
+
+    assert cache.immutable
+    assert cache.get("a") == 1
+
+
+def test_ttl_expiry(manager, clock):
+    cache = manager.namespace("prices", ttl=5)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_per_epoch_expiry(manager):
+    cache = manager.namespace("pools", per_epoch=True)
+    cache.set("a", 1)
+    assert "a" in cache
+
+    manager.advance_epoch(100)
+    assert "a" not in cache
+    cache.set("a", 2)
+    assert cache.get("a") == 2
+
+
+def test_lru_eviction_by_entries(manager):
+    cache = manager.namespace("lru", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_lru_eviction_by_bytes(manager):
+    cache = manager.namespace("bytes", max_bytes=100, sizeof=lambda value: 40)
+    for key in range(5):
+        cache.set(key, key)
+
+    assert len(cache) == 2
+    assert cache.size_bytes == 80
+    assert list(key for key, _ in cache.items()) == [3, 4]
+
+
+def test_namespace_is_shared(manager):
+    assert manager.namespace("a", ttl=1) is manager.namespace("a")
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_single_flight(manager):
+    cache = manager.namespace("tokens")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(10)))
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert await cache.get_or_load("key", loader) == "value"
+
+    stats = manager.stats()["tokens"]
+    assert stats["loads"] == 1
+    assert stats["coalesced"] == 9
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_errors_are_not_cached(manager):
+    cache = manager.namespace("tokens")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("rpc error")
+
+    results = await asyncio.gather(*(cache.get_or_load("key", failing) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key" not in cache
+
+    async def succeeding():
+        return 1
+
+    assert await cache.get_or_load("key", succeeding) == 1
+
+
+def test_list_cache_rebuilds_only_when_the_list_changes():
+    built = []
+    cache = ListCache(lambda items: built.append(list(items)) or len(built), max_entries=2)
+    items = ["a", "b"]
+
+    assert cache.get(items) == cache.get(items) == 1
+    assert cache.get(list(items)) == 2  # Equal contents, different list
+    items.append("c")
+    assert cache.get(items) == 3
+    assert built[-1] == ["a", "b", "c"]
+
+    cache.get(["d"])
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_cancelled_loader_hands_load_to_waiters(manager):
+    cache = manager.namespace("prices")
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return len(calls)
+
+    leader = asyncio.ensure_future(cache.get_or_load("key", load))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(cache.get_or_load("key", load)) for _ in range(3)]
+    await asyncio.sleep(0.005)
+    leader.cancel()
+
+    # Followers are not cancelled; one of them reloads and the rest share it
+    assert await asyncio.gather(*followers) == [2, 2, 2]
+    assert leader.cancelled()
+    assert len(calls) == 2
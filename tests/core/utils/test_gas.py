@@ -0,0 +1,132 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_gas.py
+"""
+
+"""Tests for the gas price oracle."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from goat_sdk.core.utils.cache import CacheManager
+from goat_sdk.core.utils.gas import FeeEstimate, GasOracle, gas_estimate_key
+
+GWEI = 10 ** 9
+
+
+def make_web3(fee_history=None):
+    web3 = MagicMock()
+    if fee_history is None:
+        fee_history = {
+            "baseFeePerGas": [8 * GWEI, 9 * GWEI, 10 * GWEI],
+            "reward": [[1 * GWEI, 2 * GWEI, 5 * GWEI], [1 * GWEI, 4 * GWEI, 7 * GWEI]]
+        }
+    web3.eth.fee_history = AsyncMock(return_value=fee_history)
+    web3.eth.estimate_gas = AsyncMock(return_value=50_000)
+    web3.eth.gas_price = 20 * GWEI
+    return web3
+
+
+@pytest.mark.asyncio
+async def test_fees_from_fee_history_percentiles():
+    oracle = GasOracle(make_web3())
+
+    standard = await oracle.fees()
+    assert standard.base_fee_per_gas == 10 * GWEI
+    assert standard.max_priority_fee_per_gas == 3 * GWEI
+    assert standard.max_fee_per_gas == 23 * GWEI
+    assert standard.tx_params() == {"maxFeePerGas": 23 * GWEI, "maxPriorityFeePerGas": 3 * GWEI}
+
+    fast = await oracle.fees("fast")
+    assert fast.max_priority_fee_per_gas == 6 * GWEI
+
+    with pytest.raises(ValueError):
+        await oracle.fees("instant")
+
+
+@pytest.mark.asyncio
+async def test_fee_history_fetched_once_per_block():
+    web3 = make_web3()
+    cache = CacheManager()
+    oracle = GasOracle(web3, cache)
+
+    await oracle.fees()
+    await oracle.fees("fast")
+    assert web3.eth.fee_history.await_count == 1
+
+    cache.advance_epoch(1)
+    await oracle.fees()
+    assert web3.eth.fee_history.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_legacy_chain_uses_gas_price():
+    web3 = make_web3()
+    web3.eth.fee_history = AsyncMock(side_effect=ValueError("method not found"))
+    oracle = GasOracle(web3)
+
+    fees = await oracle.fees()
+    assert not fees.eip1559
+    assert fees.gas_price == 20 * GWEI
+    assert fees.tx_params() == {"gasPrice": 20 * GWEI}
+
+
+def test_gas_price_capped_by_max_fee():
+    fees = FeeEstimate(max_fee_per_gas=12, max_priority_fee_per_gas=5, base_fee_per_gas=10)
+    assert fees.gas_price == 12
+
+
+@pytest.mark.asyncio
+async def test_estimate_gas_cached_per_exact_call():
+    web3 = make_web3()
+    oracle = GasOracle(web3)
+    to = "0x" + "1" * 40
+    transfer = {"from": "0x" + "3" * 40, "to": to, "data": "0xa9059cbb" + "00" * 64, "value": 0}
+
+    assert await oracle.estimate_gas(transfer) == 60_000
+    assert await oracle.estimate_gas(dict(transfer)) == 60_000
+    assert web3.eth.estimate_gas.await_count == 1
+
+    # Another recipient or amount may touch different storage, another sender different state
+    web3.eth.estimate_gas.return_value = 52_000
+    assert await oracle.estimate_gas(dict(transfer, data="0xa9059cbb" + "11" * 64)) == 62_400
+    await oracle.estimate_gas(dict(transfer, **{"from": "0x" + "4" * 40}))
+    await oracle.estimate_gas(dict(transfer, to="0x" + "2" * 40))
+    await oracle.estimate_gas(dict(transfer, value=1))
+    assert web3.eth.estimate_gas.await_count == 5
+
+    await oracle.estimate_gas(transfer, use_cache=False)
+    assert web3.eth.estimate_gas.await_count == 6
+
+
+def test_gas_estimate_key_ignores_address_case():
+    lower = {"from": "0x" + "b" * 40, "to": "0x" + "a" * 40, "data": "0x12345678"}
+    upper = {"from": "0x" + "B" * 40, "to": "0x" + "A" * 40, "data": "0x12345678"}
+    assert gas_estimate_key(lower) == gas_estimate_key(upper)
@@ -0,0 +1,209 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_multicall.py
+"""
+
+"""Tests for the Multicall3 batching layer."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from web3 import Web3
+
+from goat_sdk.core.exceptions import MulticallError
+from goat_sdk.core.utils.multicall import MULTICALL3_ADDRESS, Multicall, call_many, get_multicall_address
+
+TOKEN_ADDRESS = "0x" + "1" * 40
+HOLDER_ADDRESS = "0x" + "2" * 40
+
+TOKEN_ABI = [
+    {"inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"name": "account", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "token0", "outputs": [{"name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
+]
+
+
+class FakeAggregate3:
+    """Stands in for the Multicall3 contract, recording every batch it receives."""
+
+    def __init__(self, w3, responses):
+        self.w3 = w3
+        self.responses = responses
+        self.batches = []
+        self.functions = self
+
+    def aggregate3(self, calls):
+        self.batches.append(calls)
+        aggregate = MagicMock()
+
+        def call():
+            results = []
+            for target, allow_failure, calldata in calls:
+                assert allow_failure is True
+                response = self.responses[bytes(calldata)[:4]]
+                if response is None:
+                    results.append((False, b""))
+                else:
+                    results.append((True, self.w3.codec.encode(*response)))
+            return results
+
+        aggregate.call = call
+        return aggregate
+
+
+@pytest.fixture
+def w3():
+    return Web3()
+
+
+@pytest.fixture
+def token(w3):
+    return w3.eth.contract(address=Web3.to_checksum_address(TOKEN_ADDRESS), abi=TOKEN_ABI)
+
+
+def _selector(function) -> bytes:
+    return bytes.fromhex(function._encode_transaction_data()[2:10])
+
+
+@pytest.fixture
+def multicall(w3, token):
+    multicall = Multicall(w3, batch_window=0.01)
+    multicall._contract = FakeAggregate3(w3, {
+        _selector(token.functions.name()): (["string"], ["Test Token"]),
+        _selector(token.functions.decimals()): (["uint8"], [18]),
+        _selector(token.functions.balanceOf(HOLDER_ADDRESS)): (["uint256"], [500000]),
+        _selector(token.functions.token0()): (["address"], [TOKEN_ADDRESS]),
+    })
+    return multicall
+
+
+def test_get_multicall_address():
+    assert get_multicall_address(1) == MULTICALL3_ADDRESS
+    assert get_multicall_address(123456789) is None
+
+
+def test_for_chain(w3):
+    assert Multicall.for_chain(w3, 123456789) is None
+    assert Multicall.for_chain(w3, 1).address == MULTICALL3_ADDRESS
+    override = "0x" + "a" * 40
+    assert Multicall.for_chain(w3, 123456789, override).address == Web3.to_checksum_address(override)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch(multicall, token):
+    name, decimals, balance, token0 = await asyncio.gather(
+        multicall.call(token.functions.name()),
+        multicall.call(token.functions.decimals()),
+        multicall.call(token.functions.balanceOf(HOLDER_ADDRESS)),
+        multicall.call(token.functions.token0()),
+    )
+
+    assert name == "Test Token"
+    assert decimals == 18
+    assert balance == 500000
+    assert token0 == Web3.to_checksum_address(TOKEN_ADDRESS)
+    assert len(multicall._contract.batches) == 1
+    assert len(multicall._contract.batches[0]) == 4
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_are_deduplicated(multicall, token):
+    results = await asyncio.gather(*(multicall.call(token.functions.decimals()) for _ in range(5)))
+
+    assert results == [18] * 5
+    assert len(multicall._contract.batches[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_early(multicall, token):
+    multicall.max_batch_size = 2
+    await asyncio.gather(
+        multicall.call(token.functions.name()),
+        multicall.call(token.functions.decimals()),
+        multicall.call(token.functions.token0()),
+    )
+
+    assert [len(batch) for batch in multicall._contract.batches] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_reverted_call_raises(multicall, token):
+    multicall._contract.responses[_selector(token.functions.name())] = None
+
+    name, decimals = await asyncio.gather(
+        multicall.call(token.functions.name()),
+        multicall.call(token.functions.decimals()),
+        return_exceptions=True
+    )
+
+    assert isinstance(name, MulticallError)
+    assert decimals == 18
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_direct_calls_when_aggregate_fails(w3, token):
+    multicall = Multicall(w3, batch_window=0.01)
+    multicall._contract = MagicMock()
+    multicall._contract.functions.aggregate3.return_value.call.side_effect = ValueError("execution reverted")
+
+    function = token.functions.decimals()
+    direct = MagicMock(wraps=function)
+    direct.address = function.address
+    direct.abi = function.abi
+    direct._encode_transaction_data = function._encode_transaction_data
+    direct.call = lambda: 6
+
+    assert await multicall.call(direct) == 6
+
+
+@pytest.mark.asyncio
+async def test_aggregate_splits_raw_calls_into_chunks(multicall, token):
+    calldata = bytes.fromhex(token.functions.decimals()._encode_transaction_data()[2:])
+    results = await multicall.aggregate([(token.address, calldata)] * 5, chunk_size=2)
+
+    assert [len(batch) for batch in multicall._contract.batches] == [2, 2, 1]
+    assert results == [(True, multicall.web3.codec.encode(["uint8"], [18]))] * 5
+
+
+@pytest.mark.asyncio
+async def test_call_many_without_multicall_uses_eth_call():
+    web3 = MagicMock()
+
+    def eth_call(transaction, block_identifier):
+        if transaction["to"] == TOKEN_ADDRESS:
+            raise ValueError("execution reverted")
+        return b"\x01" * 32
+
+    web3.eth.call = eth_call
+    results = await call_many(web3, [(TOKEN_ADDRESS, b"\x00"), (HOLDER_ADDRESS, b"\x00")], block_identifier=123)
+
+    assert results == [(False, b""), (True, b"\x01" * 32)]
+
@@ -0,0 +1,107 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_rate_limit.py
+"""
+
+"""Tests for the GCRA rate limiter and shared rate limit buckets."""
+
+import asyncio
+import time
+
+import pytest
+
+from goat_sdk.core.utils.rate_limit import RateLimiter, get_rate_limiter, rate_limit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_burst_then_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=3, clock=clock)
+    assert [await limiter.acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert await limiter.acquire()
+    assert not await limiter.acquire()
+    clock.now += 10
+    assert limiter.tokens == 3
+
+
+def test_reserve_weights_and_refund():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=10, clock=clock)
+    assert limiter.reserve(10) == 0
+    assert limiter.reserve(5) == pytest.approx(0.5)
+    assert limiter.reserve(1) == pytest.approx(0.6)
+    limiter.refund(1)
+    assert limiter.reserve(2) == pytest.approx(0.7)
+
+
+@pytest.mark.asyncio
+async def test_waiters_sleep_concurrently():
+    limiter = RateLimiter(rate=20, burst=1)
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.wait() for _ in range(5)))
+    # Four waiters at 50 ms intervals: about 0.2 s in total, not one sleep after another
+    assert 0.15 <= time.monotonic() - started < 0.4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_tokens():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, burst=1, clock=clock)
+    limiter.reserve()
+    task = asyncio.ensure_future(limiter.wait())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_decorator_shares_named_buckets():
+    calls = []
+
+    @rate_limit(rate=1000, burst=2, key_func=lambda user: user, name="test.shared", weight=lambda user: 2)
+    async def call(user):
+        calls.append(user)
+
+    await call("alice")
+    await call("bob")
+    assert calls == ["alice", "bob"]
+    # The decorator reserved alice's whole burst in the shared bucket
+    assert not await get_rate_limiter("test.shared", 1000, 2, key="alice").acquire()
+    assert get_rate_limiter("test.shared", 1, 1, key="bob") is get_rate_limiter("test.shared", 5, 5, key="bob")
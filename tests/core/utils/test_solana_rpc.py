@@ -0,0 +1,111 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_solana_rpc.py
+"""
+
+"""Tests for pooled Solana RPC clients."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from solana.exceptions import SolanaRpcException
+from solana.rpc.core import RPCException
+
+from goat_sdk.core.utils.solana_rpc import FailoverConnection, SolanaConnectionManager
+
+PRIMARY = "https://primary.example"
+BACKUP = "https://backup.example"
+
+
+@pytest.mark.asyncio
+async def test_one_pooled_client_per_endpoint():
+    manager = SolanaConnectionManager(max_concurrent_requests=4)
+    client = manager.get_connection(PRIMARY)
+
+    assert manager.get_connection(PRIMARY) is client
+    assert manager.get_connection(BACKUP) is not client
+    assert client._provider.endpoint_uri == PRIMARY
+    pool = client._provider.session._transport._pool
+    assert pool._max_connections == 4
+    assert pool._keepalive_expiry == manager.keepalive_expiry
+
+    await manager.close()
+    assert client._provider.session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_release_closes_client_when_unreferenced():
+    manager = SolanaConnectionManager()
+    client = manager.acquire(PRIMARY)
+    assert manager.acquire(PRIMARY) is client
+
+    await manager.release(PRIMARY)
+    assert not client._provider.session.is_closed
+    await manager.release(PRIMARY)
+    assert client._provider.session.is_closed
+    assert manager.get_connection(PRIMARY) is not client
+    await manager.close()
+
+
+def make_failover():
+    manager = SolanaConnectionManager(failover_cooldown=60)
+    primary, backup = MagicMock(), MagicMock()
+    manager._clients = {PRIMARY: primary, BACKUP: backup}
+    connection = manager.get_connection([PRIMARY, BACKUP])
+    assert isinstance(connection, FailoverConnection)
+    return connection, primary, backup
+
+
+@pytest.mark.asyncio
+async def test_failover_to_next_endpoint():
+    connection, primary, backup = make_failover()
+
+    async def unreachable(*args, **kwargs):
+        raise SolanaRpcException(httpx.ConnectError("refused"), unreachable, None, MagicMock())
+
+    primary.get_balance = unreachable
+    backup.get_balance = AsyncMock(return_value="balance")
+
+    assert await connection.get_balance("address") == "balance"
+    assert await connection.get_balance("address") == "balance"
+    # The failed endpoint is skipped during its cooldown
+    assert backup.get_balance.await_count == 2
+    assert connection._ordered() == [BACKUP, PRIMARY]
+
+
+@pytest.mark.asyncio
+async def test_rpc_errors_do_not_fail_over():
+    connection, primary, backup = make_failover()
+    primary.send_raw_transaction = AsyncMock(side_effect=RPCException("simulation failed"))
+    backup.send_raw_transaction = AsyncMock()
+
+    with pytest.raises(RPCException):
+        await connection.send_raw_transaction(b"transaction")
+    backup.send_raw_transaction.assert_not_awaited()
@@ -0,0 +1,193 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/core/utils/test_transactions.py
+"""
+
+"""Tests for the nonce manager, receipt poller and transaction pipeline."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_account import Account
+from eth_utils import keccak
+from web3.exceptions import TransactionNotFound
+
+from goat_sdk.core.exceptions import TimeoutError as GoatTimeoutError
+from goat_sdk.core.exceptions import TransactionError
+from goat_sdk.core.utils.transactions import NonceManager, ReceiptPoller, TransactionPipeline
+
+
+def make_web3(pending_count=5):
+    web3 = MagicMock()
+    web3.eth.get_transaction_count = AsyncMock(return_value=pending_count)
+    web3.eth.account.sign_transaction = lambda tx, key: SimpleNamespace(
+        raw_transaction=tx["nonce"], hash=f"0x{tx['nonce']:064x}"
+    )
+    return web3
+
+
+async def test_nonce_manager_reserves_locally_and_fills_gaps():
+    """Nonces come from one chain read; released nonces are reused first."""
+    web3 = make_web3(pending_count=5)
+    manager = NonceManager(web3, "0x" + "1" * 40)
+
+    assert await asyncio.gather(*(manager.reserve() for _ in range(3))) == [5, 6, 7]
+    web3.eth.get_transaction_count.assert_awaited_once()
+
+    manager.release(6)
+    assert await manager.reserve() == 6
+    assert await manager.reserve() == 8
+
+    web3.eth.get_transaction_count.return_value = 20
+    assert await manager.resync() == 20
+    assert await manager.reserve() == 20
+
+
+async def test_resync_keeps_outstanding_nonces():
+    """A resync while a reserved nonce is unsent never hands that nonce out again."""
+    web3 = make_web3(pending_count=5)
+    manager = NonceManager(web3, "0x" + "1" * 40)
+    assert [await manager.reserve() for _ in range(3)] == [5, 6, 7]
+    manager.mark_broadcast(5)
+    manager.release(6)
+
+    # Only 7 is still in flight; the node has seen 5 but not yet 6
+    web3.eth.get_transaction_count.return_value = 6
+    assert await manager.resync() == 8
+    assert await manager.reserve() == 6
+    assert await manager.reserve() == 8
+
+    manager.mark_broadcast(7)
+    web3.eth.get_transaction_count.return_value = 9
+    for nonce in (6, 8):
+        manager.mark_broadcast(nonce)
+    assert await manager.resync() == 9
+    assert await manager.reserve() == 9
+
+
+async def test_receipt_poller_shares_one_task():
+    """Many waiters are served by one polling loop, which keeps polling until mined."""
+    web3 = MagicMock()
+    mined = set()
+
+    async def get_transaction_receipt(tx_hash):
+        if tx_hash not in mined:
+            raise TransactionNotFound(tx_hash)
+        return {"transactionHash": tx_hash, "status": 1}
+
+    web3.eth.get_transaction_receipt = get_transaction_receipt
+    poller = ReceiptPoller(web3, poll_interval=0.01)
+    hashes = [f"0x{i:064x}" for i in range(5)]
+
+    waiters = [asyncio.ensure_future(poller.wait(tx_hash, timeout=1)) for tx_hash in hashes]
+    await asyncio.sleep(0.03)
+    assert poller.pending == 5
+    task = poller._task
+
+    mined.update(hashes)
+    receipts = await asyncio.gather(*waiters)
+    assert [receipt["transactionHash"] for receipt in receipts] == hashes
+    assert poller._task is task
+    assert poller.pending == 0
+
+
+async def test_receipt_poller_timeout_stops_tracking():
+    """A timed-out hash raises and is no longer polled."""
+    web3 = MagicMock()
+    web3.eth.get_transaction_receipt = AsyncMock(side_effect=TransactionNotFound("missing"))
+    poller = ReceiptPoller(web3, poll_interval=0.01)
+
+    with pytest.raises(GoatTimeoutError):
+        await poller.wait("0x" + "ab" * 32, timeout=0.05)
+    assert poller.pending == 0
+
+
+async def test_pipeline_resyncs_on_nonce_too_low():
+    """A nonce rejected as too low triggers a resync and a resend."""
+    web3 = make_web3(pending_count=1)
+    sent = []
+
+    async def send_raw_transaction(raw):
+        if raw < 4:
+            raise ValueError({"code": -32000, "message": "nonce too low"})
+        sent.append(raw)
+        return f"0x{raw:064x}"
+
+    web3.eth.send_raw_transaction = send_raw_transaction
+    web3.eth.get_transaction_receipt = AsyncMock(return_value={"status": 1})
+    manager = NonceManager(web3, "0x" + "1" * 40)
+    pipeline = TransactionPipeline(web3, SimpleNamespace(key=b"k"), manager,
+                                   receipt_poller=ReceiptPoller(web3, poll_interval=0.01))
+
+    web3.eth.get_transaction_count.side_effect = [1, 4]
+    pending = await pipeline.submit({"to": "0x" + "2" * 40})
+    assert pending.nonce == 4
+    assert sent == [4]
+    assert await pending.wait() == {"status": 1}
+
+
+async def test_pipeline_sends_transaction_signed_by_real_account():
+    """The raw transaction is read from whichever name eth-account uses."""
+    account = Account.create()
+    web3 = make_web3(pending_count=0)
+    web3.eth.account = Account
+    sent = []
+
+    async def send_raw_transaction(raw):
+        sent.append(raw)
+        return keccak(raw)
+
+    web3.eth.send_raw_transaction = send_raw_transaction
+    web3.eth.get_transaction_receipt = AsyncMock(return_value={"status": 1})
+    manager = NonceManager(web3, account.address)
+    pipeline = TransactionPipeline(web3, account, manager)
+
+    pending = await pipeline.submit({
+        "to": "0x" + "2" * 40, "value": 1, "gas": 21000, "gasPrice": 10**9, "chainId": 1
+    })
+    assert pending.nonce == 0
+    assert len(sent) == 1 and isinstance(sent[0], bytes)
+    assert pending.tx_hash == keccak(sent[0])
+    assert await pending.wait() == {"status": 1}
+
+
+async def test_pipeline_releases_nonce_on_send_failure():
+    """A transaction that is never broadcast gives its nonce back."""
+    web3 = make_web3(pending_count=3)
+    web3.eth.send_raw_transaction = AsyncMock(side_effect=ValueError("insufficient funds"))
+    manager = NonceManager(web3, "0x" + "1" * 40)
+    pipeline = TransactionPipeline(web3, SimpleNamespace(key=b"k"), manager, max_in_flight=1)
+
+    with pytest.raises(TransactionError):
+        await pipeline.submit({"to": "0x" + "2" * 40})
+    assert await manager.reserve() == 3
+    # The in-flight slot was released as well
+    assert pipeline._slots.locked() is False
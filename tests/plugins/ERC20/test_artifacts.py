@@ -0,0 +1,94 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/ERC20/test_artifacts.py
+"""
+
+"""Tests for the precompiled ERC20 contract artifacts."""
+
+import json
+import sys
+
+import pytest
+
+from goat_sdk.plugins.ERC20.artifacts import (
+    ArtifactIntegrityError,
+    get_bytecode,
+    load_artifact,
+    read_artifact,
+    write_artifact,
+)
+from goat_sdk.plugins.ERC20.compile_contract import compile_contract, source_hash
+
+
+def test_packaged_artifact_matches_manifest_and_sources():
+    """The shipped artifact passes its hash check and tracks the contract sources."""
+    artifact = load_artifact()
+    assert artifact.contract_name == "TestToken"
+    assert artifact.source_hash == source_hash()
+
+    constructor = next(entry for entry in artifact.abi if entry["type"] == "constructor")
+    assert [param["type"] for param in constructor["inputs"]] == ["string", "string", "uint256"]
+    names = {entry.get("name") for entry in artifact.abi}
+    assert {"name", "symbol", "decimals", "totalSupply", "balanceOf", "transfer", "approve"} <= names
+
+
+def test_packaged_artifact_has_bytecode():
+    """The shipped artifact is deployable without solc."""
+    bytecode = load_artifact().bytecode
+    assert bytecode, "TestToken artifact has no bytecode; run `python -m goat_sdk.plugins.ERC20.compile_contract`"
+    int(bytecode[2:] if bytecode.startswith("0x") else bytecode, 16)
+
+
+def test_tampered_artifact_is_rejected(tmp_path):
+    """Editing an artifact without updating the manifest fails the hash check."""
+    path = write_artifact("Token", [], "0x6080", "abc", "0.8.20", artifacts_dir=tmp_path)
+    assert read_artifact("Token", artifacts_dir=tmp_path).bytecode == "0x6080"
+
+    data = json.loads(path.read_text())
+    data["bytecode"] = "0xdeadbeef"
+    path.write_text(json.dumps(data))
+    with pytest.raises(ArtifactIntegrityError):
+        read_artifact("Token", artifacts_dir=tmp_path)
+
+
+def test_bytecode_requires_opt_in_compile():
+    """Without packaged bytecode, compilation only happens when allowed."""
+    if load_artifact().bytecode:
+        pytest.skip("Artifact ships with bytecode")
+    with pytest.raises(ValueError, match="allow_compile"):
+        get_bytecode(allow_compile=False)
+
+
+def test_compile_served_from_source_hash_cache(tmp_path, monkeypatch):
+    """A cached compile for the current sources is returned without invoking solc."""
+    cached = {"abi": [{"type": "constructor", "inputs": []}], "bytecode": "0x6080", "source_hash": source_hash()}
+    (tmp_path / f"TestToken-{source_hash()}.json").write_text(json.dumps(cached))
+
+    monkeypatch.setitem(sys.modules, "solcx", None)  # Any solc import would fail
+    assert compile_contract(cache_dir=tmp_path) == (cached["abi"], "0x6080")
@@ -0,0 +1,96 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/ERC20/test_balances.py
+"""
+
+"""Tests for the batch ERC20 balance and allowance scanner."""
+
+from unittest.mock import MagicMock
+
+from web3 import Web3
+
+from goat_sdk.core.utils.abi_registry import ContractAbi
+from goat_sdk.plugins.ERC20.artifacts import load_artifact
+from goat_sdk.plugins.ERC20.balances import scan_token_matrix
+
+TOKENS = [Web3.to_checksum_address("0x" + f"{i:040x}") for i in (1, 2, 3)]
+OWNERS = [Web3.to_checksum_address("0x" + f"{i:040x}") for i in (10, 11)]
+SPENDER = Web3.to_checksum_address("0x" + "f" * 40)
+ERC20_ABI = ContractAbi("erc20.test", load_artifact().abi)
+
+
+def make_web3(balances, failing_token=None):
+    """Fake web3 answering eth_call from a {(token, owner): balance} table."""
+    web3 = MagicMock()
+
+    def eth_call(transaction, block_identifier):
+        if transaction["to"] == failing_token:
+            raise ValueError("execution reverted")
+        owner = Web3.to_checksum_address(bytes(transaction["data"])[16:36])
+        return balances[(transaction["to"], owner)].to_bytes(32, "big")
+
+    web3.eth.call = eth_call
+    return web3
+
+
+async def test_scan_builds_dense_matrix():
+    """Every token x owner pair lands in its cell; failed calls are masked."""
+    balances = {(token, owner): (i + 1) * 10 ** 30 + j for i, token in enumerate(TOKENS) for j, owner in enumerate(OWNERS)}
+    web3 = make_web3(balances, failing_token=TOKENS[1])
+
+    matrix = await scan_token_matrix(
+        web3, ERC20_ABI.function("balanceOf"), TOKENS, [owner.lower() for owner in OWNERS], lambda owner: (owner,)
+    )
+
+    assert matrix.values.shape == (3, 2)
+    assert matrix.ok.tolist() == [[True, True], [False, False], [True, True]]
+    assert matrix.get(TOKENS[2], OWNERS[1]) == 3 * 10 ** 30 + 1  # Exceeds int64
+    assert matrix.get(TOKENS[1], OWNERS[0]) is None
+
+    columns = matrix.to_columns()
+    assert columns["token"][:2] == [TOKENS[0], TOKENS[0]]
+    assert columns["account"][:2] == OWNERS
+    assert columns["value"][0] == 10 ** 30
+
+
+async def test_scan_allowances_encodes_spender():
+    """Allowance calls carry both the owner and the spender."""
+    seen = []
+    web3 = MagicMock()
+
+    def eth_call(transaction, block_identifier):
+        seen.append(bytes(transaction["data"]))
+        return (7).to_bytes(32, "big")
+
+    web3.eth.call = eth_call
+    function = ERC20_ABI.function("allowance")
+    matrix = await scan_token_matrix(web3, function, TOKENS[:1], OWNERS, lambda owner: (owner, SPENDER))
+
+    assert matrix.values.tolist() == [[7, 7]]
+    assert seen[0] == function.encode_input(OWNERS[0], SPENDER)
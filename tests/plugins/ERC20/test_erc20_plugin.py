@@ -33,8 +33,11 @@
 Tests for the ERC20 plugin implementation.
 """
 
+import asyncio
 import pytest
 import logging
+import threading
+import time
 from decimal import Decimal
 from unittest.mock import patch, AsyncMock, MagicMock, PropertyMock
 from web3 import Web3
@@ -80,6 +83,11 @@ class TestERC20Plugin(BaseGoatTest):
         eth_mock.chain_id = 919  # Mode Testnet chain ID
         eth_mock.get_transaction_count = AsyncMock(return_value=1)
         eth_mock.gas_price = 20_000_000_000  # 20 gwei
+        eth_mock.fee_history = AsyncMock(return_value={
+            'baseFeePerGas': [10_000_000_000] * 11,
+            'reward': [[1_000_000_000, 2_000_000_000, 3_000_000_000]] * 10
+        })
+        eth_mock.estimate_gas = AsyncMock(return_value=50_000)
         logger.debug(f"Mocked eth module with chain_id: {eth_mock.chain_id}, gas_price: {eth_mock.gas_price}")
         
         # Mock contract creation
@@ -116,27 +124,21 @@ class TestERC20Plugin(BaseGoatTest):
             
             # Mock transfer function
             transfer_func = MagicMock()
-            transfer_func.build_transaction = lambda tx_params: {
-                'from': tx_params['from'],
-                'nonce': tx_params['nonce'],
-                'gasPrice': tx_params['gasPrice'],
-                'gas': 100000,
-                'to': address,
-                'data': '0x',
-                'value': 0
-            }
+            transfer_func.build_transaction = lambda tx_params: dict(
+                tx_params,
+                to=address,
+                data='0xa9059cbb' + '00' * 64,
+                value=0
+            )
             
             # Mock approve function
             approve_func = MagicMock()
-            approve_func.build_transaction = lambda tx_params: {
-                'from': tx_params['from'],
-                'nonce': tx_params['nonce'],
-                'gasPrice': tx_params['gasPrice'],
-                'gas': 100000,
-                'to': address,
-                'data': '0x',
-                'value': 0
-            }
+            approve_func.build_transaction = lambda tx_params: dict(
+                tx_params,
+                to=address,
+                data='0x095ea7b3' + '00' * 64,
+                value=0
+            )
             
             # Set up functions
             functions = MagicMock()
@@ -172,6 +174,7 @@ class TestERC20Plugin(BaseGoatTest):
             logger.debug(f"Returning receipt: {receipt_mock}")
             return receipt_mock
         eth_mock.wait_for_transaction_receipt = mock_wait_for_transaction_receipt
+        eth_mock.get_transaction_receipt = AsyncMock(return_value=receipt_mock)
         
         # Mock account signing
         def mock_sign_transaction(tx, private_key):
@@ -181,7 +184,7 @@ class TestERC20Plugin(BaseGoatTest):
             return result
         
         account_mock = MagicMock()
-        account_mock.sign_transaction = mock_sign_transaction
+        account_mock.sign_transaction = MagicMock(side_effect=mock_sign_transaction)
         eth_mock.account = account_mock
         
         # Set up eth module
@@ -205,12 +208,11 @@ class TestERC20Plugin(BaseGoatTest):
         )
         logger.debug(f"Created ERC20PluginCtorParams with network: {params.network}")
         
-        # Patch both Web3 and Account to avoid actual blockchain interactions
-        with patch("goat_sdk.plugins.ERC20.erc20_plugin.Web3") as web3_class_mock, \
+        # Patch both AsyncWeb3 and Account to avoid actual blockchain interactions
+        with patch("goat_sdk.plugins.ERC20.erc20_plugin.AsyncWeb3") as web3_class_mock, \
              patch("goat_sdk.plugins.ERC20.erc20_plugin.Account") as account_mock:
             # Setup Web3 mock
             web3_class_mock.return_value = web3_mock
-            web3_class_mock.HTTPProvider = MagicMock()
             
             # Setup Account mock
             account_mock.from_key.return_value.address = self.TEST_WALLET_ADDRESS
@@ -220,6 +222,23 @@ class TestERC20Plugin(BaseGoatTest):
             logger.info("ERC20Plugin instance created successfully")
             return plugin
 
+    @pytest.mark.asyncio
+    async def test_deploy_bytecode_compiled_off_event_loop(self, erc20_plugin):
+        """Compiling is opt-in and never runs on the event loop thread."""
+        assert erc20_plugin.allow_compile is False
+        erc20_plugin.allow_compile = True
+        threads = []
+
+        def fake_get_bytecode(allow_compile):
+            threads.append(threading.get_ident())
+            return "0x6080"
+
+        artifact = MagicMock(bytecode=None)
+        with patch("goat_sdk.plugins.ERC20.erc20_plugin.load_artifact", return_value=artifact), \
+             patch("goat_sdk.plugins.ERC20.erc20_plugin.get_bytecode", side_effect=fake_get_bytecode):
+            assert await erc20_plugin._get_bytecode() == "0x6080"
+        assert threads and threads[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_get_token_info(self, erc20_plugin):
         """Test token info fetching."""
@@ -244,6 +263,33 @@ class TestERC20Plugin(BaseGoatTest):
         assert token_info.balance == 500000
         logger.info("test_get_token_info completed successfully")
 
+    @pytest.mark.asyncio
+    async def test_get_token_info_reads_concurrently(self, erc20_plugin):
+        """Token metadata reads on an async contract run concurrently."""
+        await erc20_plugin._ensure_initialized()
+        erc20_plugin.multicall = None
+
+        def async_function(value):
+            async def call():
+                await asyncio.sleep(0.1)
+                return value
+            return MagicMock(call=call)
+
+        contract = MagicMock()
+        contract.functions.name.return_value = async_function("Test Token")
+        contract.functions.symbol.return_value = async_function("TEST")
+        contract.functions.decimals.return_value = async_function(18)
+        contract.functions.totalSupply.return_value = async_function(1000000)
+        erc20_plugin._get_contract = lambda address: contract
+
+        start = time.perf_counter()
+        token_info = await erc20_plugin.get_token_info(GetTokenInfoParams(token_address=self.TEST_TOKEN_ADDRESS))
+        elapsed = time.perf_counter() - start
+
+        assert (token_info.name, token_info.symbol, token_info.decimals) == ("Test Token", "TEST", 18)
+        assert token_info.total_supply == 1000000
+        assert elapsed < 0.3  # Four 100ms reads, not run one after another
+
     @pytest.mark.asyncio
     async def test_get_balance(self, erc20_plugin):
         """Test balance fetching."""
@@ -282,6 +328,38 @@ class TestERC20Plugin(BaseGoatTest):
         assert tx_hash is not None
         logger.info("test_transfer completed successfully")
 
+    @pytest.mark.asyncio
+    async def test_submit_transfers(self, erc20_plugin):
+        """Transfers are submitted back-to-back with consecutive local nonces."""
+        transfers = [
+            TransferParams(token_address=self.TEST_TOKEN_ADDRESS, to_address=self.TEST_SPENDER_ADDRESS, amount=i + 1)
+            for i in range(3)
+        ]
+        pending = await erc20_plugin.submit_transfers(transfers)
+
+        nonces = sorted(tx.nonce for tx in pending)
+        assert nonces == list(range(nonces[0], nonces[0] + 3))
+        receipts = await asyncio.gather(*(tx.wait() for tx in pending))
+        assert all(receipt['status'] == 1 for receipt in receipts)
+
+    @pytest.mark.asyncio
+    async def test_submit_transfers_uses_oracle_fees(self, erc20_plugin):
+        """Transfers carry EIP-1559 fees and share one gas estimate per call shape."""
+        transfers = [
+            TransferParams(token_address=self.TEST_TOKEN_ADDRESS, to_address=self.TEST_SPENDER_ADDRESS, amount=i + 1)
+            for i in range(3)
+        ]
+        await erc20_plugin.submit_transfers(transfers)
+
+        signed = [call.args[0] for call in erc20_plugin.w3.eth.account.sign_transaction.call_args_list]
+        assert len(signed) == 3
+        for transaction in signed:
+            assert 'gasPrice' not in transaction
+            assert transaction['maxPriorityFeePerGas'] == 2_000_000_000
+            assert transaction['maxFeePerGas'] == 2 * 10_000_000_000 + 2_000_000_000
+            assert transaction['gas'] == 60_000
+        assert erc20_plugin.gas_oracle.web3.eth.estimate_gas.await_count <= 1
+
     @pytest.mark.asyncio
     async def test_approve(self, erc20_plugin):
         """Test token approval."""
@@ -0,0 +1,129 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/ERC20/test_tokens.py
+"""
+
+"""Tests for the indexed ERC20 token registry."""
+
+import json
+
+import pytest
+
+from goat_sdk.plugins.ERC20.tokens import (
+    MODE,
+    USDC,
+    Token,
+    TokenRegistry,
+    get_token_by_symbol,
+    get_tokens_for_network,
+)
+
+MODE_CHAIN_ID = 34443
+
+
+def token_list(count, chain_id=MODE_CHAIN_ID):
+    return {
+        "name": "Test List",
+        "tokens": [
+            {
+                "chainId": chain_id,
+                "address": f"0x{index + 1:040x}",
+                "symbol": f"TK{index}",
+                "name": f"Token {index}",
+                "decimals": 18
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def test_lookup_by_symbol_and_address():
+    registry = TokenRegistry([USDC, MODE])
+
+    token = registry.get_by_symbol("usdc", MODE_CHAIN_ID)
+    assert token.contract_address == USDC.chains[MODE_CHAIN_ID]["contract_address"]
+    assert token.decimals == 6
+    assert registry.get_by_address(token.contract_address.upper(), MODE_CHAIN_ID) is token
+    assert registry.get_by_symbol("MODE", 1) is None
+    assert {t.symbol for t in registry.tokens_for_network(MODE_CHAIN_ID)} == {"USDC", "MODE"}
+
+
+def test_module_functions_use_registry():
+    assert get_token_by_symbol("Mode", MODE_CHAIN_ID).symbol == "MODE"
+    assert [t.symbol for t in get_tokens_for_network(1)] == ["USDC"]
+
+    custom = Token(decimals=8, symbol="WBTC", name="Wrapped BTC", chains={1: {"contract_address": "0x" + "b" * 40}})
+    assert get_token_by_symbol("wbtc", 1, tokens=[custom]).decimals == 8
+    assert get_token_by_symbol("USDC", 1, tokens=[custom]) is None
+    assert get_token_by_symbol("wbtc", 1, tokens=TokenRegistry([custom])).decimals == 8
+
+
+def test_first_token_wins_duplicate_symbol():
+    first = Token(decimals=6, symbol="USDC", name="USD Coin", chains={1: {"contract_address": "0x" + "a" * 40}})
+    second = Token(decimals=18, symbol="usdc", name="Other USDC", chains={1: {"contract_address": "0x" + "c" * 40}})
+    assert get_token_by_symbol("USDC", 1, tokens=[first, second]).name == "USD Coin"
+    registry = TokenRegistry([first, second])
+    assert registry.get_by_symbol("usdc", 1).name == "USD Coin"
+    assert registry.get_by_address("0x" + "c" * 40, 1).name == "Other USDC"
+
+
+def test_token_list_parsed_on_first_lookup(tmp_path):
+    path = tmp_path / "tokens.json"
+    registry = TokenRegistry([MODE])
+    registry.load_token_list(path)  # Not read yet, so the file may not exist
+
+    path.write_text(json.dumps(token_list(5000)))
+    assert registry.get_by_symbol("tk4999", MODE_CHAIN_ID).contract_address == f"0x{5000:040x}"
+    assert registry.get_by_address(f"0x{1:040x}", MODE_CHAIN_ID).symbol == "TK0"
+    assert len(registry.tokens_for_network(MODE_CHAIN_ID)) == 5001
+
+
+def test_missing_token_list_raises_on_lookup(tmp_path):
+    registry = TokenRegistry()
+    registry.load_token_list(tmp_path / "missing.json")
+    with pytest.raises(FileNotFoundError):
+        registry.get_by_symbol("USDC", 1)
+
+
+def test_explicit_tokens_win_over_token_lists():
+    document = token_list(1)
+    document["tokens"].append({
+        "chainId": MODE_CHAIN_ID,
+        "address": "0x" + "f" * 40,
+        "symbol": "USDC",
+        "name": "Fake USDC",
+        "decimals": 18
+    })
+    document["tokens"].append({"chainId": MODE_CHAIN_ID, "symbol": "BROKEN"})
+    registry = TokenRegistry([USDC])
+    registry.load_token_list(document, lazy=False)
+
+    assert registry.get_by_symbol("USDC", MODE_CHAIN_ID).name == "USDC"
+    assert registry.get_by_address("0x" + "f" * 40, MODE_CHAIN_ID).name == "Fake USDC"
+    assert registry.get_by_symbol("BROKEN", MODE_CHAIN_ID) is None
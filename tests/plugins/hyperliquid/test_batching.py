@@ -0,0 +1,162 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/hyperliquid/test_batching.py
+"""
+
+"""Tests for batched Hyperliquid order actions."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from goat_sdk.plugins.hyperliquid.service import HyperliquidService
+from goat_sdk.plugins.hyperliquid.types.order import OrderRequest, OrderSide, OrderStatus, OrderType
+
+META = {"universe": [{"name": "BTC", "szDecimals": 5, "maxLeverage": 50}, {"name": "ETH", "szDecimals": 4, "maxLeverage": 50}]}
+
+
+def order(coin="ETH", price="3000", client_id=None):
+    return OrderRequest(
+        coin=coin, side=OrderSide.BUY, type=OrderType.LIMIT,
+        size=Decimal("0.1"), price=Decimal(price), client_id=client_id
+    )
+
+
+def _service(actions, statuses=None, **kwargs):
+    service = HyperliquidService(testnet=True, **kwargs)
+
+    async def request(method, endpoint, *, json=None, **_):
+        if endpoint == "info":
+            return META
+        actions.append(json)
+        action = json["action"]
+        if statuses is not None:
+            result = statuses
+        elif action["type"] == "cancel":
+            result = ["success"] * len(action["cancels"])
+        else:
+            items = action.get("orders") or action.get("modifies")
+            result = [{"resting": {"oid": 100 + i}} for i in range(len(items))]
+        return {"status": "ok", "response": {"type": action["type"], "data": {"statuses": result}}}
+
+    service._request = request
+    return service
+
+
+@pytest.mark.asyncio
+async def test_create_orders_maps_each_status():
+    actions = []
+    statuses = [{"resting": {"oid": 1}}, {"filled": {"oid": 2, "totalSz": "0.1", "avgPx": "2999"}},
+                {"error": "Order must have minimum value of $10."}]
+    service = _service(actions, statuses)
+    try:
+        results = await service.create_orders([order(), order("BTC"), order("UNKNOWN"), order(price="1")])
+    finally:
+        await service.close()
+
+    assert len(actions) == 1
+    assert [wire["a"] for wire in actions[0]["action"]["orders"]] == [1, 0, 1]
+    assert results[0].order.id == "1" and results[0].order.status == OrderStatus.NEW
+    assert results[1].order.status == OrderStatus.FILLED
+    assert results[1].order.average_fill_price == Decimal("2999")
+    assert not results[2].success and "UNKNOWN" in results[2].error
+    assert not results[3].success and "minimum value" in results[3].error
+
+
+@pytest.mark.asyncio
+async def test_concurrent_create_order_calls_are_coalesced():
+    actions = []
+    service = _service(actions)
+    try:
+        results = await asyncio.gather(*(service.create_order(order(client_id=str(i))) for i in range(40)))
+    finally:
+        await service.close()
+
+    assert len(actions) == 1
+    assert len(actions[0]["action"]["orders"]) == 40
+    assert [result.order.id for result in results] == [str(100 + i) for i in range(40)]
+    assert [result.order.client_id for result in results] == [str(i) for i in range(40)]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_at_max_size_and_window_can_be_disabled():
+    actions = []
+    service = _service(actions, max_order_batch_size=16)
+    try:
+        await asyncio.gather(*(service.create_order(order()) for i in range(40)))
+    finally:
+        await service.close()
+    assert [len(action["action"]["orders"]) for action in actions] == [16, 16, 8]
+
+    actions = []
+    service = _service(actions, order_batch_window=0)
+    try:
+        await asyncio.gather(*(service.create_order(order()) for i in range(3)))
+    finally:
+        await service.close()
+    assert len(actions) == 3
+    assert len({action["nonce"] for action in actions}) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_modify_orders():
+    actions = []
+    service = _service(actions)
+    try:
+        cancelled = await service.cancel_orders([("ETH", "11"), ("BTC", "12")])
+        modified = await service.modify_orders([("11", order(price="3100"))])
+    finally:
+        await service.close()
+
+    assert actions[0]["action"]["cancels"] == [{"a": 1, "o": 11}, {"a": 0, "o": 12}]
+    assert all(result.success and result.order.status == OrderStatus.CANCELLED for result in cancelled)
+    assert actions[1]["action"]["type"] == "batchModify"
+    assert actions[1]["action"]["modifies"][0]["oid"] == 11
+    assert actions[1]["action"]["modifies"][0]["order"]["p"] == "3100"
+    assert modified[0].order.id == "100"
+
+
+@pytest.mark.asyncio
+async def test_failed_action_fails_every_order():
+    service = HyperliquidService(testnet=True)
+
+    async def request(method, endpoint, *, json=None, **_):
+        if endpoint == "info":
+            return META
+        raise ValueError("Request failed with status 500")
+
+    service._request = request
+    try:
+        results = await service.create_orders([order(), order("BTC")])
+        cancelled = await service.cancel_order("ETH", "1")
+    finally:
+        await service.close()
+    assert [result.error for result in results] == ["Request failed with status 500"] * 2
+    assert not cancelled.success
@@ -0,0 +1,115 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/hyperliquid/test_orderbook.py
+"""
+
+"""Tests for the compact Hyperliquid order book."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from goat_sdk.plugins.hyperliquid.orderbook import ASK, BID, CompactOrderBook, from_fixed, to_fixed
+from goat_sdk.plugins.hyperliquid.service import HyperliquidService
+from goat_sdk.plugins.hyperliquid.types.market import OrderbookResponse
+
+L2_BOOK = {
+    "coin": "ETH",
+    "levels": [
+        [{"px": "2000.5", "sz": "1.2", "n": 3}, {"px": "2000", "sz": "4", "n": 1}, {"px": "1999.9", "sz": "2", "n": 1}],
+        [{"px": "2001.0", "sz": "0.5", "n": 2}, {"px": "2002", "sz": "1", "n": 1}],
+    ],
+}
+
+
+@pytest.fixture
+def book():
+    return CompactOrderBook.from_l2_book("ETH", L2_BOOK)
+
+
+def test_fixed_point_round_trip():
+    assert to_fixed("2000.5", 8) == 200050000000
+    assert to_fixed("0.000000019", 8) == 1
+    assert from_fixed(200050000000, 8) == Decimal("2000.5")
+    assert str(from_fixed(200000000000, 8)) == "2000"
+
+
+def test_snapshot_sorted_best_first(book):
+    assert book.best_bid() == 2000.5
+    assert book.best_ask() == 2001.0
+    assert book.mid() == 2000.75
+    assert book.spread() == 0.5
+    np.testing.assert_array_equal(book.levels(BID)[:, 0], [2000.5, 2000.0, 1999.9])
+    np.testing.assert_array_equal(book.levels(ASK, 1), [[2001.0, 0.5]])
+    assert book.bids[0] == (Decimal("2000.5"), Decimal("1.2"))
+
+
+def test_level_updates(book):
+    book.set_level(BID, "2000.7", "3")  # insert at top
+    book.set_level(BID, "2000", "0")  # remove
+    book.set_level(BID, "1999.9", "5")  # resize
+    book.set_level(ASK, "2001.5", "0")  # remove missing level: no-op
+    np.testing.assert_array_equal(book.levels(BID), [[2000.7, 3], [2000.5, 1.2], [1999.9, 5]])
+    assert len(book) == 5
+
+    for i in range(100):
+        book.set_level(ASK, str(2100 + i), "1")
+    assert book.levels(ASK).shape == (102, 2)
+    assert book.best_ask() == 2001.0
+
+
+def test_depth_vwap_and_impact(book):
+    np.testing.assert_allclose(book.depth(BID), [1.2, 5.2, 7.2])
+    assert book.vwap(ASK, 0.5) == 2001.0
+    assert book.vwap(ASK, 1.0) == pytest.approx((0.5 * 2001 + 0.5 * 2002) / 1.0)
+    assert book.vwap(BID, 2.2) == pytest.approx((1.2 * 2000.5 + 1.0 * 2000) / 2.2)
+    assert book.vwap(ASK, 10) is None
+    assert book.impact(ASK, 1.0) == pytest.approx((2001.5 - 2001) / 2001)
+
+
+def test_to_response_matches_rest_shape(book):
+    response = book.to_response(depth=2)
+    assert isinstance(response, OrderbookResponse)
+    assert [(level.price, level.size) for level in response.bids] == [
+        (Decimal("2000.5"), Decimal("1.2")), (Decimal("2000"), Decimal("4"))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_service_compact_fast_path():
+    service = HyperliquidService(testnet=True)
+    service._request = AsyncMock(return_value=L2_BOOK)
+    try:
+        book = await service.get_orderbook_compact("ETH")
+        assert isinstance(book, CompactOrderBook)
+        assert book.best_bid() == 2000.5
+    finally:
+        await service.close()
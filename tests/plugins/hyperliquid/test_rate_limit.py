@@ -0,0 +1,72 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/hyperliquid/test_rate_limit.py
+"""
+
+"""Tests for Hyperliquid request weights and rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from goat_sdk.plugins.hyperliquid.service import HyperliquidService
+from goat_sdk.plugins.hyperliquid.utils import RateLimiter, request_weight
+
+
+def test_request_weights():
+    assert request_weight("info", {"type": "l2Book", "coin": "ETH"}) == 2
+    assert request_weight("info", {"type": "meta"}) == 20
+    assert request_weight("info", {"type": "userRole"}) == 60
+    assert request_weight("exchange", {"action": {"type": "order", "orders": [{}] * 39}}) == 1
+    assert request_weight("exchange", {"action": {"type": "cancel", "cancels": [{}] * 80}}) == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_does_not_serialize_waiters():
+    limiter = RateLimiter(max_rate=10, time_period=1)
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(12)))
+    # Ten pass at once, the other two wait 0.1 and 0.2 s concurrently
+    assert 0.15 <= time.monotonic() - started < 0.4
+
+
+@pytest.mark.asyncio
+async def test_services_share_buckets_per_host_and_address():
+    first = HyperliquidService(testnet=True)
+    second = HyperliquidService(testnet=True)
+    mainnet = HyperliquidService(testnet=False)
+    try:
+        assert first.weight_limiter is second.weight_limiter
+        assert first.rate_limiters["market"] is second.rate_limiters["market"]
+        assert first.rate_limiters["agent"] is first.rate_limiters["order"]
+        assert first.weight_limiter is not mainnet.weight_limiter
+    finally:
+        for service in (first, second, mainnet):
+            await service.close()
@@ -0,0 +1,143 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/hyperliquid/test_universe.py
+"""
+
+"""Tests for the cached Hyperliquid universe metadata."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from goat_sdk.plugins.hyperliquid import universe as universe_module
+from goat_sdk.plugins.hyperliquid.service import HyperliquidService
+from goat_sdk.plugins.hyperliquid.types.order import OrderRequest, OrderSide, OrderType
+from goat_sdk.plugins.hyperliquid.universe import Universe, UniverseCache
+
+META = {
+    "universe": [
+        {"name": "BTC", "szDecimals": 5, "maxLeverage": 50},
+        {"name": "ETH", "szDecimals": 4, "maxLeverage": 50},
+        {"name": "UNIBOT", "szDecimals": 2, "maxLeverage": 2, "onlyIsolated": True},
+    ]
+}
+MIDS = {"BTC": "60000.5", "ETH": "3000", "UNIBOT": "12.3"}
+
+
+def test_universe_from_meta():
+    universe = Universe.from_meta(META)
+    assert len(universe) == 3
+    assert universe.get("ETH").index == 1
+    assert universe.get("ETH").sz_decimals == 4
+    assert universe.get("UNIBOT").only_isolated
+    assert "SOL" not in universe
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_once_and_keeps_unchanged_universe():
+    fetch = AsyncMock(return_value=META)
+    cache = UniverseCache(fetch)
+    first, second = await asyncio.gather(cache.get(), cache.get())
+    assert first is second
+    assert fetch.await_count == 1
+
+    assert await cache.refresh() is first
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_coin_refreshes_once(monkeypatch):
+    listed = {"universe": META["universe"] + [{"name": "NEW", "szDecimals": 1, "maxLeverage": 3}]}
+    fetch = AsyncMock(side_effect=[META, listed, listed])
+    cache = UniverseCache(fetch)
+    await cache.get()
+
+    # Loaded just now: a typo does not trigger another fetch
+    with pytest.raises(ValueError, match="NEW"):
+        await cache.asset("NEW")
+    assert fetch.await_count == 1
+
+    monkeypatch.setattr(universe_module, "UNKNOWN_COIN_REFRESH_INTERVAL", 0)
+    assert await cache.asset_index("NEW") == 3
+    with pytest.raises(ValueError):
+        await cache.asset("MISSING")
+    assert fetch.await_count == 3
+
+
+def _service(responses):
+    service = HyperliquidService(testnet=True)
+
+    async def request(method, endpoint, *, json=None, **kwargs):
+        responses.append(json)
+        if json.get("type") == "meta":
+            return META
+        if json.get("type") == "allMids":
+            return MIDS
+        return {"status": "ok", "response": {"data": {"statuses": [{"resting": {"oid": 7}}]}}}
+
+    service._request = request
+    return service
+
+
+@pytest.mark.asyncio
+async def test_market_data_shares_meta_and_mids():
+    requests = []
+    service = _service(requests)
+    try:
+        markets, summary = await asyncio.gather(service.get_markets(), service.get_market_summary("ETH"))
+        assert [market.coin for market in markets] == ["BTC", "ETH", "UNIBOT"]
+        assert markets[0].size_decimals == 5
+        assert summary.price == Decimal("3000")
+        assert [request["type"] for request in requests] == ["meta", "allMids"]
+
+        await service.get_markets()
+        assert len(requests) == 2
+        with pytest.raises(ValueError):
+            await service.get_market_summary("MISSING")
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_orders_use_asset_index():
+    requests = []
+    service = _service(requests)
+    try:
+        result = await service.create_order(OrderRequest(
+            coin="ETH", side=OrderSide.BUY, size=Decimal("0.1"), price=Decimal("3000"), type=OrderType.LIMIT
+        ))
+        assert result.success
+        assert requests[-1]["action"]["orders"][0]["a"] == 1
+
+        await service.cancel_order("UNIBOT", "7")
+        assert requests[-1]["action"]["cancels"][0] == {"a": 2, "o": 7}
+    finally:
+        await service.close()
@@ -0,0 +1,191 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/hyperliquid/test_websocket.py
+"""
+
+"""Tests for the Hyperliquid WebSocket client."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import web
+
+from goat_sdk.plugins.hyperliquid import websocket as websocket_module
+from goat_sdk.plugins.hyperliquid.service import HyperliquidService
+from goat_sdk.plugins.hyperliquid.types.order import OrderSide
+from goat_sdk.plugins.hyperliquid.websocket import HyperliquidWebSocket
+
+pytestmark = pytest.mark.asyncio
+
+BOOK = {
+    "coin": "ETH",
+    "time": 1700000000000,
+    "levels": [
+        [{"px": "2000.5", "sz": "1.2", "n": 3}, {"px": "2000.0", "sz": "4", "n": 1}],
+        [{"px": "2001.0", "sz": "0.5", "n": 2}],
+    ],
+}
+
+
+class FakeExchange:
+    """Local WebSocket server echoing feeds for received subscriptions."""
+
+    def __init__(self, answer_pings=True, drop_first=False):
+        self.answer_pings = answer_pings
+        self.drop_first = drop_first
+        self.connections = 0
+        self.subscriptions = []
+
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        connection = self.connections
+        async for message in ws:
+            data = message.json()
+            if data["method"] == "ping":
+                if self.answer_pings:
+                    await ws.send_json({"channel": "pong"})
+                continue
+            subscription = data["subscription"]
+            self.subscriptions.append((connection, subscription))
+            await ws.send_json({"channel": "subscriptionResponse", "data": data})
+            if subscription["type"] == "l2Book":
+                await ws.send_json({"channel": "l2Book", "data": BOOK})
+            elif subscription["type"] == "allMids":
+                await ws.send_json({"channel": "allMids", "data": {"mids": {"ETH": "2000.75"}}})
+            elif subscription["type"] == "trades":
+                await ws.send_json({"channel": "trades", "data": [
+                    {"coin": "ETH", "side": "B", "px": "2001.0", "sz": "0.1", "time": 1, "tid": 7},
+                ]})
+            if self.drop_first and connection == 1 and len(self.subscriptions) == 1:
+                await ws.close()
+        return ws
+
+
+@pytest.fixture
+async def exchange():
+    servers = []
+
+    async def start(**kwargs):
+        fake = FakeExchange(**kwargs)
+        app = web.Application()
+        app.router.add_get("/ws", fake.handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        servers.append(runner)
+        port = site._server.sockets[0].getsockname()[1]
+        return fake, f"http://127.0.0.1:{port}/ws"
+
+    yield start
+    for runner in servers:
+        await runner.cleanup()
+
+
+async def wait_until(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+async def test_local_state_from_feeds(exchange):
+    fake, url = await exchange()
+    client = HyperliquidWebSocket(url)
+    fills = []
+    await client.subscribe_l2_book("ETH")
+    await client.subscribe_trades("ETH")
+    await client.subscribe_all_mids()
+    await client.subscribe({"type": "userFills", "user": "0xabc"}, fills.append)
+    await client.start()
+    try:
+        book = await client.wait_for_book("ETH", timeout=5)
+        assert book.bids == [(Decimal("2000.5"), Decimal("1.2")), (Decimal("2000.0"), Decimal("4"))]
+        assert book.asks == [(Decimal("2001.0"), Decimal("0.5"))]
+        await wait_until(lambda: client.get_mid("ETH") is not None and client.trades.get("ETH"))
+        assert client.get_mid("ETH") == Decimal("2000.75")
+        trades = client.get_recent_trades("ETH")
+        assert trades[0].id == "7" and trades[0].side == OrderSide.BUY
+
+        await client._dispatch({"channel": "userFills", "data": {"user": "0xabc", "fills": [{"oid": 1}]}})
+        assert fills == [{"user": "0xabc", "fills": [{"oid": 1}]}]
+        assert list(client.fills["0xabc"]) == [{"oid": 1}]
+    finally:
+        await client.close()
+    assert client.get_book("ETH") is None
+
+
+async def test_resubscribes_after_reconnect(exchange, monkeypatch):
+    monkeypatch.setattr(websocket_module, "RECONNECT_DELAY", 0.01)
+    fake, url = await exchange(drop_first=True)
+    client = HyperliquidWebSocket(url)
+    await client.subscribe_l2_book("ETH")
+    await client.start()
+    try:
+        await wait_until(lambda: fake.connections == 2 and len(fake.subscriptions) == 2)
+        assert fake.subscriptions == [(1, {"type": "l2Book", "coin": "ETH"}), (2, {"type": "l2Book", "coin": "ETH"})]
+    finally:
+        await client.close()
+
+
+async def test_reconnects_when_heartbeat_unanswered(exchange, monkeypatch):
+    monkeypatch.setattr(websocket_module, "RECONNECT_DELAY", 0.01)
+    fake, url = await exchange(answer_pings=False)
+    client = HyperliquidWebSocket(url, ping_interval=0.05, ping_timeout=0.05)
+    await client.start()
+    try:
+        await wait_until(lambda: fake.connections >= 2)
+    finally:
+        await client.close()
+
+
+async def test_service_serves_orderbook_from_stream(exchange):
+    fake, url = await exchange()
+    service = HyperliquidService(testnet=True, ws_url=url)
+    service._request = AsyncMock()
+    try:
+        stream = await service.start_market_stream(["ETH"])
+        await stream.wait_for_book("ETH", timeout=5)
+
+        orderbook = await service.get_orderbook("ETH", depth=1)
+        assert [(level.price, level.size) for level in orderbook.bids] == [(Decimal("2000.5"), Decimal("1.2"))]
+        assert len(orderbook.asks) == 1
+        service._request.assert_not_awaited()
+
+        # Coins without a streamed book still use REST
+        service._request.return_value = {"levels": [[], []]}
+        await service.get_orderbook("BTC")
+        service._request.assert_awaited_once()
+    finally:
+        await service.close()
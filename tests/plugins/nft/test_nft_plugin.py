@@ -348,3 +348,32 @@ async def test_mint_nft_error_handling(plugin, valid_nft_metadata):
         with pytest.raises(Exception) as exc_info:
             await plugin.mint_nft(params)
         assert str(exc_info.value) == "Mint failed"
+
+@pytest.mark.asyncio
+async def test_plugins_share_pooled_connection(mock_wallet_client):
+    """Test that plugins share one RPC client per endpoint until released."""
+    mock_wallet_client.provider_url = "https://pooled.example"
+    first = NFTPlugin(mock_wallet_client)
+    second = NFTPlugin(mock_wallet_client)
+    assert first.connection is second.connection
+    connection = first.connection
+
+    await first.cleanup()
+    assert first.connection is None
+    assert not connection._provider.session.is_closed
+
+    await second.cleanup()
+    assert connection._provider.session.is_closed
+
+@pytest.mark.asyncio
+async def test_blockhash_refresher_runs_until_cleanup(mock_wallet_client):
+    """The first transaction starts the shared blockhash refresher; cleanup stops it."""
+    mock_wallet_client.provider_url = "https://refresher.example"
+    plugin = NFTPlugin(mock_wallet_client)
+    assert not plugin.blockhash_cache.running
+
+    with patch.object(plugin.blockhash_cache, "_fetch", AsyncMock(side_effect=Exception("offline"))):
+        plugin._new_transaction()
+        assert plugin.blockhash_cache.running
+        await plugin.cleanup()
+    assert not plugin.blockhash_cache.running
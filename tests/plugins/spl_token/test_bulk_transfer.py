@@ -0,0 +1,151 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/spl_token/test_bulk_transfer.py
+"""
+
+"""Tests for the bulk SPL token transfer engine."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.signature import Signature
+from solders.transaction import Transaction
+
+from goat_sdk.plugins.spl_token.bulk_transfer import (
+    MAX_TRANSACTION_SIZE,
+    STATUS_CONFIRMED,
+    STATUS_FAILED,
+    BulkTransfer,
+    BulkTransferEngine,
+)
+from goat_sdk.plugins.spl_token.utils.constants import ASSOCIATED_TOKEN_PROGRAM_ID
+from goat_sdk.plugins.spl_token.utils.token_account import derive_associated_token_address
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def make_connection(existing, fail_on=None):
+    """Connection reporting ``existing`` token accounts; sending transaction ``fail_on`` raises."""
+    connection = MagicMock()
+    sent = []
+
+    async def get_multiple_accounts(pubkeys, data_slice=None):
+        return SimpleNamespace(value=[object() if str(key) in existing else None for key in pubkeys])
+
+    async def send_raw_transaction(txn, opts=None):
+        sent.append(Transaction.from_bytes(txn))
+        if fail_on is not None and len(sent) - 1 == fail_on:
+            raise RuntimeError("Transaction simulation failed")
+        return SimpleNamespace(value=Signature.new_unique())
+
+    connection.get_multiple_accounts = AsyncMock(side_effect=get_multiple_accounts)
+    connection.get_latest_blockhash = AsyncMock(return_value=SimpleNamespace(
+        value=SimpleNamespace(blockhash=Hash.new_unique(), last_valid_block_height=1000)
+    ))
+    connection.send_raw_transaction = AsyncMock(side_effect=send_raw_transaction)
+    connection.confirm_transaction = AsyncMock()
+    connection.sent = sent
+    return connection
+
+
+def create_count(transaction):
+    message = transaction.message
+    return sum(
+        1 for ix in message.instructions
+        if str(message.account_keys[ix.program_id_index]) == ASSOCIATED_TOKEN_PROGRAM_ID
+    )
+
+
+@pytest.mark.asyncio
+async def test_packs_transfers_into_few_transactions():
+    payer = Keypair()
+    owners = [str(Keypair().pubkey()) for _ in range(60)]
+    existing = {derive_associated_token_address(owner, USDC_MINT) for owner in owners[::2]}
+    connection = make_connection(existing)
+    engine = BulkTransferEngine(connection, payer, USDC_MINT, max_concurrency=2)
+
+    statuses = await engine.transfer([BulkTransfer(owner, 1000 + i) for i, owner in enumerate(owners)])
+
+    assert 1 < len(connection.sent) < len(owners)
+    assert all(len(bytes(tx)) <= MAX_TRANSACTION_SIZE for tx in connection.sent)
+    assert all(tx.verify() is None for tx in connection.sent)
+    assert sum(create_count(tx) for tx in connection.sent) == len(owners) // 2
+    connection.get_latest_blockhash.assert_awaited_once()
+    assert connection.confirm_transaction.await_count == len(connection.sent)
+
+    assert [status.recipient for status in statuses] == owners
+    assert all(status.status == STATUS_CONFIRMED and status.signature for status in statuses)
+    assert [status.created_account for status in statuses] == [i % 2 == 1 for i in range(len(owners))]
+
+
+@pytest.mark.asyncio
+async def test_creates_repeated_recipient_account_once():
+    owner = str(Keypair().pubkey())
+    connection = make_connection(set())
+    engine = BulkTransferEngine(connection, Keypair(), USDC_MINT)
+
+    statuses = await engine.transfer([BulkTransfer(owner, 1), BulkTransfer(owner, 2)], confirm=False)
+
+    assert len(connection.sent) == 1
+    assert create_count(connection.sent[0]) == 1
+    assert [status.created_account for status in statuses] == [True, False]
+    connection.confirm_transaction.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_transaction_reported_per_recipient():
+    owners = [str(Keypair().pubkey()) for _ in range(60)]
+    connection = make_connection(set(), fail_on=0)
+    engine = BulkTransferEngine(connection, Keypair(), USDC_MINT, max_concurrency=1)
+
+    statuses = await engine.transfer([BulkTransfer(owner, 1) for owner in owners])
+
+    failed = [status for status in statuses if status.status == STATUS_FAILED]
+    assert 0 < len(failed) < len(owners)
+    assert all("simulation failed" in status.error and status.signature is None for status in failed)
+    assert all(status.ok for status in statuses[len(failed):])
+
+
+@pytest.mark.asyncio
+async def test_landed_but_failed_transaction_is_not_confirmed():
+    owners = [str(Keypair().pubkey()) for _ in range(3)]
+    connection = make_connection(set())
+    connection.confirm_transaction.return_value = SimpleNamespace(
+        value=[SimpleNamespace(err="InstructionError(1, Custom(1))")]
+    )
+    engine = BulkTransferEngine(connection, Keypair(), USDC_MINT, skip_preflight=True)
+
+    statuses = await engine.transfer([BulkTransfer(owner, 1) for owner in owners])
+
+    assert len(connection.sent) == 1
+    assert all(status.status == STATUS_FAILED and "Custom(1)" in status.error for status in statuses)
+    assert all(status.signature for status in statuses)
@@ -0,0 +1,114 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/spl_token/test_does_accounts_exist.py
+"""
+
+"""Tests for batched token account existence checks."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from goat_sdk.plugins.spl_token.utils.does_account_exist import (
+    does_account_exist,
+    does_accounts_exist,
+    set_account_exists,
+)
+from goat_sdk.plugins.spl_token.utils.token_account import derive_associated_token_address
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def make_connection(existing):
+    """Connection whose getMultipleAccounts reports ``existing`` addresses as present."""
+    connection = MagicMock()
+
+    async def get_multiple_accounts(pubkeys, data_slice=None):
+        return SimpleNamespace(value=[object() if str(key) in existing else None for key in pubkeys])
+
+    connection.get_multiple_accounts = AsyncMock(side_effect=get_multiple_accounts)
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_checks_accounts_in_chunks():
+    owners = [str(Keypair().pubkey()) for _ in range(250)]
+    existing = {derive_associated_token_address(owner, USDC_MINT) for owner in owners[::2]}
+    connection = make_connection(existing)
+
+    result = await does_accounts_exist(connection, [(owner, USDC_MINT) for owner in owners])
+
+    assert connection.get_multiple_accounts.await_count == 3
+    assert max(len(call.args[0]) for call in connection.get_multiple_accounts.await_args_list) == 100
+    for index, owner in enumerate(owners):
+        expected = derive_associated_token_address(owner, USDC_MINT) if index % 2 == 0 else None
+        assert result[(owner, USDC_MINT)] == expected
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached():
+    owner = Keypair().pubkey()
+    address = derive_associated_token_address(owner, USDC_MINT)
+    connection = make_connection({address})
+
+    first = await does_accounts_exist(connection, [(owner, USDC_MINT), (str(owner), USDC_MINT)])
+    second = await does_accounts_exist(connection, [(owner, USDC_MINT)])
+    assert first == second == {(str(owner), USDC_MINT): address}
+    assert connection.get_multiple_accounts.await_count == 1
+
+    await does_accounts_exist(connection, [(owner, USDC_MINT)], use_cache=False)
+    assert connection.get_multiple_accounts.await_count == 2
+
+    # The single-account check reuses the cached result without an RPC
+    connection.get_account_info = AsyncMock()
+    assert await does_account_exist(connection, owner, Pubkey.from_string(USDC_MINT)) == address
+    connection.get_account_info.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recorded_accounts_override_cache():
+    owner = str(Keypair().pubkey())
+    connection = make_connection(set())
+    assert await does_accounts_exist(connection, [(owner, USDC_MINT)]) == {(owner, USDC_MINT): None}
+
+    set_account_exists(derive_associated_token_address(owner, USDC_MINT))
+    result = await does_accounts_exist(connection, [(owner, USDC_MINT)])
+    assert result[(owner, USDC_MINT)] is not None
+    assert connection.get_multiple_accounts.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_rejects_short_response():
+    connection = MagicMock()
+    connection.get_multiple_accounts = AsyncMock(return_value={"result": {"value": []}})
+    with pytest.raises(ValueError):
+        await does_accounts_exist(connection, [(str(Keypair().pubkey()), USDC_MINT)], use_cache=False)
@@ -0,0 +1,136 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/spl_token/test_spl_token_registry.py
+"""
+
+"""Tests for the indexed SPL token registry."""
+
+import json
+import os
+
+from goat_sdk.plugins.spl_token.models import SolanaNetwork, Token
+from goat_sdk.plugins.spl_token.registry import SplTokenRegistry
+from goat_sdk.plugins.spl_token.tokens import SPL_TOKENS
+from goat_sdk.plugins.spl_token.utils.get_token_by_mint_address import get_token_by_mint_address
+from goat_sdk.plugins.spl_token.utils.get_token_info_by_symbol import get_token_info_by_symbol
+
+USDC_MAINNET = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+USDC_DEVNET = "4zMMC9srt5Ri5X14GAgXhaHii3GnPAEERYPJgZJDncDU"
+
+
+def write_token_list(path, count, chain_id=101, prefix="TK"):
+    path.write_text(json.dumps({
+        "name": "Test List",
+        "tokens": [
+            {
+                "chainId": chain_id,
+                "address": f"Mint{prefix}{index}",
+                "symbol": f"{prefix}{index}",
+                "name": f"Token {index}",
+                "decimals": 6,
+                "logoURI": "https://example.com/logo.png",
+                "tags": ["test"]
+            }
+            for index in range(count)
+        ]
+    }))
+
+
+def test_symbol_lookup_is_case_insensitive_and_per_network():
+    registry = SplTokenRegistry(SPL_TOKENS)
+
+    usdc = registry.get_by_symbol("usdc", SolanaNetwork.MAINNET)
+    assert usdc.mint_addresses[SolanaNetwork.MAINNET] == USDC_MAINNET
+    assert registry.get_by_symbol("USDC", SolanaNetwork.TESTNET) is None
+    assert registry.get_by_mint(USDC_DEVNET, SolanaNetwork.DEVNET) is usdc
+    assert registry.get_by_mint(USDC_DEVNET, SolanaNetwork.MAINNET) is None
+    assert registry.get_by_any_mint(USDC_DEVNET) is usdc
+    assert {token.symbol for token in registry.tokens_for_network("devnet")} == {"USDC", "SOL"}
+
+
+def test_bulk_token_list_uses_compact_entries(tmp_path):
+    path = tmp_path / "solana.tokenlist.json"
+    write_token_list(path, 10_000)
+    registry = SplTokenRegistry(SPL_TOKENS, token_lists=[path])
+
+    token = registry.get_by_symbol("tk9999", SolanaNetwork.MAINNET)
+    assert token.mint_addresses == {SolanaNetwork.MAINNET: "MintTK9999"}
+    assert token.decimals == 6
+    assert registry.get_by_mint("MintTK9999", "mainnet") is token
+    assert len(registry.tokens_for_network(SolanaNetwork.MAINNET)) == 10_002
+
+
+def test_explicit_tokens_win_over_token_lists(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text(json.dumps({"tokens": [
+        {"chainId": 101, "address": "FakeUsdcMint", "symbol": "USDC", "name": "Fake", "decimals": 9},
+        {"chainId": 101, "symbol": "BROKEN"},
+    ]}))
+    registry = SplTokenRegistry(SPL_TOKENS, token_lists=[path])
+
+    assert registry.get_by_symbol("USDC", SolanaNetwork.MAINNET).name == "USD Coin"
+    assert registry.get_by_mint("FakeUsdcMint", SolanaNetwork.MAINNET).name == "Fake"
+    assert registry.get_by_symbol("BROKEN", SolanaNetwork.MAINNET) is None
+
+
+def test_hot_reload(tmp_path):
+    path = tmp_path / "tokens.json"
+    write_token_list(path, 2, prefix="OLD")
+    registry = SplTokenRegistry(token_lists=[path], reload_interval=0)
+    assert registry.get_by_symbol("OLD0", SolanaNetwork.MAINNET) is not None
+    assert registry.reload() is False
+
+    write_token_list(path, 2, prefix="NEW")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert registry.get_by_symbol("NEW1", SolanaNetwork.MAINNET) is not None
+    assert registry.get_by_symbol("OLD0", SolanaNetwork.MAINNET) is None
+
+    # A broken file keeps the previous tokens
+    path.unlink()
+    assert registry.get_by_symbol("NEW1", SolanaNetwork.MAINNET) is not None
+
+
+def test_utils_use_registry():
+    assert get_token_info_by_symbol("sol", SolanaNetwork.MAINNET).symbol == "SOL"
+    assert get_token_info_by_symbol("USDC", SolanaNetwork.TESTNET) is None
+
+    custom = [Token(symbol="BONK", name="Bonk", decimals=5, mint_addresses={SolanaNetwork.MAINNET: "BonkMint"})]
+    assert get_token_info_by_symbol("bonk", SolanaNetwork.MAINNET, custom).name == "Bonk"
+    assert get_token_by_mint_address("BonkMint", SolanaNetwork.MAINNET, custom).symbol == "BONK"
+    assert get_token_by_mint_address("BonkMint", SolanaNetwork.MAINNET, SplTokenRegistry(custom)).symbol == "BONK"
+    assert get_token_by_mint_address("BonkMint", SolanaNetwork.DEVNET, custom) is None
+
+
+def test_first_token_wins_duplicate_symbol():
+    first = Token(symbol="USDC", name="USD Coin", decimals=6, mint_addresses={SolanaNetwork.MAINNET: "UsdcMint"})
+    second = Token(symbol="usdc", name="Other USDC", decimals=9, mint_addresses={SolanaNetwork.MAINNET: "OtherMint"})
+    assert get_token_info_by_symbol("usdc", SolanaNetwork.MAINNET, [first, second]).name == "USD Coin"
+    assert get_token_by_mint_address("OtherMint", SolanaNetwork.MAINNET, [first, second]).name == "Other USDC"
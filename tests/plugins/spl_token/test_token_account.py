@@ -0,0 +1,124 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/spl_token/test_token_account.py
+"""
+
+"""Tests for associated token address derivation."""
+
+import pytest
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from goat_sdk.plugins.spl_token.utils import token_account
+from goat_sdk.plugins.spl_token.utils.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
+from goat_sdk.plugins.spl_token.utils.token_account import (
+    derive_associated_token_address,
+    derive_atas,
+    derive_atas_async,
+    get_associated_token_address,
+)
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+
+
+def expected_ata(owner: str, mint: str) -> str:
+    address, _ = Pubkey.find_program_address(
+        [
+            bytes(Pubkey.from_string(owner)),
+            bytes(Pubkey.from_string(TOKEN_PROGRAM_ID)),
+            bytes(Pubkey.from_string(mint)),
+        ],
+        Pubkey.from_string(ASSOCIATED_TOKEN_PROGRAM_ID),
+    )
+    return str(address)
+
+
+@pytest.fixture
+def derivations(monkeypatch):
+    """Count uncached derivations."""
+    calls = []
+    find = token_account._find_associated_token_address
+
+    def counting_find(*key):
+        calls.append(key)
+        return find(*key)
+
+    monkeypatch.setattr(token_account, "_find_associated_token_address", counting_find)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_derivation_is_cached(derivations):
+    owner = str(Keypair().pubkey())
+
+    address = await get_associated_token_address(owner, USDC_MINT)
+    assert address == expected_ata(owner, USDC_MINT)
+    assert derive_associated_token_address(Pubkey.from_string(owner), USDC_MINT) == address
+    assert len(derivations) == 1
+
+
+def test_derive_atas_reuses_cache_and_deduplicates(derivations):
+    owners = [str(Keypair().pubkey()) for _ in range(5)]
+    cached = derive_associated_token_address(owners[0], USDC_MINT)
+
+    addresses = derive_atas(owners + owners[:2], USDC_MINT)
+    assert addresses[0] == cached
+    assert addresses == [expected_ata(owner, USDC_MINT) for owner in owners + owners[:2]]
+    assert len(derivations) == 5
+
+
+def test_derive_atas_in_process_pool(monkeypatch):
+    monkeypatch.setattr(token_account, "ATA_PROCESS_POOL_THRESHOLD", 4)
+    monkeypatch.setattr(token_account, "ATA_PROCESS_POOL_CHUNK_SIZE", 3)
+    owners = [str(Keypair().pubkey()) for _ in range(10)]
+    mints = [USDC_MINT if index % 2 else str(Keypair().pubkey()) for index in range(10)]
+
+    addresses = derive_atas(owners, mints, max_workers=2)
+    assert addresses == [expected_ata(owner, mint) for owner, mint in zip(owners, mints)]
+
+
+@pytest.mark.asyncio
+async def test_derive_atas_async_in_shared_process_pool(monkeypatch):
+    monkeypatch.setattr(token_account, "ATA_PROCESS_POOL_THRESHOLD", 4)
+    monkeypatch.setattr(token_account, "ATA_PROCESS_POOL_CHUNK_SIZE", 3)
+    owners = [str(Keypair().pubkey()) for _ in range(10)]
+
+    addresses = await derive_atas_async(owners, USDC_MINT)
+    assert addresses == [expected_ata(owner, USDC_MINT) for owner in owners]
+    pool = token_account._get_ata_pool()
+    assert pool._mp_context.get_start_method() == "spawn"
+
+    # Later derivations reuse the pool and the cache
+    assert await derive_atas_async(owners[:2], USDC_MINT) == addresses[:2]
+    assert token_account._get_ata_pool() is pool
+
+
+def test_derive_atas_rejects_mismatched_mints():
+    with pytest.raises(ValueError):
+        derive_atas([str(Keypair().pubkey())] * 2, [USDC_MINT])
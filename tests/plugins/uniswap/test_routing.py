@@ -0,0 +1,149 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/uniswap/test_routing.py
+"""
+
+"""Tests for the Uniswap route graph and local output estimation."""
+
+import math
+from decimal import Decimal
+
+import pytest
+
+from goat_sdk.plugins.uniswap.types import PoolFee, PoolInfo, TokenInfo, UniswapVersion
+from goat_sdk.plugins.uniswap.routing import RouteGraph, encode_v3_path
+
+TOKEN_A = "0x" + "a" * 40
+TOKEN_B = "0x" + "b" * 40
+TOKEN_C = "0x" + "c" * 40
+TOKEN_D = "0x" + "d" * 40
+
+
+def make_token(address: str, decimals: int = 18) -> TokenInfo:
+    return TokenInfo(address=address, symbol=address[-3:], name=address, decimals=decimals, chain_id=1)
+
+
+def make_v3_pool(address: str, token0: str, token1: str, liquidity: int, fee: PoolFee = PoolFee.MEDIUM) -> PoolInfo:
+    """Create a V3 pool priced at 1:1."""
+    return PoolInfo(
+        address=address,
+        token0=make_token(token0),
+        token1=make_token(token1),
+        fee=fee,
+        liquidity=Decimal(liquidity),
+        token0_price=Decimal(1),
+        token1_price=Decimal(1),
+        sqrt_price_x96=math.isqrt(2 ** 192)
+    )
+
+
+@pytest.fixture
+def graph():
+    pools = [
+        make_v3_pool("0x" + "1" * 40, TOKEN_A, TOKEN_B, 10**20),  # Shallow direct pool
+        make_v3_pool("0x" + "2" * 40, TOKEN_A, TOKEN_C, 10**24),
+        make_v3_pool("0x" + "3" * 40, TOKEN_C, TOKEN_B, 10**24),
+        make_v3_pool("0x" + "4" * 40, TOKEN_C, TOKEN_D, 10**24),
+        make_v3_pool("0x" + "5" * 40, TOKEN_D, TOKEN_B, 10**24),
+    ]
+    return RouteGraph.from_pools(pools, UniswapVersion.V3)
+
+
+def test_deep_multi_hop_route_beats_shallow_direct_pool(graph):
+    routes = graph.find_routes(TOKEN_A, TOKEN_B, 10**19, max_hops=3, k=5)
+
+    assert [len(route.edges) for route in routes] == [2, 3, 1]
+    assert routes[0].path == [TOKEN_A, TOKEN_C, TOKEN_B]
+    assert routes[0].amount_out > routes[-1].amount_out
+    assert routes[0].price_impact() < routes[-1].price_impact()
+
+
+def test_max_hops_bounds_search(graph):
+    routes = graph.find_routes(TOKEN_A, TOKEN_B, 10**19, max_hops=1)
+    assert len(routes) == 1
+    assert routes[0].pools == ["0x" + "1" * 40]
+
+
+def test_k_limits_results(graph):
+    assert len(graph.find_routes(TOKEN_A, TOKEN_B, 10**19, k=2)) == 2
+
+
+def test_reverse_direction_uses_same_pools(graph):
+    forward = graph.find_routes(TOKEN_A, TOKEN_B, 10**18)
+    reverse = graph.find_routes(TOKEN_B, TOKEN_A, 10**18)
+    assert [route.pools[::-1] for route in forward] == [route.pools for route in reverse]
+
+
+def test_min_liquidity_prunes_pools():
+    pools = [
+        make_v3_pool("0x" + "1" * 40, TOKEN_A, TOKEN_B, 10**20),
+        make_v3_pool("0x" + "2" * 40, TOKEN_A, TOKEN_C, 0),
+    ]
+    graph = RouteGraph.from_pools(pools, UniswapVersion.V3, min_liquidity=Decimal(10**10))
+    assert graph.pool_count == 1
+    assert graph.edges_from(TOKEN_C) == []
+
+
+def test_v3_single_tick_estimate_matches_formula():
+    pool = make_v3_pool("0x" + "1" * 40, TOKEN_A, TOKEN_B, 10**24, fee=PoolFee.LOW)
+    edge = RouteGraph.from_pools([pool], UniswapVersion.V3).edges_from(TOKEN_A)[0]
+
+    amount_in = 10**18
+    amount_less_fee = amount_in * (10**6 - 500) // 10**6
+    # At price 1 and in-range liquidity L the output is L * x / (L + x)
+    expected = 10**24 * amount_less_fee // (10**24 + amount_less_fee)
+    assert abs(edge.estimate_output(amount_in) - expected) <= 1
+
+
+def test_v2_constant_product_estimate():
+    pool = PoolInfo(
+        address="0x" + "9" * 40,
+        token0=make_token(TOKEN_A),
+        token1=make_token(TOKEN_B),
+        fee=PoolFee.MEDIUM,
+        liquidity=Decimal(10**21),
+        token0_price=Decimal(2),
+        token1_price=Decimal("0.5")
+    )
+    graph = RouteGraph.from_pools([pool], UniswapVersion.V2)
+    route = graph.find_routes(TOKEN_A, TOKEN_B, 10**18)[0]
+
+    reserve_in, reserve_out = 10**21, 2 * 10**21
+    expected = (10**18 * 997 * reserve_out) // (reserve_in * 1000 + 10**18 * 997)
+    assert route.amount_out == expected
+    assert route.gas_estimate == 100000
+
+
+def test_encode_v3_path():
+    encoded = encode_v3_path([TOKEN_A, TOKEN_C, TOKEN_B], [PoolFee.LOW, PoolFee.MEDIUM])
+    assert len(encoded) == 20 * 3 + 3 * 2
+    assert encoded[20:23] == (500).to_bytes(3, "big")
+
+    with pytest.raises(ValueError):
+        encode_v3_path([TOKEN_A, TOKEN_B], [])
@@ -32,7 +32,7 @@
 import pytest
 import asyncio
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from web3 import Web3
 
 from goat_sdk.plugins.uniswap.types import (
@@ -41,6 +41,8 @@ from goat_sdk.plugins.uniswap.types import (
 )
 from goat_sdk.plugins.uniswap.advanced_security import TokenSecurityChecker
 from goat_sdk.plugins.uniswap.uniswap_service import UniswapService
+from goat_sdk.plugins.uniswap.v3_simulator import PoolSnapshot
+from goat_sdk.core.utils.blocks import BlockSource
 
 # Fixtures
 @pytest.fixture
@@ -161,6 +163,23 @@ async def test_get_token_info(uniswap_service, mock_web3):
     assert token_info.symbol == 'TEST'
     assert token_info.decimals == 18
 
+@pytest.mark.asyncio
+async def test_get_token_info_is_cached_and_single_flight(uniswap_service, mock_web3):
+    name_call = mock_web3.eth.contract.return_value.functions.name.return_value.call
+    name_call.return_value = 'Test Token'
+    mock_web3.eth.contract.return_value.functions.symbol.return_value.call.return_value = 'TEST'
+    mock_web3.eth.contract.return_value.functions.decimals.return_value.call.return_value = 18
+
+    address = '0x1234567890123456789012345678901234567890'
+    results = await asyncio.gather(*(uniswap_service.get_token_info(address) for _ in range(5)))
+    await uniswap_service.get_token_info(address.upper().replace('0X', '0x'))
+
+    assert all(info is results[0] for info in results)
+    assert name_call.call_count == 1
+    stats = uniswap_service.cache.stats()['uniswap.tokens']
+    assert stats['loads'] == 1
+    assert stats['hits'] == 1
+
 @pytest.mark.asyncio
 async def test_get_pool_info_v3(uniswap_service, mock_web3):
     # Mock pool data
@@ -179,22 +198,136 @@ async def test_get_pool_info_v3(uniswap_service, mock_web3):
     assert pool_info.fee == PoolFee.MEDIUM
     assert pool_info.liquidity == 1000000
 
+@pytest.mark.asyncio
+async def test_block_watcher_invalidates_pool_state(uniswap_service):
+    class SingleBlockSource(BlockSource):
+        async def blocks(self):
+            yield 1000
+            await asyncio.Event().wait()
+
+    uniswap_service.pool_cache.set('0xpool', 'state')
+    uniswap_service.token_cache.set('0xtoken', 'metadata')
+
+    watcher = await uniswap_service.start_block_watcher(SingleBlockSource())
+    await asyncio.sleep(0.01)
+    assert watcher.block_number == 1000
+    assert uniswap_service.pool_cache.ttl is None
+    assert '0xpool' not in uniswap_service.pool_cache
+    assert '0xtoken' in uniswap_service.token_cache
+
+    await uniswap_service.stop_block_watcher()
+    assert uniswap_service.block_watcher is None
+    assert uniswap_service.pool_cache.ttl == UniswapService.POOL_CACHE_TTL
+
+@pytest.mark.asyncio
+async def test_quote_batch(uniswap_service):
+    token0 = '0x1111111111111111111111111111111111111111'
+    token1 = '0x2222222222222222222222222222222222222222'
+    pool = PoolInfo(
+        address='0x4444444444444444444444444444444444444444',
+        token0=TokenInfo(address=token0, symbol='TKN0', name='Token0', decimals=18, chain_id=1),
+        token1=TokenInfo(address=token1, symbol='TKN1', name='Token1', decimals=18, chain_id=1),
+        fee=PoolFee.MEDIUM,
+        liquidity=Decimal(10**24),
+        token0_price=Decimal('1'),
+        token1_price=Decimal('1'),
+        sqrt_price_x96=2**96,
+        tick=0
+    )
+
+    # The current tick range holds roughly 3000 tokens of depth; larger sizes go to the quoter
+    quote_route = AsyncMock(return_value=123 * 10**18)
+    with patch.object(UniswapService, '_discover_pools', AsyncMock(return_value=[pool])), \
+            patch.object(UniswapService, '_quote_route', quote_route):
+        quotes = await uniswap_service.quote_batch(
+            pairs=[(token1, token0)],
+            amounts=[Decimal('1'), Decimal('10'), Decimal('10000')]
+        )
+
+    small, medium, large = quotes[(token1, token0)]
+    assert Decimal('0.99') < small < Decimal('1')
+    assert Decimal('9.9') < medium < Decimal('10')
+    assert large == Decimal(123)
+    assert quote_route.await_count == 1
+
 @pytest.mark.asyncio
 async def test_find_optimal_routes(uniswap_service, mock_web3):
-    # Mock necessary contract calls
-    mock_web3.eth.contract.return_value.functions.factory.return_value.call.return_value = uniswap_service.config.factory_address
-    mock_web3.eth.contract.return_value.functions.pool.return_value.call.return_value = '0x4444444444444444444444444444444444444444'
-    mock_web3.eth.contract.return_value.functions.quote.return_value.call.return_value = [10**18, 0]
-    
-    routes = await uniswap_service.find_optimal_routes(
-        token_in='0x1111111111111111111111111111111111111111',
-        token_out='0x2222222222222222222222222222222222222222',
-        amount_in=Decimal('1.0')
+    token_in = '0x1111111111111111111111111111111111111111'
+    token_out = '0x2222222222222222222222222222222222222222'
+    pool = PoolInfo(
+        address='0x4444444444444444444444444444444444444444',
+        token0=TokenInfo(address=token_in, symbol='TKN0', name='Token0', decimals=18, chain_id=1),
+        token1=TokenInfo(address=token_out, symbol='TKN1', name='Token1', decimals=18, chain_id=1),
+        fee=PoolFee.MEDIUM,
+        liquidity=Decimal(10**24),
+        token0_price=Decimal('1'),
+        token1_price=Decimal('1'),
+        sqrt_price_x96=2**96
     )
+
+    # No quoter is configured, so routes are priced by the local estimator
+    with patch.object(UniswapService, '_discover_pools', AsyncMock(return_value=[pool])):
+        routes = await uniswap_service.find_optimal_routes(
+            token_in=token_in,
+            token_out=token_out,
+            amount_in=Decimal('1.0')
+        )
     assert len(routes) > 0
     assert isinstance(routes[0], SwapRoute)
+    assert routes[0].path == [token_in, token_out]
+    assert routes[0].pools == [pool.address]
     assert routes[0].input_amount == Decimal('1.0')
-    assert routes[0].output_amount > 0
+    assert Decimal('0.99') < routes[0].output_amount < Decimal('1.0')
+    assert routes[0].minimum_output < routes[0].output_amount
+
+@pytest.mark.asyncio
+async def test_find_optimal_routes_ranks_by_net_output(uniswap_service):
+    weth = uniswap_service.config.wrapped_native_address
+    usdc = '0x2222222222222222222222222222222222222222'
+    token_in = '0x1111111111111111111111111111111111111111'
+    middle = '0x3333333333333333333333333333333333333333'
+
+    def make_pool(address, token0, token1, decimals1=18):
+        return PoolInfo(
+            address=address,
+            token0=TokenInfo(address=token0, symbol='T0', name='Token0', decimals=18, chain_id=1),
+            token1=TokenInfo(address=token1, symbol='T1', name='Token1', decimals=decimals1, chain_id=1),
+            fee=PoolFee.MEDIUM,
+            liquidity=Decimal(10**24),
+            token0_price=Decimal('1'),
+            token1_price=Decimal('1'),
+            sqrt_price_x96=2**96
+        )
+
+    pools = [
+        make_pool('0x' + '4' * 40, weth, usdc),  # Prices gas in the output token
+        make_pool('0x' + '5' * 40, token_in, usdc),
+        make_pool('0x' + '6' * 40, token_in, middle),
+        make_pool('0x' + '7' * 40, middle, usdc),
+    ]
+    fees = MagicMock(gas_price=10**12)  # Expensive gas makes the extra hop cost ~0.13 output tokens
+
+    with patch.object(UniswapService, '_discover_pools', AsyncMock(return_value=pools)), \
+            patch.object(uniswap_service.gas_oracle, 'fees', AsyncMock(return_value=fees)):
+        routes = await uniswap_service.find_optimal_routes(token_in, usdc, Decimal('1.0'))
+
+    assert len(routes) == 2
+    assert all(route.gas_cost > 0 for route in routes)
+    assert routes[1].gas_cost > routes[0].gas_cost
+    assert routes[0].path == [token_in, usdc]
+    net = [route.output_amount - route.gas_cost for route in routes]
+    assert net == sorted(net, reverse=True)
+
+@pytest.mark.asyncio
+async def test_gas_cost_in_wrapped_native_token(uniswap_service):
+    weth = TokenInfo(
+        address=uniswap_service.config.wrapped_native_address,
+        symbol='WETH', name='Wrapped Ether', decimals=18, chain_id=1
+    )
+    fees = MagicMock(gas_price=20 * 10**9)
+    with patch.object(uniswap_service.gas_oracle, 'fees', AsyncMock(return_value=fees)):
+        cost = await uniswap_service._estimate_gas_cost_in_token(100_000, weth)
+    assert cost == Decimal('0.002')
 
 @pytest.mark.asyncio
 async def test_calculate_price_impact(uniswap_service, mock_web3):
@@ -210,6 +343,41 @@ async def test_calculate_price_impact(uniswap_service, mock_web3):
     assert isinstance(price_impact, Decimal)
     assert price_impact >= 0
 
+@pytest.mark.asyncio
+async def test_calculate_price_impact_simulates_ticks(uniswap_service):
+    token0 = '0x1111111111111111111111111111111111111111'
+    token1 = '0x2222222222222222222222222222222222222222'
+    pool = PoolInfo(
+        address='0x4444444444444444444444444444444444444444',
+        token0=TokenInfo(address=token0, symbol='TKN0', name='Token0', decimals=18, chain_id=1),
+        token1=TokenInfo(address=token1, symbol='TKN1', name='Token1', decimals=18, chain_id=1),
+        fee=PoolFee.MEDIUM,
+        liquidity=Decimal(10**21),
+        token0_price=Decimal('1'),
+        token1_price=Decimal('1'),
+        sqrt_price_x96=2**96,
+        tick=0
+    )
+    snapshot = PoolSnapshot(
+        address=pool.address,
+        sqrt_price_x96=2**96,
+        tick=0,
+        liquidity=10**21,
+        fee=3000,
+        tick_spacing=60,
+        bitmap={-1: 1 << 254, 0: 1 << 2},
+        liquidity_net={-120: 10**21, 120: -10**21}
+    )
+
+    with patch.object(UniswapService, '_discover_pools', AsyncMock(return_value=[pool])), \
+            patch.object(UniswapService, 'get_pool_snapshot', AsyncMock(return_value=snapshot)):
+        small = await uniswap_service.calculate_price_impact(token0, token1, Decimal('1'))
+        large = await uniswap_service.calculate_price_impact(token0, token1, Decimal('5'))
+
+    expected = snapshot.simulate_exact_input(10**18, zero_for_one=True).price_impact
+    assert abs(small - expected) < Decimal('1e-18')
+    assert Decimal(0) <= small < large
+
 @pytest.mark.asyncio
 async def test_simulate_swap(uniswap_service, mock_web3):
     # Mock data
@@ -0,0 +1,109 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/uniswap/test_v3_math.py
+"""
+
+"""Tests for the exact Uniswap V3 integer math."""
+
+from decimal import Decimal, getcontext
+
+import pytest
+
+from goat_sdk.plugins.uniswap.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    quote_in_range,
+)
+
+
+def encode_price_sqrt(reserve1: int, reserve0: int) -> int:
+    getcontext().prec = 80
+    return int((Decimal(reserve1) / Decimal(reserve0)).sqrt() * Decimal(Q96))
+
+
+def test_sqrt_ratio_at_tick_matches_contract():
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_sqrt_ratio_at_tick(50) == 79426470787362580746886972461
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+def test_tick_at_sqrt_ratio_inverts_tick_math():
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+    for tick in (-887, -1, 0, 1, 50, 12345):
+        assert get_tick_at_sqrt_ratio(get_sqrt_ratio_at_tick(tick)) == tick
+        assert get_tick_at_sqrt_ratio(get_sqrt_ratio_at_tick(tick) + 1) == tick
+
+
+def test_compute_swap_step_capped_at_target():
+    # v3-core SwapMath spec: exact amount in that gets capped at price target in one for zero
+    price = encode_price_sqrt(1, 1)
+    target = encode_price_sqrt(101, 100)
+    sqrt_q, amount_in, amount_out, fee_amount = compute_swap_step(price, target, 2 * 10**18, 10**18, 600)
+
+    assert sqrt_q == target
+    assert amount_in == 9975124224178055
+    assert amount_out == 9925619580021728
+    assert fee_amount == 5988667735148
+
+
+def test_compute_swap_step_fully_spent():
+    # v3-core SwapMath spec: exact amount in that is fully spent in one for zero
+    price = encode_price_sqrt(1, 1)
+    target = encode_price_sqrt(1000, 100)
+    sqrt_q, amount_in, amount_out, fee_amount = compute_swap_step(price, target, 2 * 10**18, 10**18, 600)
+
+    assert sqrt_q < target
+    assert amount_in == 999400000000000000
+    assert amount_out == 666399946655997866
+    assert fee_amount == 600000000000000
+    assert amount_in + fee_amount == 10**18
+
+
+def test_quote_in_range_flags_boundary_crossings():
+    liquidity = 10**24
+    outputs = quote_in_range(Q96, 0, liquidity, 3000, False, [0, 10**18, 10**22])
+
+    assert outputs[0] == 0
+    assert outputs[1] == compute_swap_step(Q96, get_sqrt_ratio_at_tick(60), liquidity, 10**18, 3000)[2]
+    assert outputs[2] is None
+
+
+def test_quote_in_range_on_lower_boundary_defers_to_quoter():
+    # At exactly tick 0 a zero-for-one swap crosses the tick immediately
+    assert quote_in_range(Q96, 0, 10**24, 3000, True, [10**18]) == [None]
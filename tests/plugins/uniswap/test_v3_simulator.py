@@ -0,0 +1,138 @@
+"""
+          _____                    _____                    _____                    _____           _______                   _____          
+         /\    \                  /\    \                  /\    \                  /\    \         /::\    \                 /\    \         
+        /::\    \                /::\    \                /::\    \                /::\____\       /::::\    \               /::\____\        
+       /::::\    \               \:::\    \              /::::\    \              /:::/    /      /::::::\    \             /:::/    /        
+      /::::::\    \               \:::\    \            /::::::\    \            /:::/    /      /::::::::\    \           /:::/   _/___      
+     /:::/\:::\    \               \:::\    \          /:::/\:::\    \          /:::/    /      /:::/~~\:::\    \         /:::/   /\    \     
+    /:::/__\:::\    \               \:::\    \        /:::/__\:::\    \        /:::/    /      /:::/    \:::\    \       /:::/   /::\____\    
+   /::::\   \:::\    \              /::::\    \      /::::\   \:::\    \      /:::/    /      /:::/    / \:::\    \     /:::/   /:::/    /    
+  /::::::\   \:::\    \    ____    /::::::\    \    /::::::\   \:::\    \    /:::/    /      /:::/____/   \:::\____\   /:::/   /:::/   _/___  
+ /:::/\:::\   \:::\    \  /\   \  /:::/\:::\    \  /:::/\:::\   \:::\    \  /:::/    /      |:::|    |     |:::|    | /:::/___/:::/   /\    \ 
+/:::/  \:::\   \:::\____\/::\   \/:::/  \:::\____\/:::/  \:::\   \:::\____\/:::/____/       |:::|____|     |:::|    ||:::|   /:::/   /::\____\
+\::/    \:::\  /:::/    /\:::\  /:::/    \::/    /\::/    \:::\   \::/    /\:::\    \        \:::\    \   /:::/    / |:::|__/:::/   /:::/    /
+ \/____/ \:::\/:::/    /  \:::\/:::/    / \/____/  \/____/ \:::\   \/____/  \:::\    \        \:::\    \ /:::/    /   \:::\/:::/   /:::/    / 
+          \::::::/    /    \::::::/    /                    \:::\    \       \:::\    \        \:::\    /:::/    /     \::::::/   /:::/    /  
+           \::::/    /      \::::/____/                      \:::\____\       \:::\    \        \:::\__/:::/    /       \::::/___/:::/    /   
+           /:::/    /        \:::\    \                       \::/    /        \:::\    \        \::::::::/    /         \:::\__/:::/    /    
+          /:::/    /          \:::\    \                       \/____/          \:::\    \        \::::::/    /           \::::::::/    /     
+         /:::/    /            \:::\    \                                        \:::\    \        \::::/    /             \::::::/    /      
+        /:::/    /              \:::\____\                                        \:::\____\        \::/____/               \::::/    /       
+        \::/    /                \::/    /                                         \::/    /         ~~                      \::/____/        
+         \/____/                  \/____/                                           \/____/                                   ~~              
+                                                                                                                                              
+
+         
+ 
+     GOAT-SDK Python - Unofficial SDK for GOAT - Igor Lessio - AIFlow.ml
+     
+     Path: tests/plugins/uniswap/test_v3_simulator.py
+"""
+
+"""Tests for the offline Uniswap V3 swap simulator."""
+
+import pytest
+from decimal import Decimal
+
+from goat_sdk.plugins.uniswap.v3_math import compute_swap_step, get_sqrt_ratio_at_tick
+from goat_sdk.plugins.uniswap.v3_simulator import PoolSnapshot, TickDataUnavailableError
+
+# 0.3% pool at tick 0 with positions [-120, 120] and [-600, 600] of 5e20 liquidity each
+POOL_FIXTURE = {
+    "address": "0x4444444444444444444444444444444444444444",
+    "sqrt_price_x96": str(2 ** 96),
+    "tick": 0,
+    "liquidity": str(10 ** 21),
+    "fee": 3000,
+    "tick_spacing": 60,
+    "bitmap": {
+        "-1": str((1 << 246) | (1 << 254)),
+        "0": str((1 << 2) | (1 << 10))
+    },
+    "liquidity_net": {
+        "-600": str(5 * 10 ** 20),
+        "-120": str(5 * 10 ** 20),
+        "120": str(-5 * 10 ** 20),
+        "600": str(-5 * 10 ** 20)
+    },
+    "block_number": 1000
+}
+
+
+@pytest.fixture
+def snapshot():
+    return PoolSnapshot.from_dict(POOL_FIXTURE)
+
+
+def test_initialized_ticks_match_bitmap(snapshot):
+    ticks = [
+        tick
+        for word, bitmap in snapshot.bitmap.items()
+        for tick in PoolSnapshot.initialized_ticks(word, bitmap, snapshot.tick_spacing)
+    ]
+    assert sorted(ticks) == [-600, -120, 120, 600]
+    assert PoolSnapshot.word_position(-120, 60) == -1
+    assert PoolSnapshot.word_position(120, 60) == 0
+
+
+def test_next_initialized_tick(snapshot):
+    # Tick 0 starts word 0, which holds no initialized tick at or below it
+    assert snapshot.next_initialized_tick_within_one_word(0, True) == (0, False)
+    assert snapshot.next_initialized_tick_within_one_word(-1, True) == (-120, True)
+    assert snapshot.next_initialized_tick_within_one_word(0, False) == (120, True)
+    assert snapshot.next_initialized_tick_within_one_word(-121, True) == (-600, True)
+    # No initialized tick below -600 within the word: stop at the word boundary
+    assert snapshot.next_initialized_tick_within_one_word(-601, True) == (-256 * 60, False)
+
+
+def test_swap_within_range_matches_swap_step(snapshot):
+    amount_in = 10 ** 18
+    simulation = snapshot.simulate_exact_input(amount_in, zero_for_one=True)
+
+    _, step_in, step_out, step_fee = compute_swap_step(
+        2 ** 96, get_sqrt_ratio_at_tick(-120), 10 ** 21, amount_in, 3000
+    )
+    assert simulation.amount_in == step_in + step_fee == amount_in
+    assert simulation.amount_out == step_out
+    assert simulation.ticks_crossed == 0
+    assert Decimal(0) <= simulation.price_impact < Decimal("0.001")
+
+
+def test_swap_crosses_initialized_tick(snapshot):
+    # Exhaust the [0, 120] range, then continue with half the liquidity
+    sqrt_upper = get_sqrt_ratio_at_tick(120)
+    _, first_in, first_out, first_fee = compute_swap_step(2 ** 96, sqrt_upper, 10 ** 21, 10 ** 30, 3000)
+    remaining = 10 ** 18
+    _, second_in, second_out, second_fee = compute_swap_step(
+        sqrt_upper, get_sqrt_ratio_at_tick(600), 5 * 10 ** 20, remaining, 3000
+    )
+
+    simulation = snapshot.simulate_exact_input(first_in + first_fee + remaining, zero_for_one=False)
+    assert simulation.ticks_crossed == 1
+    assert simulation.amount_out == first_out + second_out
+    assert 120 <= simulation.tick_after < 600
+
+    in_range = snapshot.simulate_exact_input(first_in + first_fee, zero_for_one=False)
+    assert simulation.price_impact > in_range.price_impact
+
+
+def test_swap_beyond_loaded_words_raises(snapshot):
+    with pytest.raises(TickDataUnavailableError):
+        snapshot.simulate_exact_input(10 ** 30, zero_for_one=True)
+
+
+def test_price_limit_stops_swap(snapshot):
+    limit = get_sqrt_ratio_at_tick(-60)
+    simulation = snapshot.simulate_exact_input(10 ** 30, zero_for_one=True, sqrt_price_limit_x96=limit)
+    assert simulation.sqrt_price_x96_after == limit
+    assert simulation.amount_in < 10 ** 30
+    assert simulation.ticks_crossed == 0
+
+
+def test_snapshot_round_trip(snapshot):
+    assert PoolSnapshot.from_dict(snapshot.to_dict()) == snapshot
+
+
+def test_snapshot_rejects_invalid_state():
+    with pytest.raises(ValueError):
+        PoolSnapshot.from_dict({**POOL_FIXTURE, "sqrt_price_x96": "1"})